@@ -16,15 +16,19 @@ from loguru import logger
 
 from app.services.authority_resolver import (
     resolve_authority,
+    resolve_authorities,
     get_all_categories,
     get_all_states,
-    AuthorityLevel
+    AuthorityLevel,
+    ResolutionResult
 )
 from app.config import get_settings
 
 router = APIRouter()
 settings = get_settings()
 
+MAX_BATCH_SIZE = 100
+
 
 # =============================================================================
 # REQUEST/RESPONSE SCHEMAS
@@ -72,6 +76,11 @@ class AuthorityRequest(BaseModel):
         }
 
 
+class BatchAuthorityRequest(BaseModel):
+    """Several issues resolved in one call"""
+    requests: List[AuthorityRequest] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
 class AuthorityInfo(BaseModel):
     """Information about a resolved authority"""
     name: str
@@ -122,6 +131,11 @@ class AuthorityResponse(BaseModel):
     timestamp: datetime
 
 
+class BatchAuthorityResponse(BaseModel):
+    """Results in request order"""
+    results: List[AuthorityResponse]
+
+
 class CategoryInfo(BaseModel):
     """Information about an issue category"""
     id: str
@@ -140,6 +154,55 @@ class StateInfo(BaseModel):
 # API ENDPOINTS
 # =============================================================================
 
+def _validate_category(issue_category: str, field_name: str = "issue_category") -> str:
+    """Normalized category, or 400 if it is not supported"""
+    valid_categories = get_all_categories()
+    category = issue_category.lower().strip()
+    
+    if category not in valid_categories:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {field_name}. Valid options: {valid_categories}"
+        )
+    return category
+
+
+def _to_match(match) -> AuthorityMatch:
+    """Service-layer AuthorityMatch -> response model"""
+    return AuthorityMatch(
+        authority=AuthorityInfo(
+            name=match.authority.name,
+            designation=match.authority.designation,
+            department=match.authority.department,
+            level=match.authority.level.value,
+            address=match.authority.address_template,
+            rti_fee=match.authority.rti_fee,
+            notes=match.authority.notes
+        ),
+        confidence=match.confidence,
+        match_reason=match.match_reason,
+        is_primary=match.is_primary
+    )
+
+
+def _to_response(result: ResolutionResult) -> AuthorityResponse:
+    """Convert a ResolutionResult to the API response"""
+    primary = None
+    if result.primary:
+        primary = _to_match(result.primary)
+        primary.is_primary = True
+    
+    return AuthorityResponse(
+        primary=primary,
+        matches=[_to_match(match) for match in result.matches],
+        category=result.category,
+        department=result.department,
+        suggestions=result.suggestions,
+        requires_state_selection=result.requires_state_selection,
+        timestamp=datetime.now()
+    )
+
+
 @router.post(
     "/authority",
     response_model=AuthorityResponse,
@@ -169,15 +232,7 @@ async def suggest_authority(request: AuthorityRequest) -> AuthorityResponse:
     logger.info(f"Authority request: category={request.issue_category}, state={request.state}, is_rti={request.is_rti}")
     
     try:
-        # Validate category
-        valid_categories = get_all_categories()
-        category = request.issue_category.lower().strip()
-        
-        if category not in valid_categories:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid issue_category. Valid options: {valid_categories}"
-            )
+        category = _validate_category(request.issue_category)
         
         # Resolve authority
         result = resolve_authority(
@@ -189,55 +244,9 @@ async def suggest_authority(request: AuthorityRequest) -> AuthorityResponse:
             extracted_entities=request.extracted_entities
         )
         
-        # Convert to response format
-        matches = []
-        for match in result.matches:
-            auth_info = AuthorityInfo(
-                name=match.authority.name,
-                designation=match.authority.designation,
-                department=match.authority.department,
-                level=match.authority.level.value,
-                address=match.authority.address_template,
-                rti_fee=match.authority.rti_fee,
-                notes=match.authority.notes
-            )
-            matches.append(AuthorityMatch(
-                authority=auth_info,
-                confidence=match.confidence,
-                match_reason=match.match_reason,
-                is_primary=match.is_primary
-            ))
+        response = _to_response(result)
         
-        # Build primary
-        primary = None
-        if result.primary:
-            auth_info = AuthorityInfo(
-                name=result.primary.authority.name,
-                designation=result.primary.authority.designation,
-                department=result.primary.authority.department,
-                level=result.primary.authority.level.value,
-                address=result.primary.authority.address_template,
-                rti_fee=result.primary.authority.rti_fee,
-                notes=result.primary.authority.notes
-            )
-            primary = AuthorityMatch(
-                authority=auth_info,
-                confidence=result.primary.confidence,
-                match_reason=result.primary.match_reason,
-                is_primary=True
-            )
-        
-        response = AuthorityResponse(
-            primary=primary,
-            matches=matches,
-            category=result.category,
-            department=result.department,
-            suggestions=result.suggestions,
-            requires_state_selection=result.requires_state_selection,
-            timestamp=datetime.now()
-        )
-        
-        logger.info(f"Authority resolved: {len(matches)} matches, primary={primary.authority.designation if primary else 'None'}")
+        logger.info(f"Authority resolved: {len(response.matches)} matches, primary={response.primary.authority.designation if response.primary else 'None'}")
         
         return response
         
@@ -251,6 +260,49 @@ async def suggest_authority(request: AuthorityRequest) -> AuthorityResponse:
         )
 
 
+@router.post(
+    "/authority/resolve/batch",
+    response_model=BatchAuthorityResponse,
+    summary="Resolve authorities for many issues",
+    description="""
+    Resolves up to 100 issues in one call, with the same rules as /authority.
+    Results are returned in request order. An invalid category anywhere in
+    the batch rejects the whole batch with 400 (the message names its index).
+    """,
+    responses={
+        200: {"description": "Authorities resolved successfully"},
+        400: {"description": "Invalid category in the batch"},
+        500: {"description": "Resolution failed"}
+    }
+)
+async def suggest_authorities_batch(request: BatchAuthorityRequest) -> BatchAuthorityResponse:
+    """Resolve every issue in the batch against the precomputed authority index"""
+    try:
+        items = [
+            dict(
+                category=_validate_category(item.issue_category, f"requests[{index}].issue_category"),
+                state=item.state,
+                district=item.district,
+                area=item.area,
+                is_rti=item.is_rti,
+                extracted_entities=item.extracted_entities
+            )
+            for index, item in enumerate(request.requests)
+        ]
+        
+        results = resolve_authorities(items)
+        return BatchAuthorityResponse(results=[_to_response(result) for result in results])
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch authority resolution failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch authority resolution failed: {str(e)}"
+        )
+
+
 @router.get(
     "/authority/categories",
     response_model=List[CategoryInfo],
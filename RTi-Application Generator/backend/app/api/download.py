@@ -3,19 +3,23 @@ Document Download API Router
 Exports documents in PDF, DOCX, XLSX formats.
 
 DESIGN PRINCIPLE:
-- Documents generated on-demand
-- Streamed directly to user
-- NO server-side storage (privacy by design)
+- Documents generated on-demand, off the event loop
+- Streamed directly to user in chunks
+- NO server-side storage (privacy by design) - large documents spill to
+  anonymous temp files that are deleted as soon as the response ends
 """
 
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
+import asyncio
 from loguru import logger
 
-from app.services.document_generator import get_document_generator
+from app.services.document_generator import RenderedDocument, build_filename, get_document_generator
+from app.services.executor import run_in_executor, ExecutorSaturatedError
 from app.config import get_settings
 
 router = APIRouter()
@@ -76,6 +80,126 @@ class DownloadRequest(BaseModel):
         }
 
 
+class BundleRequest(BaseModel):
+    """Request body for downloading all formats as one ZIP"""
+    draft_text: str = Field(
+        ...,
+        min_length=100,
+        description="Complete draft text to convert to documents"
+    )
+    document_type: str = Field(
+        ...,
+        description="Type of document (information_request, grievance, etc.)"
+    )
+    formats: List[str] = Field(
+        default=["pdf", "docx", "xlsx"],
+        description="Formats to include in the ZIP"
+    )
+    applicant: ApplicantInfo
+    authority: Optional[AuthorityInfo] = None
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+VALID_FORMATS = ["pdf", "docx", "xlsx"]
+
+# Document rendering gets its own bounded pool so downloads cannot starve inference
+DOCUMENT_POOL = "documents"
+
+
+def _validate_format(format: str) -> str:
+    """Normalize a format name; raises HTTP 400 if unsupported or disabled"""
+    format_lower = format.lower().strip()
+    
+    if format_lower not in VALID_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid format. Supported: {VALID_FORMATS}"
+        )
+    
+    # Check XLSX feature flag
+    if format_lower == "xlsx" and not settings.FEATURE_XLSX_EXPORT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="XLSX export is currently disabled"
+        )
+    
+    return format_lower
+
+
+def _document_details(
+    applicant: ApplicantInfo,
+    authority: Optional[AuthorityInfo],
+    document_type: str
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Dict[str, Any]]:
+    """Applicant/authority details (for XLSX) and metadata for the generator"""
+    applicant_details = {
+        "name": applicant.name,
+        "address": applicant.address,
+        "state": applicant.state,
+        "district": applicant.district,
+        "phone": applicant.phone,
+        "email": applicant.email
+    }
+    
+    authority_details = None
+    if authority:
+        authority_details = {
+            "department": authority.department_name,
+            "address": authority.department_address,
+            "designation": authority.designation
+        }
+    
+    # The generator stamps "generated_at" itself, to the minute, so cached output stays accurate
+    metadata = {
+        "document_type": document_type
+    }
+    return applicant_details, authority_details, metadata
+
+
+async def _render_off_loop(
+    format: str,
+    draft_text: str,
+    document_type: str,
+    applicant: ApplicantInfo,
+    authority: Optional[AuthorityInfo]
+) -> RenderedDocument:
+    """Render one document in the documents pool"""
+    applicant_details, authority_details, metadata = _document_details(applicant, authority, document_type)
+    return await run_in_executor(
+        get_document_generator().render,
+        format=format,
+        draft_text=draft_text,
+        document_type=document_type,
+        applicant_name=applicant.name,
+        applicant_details=applicant_details,
+        authority_details=authority_details,
+        metadata=metadata,
+        spool_threshold=settings.DOWNLOAD_SPOOL_THRESHOLD_MB * 1024 * 1024,
+        pool=DOCUMENT_POOL
+    )
+
+
+def _stream_document(document: RenderedDocument, headers: Dict[str, str]) -> StreamingResponse:
+    """
+    Stream a rendered document in fixed-size chunks.
+    The file is closed when streaming ends or the client disconnects.
+    """
+    return StreamingResponse(
+        document.iter_chunks(settings.DOWNLOAD_CHUNK_SIZE_KB * 1024),
+        media_type=document.content_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{document.filename}"',
+            "Content-Length": str(document.size),
+            **headers,
+            "X-Generated-At": datetime.now().isoformat()
+        },
+        background=BackgroundTask(document.close)
+    )
+
+
 # =============================================================================
 # API ENDPOINTS
 # =============================================================================
@@ -114,74 +238,27 @@ async def download_document(request: DownloadRequest):
     logger.info(f"Download request: format={request.format}, type={request.document_type}")
     
     try:
-        # Validate format
-        valid_formats = ["pdf", "docx", "xlsx"]
-        format_lower = request.format.lower().strip()
-        
-        if format_lower not in valid_formats:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid format. Supported: {valid_formats}"
-            )
+        format_lower = _validate_format(request.format)
         
-        # Check XLSX feature flag
-        if format_lower == "xlsx" and not settings.FEATURE_XLSX_EXPORT:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="XLSX export is currently disabled"
-            )
-        
-        # Prepare applicant details for XLSX
-        applicant_details = {
-            "name": request.applicant.name,
-            "address": request.applicant.address,
-            "state": request.applicant.state,
-            "district": request.applicant.district,
-            "phone": request.applicant.phone,
-            "email": request.applicant.email
-        }
-        
-        # Prepare authority details for XLSX
-        authority_details = None
-        if request.authority:
-            authority_details = {
-                "department": request.authority.department_name,
-                "address": request.authority.department_address,
-                "designation": request.authority.designation
-            }
-        
-        # Metadata
-        metadata = {
-            "generated_at": datetime.now().isoformat(),
-            "document_type": request.document_type
-        }
-        
-        # Generate document
-        generator = get_document_generator()
-        buffer, filename, content_type = generator.generate(
-            format=format_lower,
-            draft_text=request.draft_text,
-            document_type=request.document_type,
-            applicant_name=request.applicant.name,
-            applicant_details=applicant_details,
-            authority_details=authority_details,
-            metadata=metadata
+        # Generate document off the event loop (unchanged drafts come from
+        # the in-memory output cache)
+        document = await _render_off_loop(
+            format_lower,
+            request.draft_text,
+            request.document_type,
+            request.applicant,
+            request.authority
         )
         
-        logger.info(f"Document generated: {filename}")
+        logger.info(f"Document generated: {document.filename}")
         
         # Stream response
-        return StreamingResponse(
-            buffer,
-            media_type=content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "X-Document-Type": request.document_type,
-                "X-Generated-At": datetime.now().isoformat()
-            }
-        )
+        return _stream_document(document, {
+            "X-Document-Type": request.document_type,
+            "X-Document-Cache": "HIT" if document.cache_hit else "MISS"
+        })
         
-    except HTTPException:
+    except (HTTPException, ExecutorSaturatedError):
         raise
     except ValueError as e:
         logger.error(f"Invalid request: {str(e)}")
@@ -230,6 +307,85 @@ async def download_xlsx(request: DownloadRequest):
     return await download_document(request)
 
 
+@router.post(
+    "/download/bundle",
+    summary="Download all formats as ZIP",
+    description="""
+    Generate the draft in several formats concurrently and download them
+    as a single ZIP archive (PDF, DOCX and XLSX by default).
+    """,
+    responses={
+        200: {"description": "ZIP archive stream", "content": {"application/zip": {}}},
+        400: {"description": "Invalid format or input"},
+        500: {"description": "Document generation failed"}
+    }
+)
+async def download_bundle(request: BundleRequest):
+    """Generate requested formats concurrently and stream them as one ZIP"""
+    logger.info(f"Bundle request: formats={request.formats}, type={request.document_type}")
+    
+    try:
+        formats = list(dict.fromkeys(_validate_format(f) for f in request.formats))
+        if not formats:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At least one format required. Supported: {VALID_FORMATS}"
+            )
+        
+        results = await asyncio.gather(
+            *[
+                _render_off_loop(fmt, request.draft_text, request.document_type,
+                                 request.applicant, request.authority)
+                for fmt in formats
+            ],
+            return_exceptions=True
+        )
+        documents = [r for r in results if isinstance(r, RenderedDocument)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            for document in documents:
+                document.close()
+            raise errors[0]
+        
+        generator = get_document_generator()
+        filename = build_filename(request.document_type, request.applicant.name, "zip")
+        try:
+            bundle = await run_in_executor(
+                generator.bundle,
+                documents,
+                filename,
+                spool_threshold=settings.DOWNLOAD_SPOOL_THRESHOLD_MB * 1024 * 1024,
+                pool=DOCUMENT_POOL
+            )
+        except BaseException:
+            # bundle() closes its inputs, but only if it got to run
+            for document in documents:
+                document.close()
+            raise
+        
+        logger.info(f"Bundle generated: {bundle.filename} ({len(documents)} documents)")
+        
+        return _stream_document(bundle, {
+            "X-Document-Type": request.document_type,
+            "X-Bundle-Formats": ",".join(formats)
+        })
+        
+    except (HTTPException, ExecutorSaturatedError):
+        raise
+    except ValueError as e:
+        logger.error(f"Invalid request: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Bundle generation failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Document generation failed: {str(e)}"
+        )
+
+
 @router.get(
     "/download/formats",
     summary="List supported formats",
@@ -16,7 +16,8 @@ from loguru import logger
 
 from app.services.draft_assembler import get_draft_assembler, DocumentType
 from app.services.inference_orchestrator import IntentType
-from app.services.nlp import translate_to_hindi
+from app.services.nlp import translate_many_to_hindi
+from app.services.executor import run_in_executor, ExecutorSaturatedError
 from app.utils.text_sanitizer import clean_input, warn_about_pii
 from app.utils.tone import suggest_tone
 from app.config import get_settings
@@ -209,6 +210,7 @@ class DraftResponse(BaseModel):
         200: {"description": "Draft generated successfully"},
         400: {"description": "Invalid document type or input"},
         422: {"description": "Validation error"},
+        429: {"description": "Draft workers saturated, retry later"},
         500: {"description": "Draft generation failed"}
     }
 )
@@ -268,24 +270,33 @@ async def generate_draft(request: DraftRequest) -> DraftResponse:
         if language == "hindi":
              try:
                  from app.utils.language_normalizer import detect_language
-                 # Try to detect if input is English and wants Hindi output
+                 # Try to detect if input is English and wants Hindi output;
+                 # both fields go through one batched translation call
+                 to_translate = {}
                  if detect_language(cleaned_description) != "hi":
-                     logger.info("Translating description to Hindi")
-                     trans_desc = translate_to_hindi(cleaned_description)
-                     if trans_desc:
-                         final_description = trans_desc
-                         
+                     to_translate["description"] = cleaned_description
                  if cleaned_specific and detect_language(cleaned_specific) != "hi":
-                     logger.info("Translating specific request to Hindi")
-                     trans_spec = translate_to_hindi(cleaned_specific)
-                     if trans_spec:
-                         final_specific = trans_spec
+                     to_translate["specific"] = cleaned_specific
+                 
+                 if to_translate:
+                     logger.info(f"Translating {', '.join(to_translate)} to Hindi")
+                     translated = dict(zip(
+                         to_translate,
+                         await run_in_executor(translate_many_to_hindi, list(to_translate.values()))
+                     ))
+                     if translated.get("description"):
+                         final_description = translated["description"]
+                     if translated.get("specific"):
+                         final_specific = translated["specific"]
+             except ExecutorSaturatedError:
+                 raise
              except Exception as e:
                  logger.error(f"Translation preprocessing failed: {e}")
                  # Fallback to original text matches behavior if translation service fails
         
-        # Generate draft
-        result = assembler.assemble_draft(
+        # Generate draft (off the event loop)
+        result = await run_in_executor(
+            assembler.assemble_draft,
             document_type=doc_type,
             applicant_name=request.applicant.name,
             applicant_address=request.applicant.address,
@@ -386,7 +397,7 @@ async def generate_draft(request: DraftRequest) -> DraftResponse:
         
         return response
         
-    except HTTPException:
+    except (HTTPException, ExecutorSaturatedError):
         raise
     except Exception as e:
         logger.error(f"Draft generation failed: {str(e)}")
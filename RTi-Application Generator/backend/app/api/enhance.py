@@ -18,6 +18,7 @@ from datetime import datetime
 from loguru import logger
 
 from app.config import get_settings
+from app.services.executor import ExecutorSaturatedError
 
 router = APIRouter()
 settings = get_settings()
@@ -101,6 +102,7 @@ class LLMStatusResponse(BaseModel):
     enabled: bool
     model: str
     features: List[str]
+    cache: Optional[Dict[str, Any]] = None
 
 
 # =============================================================================
@@ -115,9 +117,12 @@ class LLMStatusResponse(BaseModel):
 )
 async def get_llm_status() -> LLMStatusResponse:
     """Check if LLM service is available"""
+    cache = None
     try:
-        from app.services.llm import is_llm_available
+        from app.services.llm import is_llm_available, get_openai_service
         available = is_llm_available()
+        if available:
+            cache = get_openai_service().get_cache_stats()
     except Exception:
         available = False
     
@@ -129,7 +134,8 @@ async def get_llm_status() -> LLMStatusResponse:
         available=available,
         enabled=settings.FEATURE_LLM_ASSIST,
         model=settings.OPENAI_MODEL if available else "none",
-        features=features
+        features=features,
+        cache=cache
     )
 
 
@@ -201,7 +207,7 @@ async def enhance_text(request: EnhanceTextRequest) -> EnhanceTextResponse:
             timestamp=datetime.now()
         )
         
-    except HTTPException:
+    except (HTTPException, ExecutorSaturatedError):
         raise
     except Exception as e:
         logger.error(f"LLM enhancement failed: {e}")
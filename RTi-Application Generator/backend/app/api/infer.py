@@ -14,8 +14,9 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from loguru import logger
 
-from app.services.inference_orchestrator import run_inference, IntentType, DocumentType
+from app.services.inference_orchestrator import run_inference, analyze_batch, InferenceResult, IntentType, DocumentType
 from app.services.nlp.confidence_gate import ConfidenceLevel
+from app.services.executor import get_inference_executor, ExecutorSaturatedError
 from app.utils.text_sanitizer import warn_about_pii, clean_input
 from app.config import get_settings
 
@@ -39,6 +40,10 @@ class InferenceRequest(BaseModel):
         default="english",
         description="Language of input (english, hindi)"
     )
+    include_timings: bool = Field(
+        default=False,
+        description="Return per-stage wall time and call counts in stage_timings"
+    )
     
     class Config:
         json_schema_extra = {
@@ -83,6 +88,12 @@ class ConfidenceInfo(BaseModel):
     message: str
 
 
+class StageTiming(BaseModel):
+    """Wall time spent in one pipeline stage"""
+    ms: float
+    calls: int
+
+
 class PIIWarning(BaseModel):
     """PII detection warnings"""
     has_pii: bool
@@ -125,6 +136,10 @@ class InferenceResponse(BaseModel):
     # Metadata
     timestamp: datetime
     processing_time_ms: float
+    stage_timings: Optional[Dict[str, StageTiming]] = Field(
+        default=None,
+        description="Per-stage timings (only when include_timings is set)"
+    )
     
     class Config:
         json_schema_extra = {
@@ -149,6 +164,101 @@ class InferenceResponse(BaseModel):
         }
 
 
+class BatchInferenceRequest(BaseModel):
+    """Request body for batch inference"""
+    texts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Issue descriptions to analyze (10-5000 characters each)"
+    )
+    language: str = Field(
+        default="english",
+        description="Language of input (english, hindi)"
+    )
+    include_timings: bool = Field(
+        default=False,
+        description="Return per-stage timings for every result"
+    )
+
+
+class BatchInferenceResponse(BaseModel):
+    """Response from batch inference endpoint"""
+    results: List[InferenceResponse]
+    count: int
+    processing_time_ms: float
+
+
+# =============================================================================
+# RESPONSE BUILDING
+# =============================================================================
+
+def _build_response(
+    result: InferenceResult,
+    pii_result: Dict[str, Any],
+    processing_time: float,
+    include_timings: bool = False
+) -> InferenceResponse:
+    """Map an InferenceResult to the API response model"""
+    # Map confidence level to string
+    confidence_level_map = {
+        ConfidenceLevel.HIGH: "high",
+        ConfidenceLevel.MEDIUM: "medium",
+        ConfidenceLevel.LOW: "low",
+        ConfidenceLevel.VERY_LOW: "very_low"
+    }
+    
+    # Build confidence message
+    confidence_messages = {
+        "high": f"High confidence ({result.confidence:.0%}) - auto-applied",
+        "medium": f"Medium confidence ({result.confidence:.0%}) - please verify",
+        "low": f"Low confidence ({result.confidence:.0%}) - please select from options",
+        "very_low": f"Very low confidence ({result.confidence:.0%}) - manual input recommended"
+    }
+    
+    confidence_level = confidence_level_map.get(result.confidence_level, "medium")
+    
+    # Build department mapping
+    dept_mapping = None
+    if result.department_mapping and result.department_mapping.get("primary_category"):
+        dept_mapping = DepartmentMatch(
+            category=result.department_mapping["primary_category"],
+            departments=result.department_mapping.get("primary_departments", []),
+            confidence=result.department_mapping["matches"][0]["confidence"] if result.department_mapping.get("matches") else 0.5
+        )
+    
+    return InferenceResponse(
+        intent=result.intent.value,
+        document_type=result.document_type.value,
+        confidence=ConfidenceInfo(
+            score=result.confidence,
+            level=confidence_level,
+            requires_confirmation=result.requires_confirmation,
+            message=confidence_messages[confidence_level]
+        ),
+        extracted_entities=result.extracted_entities,
+        key_phrases=result.key_phrases,
+        legal_triggers=LegalTriggers(
+            rti_sections=result.legal_triggers.get("rti_sections", []),
+            grievance_markers=result.legal_triggers.get("grievance_markers", []),
+            suggested_citations=result.legal_triggers.get("suggested_citations", [])
+        ),
+        department_mapping=dept_mapping,
+        sentiment=result.sentiment,
+        suggestions=result.suggestions,
+        explanation=result.explanation,
+        decision_path=result.decision_path,
+        pii_warnings=PIIWarning(
+            has_pii=pii_result["has_pii"],
+            warnings=pii_result.get("warnings", []),
+            types_found=pii_result.get("types_found", [])
+        ),
+        timestamp=datetime.now(),
+        processing_time_ms=processing_time,
+        stage_timings=result.stage_timings if include_timings else None
+    )
+
+
 # =============================================================================
 # API ENDPOINT
 # =============================================================================
@@ -169,13 +279,17 @@ class InferenceResponse(BaseModel):
     2. spaCy NLP (entity extraction)
     3. Confidence Gate (threshold checking)
     4. DistilBERT (only if confidence is low)
-    
+
+    Set `include_timings` to get the wall time and call count of each stage
+    in `stage_timings`; the same timings are aggregated on `/metrics`.
+
     **Important:** This endpoint provides SUGGESTIONS. The user must confirm the intent.
     """,
     responses={
         200: {"description": "Successful inference"},
         400: {"description": "Invalid input"},
         422: {"description": "Validation error"},
+        429: {"description": "Inference workers saturated, retry later"},
         500: {"description": "Internal server error"}
     }
 )
@@ -202,75 +316,19 @@ async def infer_intent(request: InferenceRequest) -> InferenceResponse:
         # Check for PII
         pii_result = warn_about_pii(cleaned_text)
         
-        # Run inference
-        result = run_inference(cleaned_text, request.language)
+        # Run inference off the event loop (CPU-bound: rules, spaCy, DistilBERT)
+        result = await get_inference_executor().run(run_inference, cleaned_text, request.language)
         
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
         
-        # Map confidence level to string
-        confidence_level_map = {
-            ConfidenceLevel.HIGH: "high",
-            ConfidenceLevel.MEDIUM: "medium",
-            ConfidenceLevel.LOW: "low",
-            ConfidenceLevel.VERY_LOW: "very_low"
-        }
-        
-        # Build confidence message
-        confidence_messages = {
-            "high": f"High confidence ({result.confidence:.0%}) - auto-applied",
-            "medium": f"Medium confidence ({result.confidence:.0%}) - please verify",
-            "low": f"Low confidence ({result.confidence:.0%}) - please select from options",
-            "very_low": f"Very low confidence ({result.confidence:.0%}) - manual input recommended"
-        }
-        
-        confidence_level = confidence_level_map.get(result.confidence_level, "medium")
-        
-        # Build department mapping
-        dept_mapping = None
-        if result.department_mapping and result.department_mapping.get("primary_category"):
-            dept_mapping = DepartmentMatch(
-                category=result.department_mapping["primary_category"],
-                departments=result.department_mapping.get("primary_departments", []),
-                confidence=result.department_mapping["matches"][0]["confidence"] if result.department_mapping.get("matches") else 0.5
-            )
-        
-        # Build response
-        response = InferenceResponse(
-            intent=result.intent.value,
-            document_type=result.document_type.value,
-            confidence=ConfidenceInfo(
-                score=result.confidence,
-                level=confidence_level,
-                requires_confirmation=result.requires_confirmation,
-                message=confidence_messages[confidence_level]
-            ),
-            extracted_entities=result.extracted_entities,
-            key_phrases=result.key_phrases,
-            legal_triggers=LegalTriggers(
-                rti_sections=result.legal_triggers.get("rti_sections", []),
-                grievance_markers=result.legal_triggers.get("grievance_markers", []),
-                suggested_citations=result.legal_triggers.get("suggested_citations", [])
-            ),
-            department_mapping=dept_mapping,
-            sentiment=result.sentiment,
-            suggestions=result.suggestions,
-            explanation=result.explanation,
-            decision_path=result.decision_path,
-            pii_warnings=PIIWarning(
-                has_pii=pii_result["has_pii"],
-                warnings=pii_result.get("warnings", []),
-                types_found=pii_result.get("types_found", [])
-            ),
-            timestamp=datetime.now(),
-            processing_time_ms=processing_time
-        )
+        response = _build_response(result, pii_result, processing_time, request.include_timings)
         
         logger.info(f"Inference completed: intent={result.intent.value}, confidence={result.confidence:.2f}, time={processing_time:.2f}ms")
         
         return response
         
-    except HTTPException:
+    except (HTTPException, ExecutorSaturatedError):
         raise
     except Exception as e:
         logger.error(f"Inference failed: {str(e)}")
@@ -279,3 +337,69 @@ async def infer_intent(request: InferenceRequest) -> InferenceResponse:
             detail=f"Inference processing failed: {str(e)}"
         )
 
+
+@router.post(
+    "/infer/batch",
+    response_model=BatchInferenceResponse,
+    summary="Analyze several inputs in one call",
+    description="""
+    Runs the same pipeline as `/infer` on up to 50 texts.
+    All texts are parsed by spaCy in a single batched pass (`nlp.pipe`),
+    which is considerably cheaper than separate `/infer` calls.
+    
+    Results are returned in the same order as the input texts.
+    """,
+    responses={
+        200: {"description": "Successful inference"},
+        400: {"description": "Invalid input"},
+        422: {"description": "Validation error"},
+        429: {"description": "Inference workers saturated, retry later"},
+        500: {"description": "Internal server error"}
+    }
+)
+async def infer_batch(request: BatchInferenceRequest) -> BatchInferenceResponse:
+    """Analyze a batch of inputs with one shared spaCy pass"""
+    import time
+    start_time = time.time()
+    
+    logger.info(f"Batch inference request received: {len(request.texts)} texts")
+    
+    try:
+        cleaned_texts = []
+        for index, text in enumerate(request.texts):
+            cleaned = clean_input(text)
+            if len(cleaned) < 10 or len(text) > 5000:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Text at index {index} must be 10-5000 characters after cleaning."
+                )
+            cleaned_texts.append(cleaned)
+        
+        pii_results = [warn_about_pii(text) for text in cleaned_texts]
+        
+        results = await get_inference_executor().run(analyze_batch, cleaned_texts, request.language)
+        
+        processing_time = (time.time() - start_time) * 1000
+        per_item_time = processing_time / len(results)
+        
+        responses = [
+            _build_response(result, pii_result, per_item_time, request.include_timings)
+            for result, pii_result in zip(results, pii_results)
+        ]
+        
+        logger.info(f"Batch inference completed: {len(responses)} texts, time={processing_time:.2f}ms")
+        
+        return BatchInferenceResponse(
+            results=responses,
+            count=len(responses),
+            processing_time_ms=processing_time
+        )
+        
+    except (HTTPException, ExecutorSaturatedError):
+        raise
+    except Exception as e:
+        logger.error(f"Batch inference failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch inference processing failed: {str(e)}"
+        )
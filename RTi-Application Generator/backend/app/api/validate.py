@@ -4,14 +4,17 @@ Endpoint for validating and scoring RTI/Complaint drafts.
 """
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from loguru import logger
 
 from ..services.validation_engine import get_validator, ValidationResult, ValidationIssue
+from ..services.executor import run_in_executor, ExecutorSaturatedError
 
 router = APIRouter(prefix="/validate", tags=["Validation"])
 
+MAX_BATCH_SIZE = 100
+
 
 class ValidationRequest(BaseModel):
     """Request for validation"""
@@ -26,6 +29,11 @@ class ValidationRequest(BaseModel):
     language: str = "english"
 
 
+class BatchValidationRequest(BaseModel):
+    """Several RTI requests validated in one call"""
+    requests: List[ValidationRequest] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
 class ValidationIssueResponse(BaseModel):
     """Single validation issue"""
     code: str
@@ -48,6 +56,11 @@ class ValidationResponse(BaseModel):
     summary_hi: str
 
 
+class BatchValidationResponse(BaseModel):
+    """Results in request order"""
+    results: List[ValidationResponse]
+
+
 class EditValidationRequest(BaseModel):
     """Request to validate user edits"""
     original_text: str
@@ -113,6 +126,46 @@ def generate_summary(result: ValidationResult, language: str = "english") -> tup
     return summary, summary_hi
 
 
+def _request_fields(request: ValidationRequest) -> Dict[str, str]:
+    return dict(
+        information_sought=request.information_sought,
+        time_period=request.time_period or "",
+        department=request.department or "",
+        record_type=request.record_type or "",
+        applicant_name=request.applicant_name or "",
+        applicant_address=request.applicant_address or "",
+        applicant_state=request.applicant_state or "",
+    )
+
+
+def _to_response(result: ValidationResult, language: str) -> ValidationResponse:
+    """Convert a ValidationResult to the API response in the requested language"""
+    issues_response = [
+        ValidationIssueResponse(
+            code=issue.code,
+            message=issue.message if language == "english" else issue.message_hi,
+            severity=issue.severity.value,
+            category=issue.category.value,
+            field=issue.field,
+            suggestion=issue.suggestion if language == "english" else issue.suggestion_hi
+        )
+        for issue in result.issues
+    ]
+    
+    summary, summary_hi = generate_summary(result, language)
+    
+    return ValidationResponse(
+        is_valid=result.is_valid,
+        can_generate=result.can_generate,
+        score=result.score,
+        grade=score_to_grade(result.score),
+        scores_breakdown=result.scores_breakdown,
+        issues=issues_response,
+        summary=summary,
+        summary_hi=summary_hi
+    )
+
+
 @router.post("/rti", response_model=ValidationResponse)
 async def validate_rti_request(request: ValidationRequest):
     """
@@ -129,45 +182,42 @@ async def validate_rti_request(request: ValidationRequest):
     try:
         validator = get_validator()
         
-        result = validator.validate(
-            information_sought=request.information_sought,
-            time_period=request.time_period or "",
-            department=request.department or "",
-            record_type=request.record_type or "",
-            applicant_name=request.applicant_name or "",
-            applicant_address=request.applicant_address or "",
-            applicant_state=request.applicant_state or "",
-        )
+        result = await run_in_executor(validator.validate, **_request_fields(request))
         
-        # Convert issues to response format
-        issues_response = [
-            ValidationIssueResponse(
-                code=issue.code,
-                message=issue.message if request.language == "english" else issue.message_hi,
-                severity=issue.severity.value,
-                category=issue.category.value,
-                field=issue.field,
-                suggestion=issue.suggestion if request.language == "english" else issue.suggestion_hi
-            )
-            for issue in result.issues
-        ]
+        return _to_response(result, request.language)
         
-        summary, summary_hi = generate_summary(result, request.language)
+    except ExecutorSaturatedError:
+        raise
+    except Exception as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
+
+
+@router.post("/rti/batch", response_model=BatchValidationResponse)
+async def validate_rti_batch(request: BatchValidationRequest):
+    """
+    Validate up to MAX_BATCH_SIZE RTI requests in one call.
+    
+    Results are returned in request order, each in the same shape as /validate/rti.
+    """
+    try:
+        validator = get_validator()
         
-        return ValidationResponse(
-            is_valid=result.is_valid,
-            can_generate=result.can_generate,
-            score=result.score,
-            grade=score_to_grade(result.score),
-            scores_breakdown=result.scores_breakdown,
-            issues=issues_response,
-            summary=summary,
-            summary_hi=summary_hi
+        results = await run_in_executor(
+            validator.validate_many,
+            [_request_fields(item) for item in request.requests]
         )
         
+        return BatchValidationResponse(results=[
+            _to_response(result, item.language)
+            for result, item in zip(results, request.requests)
+        ])
+        
+    except ExecutorSaturatedError:
+        raise
     except Exception as e:
-        logger.error(f"Validation error: {e}")
-        raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
+        logger.error(f"Batch validation error: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch validation failed: {str(e)}")
 
 
 @router.post("/edit", response_model=EditValidationResponse)
@@ -181,7 +231,8 @@ async def validate_edit(request: EditValidationRequest):
     try:
         validator = get_validator()
         
-        is_safe, issues = validator.validate_edit(
+        is_safe, issues = await run_in_executor(
+            validator.validate_edit,
             original_text=request.original_text,
             edited_text=request.edited_text,
             document_type=request.document_type
@@ -207,6 +258,8 @@ async def validate_edit(request: EditValidationRequest):
             warnings=warnings
         )
         
+    except ExecutorSaturatedError:
+        raise
     except Exception as e:
         logger.error(f"Edit validation error: {e}")
         raise HTTPException(status_code=500, detail=f"Edit validation failed: {str(e)}")
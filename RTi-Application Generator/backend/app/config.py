@@ -72,8 +72,22 @@ class Settings(BaseSettings):
     # NLP Configuration
     # ===================
     SPACY_MODEL: str = Field(default="en_core_web_sm", description="spaCy model to use")
+    SPACY_BATCH_ENABLED: bool = Field(default=True, description="Micro-batch concurrent spaCy parses through nlp.pipe")
+    SPACY_BATCH_MAX_SIZE: int = Field(default=32, description="Max texts per spaCy micro-batch")
+    SPACY_BATCH_MAX_WAIT_MS: float = Field(default=5.0, description="Max time a parse waits for its batch to fill")
     ENABLE_DISTILBERT: bool = Field(default=False, description="Enable DistilBERT for semantic analysis (memory intensive)")
     DISTILBERT_MODEL: str = Field(default="distilbert-base-uncased", description="DistilBERT model")
+    EMBEDDING_CACHE_SIZE: int = Field(default=1000, description="Max embeddings kept in the in-process LRU")
+    EMBEDDING_STORE_PATH: str = Field(default="", description="Directory for the memory-mapped embedding store (empty = disabled)")
+    EMBEDDING_STORE_READ_ONLY: bool = Field(default=False, description="Only read the embedding store, never write to it")
+    EMBEDDING_STORE_FLUSH_EVERY: int = Field(default=64, description="Write new embeddings to disk after this many misses")
+    TRANSLATION_CACHE_PATH: str = Field(default="translation_cache.db", description="SQLite file for cached sentence translations (empty = memory only)")
+    TRANSLATION_CACHE_SIZE: int = Field(default=4096, description="Max sentence translations kept in memory")
+    TRANSLATION_BATCH_SIZE: int = Field(default=16, description="Sentences per translation model call")
+    TRANSLATION_MAX_CHARS: int = Field(default=1000, description="Longer sentences are wrapped before translation")
+    MODEL_WARMUP_TIMEOUT_SECONDS: float = Field(default=300, description="Max time startup waits for parallel model warm-up")
+    MODEL_IDLE_UNLOAD_SECONDS: int = Field(default=1800, description="Unload heavy models (DistilBERT, translator) idle this long (0 = never)")
+    MODEL_IDLE_CHECK_SECONDS: int = Field(default=60, description="How often idle models are checked")
     
     # ===================
     # Confidence Thresholds
@@ -88,6 +102,19 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = Field(default=True, description="Enable rate limiting")
     RATE_LIMIT_REQUESTS: int = Field(default=100, description="Max requests per window")
     RATE_LIMIT_WINDOW_SECONDS: int = Field(default=60, description="Rate limit window in seconds")
+    RATE_LIMIT_ALGORITHM: str = Field(default="sliding_window", description="Rate limit algorithm: sliding_window, token_bucket")
+    RATE_LIMIT_BACKEND: str = Field(default="memory", description="Rate limit storage: memory (per process), sqlite (shared by workers on one host)")
+    RATE_LIMIT_SQLITE_PATH: str = Field(default="rate_limits.db", description="SQLite file for the sqlite rate limit backend")
+    RATE_LIMIT_SHARDS: int = Field(default=16, description="Lock shards for the in-memory rate limit backend")
+    RATE_LIMIT_EVICT_INTERVAL_SECONDS: int = Field(default=60, description="How often idle clients are evicted from rate limit storage")
+    
+    # ===================
+    # Execution (CPU-bound work off the event loop)
+    # ===================
+    EXECUTOR_THREAD_WORKERS: int = Field(default=4, description="Thread pool size for rule engine/spaCy/validation work")
+    EXECUTOR_TRANSFORMER_KIND: str = Field(default="thread", description="Pool type for the DistilBERT path: thread, process")
+    EXECUTOR_TRANSFORMER_WORKERS: int = Field(default=2, description="Worker count for the DistilBERT pool")
+    EXECUTOR_MAX_QUEUE: int = Field(default=32, description="Max queued tasks per pool before returning 429")
     
     # ===================
     # Logging
@@ -100,12 +127,25 @@ class Settings(BaseSettings):
     LOG_TO_FILE: bool = Field(default=False, description="Also log to file")
     LOG_FILE_PATH: str = Field(default="logs/app.log", description="Log file path")
     
+    # ===================
+    # Metrics
+    # ===================
+    METRICS_ENABLED: bool = Field(default=True, description="Aggregate stage/request timings and serve them on /metrics")
+    
     # ===================
     # Document Generation
     # ===================
     MAX_DOCUMENT_SIZE_MB: int = Field(default=10, description="Max generated document size in MB")
     PDF_FONT: str = Field(default="Helvetica", description="PDF font family")
     PDF_FONT_SIZE: int = Field(default=11, description="PDF base font size")
+    DOCUMENT_CACHE_ENABLED: bool = Field(default=True, description="Keep recently rendered documents in memory keyed by content hash")
+    DOCUMENT_CACHE_MAX_ENTRIES: int = Field(default=64, description="Max rendered documents kept in memory")
+    DOCUMENT_CACHE_MAX_MB: int = Field(default=32, description="Max total size of cached documents in MB")
+    DOCUMENT_CACHE_TTL_SECONDS: int = Field(default=300, description="How long a rendered document stays cached")
+    DOWNLOAD_CHUNK_SIZE_KB: int = Field(default=64, description="Chunk size for streamed downloads")
+    DOWNLOAD_SPOOL_THRESHOLD_MB: int = Field(default=2, description="Documents larger than this spill from memory to an anonymous temp file")
+    TEMPLATE_HOT_RELOAD: bool = Field(default=True, description="Recompile draft templates when their file changes")
+    TEMPLATE_RELOAD_CHECK_SECONDS: float = Field(default=2.0, description="Min interval between template mtime checks")
     
     # ===================
     # Security
@@ -142,6 +182,10 @@ class Settings(BaseSettings):
     OPENAI_TEMPERATURE: float = Field(default=0.3, description="Low temperature for consistent legal language")
     ENABLE_LLM_ENHANCEMENT: bool = Field(default=True, description="Enable LLM text enhancement")
     LLM_ENHANCEMENT_MODE: str = Field(default="polish", description="polish, translate, clarify")
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="Cache LLM responses for identical text/mode/tone")
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=512, description="Max cached LLM responses")
+    LLM_CACHE_TTL_SECONDS: int = Field(default=3600, description="How long a cached LLM response is reused")
+    LLM_AUDIT_LOG_SIZE: int = Field(default=100, description="LLM interactions kept in the in-memory audit log")
     
     # ===================
     # Feature Flags
@@ -11,7 +11,7 @@ Production-grade backend with:
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -19,6 +19,9 @@ from loguru import logger
 import sys
 
 from app.config import get_settings
+from app.services.executor import ExecutorSaturatedError, get_executor_stats, shutdown_executors
+from app.services.nlp.model_registry import get_model_registry
+from app.services.stage_metrics import get_metrics_registry
 from app.middleware import (
     ErrorHandlingMiddleware,
     RequestLoggingMiddleware,
@@ -84,25 +87,31 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
     
-    # Pre-load NLP models in production
+    # Load and warm all enabled NLP models in parallel in production
+    registry = get_model_registry()
     if settings.ENVIRONMENT == "production":
-        logger.info("Pre-loading NLP models...")
-        try:
-            from app.services.nlp.spacy_engine import get_nlp
-            get_nlp()
-            logger.info("spaCy model loaded")
-            
-            if settings.ENABLE_DISTILBERT:
-                from app.services.nlp.distilbert_semantic import get_model
-                get_model()
-                logger.info("DistilBERT model loaded")
-        except Exception as e:
-            logger.warning(f"Model pre-loading failed: {e}")
+        logger.info("Warming up NLP models...")
+        results = registry.warm_up(timeout=settings.MODEL_WARMUP_TIMEOUT_SECONDS)
+        logger.info(f"Model warm-up finished: {results}")
+        
+        from app.services.document_generator import get_document_generator
+        get_document_generator().warm_up()
+        logger.info("Document templates ready")
+    
+    from app.services.authority_resolver import get_authority_index
+    logger.info(f"Authority index ready: {len(get_authority_index())} entries")
+    
+    registry.start_idle_reaper(settings.MODEL_IDLE_CHECK_SECONDS)
     
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    registry.stop_idle_reaper()
+    shutdown_executors(wait=False)
+    if settings.ENABLE_DISTILBERT:
+        from app.services.nlp.distilbert_semantic import persist_embeddings
+        persist_embeddings()
 
 
 # =============================================================================
@@ -154,7 +163,12 @@ app.add_middleware(APIKeyMiddleware)
 app.add_middleware(
     RateLimitMiddleware,
     requests_per_window=settings.RATE_LIMIT_REQUESTS,
-    window_seconds=settings.RATE_LIMIT_WINDOW_SECONDS
+    window_seconds=settings.RATE_LIMIT_WINDOW_SECONDS,
+    algorithm=settings.RATE_LIMIT_ALGORITHM,
+    backend=settings.RATE_LIMIT_BACKEND,
+    sqlite_path=settings.RATE_LIMIT_SQLITE_PATH,
+    shards=settings.RATE_LIMIT_SHARDS,
+    evict_interval_seconds=settings.RATE_LIMIT_EVICT_INTERVAL_SECONDS
 )
 
 # Request logging
@@ -199,6 +213,22 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    """Backpressure: worker pool queue is full"""
+    logger.warning(f"Rejecting {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={
+            "error": "server_busy",
+            "message": "Server is processing too many requests. Please retry shortly.",
+            "retry_after_seconds": exc.retry_after_seconds,
+            "timestamp": datetime.now().isoformat()
+        },
+        headers={"Retry-After": str(exc.retry_after_seconds)}
+    )
+
+
 # =============================================================================
 # ROUTES
 # =============================================================================
@@ -208,16 +238,34 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def health_check():
     """
     Health check endpoint for load balancers and monitoring.
-    Returns application status and version.
+    Returns application status and version, plus per-model load time,
+    memory and idle time.
     """
     return {
         "status": "healthy",
         "version": settings.APP_VERSION,
         "environment": settings.ENVIRONMENT,
+        "executors": get_executor_stats(),
+        "models": get_model_registry().stats(),
         "timestamp": datetime.now().isoformat()
     }
 
 
+# Prometheus scrape target (not under /api prefix)
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics():
+    """
+    Inference stage and HTTP request duration histograms in the
+    Prometheus text exposition format.
+    """
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("Metrics disabled\n", status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(
+        get_metrics_registry().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 # API info
 @app.get("/", tags=["Info"])
 async def root():
@@ -229,11 +277,15 @@ async def root():
         "documentation": "/docs" if settings.DEBUG else "Documentation disabled in production",
         "endpoints": {
             "inference": "/api/infer",
+            "inference_batch": "/api/infer/batch",
             "draft": "/api/draft",
             "authority": "/api/authority",
+            "authority_batch": "/api/authority/resolve/batch",
             "download": "/api/download",
+            "download_bundle": "/api/download/bundle",
             "validate": "/api/validate",
-            "health": "/health"
+            "health": "/health",
+            "metrics": "/metrics"
         },
         "design_principles": [
             "Rules decide, AI assists",
@@ -9,11 +9,11 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from typing import Callable
 import time
 from datetime import datetime
-from collections import defaultdict
-import asyncio
 from loguru import logger
 
 from app.config import get_settings
+from app.services.rate_limiter import build_rate_limiter
+from app.services.stage_metrics import get_metrics_registry
 
 
 # =============================================================================
@@ -57,10 +57,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
     Logs all incoming requests and outgoing responses.
     Sanitizes sensitive data before logging.
+    Request durations are also recorded for /metrics.
     """
     
     SENSITIVE_HEADERS = {"authorization", "x-api-key", "cookie"}
-    SENSITIVE_PATHS = {"/health"}  # Don't log health checks
+    SENSITIVE_PATHS = {"/health", "/metrics"}  # Don't log health checks or scrapes
     
     async def dispatch(self, request: Request, call_next: Callable):
         # Skip logging for certain paths
@@ -91,6 +92,12 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # Add timing header
         response.headers["X-Process-Time-Ms"] = f"{duration:.2f}"
         
+        if get_settings().METRICS_ENABLED:
+            # No route takes path parameters, so a matched path is already a
+            # bounded label; anything unrouted (404s, scans) shares one label
+            path = request.url.path if "route" in request.scope else "unmatched"
+            get_metrics_registry().observe_request(request.method, path, response.status_code, duration / 1000)
+        
         return response
 
 
@@ -100,16 +107,36 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
-    Simple in-memory rate limiting.
-    For production, use Redis-based rate limiting.
+    Per-client rate limiting with O(1) state per client.
+    
+    Uses a sliding-window counter or token bucket (see services/rate_limiter.py)
+    over sharded in-memory storage, or a SQLite file shared by all workers on
+    the host. For multi-host deployments, use Redis-based rate limiting.
     """
     
-    def __init__(self, app, requests_per_window: int = 100, window_seconds: int = 60):
+    def __init__(
+        self,
+        app,
+        requests_per_window: int = 100,
+        window_seconds: int = 60,
+        algorithm: str = "sliding_window",
+        backend: str = "memory",
+        sqlite_path: str = "rate_limits.db",
+        shards: int = 16,
+        evict_interval_seconds: float = 60.0
+    ):
         super().__init__(app)
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
-        self.request_counts = defaultdict(list)
-        self._lock = asyncio.Lock()
+        self.limiter = build_rate_limiter(
+            requests_per_window,
+            window_seconds,
+            algorithm=algorithm,
+            backend=backend,
+            sqlite_path=sqlite_path,
+            shards=shards,
+            evict_interval_seconds=evict_interval_seconds
+        )
     
     def _get_client_id(self, request: Request) -> str:
         """Get client identifier (IP address)"""
@@ -130,48 +157,43 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if not settings.RATE_LIMIT_ENABLED:
             return await call_next(request)
         
-        # Skip rate limiting for health checks
-        if request.url.path == "/health":
+        # Skip rate limiting for health checks and metrics scrapes
+        if request.url.path in ("/health", "/metrics"):
             return await call_next(request)
         
         client_id = self._get_client_id(request)
         current_time = time.time()
         
-        async with self._lock:
-            # Clean old entries
-            window_start = current_time - self.window_seconds
-            self.request_counts[client_id] = [
-                t for t in self.request_counts[client_id] if t > window_start
-            ]
-            
-            # Check rate limit
-            if len(self.request_counts[client_id]) >= self.requests_per_window:
-                logger.warning(f"Rate limit exceeded for client: {client_id}")
-                return JSONResponse(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    content={
-                        "error": "rate_limit_exceeded",
-                        "message": f"Too many requests. Limit: {self.requests_per_window} requests per {self.window_seconds} seconds.",
-                        "retry_after_seconds": self.window_seconds
-                    },
-                    headers={
-                        "Retry-After": str(self.window_seconds),
-                        "X-RateLimit-Limit": str(self.requests_per_window),
-                        "X-RateLimit-Remaining": "0",
-                        "X-RateLimit-Reset": str(int(window_start + self.window_seconds))
-                    }
-                )
-            
-            # Record this request
-            self.request_counts[client_id].append(current_time)
-            remaining = self.requests_per_window - len(self.request_counts[client_id])
+        try:
+            decision = await self.limiter.hit_async(client_id, current_time)
+        except Exception as e:
+            # Fail open: a storage hiccup must not take the API down
+            logger.warning(f"Rate limiter unavailable, allowing request: {e}")
+            return await call_next(request)
+        
+        if not decision.allowed:
+            logger.warning(f"Rate limit exceeded for client: {client_id}")
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "error": "rate_limit_exceeded",
+                    "message": f"Too many requests. Limit: {self.requests_per_window} requests per {self.window_seconds} seconds.",
+                    "retry_after_seconds": decision.retry_after_seconds
+                },
+                headers={
+                    "Retry-After": str(decision.retry_after_seconds),
+                    "X-RateLimit-Limit": str(decision.limit),
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(int(current_time + decision.reset_after))
+                }
+            )
         
         # Process request
         response = await call_next(request)
         
         # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(self.requests_per_window)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        response.headers["X-RateLimit-Limit"] = str(decision.limit)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
         
         return response
 
@@ -213,7 +235,7 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
     """
     
     # Paths that don't require API key
-    PUBLIC_PATHS = {"/health", "/docs", "/redoc", "/openapi.json"}
+    PUBLIC_PATHS = {"/health", "/metrics", "/docs", "/redoc", "/openapi.json"}
     
     async def dispatch(self, request: Request, call_next: Callable):
         settings = get_settings()
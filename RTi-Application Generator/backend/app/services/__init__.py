@@ -11,9 +11,16 @@ Package Structure:
 - document_generator.py: PDF/DOCX/XLSX generation
 """
 
-from .inference_orchestrator import InferenceResult, run_inference, IntentType, DocumentType
+from .inference_orchestrator import InferenceResult, run_inference, analyze_batch, IntentType, DocumentType
 from .draft_assembler import DraftAssembler, get_draft_assembler
-from .authority_resolver import resolve_authority, Authority, AuthorityMatch, ResolutionResult
+from .authority_resolver import (
+    resolve_authority,
+    resolve_authorities,
+    get_authority_index,
+    Authority,
+    AuthorityMatch,
+    ResolutionResult,
+)
 from .document_generator import DocumentGenerator, get_document_generator
 
 # Re-export from sub-packages for convenience
@@ -38,11 +45,14 @@ __all__ = [
     # Main services
     "InferenceResult",
     "run_inference",
+    "analyze_batch",
     "IntentType",
     "DocumentType",
     "DraftAssembler",
     "get_draft_assembler",
     "resolve_authority",
+    "resolve_authorities",
+    "get_authority_index",
     "Authority",
     "AuthorityMatch",
     "ResolutionResult",
@@ -6,9 +6,10 @@ This module uses RULES ONLY to resolve authorities.
 AI is NOT used for guessing authorities - only for entity hints from spaCy.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from loguru import logger
 
 
@@ -465,13 +466,20 @@ STATE_INFO: Dict[str, Dict[str, str]] = {
 }
 
 
+# Complaint routing: first key present in the department wins
+LOCAL_AUTHORITY_KEYS = ("je", "sho", "inspector", "tehsildar", "ae")
+DISTRICT_AUTHORITY_KEYS = ("ee", "sp", "cmo", "rto", "sdo", "fso", "deo")
+ESCALATION_WORDS = ("no response", "ignored", "months", "escalate", "higher")
+
+
 def _normalize_state(state: str) -> str:
     """Normalize state name for lookup"""
     return state.lower().replace(" ", "_").replace("-", "_")
 
 
+@lru_cache(maxsize=4096)
 def _format_address(template: str, state: str, district: Optional[str], area: Optional[str]) -> str:
-    """Format address template with location details"""
+    """Format address template with location details (memoized: inputs repeat across requests)"""
     address = template
     
     # Format state name
@@ -489,185 +497,253 @@ def _format_address(template: str, state: str, district: Optional[str], area: Op
     return address
 
 
-def resolve_authority(
-    category: str,
-    state: str,
-    district: Optional[str] = None,
-    area: Optional[str] = None,
-    is_rti: bool = True,
-    extracted_entities: Optional[Dict] = None
-) -> ResolutionResult:
-    """
-    Resolve appropriate authority for an issue.
-    
-    This is DETERMINISTIC - no AI guessing.
-    
-    Args:
-        category: Issue category (electricity, water, etc.)
-        state: State name
-        district: District name (optional)
-        area: Local area (optional)
-        is_rti: True for RTI, False for Complaint
-        extracted_entities: Entities extracted by spaCy (hints only)
-    
-    Returns:
-        ResolutionResult with matched authorities
-    """
-    logger.info(f"Resolving authority for category={category}, state={state}, is_rti={is_rti}")
-    
-    # Normalize inputs
-    category = category.lower().strip()
-    state_normalized = _normalize_state(state)
-    
-    # Get department authorities
+def _is_escalation(extracted_entities: Optional[Dict]) -> bool:
+    """Entity hints mention earlier, unanswered complaints"""
+    if not extracted_entities:
+        return False
+    text_hints = str(extracted_entities).lower()
+    return any(word in text_hints for word in ESCALATION_WORDS)
+
+
+# =============================================================================
+# RESOLUTION INDEX
+# Every (category, state, level, is_rti) combination resolved once
+# =============================================================================
+
+@dataclass(frozen=True)
+class IndexedMatch:
+    """A match whose address still has {state}/{district}/{area} placeholders"""
+    authority: Authority
+    confidence: float
+    match_reason: str
+    is_primary: bool
+
+
+@dataclass(frozen=True)
+class IndexedResolution:
+    """Location-independent part of a ResolutionResult"""
+    matches: Tuple[IndexedMatch, ...]
+    primary_index: Optional[int]
+    department: str
+    suggestions: Tuple[str, ...]
+    requires_state_selection: bool
+
+
+# Key: (category or None if unknown, normalized state or None if unknown,
+#       complaint routing level, is_rti)
+IndexKey = Tuple[Optional[str], Optional[str], AuthorityLevel, bool]
+
+
+def _plan_resolution(
+    category: Optional[str],
+    level: AuthorityLevel,
+    is_rti: bool,
+    state_known: bool
+) -> IndexedResolution:
+    """The deterministic rules, applied once per index entry"""
     dept_authorities = DEPARTMENT_AUTHORITIES.get(category, DEPARTMENT_AUTHORITIES["general"])
-    
-    matches: List[AuthorityMatch] = []
+    matches: List[IndexedMatch] = []
     suggestions: List[str] = []
     
     # For RTI - always recommend PIO first
     if is_rti and "pio" in dept_authorities:
         pio = dept_authorities["pio"]
-        formatted_address = _format_address(pio.address_template, state, district, area)
-        
-        matches.append(AuthorityMatch(
-            authority=Authority(
-                name=pio.name,
-                designation=pio.designation,
-                department=pio.department,
-                level=pio.level,
-                address_template=formatted_address,
-                rti_fee=pio.rti_fee,
-                notes=pio.notes
-            ),
-            confidence=0.95,
-            match_reason="PIO is the designated officer for RTI applications",
-            is_primary=True
+        matches.append(IndexedMatch(
+            pio, 0.95, "PIO is the designated officer for RTI applications", True
         ))
-        
         suggestions.append("RTI applications should be addressed to the Public Information Officer (PIO)")
         suggestions.append(f"RTI fee: Rs. {pio.rti_fee}/- via IPO/DD/Online")
     
-    # For Complaints - recommend appropriate level based on context
+    # For escalated complaints, go to district level directly
+    elif level == AuthorityLevel.DISTRICT:
+        key = next((k for k in DISTRICT_AUTHORITY_KEYS if k in dept_authorities), None)
+        if key:
+            matches.append(IndexedMatch(
+                dept_authorities[key], 0.85, "District-level authority for escalated complaints", True
+            ))
+        suggestions.append("For escalated complaints, consider mentioning previous complaint details")
+    
+    # For new complaints, start at local level
     else:
-        # Start with local level for complaints
-        local_keys = ["je", "sho", "inspector", "tehsildar", "ae"]
-        district_keys = ["ee", "sp", "cmo", "rto", "sdo", "fso", "deo"]
-        
-        # Check if this seems like an escalation
-        is_escalation = False
-        if extracted_entities:
-            text_hints = str(extracted_entities).lower()
-            escalation_words = ["no response", "ignored", "months", "escalate", "higher"]
-            is_escalation = any(word in text_hints for word in escalation_words)
-        
-        if is_escalation:
-            # For escalations, go to district level directly
-            for key in district_keys:
-                if key in dept_authorities:
-                    auth = dept_authorities[key]
-                    formatted_address = _format_address(auth.address_template, state, district, area)
-                    matches.append(AuthorityMatch(
-                        authority=Authority(
-                            name=auth.name,
-                            designation=auth.designation,
-                            department=auth.department,
-                            level=auth.level,
-                            address_template=formatted_address,
-                            notes=auth.notes
-                        ),
-                        confidence=0.85,
-                        match_reason="District-level authority for escalated complaints",
-                        is_primary=len(matches) == 0
-                    ))
-                    break
-            
-            suggestions.append("For escalated complaints, consider mentioning previous complaint details")
-        else:
-            # For new complaints, start at local level
-            for key in local_keys:
-                if key in dept_authorities:
-                    auth = dept_authorities[key]
-                    formatted_address = _format_address(auth.address_template, state, district, area)
-                    matches.append(AuthorityMatch(
-                        authority=Authority(
-                            name=auth.name,
-                            designation=auth.designation,
-                            department=auth.department,
-                            level=auth.level,
-                            address_template=formatted_address,
-                            notes=auth.notes
-                        ),
-                        confidence=0.85,
-                        match_reason="Local-level authority for new complaints",
-                        is_primary=True
-                    ))
-                    break
+        key = next((k for k in LOCAL_AUTHORITY_KEYS if k in dept_authorities), None)
+        if key:
+            matches.append(IndexedMatch(
+                dept_authorities[key], 0.85, "Local-level authority for new complaints", True
+            ))
     
     # Add fallback options
     if "grievance" in dept_authorities and len(matches) < 3:
-        grievance = dept_authorities["grievance"]
-        formatted_address = _format_address(grievance.address_template, state, district, area)
-        matches.append(AuthorityMatch(
-            authority=Authority(
-                name=grievance.name,
-                designation=grievance.designation,
-                department=grievance.department,
-                level=grievance.level,
-                address_template=formatted_address,
-                notes=grievance.notes
-            ),
-            confidence=0.7,
-            match_reason="Grievance redressal forum as alternative",
-            is_primary=False
+        matches.append(IndexedMatch(
+            dept_authorities["grievance"], 0.7, "Grievance redressal forum as alternative", False
         ))
     
-    # Add collector as final fallback
+    # Add collector as final fallback (unknown categories use the general
+    # department but still get the collector)
     if category != "general" and len(matches) < 3:
-        collector = DEPARTMENT_AUTHORITIES["general"]["collector"]
-        formatted_address = _format_address(collector.address_template, state, district, area)
-        matches.append(AuthorityMatch(
-            authority=Authority(
-                name=collector.name,
-                designation=collector.designation,
-                department=collector.department,
-                level=collector.level,
-                address_template=formatted_address,
-                notes=collector.notes
-            ),
-            confidence=0.6,
-            match_reason="District Collector as general authority",
-            is_primary=False
+        matches.append(IndexedMatch(
+            DEPARTMENT_AUTHORITIES["general"]["collector"], 0.6,
+            "District Collector as general authority", False
         ))
     
-    # Determine primary
-    primary = next((m for m in matches if m.is_primary), matches[0] if matches else None)
-    
-    # Check if state selection needed
-    requires_state = state_normalized not in STATE_INFO
-    if requires_state:
+    if not state_known:
         suggestions.append("Please verify your state name for accurate authority details")
     
+    primary_index = next(
+        (i for i, m in enumerate(matches) if m.is_primary), 0 if matches else None
+    )
+    department = dept_authorities.get("pio", dept_authorities.get("grievance"))
+    
+    return IndexedResolution(
+        matches=tuple(matches),
+        primary_index=primary_index,
+        department=department.department if department else "General",
+        suggestions=tuple(suggestions),
+        requires_state_selection=not state_known
+    )
+
+
+class AuthorityIndex:
+    """
+    Precomputed resolutions for every normalized
+    (category, state, level, is_rti); built once, read-only afterwards.
+    
+    Unknown categories resolve like "general" (plus the collector fallback)
+    and unknown states like any state (plus a "verify your state" hint),
+    each under a None key.
+    """
+    
+    def __init__(self):
+        plans: Dict[tuple, IndexedResolution] = {}
+        self._entries: Dict[IndexKey, IndexedResolution] = {}
+        for category in [*DEPARTMENT_AUTHORITIES, None]:
+            for state in [*STATE_INFO, None]:
+                for level in (AuthorityLevel.LOCAL, AuthorityLevel.DISTRICT):
+                    for is_rti in (True, False):
+                        plan_key = (category, level, is_rti, state is not None)
+                        plan = plans.get(plan_key)
+                        if plan is None:
+                            plan = plans[plan_key] = _plan_resolution(*plan_key)
+                        self._entries[(category, state, level, is_rti)] = plan
+        self.states: Tuple[Dict[str, str], ...] = tuple(
+            {"name": state.replace("_", " ").title(), "code": info["code"]}
+            for state, info in STATE_INFO.items()
+        )
+        self.categories: Tuple[str, ...] = tuple(DEPARTMENT_AUTHORITIES)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def lookup(self, category: str, state: str, level: AuthorityLevel, is_rti: bool) -> IndexedResolution:
+        """category and state as normalized by resolve_authority"""
+        if category not in DEPARTMENT_AUTHORITIES:
+            category = None
+        if state not in STATE_INFO:
+            state = None
+        return self._entries[(category, state, level, is_rti)]
+
+
+_authority_index: Optional[AuthorityIndex] = None
+
+
+def get_authority_index() -> AuthorityIndex:
+    """Shared index, built on first use (the app builds it at startup)"""
+    global _authority_index
+    if _authority_index is None:
+        _authority_index = AuthorityIndex()
+    return _authority_index
+
+
+# =============================================================================
+# RESOLUTION
+# =============================================================================
+
+def _resolve(
+    category: str,
+    state: str,
+    district: Optional[str] = None,
+    area: Optional[str] = None,
+    is_rti: bool = True,
+    extracted_entities: Optional[Dict] = None
+) -> ResolutionResult:
+    # Normalize inputs
+    category = category.lower().strip()
+    level = AuthorityLevel.DISTRICT if not is_rti and _is_escalation(extracted_entities) else AuthorityLevel.LOCAL
+    plan = get_authority_index().lookup(category, _normalize_state(state), level, is_rti)
+    
+    # Fresh records per request; only the address depends on the location
+    matches = [
+        AuthorityMatch(
+            authority=Authority(
+                name=m.authority.name,
+                designation=m.authority.designation,
+                department=m.authority.department,
+                level=m.authority.level,
+                address_template=_format_address(m.authority.address_template, state, district, area),
+                rti_fee=m.authority.rti_fee,
+                notes=m.authority.notes
+            ),
+            confidence=m.confidence,
+            match_reason=m.match_reason,
+            is_primary=m.is_primary
+        )
+        for m in plan.matches
+    ]
+    
     return ResolutionResult(
         matches=matches,
-        primary=primary,
+        primary=matches[plan.primary_index] if plan.primary_index is not None else None,
         category=category,
-        department=dept_authorities.get("pio", dept_authorities.get("grievance", Authority(
-            name="", designation="", department="General", level=AuthorityLevel.STATE, address_template=""
-        ))).department,
-        suggestions=suggestions,
-        requires_state_selection=requires_state
+        department=plan.department,
+        suggestions=list(plan.suggestions),
+        requires_state_selection=plan.requires_state_selection
     )
 
 
+def resolve_authority(
+    category: str,
+    state: str,
+    district: Optional[str] = None,
+    area: Optional[str] = None,
+    is_rti: bool = True,
+    extracted_entities: Optional[Dict] = None
+) -> ResolutionResult:
+    """
+    Resolve appropriate authority for an issue.
+    
+    This is DETERMINISTIC - no AI guessing. The rules are evaluated ahead of
+    time into the AuthorityIndex; this only looks up the entry and fills in
+    the (memoized) addresses.
+    
+    Args:
+        category: Issue category (electricity, water, etc.)
+        state: State name
+        district: District name (optional)
+        area: Local area (optional)
+        is_rti: True for RTI, False for Complaint
+        extracted_entities: Entities extracted by spaCy (hints only)
+    
+    Returns:
+        ResolutionResult with matched authorities
+    """
+    logger.info(f"Resolving authority for category={category}, state={state}, is_rti={is_rti}")
+    return _resolve(category, state, district, area, is_rti, extracted_entities)
+
+
+def resolve_authorities(requests: Iterable[Dict[str, Any]]) -> List[ResolutionResult]:
+    """
+    Resolve a batch of requests (dicts with resolve_authority()'s argument
+    names), in order.
+    """
+    requests = list(requests)
+    logger.info(f"Resolving authorities for {len(requests)} requests")
+    return [_resolve(**request) for request in requests]
+
+
 def get_all_categories() -> List[str]:
     """Get list of all supported issue categories"""
-    return list(DEPARTMENT_AUTHORITIES.keys())
+    return list(get_authority_index().categories)
 
 
 def get_all_states() -> List[Dict[str, str]]:
-    """Get list of all supported states"""
-    return [
-        {"name": state.replace("_", " ").title(), "code": info["code"]}
-        for state, info in STATE_INFO.items()
-    ]
+    """Get list of all supported states (entries are shared; do not mutate)"""
+    return list(get_authority_index().states)
@@ -4,11 +4,27 @@ Generates PDF, DOCX, and XLSX documents from draft text.
 
 Documents are generated on-demand and streamed directly to user.
 NO SERVER-SIDE STORAGE - privacy by design.
+
+Performance:
+- Styles, fonts and static sheet layout are built once per process
+  (the "warm template layer") and reused for every render
+- Rendered bytes are kept in a small in-memory cache keyed by a hash of
+  the document content, so re-downloading an unchanged draft skips
+  rendering. Memory only, short TTL, never written to disk.
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, List, BinaryIO, Iterator
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
 from io import BytesIO
 from datetime import datetime
+import hashlib
+import json
+import tempfile
+import threading
+import time
+import zipfile
 from loguru import logger
 
 # PDF Generation
@@ -33,6 +49,191 @@ from openpyxl.worksheet.worksheet import Worksheet
 from app.config import get_settings
 
 
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# XLSX static layout (shared, read-only)
+XLSX_TITLE_FONT = Font(bold=True, size=14)
+XLSX_HEADER_FONT = Font(bold=True, size=12)
+XLSX_LABEL_FONT = Font(bold=True)
+XLSX_HINT_FONT = Font(italic=True, color="808080")
+XLSX_TRACKING_FIELDS = (
+    ("Date Submitted", ""),
+    ("Mode of Submission", "(Post/Online/In-Person)"),
+    ("Reference Number", ""),
+    ("Acknowledgment Received", "(Yes/No)"),
+    ("Response Due Date", ""),
+    ("Response Received", "(Yes/No)"),
+    ("Response Date", ""),
+    ("Status", "(Pending/Resolved/Appeal Required)"),
+    ("Notes", ""),
+)
+XLSX_COLUMN_WIDTHS = {"A": 25, "B": 40, "C": 20, "D": 20}
+
+
+def _build_pdf_styles() -> Dict[str, ParagraphStyle]:
+    """ReportLab paragraph styles used by every PDF"""
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=14,
+            spaceAfter=20,
+            alignment=TA_CENTER,
+            fontName='Times-Bold'
+        ),
+        "body": ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontSize=12,
+            leading=18,  # 1.5 line spacing
+            alignment=TA_JUSTIFY,
+            fontName='Times-Roman',
+            spaceAfter=12
+        ),
+        "subject": ParagraphStyle(
+            'Subject',
+            parent=styles['Normal'],
+            fontSize=12,
+            fontName='Times-Bold',
+            spaceAfter=12,
+            spaceBefore=12
+        ),
+        "footer": ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey),
+    }
+
+
+def _build_docx_template() -> bytes:
+    """Empty DOCX with the default font already applied"""
+    doc = Document()
+    style = doc.styles['Normal']
+    if hasattr(style, 'font'):
+        style.font.name = 'Times New Roman'  # type: ignore[union-attr]
+        style.font.size = Pt(12)  # type: ignore[union-attr]
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def generation_time() -> datetime:
+    """Timestamp stamped into documents, to the minute so cached output stays accurate"""
+    return datetime.now().replace(second=0, microsecond=0)
+
+
+def build_filename(document_type: str, applicant_name: str, extension: str, infix: str = "") -> str:
+    safe_name = "".join(c for c in applicant_name if c.isalnum() or c in " -_").strip()
+    safe_name = safe_name.replace(" ", "_")[:30]
+    date_str = datetime.now().strftime("%Y%m%d")
+    return f"{document_type}_{infix}{safe_name}_{date_str}.{extension}"
+
+
+@dataclass
+class RenderedDocument:
+    """
+    Rendered document plus response metadata.
+    
+    The bytes live in `file`: an in-memory buffer, or a SpooledTemporaryFile
+    that rolled over to an anonymous temp file for large documents. Read it
+    with iter_chunks() (closes the file when done) or `content`.
+    """
+    file: BinaryIO
+    size: int
+    filename: str
+    content_type: str
+    format: str
+    cache_hit: bool = False
+    render_ms: float = 0.0
+
+    @property
+    def content(self) -> bytes:
+        self.file.seek(0)
+        return self.file.read()
+
+    @property
+    def spooled_to_disk(self) -> bool:
+        return bool(getattr(self.file, "_rolled", False))
+
+    def iter_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield the document in chunks, then close the underlying file"""
+        try:
+            self.file.seek(0)
+            while True:
+                chunk = self.file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self.close()
+
+    def close(self):
+        self.file.close()
+
+
+class DocumentCache:
+    """
+    In-memory LRU of rendered documents keyed by content hash.
+    Bounded by entry count and total bytes; entries expire after ttl_seconds.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 32 * 1024 * 1024, ttl_seconds: float = 300):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, content: bytes):
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (content, time.monotonic() + self.ttl_seconds)
+            self._bytes += len(content)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str):
+        content, _ = self._entries.pop(key)
+        self._bytes -= len(content)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
 class DocumentGenerator:
     """
     Generates documents in multiple formats.
@@ -46,6 +247,30 @@ class DocumentGenerator:
     
     def __init__(self):
         self.settings = get_settings()
+        
+        self.cache: Optional[DocumentCache] = None
+        if self.settings.DOCUMENT_CACHE_ENABLED:
+            self.cache = DocumentCache(
+                max_entries=self.settings.DOCUMENT_CACHE_MAX_ENTRIES,
+                max_bytes=self.settings.DOCUMENT_CACHE_MAX_MB * 1024 * 1024,
+                ttl_seconds=self.settings.DOCUMENT_CACHE_TTL_SECONDS
+            )
+    
+    # =========================================================================
+    # WARM TEMPLATE LAYER (built once per format, shared by all renders)
+    # =========================================================================
+    
+    @cached_property
+    def _pdf_styles(self) -> Dict[str, ParagraphStyle]:
+        return _build_pdf_styles()
+    
+    @cached_property
+    def _docx_template(self) -> bytes:
+        return _build_docx_template()
+    
+    def warm_up(self):
+        """Build all templates ahead of the first download"""
+        _ = self._pdf_styles, self._docx_template
     
     # =========================================================================
     # PDF GENERATION
@@ -73,10 +298,18 @@ class DocumentGenerator:
         logger.info(f"Generating PDF for {document_type}")
         
         buffer = BytesIO()
+        self._render_pdf(draft_text, metadata, buffer)
+        buffer.seek(0)
+        filename = build_filename(document_type, applicant_name, "pdf")
         
+        logger.info(f"PDF generated successfully: {filename}")
+        
+        return buffer, filename
+    
+    def _render_pdf(self, draft_text: str, metadata: Optional[Dict[str, Any]], out: BinaryIO):
         # Create document
         doc = SimpleDocTemplate(
-            buffer,
+            out,
             pagesize=A4,
             rightMargin=1.0 * inch,
             leftMargin=1.0 * inch,
@@ -84,37 +317,8 @@ class DocumentGenerator:
             bottomMargin=1.0 * inch
         )
         
-        # Styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=14,
-            spaceAfter=20,
-            alignment=TA_CENTER,
-            fontName='Times-Bold'
-        )
-        
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['Normal'],
-            fontSize=12,
-            leading=18,  # 1.5 line spacing
-            alignment=TA_JUSTIFY,
-            fontName='Times-Roman',
-            spaceAfter=12
-        )
-        
-        subject_style = ParagraphStyle(
-            'Subject',
-            parent=styles['Normal'],
-            fontSize=12,
-            fontName='Times-Bold',
-            spaceAfter=12,
-            spaceBefore=12
-        )
+        body_style = self._pdf_styles["body"]
+        subject_style = self._pdf_styles["subject"]
         
         # Build content
         story = []
@@ -146,24 +350,11 @@ class DocumentGenerator:
             story.append(Spacer(1, 30))
             story.append(Paragraph(
                 f"<i>Generated on: {metadata.get('generated_at', datetime.now().isoformat())}</i>",
-                ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey)
+                self._pdf_styles["footer"]
             ))
         
         # Build PDF
         doc.build(story)
-        
-        # Reset buffer position
-        buffer.seek(0)
-        
-        # Generate filename
-        safe_name = "".join(c for c in applicant_name if c.isalnum() or c in " -_").strip()
-        safe_name = safe_name.replace(" ", "_")[:30]
-        date_str = datetime.now().strftime("%Y%m%d")
-        filename = f"{document_type}_{safe_name}_{date_str}.pdf"
-        
-        logger.info(f"PDF generated successfully: {filename}")
-        
-        return buffer, filename
     
     # =========================================================================
     # DOCX GENERATION
@@ -190,18 +381,21 @@ class DocumentGenerator:
         """
         logger.info(f"Generating DOCX for {document_type}")
         
-        # Create document
-        doc = Document()
+        buffer = BytesIO()
+        self._render_docx(draft_text, metadata, buffer)
+        buffer.seek(0)
+        filename = build_filename(document_type, applicant_name, "docx")
+        
+        logger.info(f"DOCX generated successfully: {filename}")
         
-        # Set default font
-        style = doc.styles['Normal']
-        if hasattr(style, 'font'):
-            style.font.name = 'Times New Roman'  # type: ignore[union-attr]
-            style.font.size = Pt(12)  # type: ignore[union-attr]
+        return buffer, filename
+    
+    def _render_docx(self, draft_text: str, metadata: Optional[Dict[str, Any]], out: BinaryIO):
+        # Start from the pre-styled template (default font already set)
+        doc = Document(BytesIO(self._docx_template))
         
         # Process draft text
         lines = draft_text.strip().split('\n')
-        current_paragraph = None
         
         for line in lines:
             line = line.strip()
@@ -209,7 +403,6 @@ class DocumentGenerator:
             if not line:
                 # Empty line - add spacing
                 doc.add_paragraph()
-                current_paragraph = None
                 continue
             
             # Detect subject line
@@ -218,13 +411,11 @@ class DocumentGenerator:
                 run = para.add_run(line)
                 run.bold = True
                 para.paragraph_format.space_after = Pt(12)
-                current_paragraph = None
             # Detect "To," header
             elif line == 'To,' or line == 'To':
                 para = doc.add_paragraph()
                 run = para.add_run('To,')
                 run.bold = True
-                current_paragraph = None
             # Regular text
             else:
                 para = doc.add_paragraph(line)
@@ -239,20 +430,7 @@ class DocumentGenerator:
             run.font.size = Pt(9)
             run.font.color.rgb = None  # Grey color
         
-        # Save to buffer
-        buffer = BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
-        
-        # Generate filename
-        safe_name = "".join(c for c in applicant_name if c.isalnum() or c in " -_").strip()
-        safe_name = safe_name.replace(" ", "_")[:30]
-        date_str = datetime.now().strftime("%Y%m%d")
-        filename = f"{document_type}_{safe_name}_{date_str}.docx"
-        
-        logger.info(f"DOCX generated successfully: {filename}")
-        
-        return buffer, filename
+        doc.save(out)
     
     # =========================================================================
     # XLSX GENERATION (Tracking Sheet)
@@ -286,110 +464,81 @@ class DocumentGenerator:
         """
         logger.info(f"Generating XLSX tracking sheet for {document_type}")
         
+        buffer = BytesIO()
+        self._render_xlsx(
+            draft_text, document_type, applicant_name, applicant_details, authority_details, buffer
+        )
+        buffer.seek(0)
+        filename = build_filename(document_type, applicant_name, "xlsx", infix="tracker_")
+        
+        logger.info(f"XLSX generated successfully: {filename}")
+        
+        return buffer, filename
+    
+    def _render_xlsx(
+        self,
+        draft_text: str,
+        document_type: str,
+        applicant_name: str,
+        applicant_details: Optional[Dict[str, Any]],
+        authority_details: Optional[Dict[str, Any]],
+        out: BinaryIO,
+        generated_at: Optional[datetime] = None
+    ):
         wb = Workbook()
         ws: Worksheet = wb.active  # type: ignore[assignment]
         ws.title = "Application Tracker"
         
-        # Styles
-        header_font = Font(bold=True, size=12)
-        title_font = Font(bold=True, size=14)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
         # Title
         ws['A1'] = f"{document_type.upper()} APPLICATION TRACKING SHEET"
-        ws['A1'].font = title_font
+        ws['A1'].font = XLSX_TITLE_FONT
         ws.merge_cells('A1:D1')
         
         # Application Details Section
         row = 3
-        ws[f'A{row}'] = "APPLICATION DETAILS"
-        ws[f'A{row}'].font = header_font
-        ws.merge_cells(f'A{row}:D{row}')
-        
-        row += 1
+        row = self._xlsx_section(ws, row, "APPLICATION DETAILS")
+        now = generated_at or generation_time()
         details = [
             ("Application Type", document_type.replace("_", " ").title()),
-            ("Date Generated", datetime.now().strftime("%d/%m/%Y")),
-            ("Time Generated", datetime.now().strftime("%H:%M:%S")),
+            ("Date Generated", now.strftime("%d/%m/%Y")),
+            ("Time Generated", now.strftime("%H:%M")),
         ]
-        
-        for label, value in details:
-            ws[f'A{row}'] = label
-            ws[f'A{row}'].font = Font(bold=True)
-            ws[f'B{row}'] = value
-            row += 1
+        row = self._xlsx_rows(ws, row, details)
         
         # Applicant Details Section
-        row += 1
-        ws[f'A{row}'] = "APPLICANT DETAILS"
-        ws[f'A{row}'].font = header_font
-        ws.merge_cells(f'A{row}:D{row}')
-        
-        row += 1
+        row = self._xlsx_section(ws, row + 1, "APPLICANT DETAILS")
         if applicant_details:
-            for key, value in applicant_details.items():
-                ws[f'A{row}'] = key.replace("_", " ").title()
-                ws[f'A{row}'].font = Font(bold=True)
-                ws[f'B{row}'] = str(value) if value else ""
-                row += 1
+            row = self._xlsx_rows(ws, row, [
+                (key.replace("_", " ").title(), str(value) if value else "")
+                for key, value in applicant_details.items()
+            ])
         else:
-            ws[f'A{row}'] = "Name"
-            ws[f'A{row}'].font = Font(bold=True)
-            ws[f'B{row}'] = applicant_name
-            row += 1
+            row = self._xlsx_rows(ws, row, [("Name", applicant_name)])
         
         # Authority Details Section
-        row += 1
-        ws[f'A{row}'] = "AUTHORITY DETAILS"
-        ws[f'A{row}'].font = header_font
-        ws.merge_cells(f'A{row}:D{row}')
-        
-        row += 1
+        row = self._xlsx_section(ws, row + 1, "AUTHORITY DETAILS")
         if authority_details:
-            for key, value in authority_details.items():
-                ws[f'A{row}'] = key.replace("_", " ").title()
-                ws[f'A{row}'].font = Font(bold=True)
-                ws[f'B{row}'] = str(value) if value else ""
-                row += 1
+            row = self._xlsx_rows(ws, row, [
+                (key.replace("_", " ").title(), str(value) if value else "")
+                for key, value in authority_details.items()
+            ])
         else:
             ws[f'A{row}'] = "To be filled"
             row += 1
         
         # Tracking Section
-        row += 1
-        ws[f'A{row}'] = "SUBMISSION TRACKING"
-        ws[f'A{row}'].font = header_font
-        ws.merge_cells(f'A{row}:D{row}')
-        
-        row += 1
-        tracking_fields = [
-            ("Date Submitted", ""),
-            ("Mode of Submission", "(Post/Online/In-Person)"),
-            ("Reference Number", ""),
-            ("Acknowledgment Received", "(Yes/No)"),
-            ("Response Due Date", ""),
-            ("Response Received", "(Yes/No)"),
-            ("Response Date", ""),
-            ("Status", "(Pending/Resolved/Appeal Required)"),
-            ("Notes", ""),
-        ]
-        
-        for label, hint in tracking_fields:
+        row = self._xlsx_section(ws, row + 1, "SUBMISSION TRACKING")
+        for label, hint in XLSX_TRACKING_FIELDS:
             ws[f'A{row}'] = label
-            ws[f'A{row}'].font = Font(bold=True)
+            ws[f'A{row}'].font = XLSX_LABEL_FONT
             ws[f'B{row}'] = hint
-            ws[f'B{row}'].font = Font(italic=True, color="808080")
+            ws[f'B{row}'].font = XLSX_HINT_FONT
             row += 1
         
         # Draft Content (in a separate sheet)
         ws2 = wb.create_sheet("Draft Content")
         ws2['A1'] = "DRAFT CONTENT"
-        ws2['A1'].font = title_font
+        ws2['A1'].font = XLSX_TITLE_FONT
         
         # Split draft into rows
         lines = draft_text.strip().split('\n')
@@ -397,27 +546,30 @@ class DocumentGenerator:
             ws2[f'A{i}'] = line
         
         # Adjust column widths
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 40
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 20
+        for column, width in XLSX_COLUMN_WIDTHS.items():
+            ws.column_dimensions[column].width = width
         
         ws2.column_dimensions['A'].width = 100
         
-        # Save to buffer
-        buffer = BytesIO()
-        wb.save(buffer)
-        buffer.seek(0)
-        
-        # Generate filename
-        safe_name = "".join(c for c in applicant_name if c.isalnum() or c in " -_").strip()
-        safe_name = safe_name.replace(" ", "_")[:30]
-        date_str = datetime.now().strftime("%Y%m%d")
-        filename = f"{document_type}_tracker_{safe_name}_{date_str}.xlsx"
-        
-        logger.info(f"XLSX generated successfully: {filename}")
-        
-        return buffer, filename
+        wb.save(out)
+    
+    @staticmethod
+    def _xlsx_section(ws: Worksheet, row: int, title: str) -> int:
+        """Write a merged section header; returns the next row"""
+        ws[f'A{row}'] = title
+        ws[f'A{row}'].font = XLSX_HEADER_FONT
+        ws.merge_cells(f'A{row}:D{row}')
+        return row + 1
+    
+    @staticmethod
+    def _xlsx_rows(ws: Worksheet, row: int, pairs: List[Tuple[str, Any]]) -> int:
+        """Write bold label / value rows; returns the next row"""
+        for label, value in pairs:
+            ws[f'A{row}'] = label
+            ws[f'A{row}'].font = XLSX_LABEL_FONT
+            ws[f'B{row}'] = value
+            row += 1
+        return row
     
     # =========================================================================
     # UNIFIED GENERATION METHOD
@@ -448,27 +600,161 @@ class DocumentGenerator:
         Returns:
             Tuple of (BytesIO buffer, filename, content_type)
         """
-        format = format.lower().strip()
+        document = self.render(
+            format, draft_text, document_type, applicant_name,
+            applicant_details, authority_details, metadata
+        )
+        document.file.seek(0)
+        return document.file, document.filename, document.content_type
+    
+    def render(
+        self,
+        format: str,
+        draft_text: str,
+        document_type: str,
+        applicant_name: str,
+        applicant_details: Optional[Dict[str, Any]] = None,
+        authority_details: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        spool_threshold: Optional[int] = None
+    ) -> RenderedDocument:
+        """
+        Render a document, serving unchanged drafts from the output cache.
         
-        if format == "pdf":
-            buffer, filename = self.generate_pdf(draft_text, document_type, applicant_name, metadata)
-            content_type = "application/pdf"
+        The cache key covers everything that shapes the document, including
+        the generation timestamp. That is stamped to the minute (unless
+        metadata carries its own "generated_at"), so a repeat download within
+        the same minute returns the bytes of the first render and a later one
+        never shows a stale time.
         
-        elif format == "docx":
-            buffer, filename = self.generate_docx(draft_text, document_type, applicant_name, metadata)
-            content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        With spool_threshold, output larger than that many bytes rolls over
+        from memory to an anonymous temp file (deleted on close) and is not
+        cached.
+        """
+        format = format.lower().strip()
+        if format not in CONTENT_TYPES:
+            raise ValueError(f"Unsupported format: {format}. Supported: pdf, docx, xlsx")
         
-        elif format == "xlsx":
-            buffer, filename = self.generate_xlsx(
-                draft_text, document_type, applicant_name,
-                applicant_details, authority_details, metadata
+        infix = "tracker_" if format == "xlsx" else ""
+        filename = build_filename(document_type, applicant_name, format, infix=infix)
+        content_type = CONTENT_TYPES[format]
+        
+        generated_at = generation_time()
+        if metadata:
+            # Shown in the PDF/DOCX footer
+            metadata = {**metadata, "generated_at": metadata.get("generated_at") or generated_at.isoformat(timespec="minutes")}
+        
+        cache = self.cache if use_cache else None
+        key = None
+        if cache is not None:
+            key = self.content_key(
+                format, draft_text, document_type, applicant_name,
+                applicant_details, authority_details, metadata, generated_at
             )
-            content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            content = cache.get(key)
+            if content is not None:
+                logger.info(f"Serving cached {format.upper()}: {filename}")
+                return RenderedDocument(BytesIO(content), len(content), filename, content_type, format, cache_hit=True)
         
+        if spool_threshold:
+            out: BinaryIO = tempfile.SpooledTemporaryFile(max_size=spool_threshold)  # type: ignore[assignment]
         else:
-            raise ValueError(f"Unsupported format: {format}. Supported: pdf, docx, xlsx")
-        
-        return buffer, filename, content_type
+            out = BytesIO()
+        
+        logger.info(f"Rendering {format.upper()} for {document_type}")
+        start = time.perf_counter()
+        try:
+            if format == "pdf":
+                self._render_pdf(draft_text, metadata, out)
+            elif format == "docx":
+                self._render_docx(draft_text, metadata, out)
+            else:
+                self._render_xlsx(
+                    draft_text, document_type, applicant_name, applicant_details, authority_details, out,
+                    generated_at=generated_at
+                )
+        except Exception:
+            out.close()
+            raise
+        render_ms = (time.perf_counter() - start) * 1000
+        
+        document = RenderedDocument(out, out.tell(), filename, content_type, format, render_ms=render_ms)
+        if cache is not None and not document.spooled_to_disk:
+            cache.put(key, document.content)
+        document.file.seek(0)
+        
+        logger.info(
+            f"{format.upper()} generated successfully: {filename} "
+            f"({render_ms:.1f}ms, {document.size} bytes{', spooled' if document.spooled_to_disk else ''})"
+        )
+        return document
+    
+    def bundle(
+        self,
+        documents: List[RenderedDocument],
+        filename: str,
+        spool_threshold: Optional[int] = None
+    ) -> RenderedDocument:
+        """
+        Pack rendered documents into one ZIP (stored, not deflated - the
+        formats are already compressed). Closes the input documents.
+        """
+        if spool_threshold:
+            out: BinaryIO = tempfile.SpooledTemporaryFile(max_size=spool_threshold)  # type: ignore[assignment]
+        else:
+            out = BytesIO()
+        
+        try:
+            with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED) as archive:
+                for document in documents:
+                    with archive.open(document.filename, "w") as entry:
+                        for chunk in document.iter_chunks():
+                            entry.write(chunk)
+        except Exception:
+            out.close()
+            raise
+        finally:
+            for document in documents:
+                document.close()
+        
+        bundle = RenderedDocument(out, out.tell(), filename, "application/zip", "zip")
+        bundle.file.seek(0)
+        return bundle
+    
+    @staticmethod
+    def content_key(
+        format: str,
+        draft_text: str,
+        document_type: str,
+        applicant_name: str,
+        applicant_details: Optional[Dict[str, Any]] = None,
+        authority_details: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        generated_at: Optional[datetime] = None
+    ) -> str:
+        """SHA-256 over the inputs that determine the rendered document"""
+        if format == "xlsx":
+            stamp = generated_at.isoformat(timespec="minutes") if generated_at else None
+        else:
+            stamp = metadata.get("generated_at") if metadata else None
+        payload = {
+            "format": format,
+            "draft_text": draft_text,
+            "document_type": document_type,
+            # Only the XLSX sheet renders applicant/authority details
+            "applicant_name": applicant_name if format == "xlsx" else None,
+            "applicant_details": applicant_details if format == "xlsx" else None,
+            "authority_details": authority_details if format == "xlsx" else None,
+            "footer": bool(metadata) and format != "xlsx",
+            "generated_at": stamp,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Output cache counters (None when caching is disabled)"""
+        return self.cache.stats() if self.cache is not None else None
 
 
 # Singleton instance
@@ -3,20 +3,71 @@ Draft Assembler
 Fills legal templates with user data and extracted entities.
 AI ONLY fills placeholders - NEVER generates legal language.
 Supports English and Hindi templates.
+
+Templates are compiled once when loaded into literal chunks and placeholder
+slots, so filling a draft is a single join instead of one regex scan plus a
+str.replace pass per placeholder. Template files are re-read when their
+mtime changes (checked at most every reload_check_seconds).
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import re
+import time
 from loguru import logger
 
+from app.config import get_settings
 from app.services.inference_orchestrator import DocumentType, IntentType
 
 
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
+PLACEHOLDER_PATTERN = re.compile(r'\{([A-Z_]+)\}')
+
+
+@dataclass
+class CompiledTemplate:
+    """
+    Template split into literals and slots:
+    literals[0] + slots[0] + literals[1] + ... + slots[n-1] + literals[n]
+    """
+    source: str
+    literals: List[str]
+    slots: List[str]
+    path: Optional[Path] = None
+    mtime: Optional[float] = None
+    
+    @classmethod
+    def compile(cls, source: str, path: Optional[Path] = None, mtime: Optional[float] = None) -> "CompiledTemplate":
+        literals, slots, position = [], [], 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            literals.append(source[position:match.start()])
+            slots.append(match.group(1))
+            position = match.end()
+        literals.append(source[position:])
+        return cls(source=source, literals=literals, slots=slots, path=path, mtime=mtime)
+    
+    def render(self, values: Dict[str, str], drop_line_if_empty: Iterable[str] = ()) -> str:
+        """
+        Fill slots from values in one pass.
+        Slots without a value are left as "{NAME}" for the user to fill;
+        empty slots named in drop_line_if_empty also swallow their trailing newline.
+        """
+        parts = [self.literals[0]]
+        for name, literal in zip(self.slots, self.literals[1:]):
+            value = values.get(name)
+            if value is None:
+                parts.append("{" + name + "}")
+            elif value:
+                parts.append(value)
+            elif name in drop_line_if_empty and literal.startswith("\n"):
+                literal = literal[1:]
+            parts.append(literal)
+        return "".join(parts)
+
 
 class DraftAssembler:
     """
@@ -69,50 +120,80 @@ class DraftAssembler:
         "START_DATE": "कुछ समय पहले",
     }
     
-    def __init__(self):
+    def __init__(
+        self,
+        template_dir: Path = TEMPLATE_DIR,
+        auto_reload: bool = True,
+        reload_check_seconds: float = 2.0
+    ):
+        self.template_dir = Path(template_dir)
+        self.auto_reload = auto_reload
+        self.reload_check_seconds = reload_check_seconds
         self.templates: Dict[str, str] = {}  # key: "doctype_lang"
+        self._compiled: Dict[str, CompiledTemplate] = {}
+        self._next_reload_check = 0.0
         self._load_templates()
     
     def _load_templates(self):
-        """Load all templates from disk (English and Hindi)"""
-        # Load English templates
+        """Load and compile all templates from disk (English and Hindi)"""
         for doc_type, template_path in self.TEMPLATE_MAP.items():
-            full_path = TEMPLATE_DIR / template_path
-            try:
-                if full_path.exists():
-                    key = f"{doc_type.value}_english"
-                    self.templates[key] = full_path.read_text(encoding="utf-8")
-                    logger.info(f"Loaded template: {template_path}")
-                else:
-                    logger.warning(f"Template not found: {template_path}")
-            except Exception as e:
-                logger.error(f"Failed to load template {template_path}: {e}")
-        
-        # Load Hindi templates
+            self._load_template(f"{doc_type.value}_english", template_path)
         for doc_type, template_path in self.TEMPLATE_MAP_HINDI.items():
-            full_path = TEMPLATE_DIR / template_path
+            self._load_template(f"{doc_type.value}_hindi", template_path)
+        self._next_reload_check = time.monotonic() + self.reload_check_seconds
+    
+    def _load_template(self, key: str, template_path: str) -> bool:
+        """Read one template file and compile it into segments"""
+        full_path = self.template_dir / template_path
+        try:
+            if not full_path.exists():
+                logger.warning(f"Template not found: {template_path}")
+                return False
+            mtime = full_path.stat().st_mtime
+            source = full_path.read_text(encoding="utf-8")
+            compiled = CompiledTemplate.compile(source, full_path, mtime)
+            self.templates[key] = source
+            self._compiled[key] = compiled
+            logger.info(f"Loaded template: {template_path} ({len(compiled.slots)} placeholders)")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to load template {template_path}: {e}")
+            return False
+    
+    def _reload_changed_templates(self):
+        """Recompile templates whose file changed since they were loaded"""
+        if not self.auto_reload:
+            return
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        self._next_reload_check = now + self.reload_check_seconds
+        
+        for key, compiled in list(self._compiled.items()):
             try:
-                if full_path.exists():
-                    key = f"{doc_type.value}_hindi"
-                    self.templates[key] = full_path.read_text(encoding="utf-8")
-                    logger.info(f"Loaded Hindi template: {template_path}")
-                else:
-                    logger.warning(f"Hindi template not found: {template_path}")
-            except Exception as e:
-                logger.error(f"Failed to load Hindi template {template_path}: {e}")
+                mtime = compiled.path.stat().st_mtime
+            except OSError:
+                continue  # Deleted or unreadable: keep serving the last good version
+            if mtime != compiled.mtime:
+                logger.info(f"Template changed on disk, reloading: {compiled.path.name}")
+                self._load_template(key, str(compiled.path.relative_to(self.template_dir)))
+    
+    def _get_compiled(self, document_type: DocumentType, language: str) -> Optional[CompiledTemplate]:
+        """Get compiled template for document type and language, with fallback to English"""
+        self._reload_changed_templates()
+        compiled = self._compiled.get(f"{document_type.value}_{language}")
+        if compiled is None:
+            compiled = self._compiled.get(f"{document_type.value}_english")
+        return compiled
     
     def _get_template(self, document_type: DocumentType, language: str) -> Optional[str]:
         """Get template for document type and language, with fallback to English"""
-        key = f"{document_type.value}_{language}"
-        if key in self.templates:
-            return self.templates[key]
-        # Fallback to English
-        fallback_key = f"{document_type.value}_english"
-        return self.templates.get(fallback_key)
+        compiled = self._get_compiled(document_type, language)
+        return compiled.source if compiled else None
     
     def _extract_placeholders(self, template: str) -> List[str]:
         """Extract all placeholder names from a template"""
-        return re.findall(r'\{([A-Z_]+)\}', template)
+        return PLACEHOLDER_PATTERN.findall(template)
     
     def _format_applicant_details(
         self,
@@ -204,7 +285,7 @@ class DraftAssembler:
             - language: Language used for the draft
         """
         # Get template for the specified language
-        template = self._get_template(document_type, language)
+        template = self._get_compiled(document_type, language)
         
         if not template:
             logger.error(f"No template for document type: {document_type}, language: {language}")
@@ -253,28 +334,28 @@ class DraftAssembler:
                 if placeholder_key not in placeholders:
                     placeholders[placeholder_key] = value
         
-        # Track which placeholders were filled vs defaulted
-        template_placeholders = self._extract_placeholders(template)
+        # Resolve each slot and track which placeholders were filled vs defaulted
+        values: Dict[str, str] = {}
         placeholders_filled = {}
         placeholders_missing = []
         
-        # Fill the template
-        draft_text = template
-        for placeholder in template_placeholders:
+        for placeholder in template.slots:
             if placeholder in placeholders and placeholders[placeholder]:
-                draft_text = draft_text.replace(f"{{{placeholder}}}", placeholders[placeholder])
+                values[placeholder] = placeholders[placeholder]
                 placeholders_filled[placeholder] = placeholders[placeholder]
             elif placeholder in defaults:
-                draft_text = draft_text.replace(f"{{{placeholder}}}", defaults[placeholder])
+                values[placeholder] = defaults[placeholder]
                 placeholders_missing.append(placeholder)
             elif placeholder == "APPLICANT_CONTACT":
                 # Remove empty contact placeholder entirely
-                draft_text = draft_text.replace(f"{{{placeholder}}}\n", "")
-                draft_text = draft_text.replace(f"{{{placeholder}}}", "")
+                values[placeholder] = ""
             else:
                 # Leave as is for user to fill
                 placeholders_missing.append(placeholder)
         
+        # Fill the template
+        draft_text = template.render(values, drop_line_if_empty=("APPLICANT_CONTACT",))
+        
         # Apply tone adjustments
         if tone != "neutral":
             from app.utils.tone import adjust_tone
@@ -311,6 +392,10 @@ class DraftAssembler:
         """List all available template types"""
         return list(self.templates.keys())
     
+    def reload_templates(self):
+        """Re-read every template from disk"""
+        self._load_templates()
+    
     def get_supported_languages(self, document_type: DocumentType) -> List[str]:
         """Get list of supported languages for a document type"""
         languages = []
@@ -329,5 +414,9 @@ def get_draft_assembler() -> DraftAssembler:
     """Get singleton draft assembler instance"""
     global _assembler
     if _assembler is None:
-        _assembler = DraftAssembler()
+        settings = get_settings()
+        _assembler = DraftAssembler(
+            auto_reload=settings.TEMPLATE_HOT_RELOAD,
+            reload_check_seconds=settings.TEMPLATE_RELOAD_CHECK_SECONDS
+        )
     return _assembler
@@ -0,0 +1,246 @@
+"""
+Executor Layer
+Runs CPU-bound work (rule engine, spaCy, DistilBERT, validation) off the event loop.
+
+Design:
+- "nlp" pool: thread pool for rule engine / spaCy / template work
+- "transformer" pool: thread or process pool for the DistilBERT path
+- Bounded queue depth per pool - callers get ExecutorSaturatedError (HTTP 429)
+  instead of piling up behind a slow request
+- Metrics separate time spent waiting in the queue from compute time
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from dataclasses import dataclass, field
+import asyncio
+import functools
+import threading
+import time
+from loguru import logger
+
+from app.config import get_settings
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when a pool already has max_workers + max_queue tasks in flight"""
+
+    def __init__(self, pool_name: str, limit: int, retry_after_seconds: int = 1):
+        self.pool_name = pool_name
+        self.limit = limit
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(f"Executor '{pool_name}' saturated ({limit} tasks in flight)")
+
+
+def _timed_call(func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Any, float, float]:
+    """
+    Run func inside the worker and report wall-clock start/end.
+    Module-level so it can be pickled for process pools.
+    """
+    started = time.time()
+    result = func(*args, **kwargs)
+    return result, started, time.time()
+
+
+@dataclass
+class ExecutorMetrics:
+    """Counters and timing samples for one pool"""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    total_queue_wait_ms: float = 0.0
+    total_compute_ms: float = 0.0
+    max_queue_wait_ms: float = 0.0
+    max_compute_ms: float = 0.0
+    recent_queue_wait_ms: deque = field(default_factory=lambda: deque(maxlen=512))
+    recent_compute_ms: deque = field(default_factory=lambda: deque(maxlen=512))
+
+    def record(self, queue_wait_ms: float, compute_ms: float):
+        self.completed += 1
+        self.total_queue_wait_ms += queue_wait_ms
+        self.total_compute_ms += compute_ms
+        self.max_queue_wait_ms = max(self.max_queue_wait_ms, queue_wait_ms)
+        self.max_compute_ms = max(self.max_compute_ms, compute_ms)
+        self.recent_queue_wait_ms.append(queue_wait_ms)
+        self.recent_compute_ms.append(compute_ms)
+
+    @staticmethod
+    def _percentile(samples, pct: float) -> float:
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = max(self.completed, 1)
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "in_flight": self.in_flight,
+            "queue_wait_ms": {
+                "avg": round(self.total_queue_wait_ms / completed, 2),
+                "p95": round(self._percentile(self.recent_queue_wait_ms, 0.95), 2),
+                "max": round(self.max_queue_wait_ms, 2),
+            },
+            "compute_ms": {
+                "avg": round(self.total_compute_ms / completed, 2),
+                "p95": round(self._percentile(self.recent_compute_ms, 0.95), 2),
+                "max": round(self.max_compute_ms, 2),
+            },
+        }
+
+
+class BoundedExecutor:
+    """
+    Thread or process pool with a bounded number of in-flight tasks.
+
+    Usage:
+        result = await get_executor("nlp").run(run_inference, text, language)
+    """
+
+    def __init__(self, name: str, kind: str = "thread", max_workers: int = 4, max_queue: int = 32):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+
+        self.name = name
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.metrics = ExecutorMetrics()
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of running + queued tasks"""
+        return self.max_workers + self.max_queue
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"{self.name}-worker"
+                )
+            logger.info(f"Started {self.kind} executor '{self.name}' ({self.max_workers} workers, queue {self.max_queue})")
+        return self._pool
+
+    def _release(self, _future):
+        with self._lock:
+            self.metrics.in_flight -= 1
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run func(*args, **kwargs) in the pool and await the result.
+        Raises ExecutorSaturatedError immediately if the queue is full.
+        """
+        with self._lock:
+            if self.metrics.in_flight >= self.capacity:
+                self.metrics.rejected += 1
+                raise ExecutorSaturatedError(self.name, self.capacity)
+            self.metrics.in_flight += 1
+            self.metrics.submitted += 1
+            pool = self._get_pool()
+
+        submitted = time.time()
+        try:
+            future = pool.submit(_timed_call, func, args, kwargs)
+        except Exception:
+            self._release(None)
+            raise
+        # Release the slot when the worker finishes, even if the caller was cancelled
+        future.add_done_callback(self._release)
+
+        try:
+            result, started, finished = await asyncio.wrap_future(future)
+        except Exception:
+            with self._lock:
+                self.metrics.failed += 1
+            raise
+
+        with self._lock:
+            self.metrics.record(
+                queue_wait_ms=max(0.0, started - submitted) * 1000,
+                compute_ms=(finished - started) * 1000
+            )
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = self.metrics.to_dict()
+        stats.update({
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+        })
+        return stats
+
+    def shutdown(self, wait: bool = True):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+# Singleton pools
+_executors: Dict[str, BoundedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _build_executor(name: str) -> BoundedExecutor:
+    settings = get_settings()
+    if name == "transformer":
+        return BoundedExecutor(
+            name,
+            kind=settings.EXECUTOR_TRANSFORMER_KIND,
+            max_workers=settings.EXECUTOR_TRANSFORMER_WORKERS,
+            max_queue=settings.EXECUTOR_MAX_QUEUE
+        )
+    return BoundedExecutor(
+        name,
+        kind="thread",
+        max_workers=settings.EXECUTOR_THREAD_WORKERS,
+        max_queue=settings.EXECUTOR_MAX_QUEUE
+    )
+
+
+def get_executor(name: str = "nlp") -> BoundedExecutor:
+    """Get (or lazily create) a named pool: 'nlp' or 'transformer'"""
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = _build_executor(name)
+                _executors[name] = executor
+    return executor
+
+
+def get_inference_executor() -> BoundedExecutor:
+    """Pool for run_inference: transformer pool when DistilBERT is enabled"""
+    settings = get_settings()
+    return get_executor("transformer" if settings.ENABLE_DISTILBERT else "nlp")
+
+
+async def run_in_executor(func: Callable, *args, pool: str = "nlp", **kwargs) -> Any:
+    """Convenience wrapper for get_executor(pool).run(...)"""
+    return await get_executor(pool).run(func, *args, **kwargs)
+
+
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Metrics for every pool created so far"""
+    return {name: executor.stats() for name, executor in list(_executors.items())}
+
+
+def shutdown_executors(wait: bool = True):
+    """Stop all pools (called on application shutdown)"""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
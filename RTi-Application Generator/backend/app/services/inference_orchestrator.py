@@ -5,16 +5,21 @@ This is the SINGLE source of truth for inference decisions.
 """
 
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from loguru import logger
 
+from app.config import get_settings
 from app.services.rule_engine.intent_rules import classify_intent
 from app.services.rule_engine.legal_triggers import detect_legal_triggers
 from app.services.rule_engine.issue_rules import map_issue_to_department
-from app.services.nlp.spacy_engine import extract_entities, extract_key_phrases, analyze_sentiment_basic
+from app.services.rule_engine.keyword_automaton import KeywordScan, register_keywords, scan_text
+from app.services.nlp.spacy_engine import (
+    extract_entities, extract_key_phrases, analyze_sentiment_basic, parse_text, parse_texts
+)
 from app.services.nlp.confidence_gate import gate_result, should_use_nlp, GatedResult, ConfidenceLevel
 from app.services.nlp.distilbert_semantic import rank_by_similarity, compute_similarity
+from app.services.stage_metrics import StageTrace
 
 
 class DocumentType(str, Enum):
@@ -53,6 +58,7 @@ class InferenceResult:
     suggestions: List[str]
     explanation: str
     decision_path: List[str]  # Audit trail
+    stage_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)  # stage -> {ms, calls}
 
 
 # RTI document type indicators
@@ -88,12 +94,21 @@ COMPLAINT_DOCUMENT_INDICATORS = {
 }
 
 
-def _determine_document_type(text: str, intent: IntentType) -> Tuple[DocumentType, float]:
+# Compile document type indicators into the shared rule engine automaton
+for _indicators in (RTI_DOCUMENT_INDICATORS, COMPLAINT_DOCUMENT_INDICATORS):
+    for _keywords in _indicators.values():
+        register_keywords(_keywords)
+
+
+def _determine_document_type(
+    text: str,
+    intent: IntentType,
+    scan: Optional[KeywordScan] = None
+) -> Tuple[DocumentType, float]:
     """
     Determine specific document type based on intent and text analysis.
     Uses keyword matching - NO AI decision making.
     """
-    text_lower = text.lower()
     
     if intent == IntentType.RTI:
         indicators = RTI_DOCUMENT_INDICATORS
@@ -106,11 +121,13 @@ def _determine_document_type(text: str, intent: IntentType) -> Tuple[DocumentTyp
     else:
         return DocumentType.GRIEVANCE, 0.5
     
+    if scan is None:
+        scan = scan_text(text)
+    
     # Score each document type
     scores = {}
     for doc_type, keywords in indicators.items():
-        score = sum(1 for kw in keywords if kw in text_lower)
-        scores[doc_type] = score
+        scores[doc_type] = scan.count(keywords)
     
     # Find best match
     if max(scores.values()) > 0:
@@ -174,7 +191,7 @@ def _build_explanation(decision_path: List[str], confidence: float) -> str:
     return f"Decision made with {confidence_text} ({confidence:.0%}). Path: {path_text}"
 
 
-def run_inference(text: str, language: str = "english") -> InferenceResult:
+def run_inference(text: str, language: str = "english", doc=None) -> InferenceResult:
     """
     Main inference orchestrator.
     
@@ -185,9 +202,16 @@ def run_inference(text: str, language: str = "english") -> InferenceResult:
     4. DistilBERT (only if confidence is low)
     5. Return result with confidence level
     
+    `doc` may be a spaCy Doc already parsed for this text (see analyze_batch);
+    otherwise the text is parsed once, via the micro-batcher when enabled.
+    
+    Each stage runs inside a StageTrace span; the timings are returned in
+    stage_timings and aggregated for /metrics.
+    
     This function NEVER makes final legal decisions - it only assists.
     """
     decision_path = []
+    trace = StageTrace()
     
     # ============================================
     # STEP 1: Rule Engine (PRIMARY DECISION LAYER)
@@ -195,17 +219,24 @@ def run_inference(text: str, language: str = "english") -> InferenceResult:
     logger.info("Step 1: Running rule engine")
     decision_path.append("Rule Engine")
     
-    intent_str, rule_confidence = classify_intent(text)
+    # One pass over the text feeds every rule module
+    with trace.span("keyword_scan"):
+        keyword_scan = scan_text(text)
+    
+    with trace.span("intent_rules"):
+        intent_str, rule_confidence = classify_intent(text, scan=keyword_scan)
     intent = IntentType(intent_str) if intent_str != "unknown" else IntentType.UNKNOWN
     
     logger.info(f"Rule engine result: intent={intent}, confidence={rule_confidence}")
     
     # Detect legal triggers
-    legal_triggers = detect_legal_triggers(text)
+    with trace.span("legal_triggers"):
+        legal_triggers = detect_legal_triggers(text, scan=keyword_scan)
     decision_path.append(f"Legal Triggers ({len(legal_triggers.get('rti_sections', []))} RTI, {len(legal_triggers.get('grievance_markers', []))} Grievance)")
     
     # Map to departments
-    department_mapping = map_issue_to_department(text)
+    with trace.span("issue_mapping"):
+        department_mapping = map_issue_to_department(text, scan=keyword_scan)
     
     # ============================================
     # STEP 2: spaCy NLP (Entity Extraction)
@@ -213,9 +244,17 @@ def run_inference(text: str, language: str = "english") -> InferenceResult:
     logger.info("Step 2: Running spaCy NLP")
     decision_path.append("spaCy NLP")
     
-    entities = extract_entities(text)
-    key_phrases = extract_key_phrases(text)
-    sentiment = analyze_sentiment_basic(text)
+    # Parse once and share the Doc across the spaCy helpers
+    if doc is None:
+        with trace.span("spacy_parse"):
+            doc = parse_text(text, batched=get_settings().SPACY_BATCH_ENABLED)
+    
+    with trace.span("entity_extraction"):
+        entities = extract_entities(text, doc=doc)
+    with trace.span("key_phrases"):
+        key_phrases = extract_key_phrases(text, doc=doc)
+    with trace.span("sentiment"):
+        sentiment = analyze_sentiment_basic(text)
     
     logger.info(f"spaCy extracted {len(entities)} entity types, {len(key_phrases)} phrases")
     
@@ -225,21 +264,24 @@ def run_inference(text: str, language: str = "english") -> InferenceResult:
     logger.info("Step 3: Evaluating confidence gate")
     decision_path.append("Confidence Gate")
     
-    # Boost confidence if legal triggers support the intent
-    adjusted_confidence = rule_confidence
-    
-    if intent == IntentType.RTI and legal_triggers.get("rti_sections"):
-        adjusted_confidence = min(0.95, adjusted_confidence + 0.1)
-        decision_path.append("RTI sections confirmed (+10%)")
-    
-    if intent == IntentType.COMPLAINT and legal_triggers.get("grievance_markers"):
-        adjusted_confidence = min(0.95, adjusted_confidence + 0.1)
-        decision_path.append("Grievance markers confirmed (+10%)")
+    with trace.span("confidence_gate"):
+        # Boost confidence if legal triggers support the intent
+        adjusted_confidence = rule_confidence
+        
+        if intent == IntentType.RTI and legal_triggers.get("rti_sections"):
+            adjusted_confidence = min(0.95, adjusted_confidence + 0.1)
+            decision_path.append("RTI sections confirmed (+10%)")
+        
+        if intent == IntentType.COMPLAINT and legal_triggers.get("grievance_markers"):
+            adjusted_confidence = min(0.95, adjusted_confidence + 0.1)
+            decision_path.append("Grievance markers confirmed (+10%)")
+        
+        use_nlp = should_use_nlp(adjusted_confidence)
     
     # ============================================
     # STEP 4: DistilBERT (ONLY if confidence is low)
     # ============================================
-    if should_use_nlp(adjusted_confidence):
+    if use_nlp:
         logger.info("Step 4: Confidence low, invoking DistilBERT for semantic analysis")
         decision_path.append("DistilBERT (semantic boost)")
         
@@ -255,33 +297,34 @@ def run_inference(text: str, language: str = "english") -> InferenceResult:
             "I want to report corruption and misconduct"
         ]
         
-        try:
-            rti_scores = [compute_similarity(text, t) for t in rti_templates]
-            complaint_scores = [compute_similarity(text, t) for t in complaint_templates]
-            
-            max_rti = max(rti_scores) if rti_scores else 0
-            max_complaint = max(complaint_scores) if complaint_scores else 0
-            
-            # Use semantic results to refine intent if rule engine was uncertain
-            if intent == IntentType.UNKNOWN:
-                if max_rti > max_complaint and max_rti > 0.6:
-                    intent = IntentType.RTI
-                    adjusted_confidence = max_rti * 0.8  # Scale down for safety
-                    decision_path.append(f"DistilBERT suggests RTI ({max_rti:.2f})")
-                elif max_complaint > max_rti and max_complaint > 0.6:
-                    intent = IntentType.COMPLAINT
-                    adjusted_confidence = max_complaint * 0.8
-                    decision_path.append(f"DistilBERT suggests Complaint ({max_complaint:.2f})")
+        with trace.span("distilbert_fallback"):
+            try:
+                rti_scores = [compute_similarity(text, t) for t in rti_templates]
+                complaint_scores = [compute_similarity(text, t) for t in complaint_templates]
+                
+                max_rti = max(rti_scores) if rti_scores else 0
+                max_complaint = max(complaint_scores) if complaint_scores else 0
+                
+                # Use semantic results to refine intent if rule engine was uncertain
+                if intent == IntentType.UNKNOWN:
+                    if max_rti > max_complaint and max_rti > 0.6:
+                        intent = IntentType.RTI
+                        adjusted_confidence = max_rti * 0.8  # Scale down for safety
+                        decision_path.append(f"DistilBERT suggests RTI ({max_rti:.2f})")
+                    elif max_complaint > max_rti and max_complaint > 0.6:
+                        intent = IntentType.COMPLAINT
+                        adjusted_confidence = max_complaint * 0.8
+                        decision_path.append(f"DistilBERT suggests Complaint ({max_complaint:.2f})")
+                    else:
+                        decision_path.append("DistilBERT inconclusive")
                 else:
-                    decision_path.append("DistilBERT inconclusive")
-            else:
-                # Boost existing confidence slightly
-                boost = max(max_rti, max_complaint) * 0.1
-                adjusted_confidence = min(0.9, adjusted_confidence + boost)
-                decision_path.append(f"DistilBERT boosted confidence (+{boost:.2f})")
-        except Exception as e:
-            logger.warning(f"DistilBERT analysis failed: {e}")
-            decision_path.append("DistilBERT skipped (error)")
+                    # Boost existing confidence slightly
+                    boost = max(max_rti, max_complaint) * 0.1
+                    adjusted_confidence = min(0.9, adjusted_confidence + boost)
+                    decision_path.append(f"DistilBERT boosted confidence (+{boost:.2f})")
+            except Exception as e:
+                logger.warning(f"DistilBERT analysis failed: {e}")
+                decision_path.append("DistilBERT skipped (error)")
     else:
         logger.info("Step 4: Confidence sufficient, skipping DistilBERT")
         decision_path.append("DistilBERT skipped (confidence sufficient)")
@@ -289,18 +332,20 @@ def run_inference(text: str, language: str = "english") -> InferenceResult:
     # ============================================
     # STEP 5: Determine document type
     # ============================================
-    document_type, doc_type_confidence = _determine_document_type(text, intent)
+    with trace.span("document_type"):
+        document_type, doc_type_confidence = _determine_document_type(text, intent, keyword_scan)
     decision_path.append(f"Document type: {document_type.value}")
     
     # ============================================
     # STEP 6: Apply confidence gate for final result
     # ============================================
-    gated = gate_result(
-        value=intent,
-        confidence=adjusted_confidence,
-        alternatives=[{"type": t.value, "confidence": 0.0} for t in [IntentType.RTI, IntentType.COMPLAINT, IntentType.APPEAL]] if intent == IntentType.UNKNOWN else [],
-        context=text[:100]
-    )
+    with trace.span("confidence_gate"):
+        gated = gate_result(
+            value=intent,
+            confidence=adjusted_confidence,
+            alternatives=[{"type": t.value, "confidence": 0.0} for t in [IntentType.RTI, IntentType.COMPLAINT, IntentType.APPEAL]] if intent == IntentType.UNKNOWN else [],
+            context=text[:100]
+        )
     
     # Generate suggestions
     suggestions = _generate_suggestions(intent, entities, legal_triggers)
@@ -321,5 +366,20 @@ def run_inference(text: str, language: str = "english") -> InferenceResult:
         sentiment=sentiment,
         suggestions=suggestions,
         explanation=explanation,
-        decision_path=decision_path
+        decision_path=decision_path,
+        stage_timings=trace.finish()
     )
+
+
+def analyze_batch(texts: List[str], language: str = "english") -> List[InferenceResult]:
+    """
+    Run inference on many texts at once.
+    All texts go through a single nlp.pipe call; the rest of the pipeline
+    runs per text exactly as in run_inference.
+    """
+    if not texts:
+        return []
+    
+    logger.info(f"Batch inference on {len(texts)} texts")
+    docs = parse_texts(texts, batch_size=get_settings().SPACY_BATCH_MAX_SIZE)
+    return [run_inference(text, language, doc=doc) for text, doc in zip(texts, docs)]
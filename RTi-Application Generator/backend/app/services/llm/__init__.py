@@ -13,6 +13,7 @@ CRITICAL DESIGN PRINCIPLES:
 Components:
 - openai_service: Core OpenAI API wrapper with safety guardrails
 - text_enhancer: Polishes draft text while preserving legal accuracy
+- response_cache: TTL/LRU response cache and single-flight request coalescing
 - smart_translator: Better translation than rule-based models
 """
 
@@ -24,6 +25,11 @@ from .openai_service import (
     LLMMode,
 )
 
+from .response_cache import (
+    LLMResponseCache,
+    SingleFlight,
+)
+
 from .text_enhancer import (
     enhance_draft_text,
     clarify_issue_description,
@@ -39,6 +45,8 @@ __all__ = [
     "is_llm_available",
     "LLMResponse",
     "LLMMode",
+    "LLMResponseCache",
+    "SingleFlight",
     
     # Text Enhancer
     "enhance_draft_text",
@@ -8,16 +8,19 @@ DESIGN PRINCIPLE:
 This service provides controlled access to OpenAI's API with:
 1. Strict system prompts that enforce legal/civic language
 2. Guardrails preventing hallucination of legal facts
-3. Audit logging of all LLM interactions
+3. Audit logging of all LLM interactions (bounded ring buffer)
 4. Fallback to rule-based output if LLM fails
+5. Response cache + single-flight so identical requests are paid for once
 
 The LLM is NEVER the authority - it assists within controlled boundaries.
 """
 
+import asyncio
 import os
+from collections import deque
 from enum import Enum
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from loguru import logger
 
@@ -29,6 +32,7 @@ except ImportError:
     logger.warning("OpenAI package not installed. LLM features disabled.")
 
 from app.config import get_settings
+from .response_cache import LLMResponseCache, SingleFlight, make_cache_key
 
 
 class LLMMode(str, Enum):
@@ -53,6 +57,7 @@ class LLMResponse:
     confidence: float = 1.0
     fallback_used: bool = False
     error: Optional[str] = None
+    cached: bool = False        # Served from cache or a coalesced in-flight call
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
@@ -143,11 +148,19 @@ class OpenAIService:
     not as a replacement for it.
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[Any] = None):
         self.settings = get_settings()
-        self.client: Optional[OpenAI] = None
-        self._initialized = False
-        self._audit_log: List[Dict[str, Any]] = []
+        self.client: Optional[OpenAI] = client
+        # An injected client (e.g. a local fake in tests) skips API-key setup
+        self._initialized = client is not None
+        self._audit_log: deque = deque(maxlen=max(1, self.settings.LLM_AUDIT_LOG_SIZE))
+        self._cache: Optional[LLMResponseCache] = None
+        if self.settings.LLM_CACHE_ENABLED:
+            self._cache = LLMResponseCache(
+                max_entries=self.settings.LLM_CACHE_MAX_ENTRIES,
+                ttl_seconds=self.settings.LLM_CACHE_TTL_SECONDS
+            )
+        self._single_flight = SingleFlight()
         
     def _initialize(self) -> bool:
         """Lazy initialization of OpenAI client"""
@@ -225,11 +238,45 @@ class OpenAIService:
             elif mode == LLMMode.TRANSLATE and "target_language" in context:
                 user_message = f"Translate to: {context.get('target_language', 'Hindi')}\n\nTEXT:\n{text}"
         
+        # Identical requests (same model, mode, text and tone/language) are
+        # answered from cache or joined onto the call already in flight
+        cache_key = make_cache_key(self.settings.OPENAI_MODEL, mode.value, user_message)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return self._reuse(cached, start_time, context, source="cache")
+        
+        result, shared = await self._single_flight.run(
+            cache_key,
+            lambda: self._call_llm(text, mode, system_prompt, user_message, context, start_time)
+        )
+        if shared:
+            return self._reuse(result, start_time, context, source="coalesced")
+        
+        if self._cache is not None and not result.fallback_used:
+            self._cache.put(cache_key, result)
+        return result
+    
+    async def _call_llm(
+        self,
+        text: str,
+        mode: LLMMode,
+        system_prompt: str,
+        user_message: str,
+        context: Optional[Dict[str, Any]],
+        start_time: float
+    ) -> LLMResponse:
+        """Make the API call (off the event loop) and build the audited response"""
+        import time
+        
         try:
             if self.client is None:
                 raise ValueError("OpenAI client not initialized")
             
-            response = self.client.chat.completions.create(
+            # The OpenAI client is synchronous; run it in a thread so other
+            # requests (including coalesced duplicates) keep being served
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.settings.OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -278,6 +325,28 @@ class OpenAIService:
                 error=str(e)
             )
     
+    def _reuse(
+        self,
+        response: LLMResponse,
+        start_time: float,
+        context: Optional[Dict[str, Any]],
+        source: str
+    ) -> LLMResponse:
+        """Copy of a shared response for this caller - no tokens were spent"""
+        import time
+        
+        reused = replace(
+            response,
+            tokens_used=0,
+            processing_time_ms=(time.time() - start_time) * 1000,
+            changes_made=list(response.changes_made),
+            cached=True,
+            timestamp=datetime.utcnow()
+        )
+        if not reused.fallback_used:
+            self._log_interaction(reused, context, source=source)
+        return reused
+    
     def _detect_changes(self, original: str, enhanced: str) -> List[str]:
         """Detect what changes were made (for transparency)"""
         changes = []
@@ -297,7 +366,7 @@ class OpenAIService:
         
         return changes
     
-    def _log_interaction(self, response: LLMResponse, context: Optional[Dict] = None):
+    def _log_interaction(self, response: LLMResponse, context: Optional[Dict] = None, source: str = "llm"):
         """Log LLM interaction for audit purposes"""
         log_entry = {
             "timestamp": response.timestamp.isoformat(),
@@ -307,22 +376,32 @@ class OpenAIService:
             "processing_ms": response.processing_time_ms,
             "changes": response.changes_made,
             "fallback": response.fallback_used,
+            "source": source,  # llm, cache or coalesced
             "context": context,
             # Don't log full text for privacy, just lengths
             "original_length": len(response.original_text),
             "enhanced_length": len(response.enhanced_text),
         }
+        # Ring buffer: the oldest entry drops off once LLM_AUDIT_LOG_SIZE is reached
         self._audit_log.append(log_entry)
         
-        # Keep only last 100 entries in memory
-        if len(self._audit_log) > 100:
-            self._audit_log = self._audit_log[-100:]
-        
-        logger.debug(f"LLM interaction logged: {response.mode.value}, {response.tokens_used} tokens")
+        logger.debug(f"LLM interaction logged: {response.mode.value} ({source}), {response.tokens_used} tokens")
     
     def get_audit_log(self) -> List[Dict[str, Any]]:
         """Get recent LLM interactions for audit"""
-        return self._audit_log.copy()
+        return list(self._audit_log)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Response cache and single-flight counters"""
+        stats: Dict[str, Any] = self._cache.stats() if self._cache is not None else {"enabled": False}
+        stats["coalesced"] = self._single_flight.coalesced
+        stats["in_flight"] = self._single_flight.in_flight
+        return stats
+    
+    def clear_cache(self):
+        """Drop all cached responses"""
+        if self._cache is not None:
+            self._cache.clear()
 
 
 # =============================================================================
@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from loguru import logger
 
+from app.services.executor import run_in_executor
 from .openai_service import (
     get_openai_service,
     is_llm_available,
@@ -301,9 +302,9 @@ async def translate_to_hindi_llm(text: str) -> EnhancementResult:
     """
     
     if not is_llm_available():
-        # Fallback to existing translator
+        # Fallback to existing translator (sentence-cached, off the event loop)
         from app.services.nlp import translate_to_hindi
-        translated = translate_to_hindi(text)
+        translated = await run_in_executor(translate_to_hindi, text)
         
         return EnhancementResult(
             original_text=text,
@@ -337,7 +338,7 @@ async def translate_to_hindi_llm(text: str) -> EnhancementResult:
     except Exception as e:
         logger.error(f"LLM translation failed, using fallback: {e}")
         from app.services.nlp import translate_to_hindi
-        translated = translate_to_hindi(text)
+        translated = await run_in_executor(translate_to_hindi, text)
         
         return EnhancementResult(
             original_text=text,
@@ -6,6 +6,8 @@ Components:
 - spacy_engine: Named Entity Recognition and phrase matching
 - distilbert_semantic: Semantic similarity ranking (NOT generation)
 - confidence_gate: Controls when AI predictions require user confirmation
+- translator: Sentence-level English -> Hindi translation with a shared cache
+- model_registry: Loading, warm-up, memory accounting and idle unloading of all models
 """
 
 # Import spaCy NLP functions directly
@@ -19,6 +21,8 @@ from .spacy_engine import (
     full_analysis,
     preload_models as preload_spacy,
     get_nlp,
+    parse_text,
+    parse_texts,
     NLPResult,
     ExtractedEntity,
     EntityType,
@@ -36,6 +40,8 @@ from .distilbert_semantic import (
     is_model_loaded,
     clear_cache,
     get_cache_stats,
+    persist_embeddings,
+    set_encoder,
     SimilarityResult,
     SemanticAnalysisResult,
 )
@@ -51,7 +57,19 @@ from .confidence_gate import (
 # Import translator functions
 from .translator import (
     translate_to_hindi,
+    translate_many_to_hindi,
     get_translator,
+    get_translation_engine,
+    set_translation_engine,
+    TranslationBackend,
+    TranslationEngine,
+)
+
+# Import model registry
+from .model_registry import (
+    ModelRegistry,
+    ModelSpec,
+    get_model_registry,
 )
 
 # Export main functions
@@ -68,7 +86,12 @@ __all__ = [
     "preload_spacy",
     "preload_all_models",
     "translate_to_hindi",
+    "translate_many_to_hindi",
     "get_translator",
+    "get_translation_engine",
+    "set_translation_engine",
+    "TranslationBackend",
+    "TranslationEngine",
 ]
 
 from .confidence_gate import (
@@ -100,6 +123,8 @@ __all__ = [
     "full_analysis",
     "preload_spacy",
     "get_nlp",
+    "parse_text",
+    "parse_texts",
     "NLPResult",
     "ExtractedEntity",
     "EntityType",
@@ -115,12 +140,25 @@ __all__ = [
     "is_model_loaded",
     "clear_cache",
     "get_cache_stats",
+    "persist_embeddings",
+    "set_encoder",
     "SimilarityResult",
     "SemanticAnalysisResult",
 
     # Translation
     "translate_to_hindi",
+    "translate_many_to_hindi",
     "get_translator",
+    "get_translation_engine",
+    "set_translation_engine",
+    "TranslationBackend",
+    "TranslationEngine",
+
+    # Model registry
+    "ModelRegistry",
+    "ModelSpec",
+    "get_model_registry",
+    "preload_all_models",
     
     # Confidence gate
     "ConfidenceLevel",
@@ -142,22 +180,5 @@ __all__ = [
 
 
 def preload_all_models():
-    """Preload all NLP models for faster inference"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    logger.info("Preloading all NLP models...")
-    
-    try:
-        preload_spacy()
-        logger.info("✓ spaCy models loaded")
-    except Exception as e:
-        logger.error(f"✗ spaCy loading failed: {e}")
-    
-    try:
-        preload_distilbert()
-        logger.info("✓ DistilBERT model loaded")
-    except Exception as e:
-        logger.error(f"✗ DistilBERT loading failed: {e}")
-    
-    logger.info("NLP model preloading complete")
+    """Load and warm every enabled NLP model in parallel; returns name -> status"""
+    return get_model_registry().warm_up()
@@ -0,0 +1,135 @@
+"""
+Micro-batching for NLP pipelines
+Collects concurrent single-item requests for a few milliseconds and
+processes them together (e.g. through spaCy's nlp.pipe).
+
+Callers are worker threads (see app.services.executor); each one blocks on
+its own future while a single background thread runs the batches.
+"""
+
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+from concurrent.futures import Future
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Gathers items submitted from many threads into batches.
+
+    A batch is flushed when it reaches max_batch_size or when max_wait_ms
+    has passed since its first item arrived, whichever comes first.
+    process_batch must return one result per input, in order.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], List[R]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "micro-batcher"
+    ):
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.name = name
+
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+        self.batches = 0
+        self.items = 0
+        self.max_observed_batch = 0
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                    self._thread.start()
+
+    def submit(self, item: T) -> "Future[R]":
+        """Queue an item; the returned future resolves when its batch is done"""
+        if self._closed:
+            raise RuntimeError(f"{self.name} is closed")
+        self._ensure_started()
+        future: "Future[R]" = Future()
+        self._queue.put((item, future))
+        return future
+
+    def process(self, item: T, timeout: Optional[float] = None) -> R:
+        """Submit an item and block until its result is ready"""
+        return self.submit(item).result(timeout=timeout)
+
+    def _collect(self) -> List[tuple]:
+        """Block for the first item, then gather more until size or deadline"""
+        first = self._queue.get()
+        if first is None:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is None:
+                self._queue.put(None)  # re-signal shutdown after this batch
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if not batch:
+                return
+
+            items = [item for item, _ in batch]
+            futures = [future for _, future in batch]
+            try:
+                results = self.process_batch(items)
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"{self.name}: batch returned {len(results)} results for {len(items)} items"
+                    )
+                for future, result in zip(futures, results):
+                    future.set_result(result)
+            except Exception as e:
+                logger.error(f"{self.name} batch failed: {e}")
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+
+            self.batches += 1
+            self.items += len(items)
+            self.max_observed_batch = max(self.max_observed_batch, len(items))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_observed_batch,
+            "pending": self._queue.qsize(),
+        }
+
+    def close(self):
+        """Stop the background thread after pending batches finish"""
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
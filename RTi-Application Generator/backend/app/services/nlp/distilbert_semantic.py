@@ -10,21 +10,36 @@ Following MODEL_USAGE_POLICY:
 - All decisions logged for audit trail
 """
 
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Callable
+from collections import OrderedDict
 from dataclasses import dataclass, field
 import numpy as np
 import logging
-from functools import lru_cache
+import threading
 import hashlib
 
+from .embedding_store import DiskEmbeddingStore, EmbeddingCache
+from .model_registry import ModelSpec, get_model_registry, torch_module_bytes
+
 logger = logging.getLogger(__name__)
 
 # Model will be loaded on first use
 _model = None
 _tokenizer = None
-_embedding_cache: Dict[str, np.ndarray] = {}
+_embedding_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
 _cache_max_size = 1000
 
+# Text -> embedding function; None means the DistilBERT mean-pooling encoder.
+# Tests and benchmarks swap in a stub via set_encoder().
+_encoder: Optional[Callable[[str], np.ndarray]] = None
+
+# Row-normalized candidate matrices keyed by candidate-set fingerprint, so
+# ranking against a fixed template/authority list is one matrix-vector product
+_candidate_matrices: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_candidate_matrix_cache_size = 8
+_matrix_lock = threading.Lock()
+
 
 @dataclass
 class SimilarityResult:
@@ -64,32 +79,45 @@ class SemanticAnalysisResult:
         }
 
 
+def _load_model():
+    try:
+        from transformers import DistilBertModel, DistilBertTokenizer
+        import torch
+        
+        logger.info("Loading DistilBERT model...")
+        tokenizer = DistilBertTokenizer.from_pretrained('distilbert-base-uncased')
+        model = DistilBertModel.from_pretrained('distilbert-base-uncased')
+        
+        # Set to evaluation mode
+        model.eval()
+        
+        # Move to GPU if available
+        if torch.cuda.is_available():
+            model = model.cuda()
+            logger.info("DistilBERT loaded on GPU")
+        else:
+            logger.info("DistilBERT loaded on CPU")
+        return model, tokenizer
+            
+    except Exception as e:
+        logger.error(f"Failed to load DistilBERT: {e}")
+        raise RuntimeError(f"Failed to load DistilBERT: {e}")
+
+
+def _release_model(loaded):
+    """Drop module references; cached embeddings stay valid for the reload"""
+    global _model, _tokenizer
+    _model = _tokenizer = None
+
+
 def get_model():
-    """Lazy load DistilBERT model with proper error handling"""
+    """Lazy load DistilBERT model with proper error handling (owned by the model registry)"""
     global _model, _tokenizer
     
     if _model is None:
-        try:
-            from transformers import DistilBertModel, DistilBertTokenizer
-            import torch
-            
-            logger.info("Loading DistilBERT model...")
-            _tokenizer = DistilBertTokenizer.from_pretrained('distilbert-base-uncased')
-            _model = DistilBertModel.from_pretrained('distilbert-base-uncased')
-            
-            # Set to evaluation mode
-            _model.eval()
-            
-            # Move to GPU if available
-            if torch.cuda.is_available():
-                _model = _model.cuda()
-                logger.info("DistilBERT loaded on GPU")
-            else:
-                logger.info("DistilBERT loaded on CPU")
-                
-        except Exception as e:
-            logger.error(f"Failed to load DistilBERT: {e}")
-            raise RuntimeError(f"Failed to load DistilBERT: {e}")
+        _model, _tokenizer = get_model_registry().get("distilbert")
+    else:
+        get_model_registry().touch("distilbert")
     
     return _model, _tokenizer
 
@@ -104,34 +132,69 @@ def _get_cache_key(text: str) -> str:
     return hashlib.md5(text.encode()).hexdigest()
 
 
-def _manage_cache():
-    """Manage cache size"""
+def _get_embedding_cache() -> EmbeddingCache:
+    """LRU (plus optional memory-mapped disk store) built from settings on first use"""
     global _embedding_cache
-    if len(_embedding_cache) > _cache_max_size:
-        # Remove oldest entries (first half)
-        keys = list(_embedding_cache.keys())
-        for key in keys[:len(keys)//2]:
-            del _embedding_cache[key]
-        logger.debug(f"Cache trimmed to {len(_embedding_cache)} entries")
+    if _embedding_cache is None:
+        with _cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = _build_embedding_cache()
+    return _embedding_cache
 
 
-def get_embedding(text: str, use_cache: bool = True) -> Tuple[np.ndarray, bool]:
+def _build_embedding_cache() -> EmbeddingCache:
+    from app.config import get_settings
+    settings = get_settings()
+
+    store = None
+    if settings.EMBEDDING_STORE_PATH:
+        try:
+            store = DiskEmbeddingStore(
+                settings.EMBEDDING_STORE_PATH,
+                read_only=settings.EMBEDDING_STORE_READ_ONLY
+            )
+            logger.info(f"Embedding store at {settings.EMBEDDING_STORE_PATH} ({len(store)} entries)")
+        except OSError as e:
+            logger.warning(f"Embedding store disabled: {e}")
+
+    return EmbeddingCache(
+        max_size=settings.EMBEDDING_CACHE_SIZE,
+        store=store,
+        flush_every=settings.EMBEDDING_STORE_FLUSH_EVERY
+    )
+
+
+def configure_embedding_cache(
+    max_size: int = _cache_max_size,
+    store_path: Optional[str] = None,
+    read_only: bool = False,
+    flush_every: int = 64
+) -> EmbeddingCache:
+    """Replace the embedding cache (used by tests, benchmarks and scripts)"""
+    global _embedding_cache
+    store = DiskEmbeddingStore(store_path, read_only=read_only) if store_path else None
+    with _cache_lock:
+        _embedding_cache = EmbeddingCache(max_size=max_size, store=store, flush_every=flush_every)
+    _clear_candidate_matrices()
+    return _embedding_cache
+
+
+def set_encoder(encoder: Optional[Callable[[str], np.ndarray]]):
     """
-    Get sentence embedding using DistilBERT.
-    Uses mean pooling of last hidden states.
-    
-    Returns: (embedding, cache_hit)
+    Override the text encoder (e.g. a deterministic stub in tests).
+    Pass None to restore the DistilBERT encoder.
     """
+    global _encoder
+    _encoder = encoder
+    _clear_candidate_matrices()
+
+
+def _encode_with_model(text: str) -> np.ndarray:
+    """DistilBERT sentence embedding: mean pooling of last hidden states"""
     import torch
-    
-    cache_key = _get_cache_key(text)
-    
-    # Check cache
-    if use_cache and cache_key in _embedding_cache:
-        return _embedding_cache[cache_key], True
-    
+
     model, tokenizer = get_model()
-    
+
     # Tokenize with truncation
     inputs = tokenizer(
         text, 
@@ -159,16 +222,204 @@ def get_embedding(text: str, use_cache: bool = True) -> Tuple[np.ndarray, bool]:
     # Sum embeddings where mask is 1, then divide by count
     sum_embeddings = torch.sum(token_embeddings * input_mask_expanded, 1)
     sum_mask = torch.clamp(input_mask_expanded.sum(1), min=1e-9)
-    embedding = (sum_embeddings / sum_mask).squeeze().cpu().numpy()
+    return (sum_embeddings / sum_mask).squeeze().cpu().numpy()
+
+
+def _encode_batch_with_model(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """Mean-pooled DistilBERT embeddings for many texts, tokenized in batches"""
+    import torch
+    
+    model, tokenizer = get_model()
+    
+    chunks = []
+    for i in range(0, len(texts), batch_size):
+        batch = texts[i:i + batch_size]
+        
+        inputs = tokenizer(
+            batch,
+            return_tensors="pt",
+            truncation=True,
+            max_length=512,
+            padding=True
+        )
+        
+        if torch.cuda.is_available():
+            inputs = {k: v.cuda() for k, v in inputs.items()}
+        
+        with torch.no_grad():
+            outputs = model(**inputs)
+        
+        # Mean pooling
+        attention_mask = inputs['attention_mask']
+        token_embeddings = outputs.last_hidden_state
+        input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
+        sum_embeddings = torch.sum(token_embeddings * input_mask_expanded, 1)
+        sum_mask = torch.clamp(input_mask_expanded.sum(1), min=1e-9)
+        chunks.append((sum_embeddings / sum_mask).cpu().numpy())
+    
+    return np.concatenate(chunks)
+
+
+def _encode_many(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """Encode texts with the active encoder as one (n, dim) float32 matrix"""
+    if _encoder is not None:
+        return np.stack([np.asarray(_encoder(t), dtype=np.float32) for t in texts])
+    return _encode_batch_with_model(texts, batch_size).astype(np.float32, copy=False)
+
+
+def get_embedding(text: str, use_cache: bool = True) -> Tuple[np.ndarray, bool]:
+    """
+    Get sentence embedding using DistilBERT.
+    Uses mean pooling of last hidden states.
+    
+    Lookup order: in-process LRU, then the memory-mapped disk store
+    (if configured), then the encoder.
+    
+    Returns: (embedding, cache_hit)
+    """
+    cache_key = _get_cache_key(text)
+    cache = _get_embedding_cache() if use_cache else None
+    
+    # Check cache
+    if cache is not None:
+        embedding = cache.get(cache_key)
+        if embedding is not None:
+            return embedding, True
+    
+    encoder = _encoder or _encode_with_model
+    embedding = np.asarray(encoder(text), dtype=np.float32)
     
     # Cache result
-    if use_cache:
-        _manage_cache()
-        _embedding_cache[cache_key] = embedding
+    if cache is not None:
+        cache.put(cache_key, embedding)
     
     return embedding, False
 
 
+def persist_embeddings() -> int:
+    """Write embeddings staged since the last flush to the disk store"""
+    if _embedding_cache is None:
+        return 0
+    written = _embedding_cache.flush()
+    if written:
+        logger.info(f"Persisted {written} embeddings")
+    return written
+
+
+def get_embeddings(
+    texts: List[str],
+    use_cache: bool = True,
+    batch_size: int = 32
+) -> Tuple[np.ndarray, int]:
+    """
+    Embeddings for many texts as one (n, dim) float32 matrix.
+    Cache misses are encoded together in batches.
+    
+    Returns: (matrix, cache_hits)
+    """
+    cache = _get_embedding_cache() if use_cache else None
+    keys = [_get_cache_key(t) for t in texts]
+    rows: List[Optional[np.ndarray]] = [None] * len(texts)
+    
+    if cache is not None:
+        for i, key in enumerate(keys):
+            rows[i] = cache.get(key)
+    
+    missing = [i for i, row in enumerate(rows) if row is None]
+    # Encode each distinct missing text once
+    unique_missing: Dict[str, int] = {}
+    for i in missing:
+        unique_missing.setdefault(keys[i], i)
+    if unique_missing:
+        encoded = _encode_many([texts[i] for i in unique_missing.values()], batch_size)
+        by_key = dict(zip(unique_missing.keys(), encoded))
+        for key, embedding in by_key.items():
+            if cache is not None:
+                cache.put(key, embedding)
+        for i in missing:
+            rows[i] = by_key[keys[i]]
+    
+    return np.stack(rows).astype(np.float32, copy=False), len(texts) - len(missing)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row; zero rows stay zero (similarity 0)"""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _candidate_fingerprint(candidates: List[str]) -> str:
+    """Order-sensitive hash of a candidate list"""
+    digest = hashlib.sha1()
+    for candidate in candidates:
+        encoded = candidate.encode()
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def _clear_candidate_matrices():
+    with _matrix_lock:
+        _candidate_matrices.clear()
+
+
+def get_candidate_matrix(candidates: List[str], batch_size: int = 32) -> Tuple[np.ndarray, int, bool]:
+    """
+    Row-normalized embedding matrix for a candidate list, cached per
+    candidate-set fingerprint.
+    
+    Returns: (matrix, embedding_cache_hits, matrix_cache_hit)
+    """
+    fingerprint = _candidate_fingerprint(candidates)
+    with _matrix_lock:
+        matrix = _candidate_matrices.get(fingerprint)
+        if matrix is not None:
+            _candidate_matrices.move_to_end(fingerprint)
+            return matrix, len(candidates), True
+    
+    embeddings, cache_hits = get_embeddings(candidates, batch_size=batch_size)
+    matrix = _normalize_rows(embeddings)
+    matrix.flags.writeable = False
+    
+    with _matrix_lock:
+        _candidate_matrices[fingerprint] = matrix
+        while len(_candidate_matrices) > _candidate_matrix_cache_size:
+            _candidate_matrices.popitem(last=False)
+    return matrix, cache_hits, False
+
+
+def _top_k_indices(scores: np.ndarray, top_k: Optional[int]) -> np.ndarray:
+    """
+    Indices of the top_k scores, highest first.
+    Ties keep input order, matching a stable descending sort.
+    """
+    n = scores.shape[0]
+    if top_k is None or top_k >= n:
+        candidates = np.arange(n)
+    elif top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+    else:
+        partition = np.argpartition(-scores, top_k - 1)[:top_k]
+        # Include every score tied with the k-th so tie order is deterministic
+        candidates = np.flatnonzero(scores >= scores[partition].min())
+    order = np.lexsort((candidates, -scores[candidates]))
+    result = candidates[order]
+    return result[:top_k] if top_k is not None else result
+
+
+def _score_candidates(query_emb: np.ndarray, candidates: List[str], batch_size: int = 32) -> Tuple[np.ndarray, int, bool]:
+    """
+    Cosine similarity of a query embedding against every candidate in one product.
+    
+    Returns: (scores, candidate_cache_hits, matrix_cache_hit)
+    """
+    if not candidates:
+        return np.empty(0, dtype=np.float32), 0, False
+    matrix, cache_hits, matrix_cached = get_candidate_matrix(candidates, batch_size)
+    query_unit = _normalize_rows(np.asarray(query_emb, dtype=np.float32).reshape(1, -1))[0]
+    return matrix @ query_unit, cache_hits, matrix_cached
+
+
 def compute_similarity(text1: str, text2: str) -> float:
     """
     Compute cosine similarity between two texts.
@@ -206,31 +457,12 @@ def rank_by_similarity(
     import time
     start_time = time.time()
     
-    query_emb, query_cached = get_embedding(query)
-    
-    results = []
-    for candidate in candidates:
-        cand_emb, _ = get_embedding(candidate)
-        
-        # Cosine similarity
-        dot_product = np.dot(query_emb, cand_emb)
-        norm1 = np.linalg.norm(query_emb)
-        norm2 = np.linalg.norm(cand_emb)
-        
-        if norm1 == 0 or norm2 == 0:
-            score = 0.0
-        else:
-            score = float(dot_product / (norm1 * norm2))
-            score = max(0.0, min(1.0, score))
-        
-        results.append((candidate, score))
-    
-    # Sort by score descending
-    results.sort(key=lambda x: x[1], reverse=True)
+    query_emb, _ = get_embedding(query)
+    scores, _, _ = _score_candidates(query_emb, candidates)
+    scores = np.clip(scores, 0.0, 1.0)
     
-    # Return top_k if specified
-    if top_k:
-        results = results[:top_k]
+    # top_k=0 historically meant "no limit"
+    results = [(candidates[i], float(scores[i])) for i in _top_k_indices(scores, top_k or None)]
     
     logger.debug(f"Ranked {len(candidates)} candidates in {(time.time()-start_time)*1000:.2f}ms")
     
@@ -268,44 +500,26 @@ def rank_by_similarity_detailed(
         "embedding_dim": len(query_emb)
     })
     
-    # Get candidate embeddings
-    results = []
-    cache_hits = 0
-    
-    for i, candidate in enumerate(candidates):
-        cand_emb, cached = get_embedding(candidate)
-        if cached:
-            cache_hits += 1
-        
-        # Compute similarity
-        score = compute_similarity(query, candidate)
-        
-        label = candidate_labels[i] if candidate_labels else candidate
-        results.append({
-            "candidate": label,
-            "original": candidate,
-            "score": score,
-            "cached": cached
-        })
-    
+    # Score all candidates against the cached, pre-normalized matrix
+    scores, cache_hits, matrix_cached = _score_candidates(query_emb, candidates)
+    scores = np.clip(scores, 0.0, 1.0)
     audit_trail.append({
         "step": "candidate_embeddings",
         "total_candidates": len(candidates),
-        "cache_hits": cache_hits
+        "cache_hits": cache_hits,
+        "matrix_cache_hit": matrix_cached
     })
     
-    # Sort and rank
-    results.sort(key=lambda x: x["score"], reverse=True)
-    
-    # Build top matches with explanations
+    # Rank (top_k only) and build matches with explanations
+    top_indices = _top_k_indices(scores, top_k)
     top_matches = []
-    for i, r in enumerate(results[:top_k]):
-        explanation = _generate_explanation(r["score"], i + 1)
+    for rank, i in enumerate(top_indices, start=1):
+        score = float(scores[i])
         top_matches.append(SimilarityResult(
-            candidate=r["candidate"],
-            score=r["score"],
-            rank=i + 1,
-            explanation=explanation
+            candidate=candidate_labels[i] if candidate_labels else candidates[i],
+            score=score,
+            rank=rank,
+            explanation=_generate_explanation(score, rank)
         ))
     
     processing_time = (time.time() - start_time) * 1000
@@ -313,7 +527,7 @@ def rank_by_similarity_detailed(
     audit_trail.append({
         "step": "ranking_complete",
         "processing_time_ms": round(processing_time, 2),
-        "top_score": results[0]["score"] if results else 0
+        "top_score": float(scores.max()) if len(scores) else 0
     })
     
     return SemanticAnalysisResult(
@@ -348,55 +562,13 @@ def batch_compute_similarities(
     """
     Compute similarities in batches for efficiency.
     Useful for large candidate sets.
-    """
-    import torch
     
-    model, tokenizer = get_model()
-    
-    # Get query embedding
+    Shares the cached candidate matrix with rank_by_similarity; scores are
+    raw cosine values in input order (not clamped).
+    """
     query_emb, _ = get_embedding(query)
-    
-    scores = []
-    
-    # Process candidates in batches
-    for i in range(0, len(candidates), batch_size):
-        batch = candidates[i:i + batch_size]
-        
-        # Tokenize batch
-        inputs = tokenizer(
-            batch,
-            return_tensors="pt",
-            truncation=True,
-            max_length=512,
-            padding=True
-        )
-        
-        if torch.cuda.is_available():
-            inputs = {k: v.cuda() for k, v in inputs.items()}
-        
-        with torch.no_grad():
-            outputs = model(**inputs)
-        
-        # Mean pooling
-        attention_mask = inputs['attention_mask']
-        token_embeddings = outputs.last_hidden_state
-        input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
-        sum_embeddings = torch.sum(token_embeddings * input_mask_expanded, 1)
-        sum_mask = torch.clamp(input_mask_expanded.sum(1), min=1e-9)
-        batch_embeddings = (sum_embeddings / sum_mask).cpu().numpy()
-        
-        # Compute cosine similarities
-        for emb in batch_embeddings:
-            dot = np.dot(query_emb, emb)
-            norm1 = np.linalg.norm(query_emb)
-            norm2 = np.linalg.norm(emb)
-            
-            if norm1 == 0 or norm2 == 0:
-                scores.append(0.0)
-            else:
-                scores.append(float(dot / (norm1 * norm2)))
-    
-    return scores
+    scores, _, _ = _score_candidates(query_emb, candidates, batch_size)
+    return scores.tolist()
 
 
 # Pre-defined templates for common civic queries
@@ -453,6 +625,22 @@ def classify_query_type(query: str) -> Dict[str, float]:
     return dict(sorted(results.items(), key=lambda x: x[1], reverse=True))
 
 
+def _distilbert_enabled() -> bool:
+    from app.config import get_settings
+    return get_settings().ENABLE_DISTILBERT
+
+
+get_model_registry().register(ModelSpec(
+    name="distilbert",
+    loader=_load_model,
+    warmup=lambda loaded: _encode_with_model("Warm-up request about a delayed pension payment"),
+    unloader=_release_model,
+    memory_estimator=lambda loaded: torch_module_bytes(loaded[0]),
+    enabled=_distilbert_enabled,
+    heavy=True,
+))
+
+
 def preload_model():
     """Pre-load model for faster inference"""
     logger.info("Pre-loading DistilBERT model...")
@@ -461,20 +649,26 @@ def preload_model():
     # Warm up with a test embedding
     _ = get_embedding("test query for model warmup")
     
+    # Template embeddings are reused on every classification; keep them on disk
+    for templates in CIVIC_TEMPLATES.values():
+        for template in templates:
+            get_embedding(template)
+    persist_embeddings()
+    
     logger.info("DistilBERT model loaded and ready")
 
 
 def clear_cache():
-    """Clear embedding cache"""
-    global _embedding_cache
-    _embedding_cache = {}
+    """Clear in-memory embedding cache (the disk store is kept)"""
+    if _embedding_cache is not None:
+        _embedding_cache.clear()
+    _clear_candidate_matrices()
     logger.info("Embedding cache cleared")
 
 
 def get_cache_stats() -> Dict[str, Any]:
-    """Get cache statistics"""
-    return {
-        "cache_size": len(_embedding_cache),
-        "max_size": _cache_max_size,
-        "model_loaded": is_model_loaded()
-    }
+    """Get cache statistics: LRU size, hits/misses/evictions and disk store"""
+    stats = _get_embedding_cache().stats()
+    stats["candidate_matrices"] = len(_candidate_matrices)
+    stats["model_loaded"] = is_model_loaded()
+    return stats
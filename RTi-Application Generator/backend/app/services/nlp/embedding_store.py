@@ -0,0 +1,301 @@
+"""
+Embedding Store
+Caching layer for sentence embeddings used by distilbert_semantic
+
+Two tiers:
+- EmbeddingLRU: in-process, size-bounded LRU with hit/miss/eviction counters
+- DiskEmbeddingStore: optional on-disk float32 matrix opened with np.memmap,
+  so embeddings (e.g. civic template candidates) survive restarts and the
+  pages are shared read-only between uvicorn workers
+
+Disk layout (one directory):
+- vectors.f32: row-major float32 matrix, one row per embedding
+- index.json:  {"dim": int, "keys": [cache_key, ...]} - row i belongs to keys[i]
+
+Writers never modify files in place: new rows are merged with whatever is
+on disk and both files are replaced atomically, so readers holding an old
+mapping keep a consistent view.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-writer deployments only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.f32"
+INDEX_FILE = "index.json"
+LOCK_FILE = ".lock"
+
+
+class EmbeddingLRU:
+    """Thread-safe LRU of embeddings keyed by cache key"""
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max(1, max_size)
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def put(self, key: str, embedding: np.ndarray):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = embedding
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "cache_size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class DiskEmbeddingStore:
+    """
+    Memory-mapped float32 embedding matrix plus a key index.
+
+    Lookups go through a read-only np.memmap; new embeddings are staged in
+    memory and written by flush(). The mapping is reopened whenever another
+    process has replaced the index.
+    """
+
+    def __init__(self, path: str, read_only: bool = False):
+        self.path = path
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._rows: Dict[str, int] = {}
+        self._dim: Optional[int] = None
+        self._index_mtime: Optional[float] = None
+        self._pending: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.writes = 0
+
+        if not read_only:
+            os.makedirs(path, exist_ok=True)
+        self._reload()
+
+    @property
+    def _vectors_path(self) -> str:
+        return os.path.join(self.path, VECTORS_FILE)
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.path, INDEX_FILE)
+
+    @contextmanager
+    def _writer_lock(self):
+        """Serialize flushes across worker processes sharing the directory"""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.path, LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _reload(self):
+        """(Re)open the mapping if the on-disk index changed"""
+        try:
+            mtime = os.path.getmtime(self._index_path)
+        except OSError:
+            return
+        if mtime == self._index_mtime:
+            return
+
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            keys = index["keys"]
+            dim = int(index["dim"])
+            vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(len(keys), dim)) \
+                if keys else np.empty((0, dim), dtype=np.float32)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable embedding store at {self.path}: {e}")
+            return
+
+        self._vectors = vectors
+        self._rows = {key: i for i, key in enumerate(keys)}
+        self._dim = dim
+        self._index_mtime = mtime
+        logger.debug(f"Mapped {len(keys)} embeddings from {self.path}")
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.hits += 1
+                return pending
+            row = self._rows.get(key)
+            if row is None:
+                self._reload()
+                row = self._rows.get(key)
+                if row is None:
+                    return None
+            self.hits += 1
+            return self._vectors[row]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._pending or key in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows) + sum(1 for key in self._pending if key not in self._rows)
+
+    def add(self, key: str, embedding: np.ndarray):
+        """Stage an embedding for the next flush()"""
+        if self.read_only:
+            return
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        with self._lock:
+            if key in self._rows:
+                return
+            if self._dim is not None and vector.shape[0] != self._dim:
+                raise ValueError(f"Embedding dim {vector.shape[0]} does not match store dim {self._dim}")
+            self._dim = vector.shape[0]
+            self._pending[key] = vector
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Merge staged embeddings into the on-disk store.
+        Returns the number of rows written.
+        """
+        if self.read_only:
+            return 0
+        with self._lock, self._writer_lock():
+            self._reload()
+            new_items = [(k, v) for k, v in self._pending.items() if k not in self._rows]
+            if not new_items:
+                self._pending.clear()
+                return 0
+
+            keys: List[str] = [None] * len(self._rows)
+            for key, row in self._rows.items():
+                keys[row] = key
+            existing = self._vectors if self._vectors is not None else np.empty((0, self._dim), dtype=np.float32)
+            merged = np.concatenate([
+                np.asarray(existing, dtype=np.float32),
+                np.stack([v for _, v in new_items]).astype(np.float32, copy=False),
+            ])
+            keys.extend(k for k, _ in new_items)
+
+            tmp_vectors = f"{self._vectors_path}.{os.getpid()}.tmp"
+            tmp_index = f"{self._index_path}.{os.getpid()}.tmp"
+            try:
+                merged.tofile(tmp_vectors)
+                with open(tmp_index, "w", encoding="utf-8") as f:
+                    json.dump({"dim": int(merged.shape[1]), "keys": keys}, f)
+                # Vectors first: a reader that sees the new index always finds enough rows
+                os.replace(tmp_vectors, self._vectors_path)
+                os.replace(tmp_index, self._index_path)
+            except OSError as e:
+                logger.warning(f"Could not write embedding store at {self.path}: {e}")
+                for tmp in (tmp_vectors, tmp_index):
+                    if os.path.exists(tmp):
+                        os.remove(tmp)
+                return 0
+
+            self._pending.clear()
+            self._index_mtime = None
+            self._reload()
+            self.writes += len(new_items)
+            return len(new_items)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "read_only": self.read_only,
+            "entries": len(self._rows),
+            "pending": len(self._pending),
+            "dim": self._dim,
+            "hits": self.hits,
+            "writes": self.writes,
+        }
+
+
+class EmbeddingCache:
+    """LRU in front of an optional disk store"""
+
+    def __init__(self, max_size: int = 1000, store: Optional[DiskEmbeddingStore] = None,
+                 flush_every: int = 64):
+        self.lru = EmbeddingLRU(max_size)
+        self.store = store
+        self.flush_every = max(1, flush_every)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        embedding = self.lru.get(key)
+        if embedding is not None or self.store is None:
+            return embedding
+        embedding = self.store.get(key)
+        if embedding is not None:
+            self.lru.put(key, embedding)
+        return embedding
+
+    def put(self, key: str, embedding: np.ndarray):
+        self.lru.put(key, embedding)
+        if self.store is not None and not self.store.read_only:
+            self.store.add(key, embedding)
+            if self.store.pending_count >= self.flush_every:
+                self.store.flush()
+
+    def put_many(self, items: Iterable[Tuple[str, np.ndarray]]):
+        for key, embedding in items:
+            self.put(key, embedding)
+
+    def flush(self) -> int:
+        return self.store.flush() if self.store is not None else 0
+
+    def clear(self):
+        """Drop in-memory entries; the disk store is left untouched"""
+        self.lru.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.lru.stats()
+        stats["disk"] = self.store.stats() if self.store is not None else None
+        return stats
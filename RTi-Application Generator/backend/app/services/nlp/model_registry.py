@@ -0,0 +1,324 @@
+"""
+Model Registry
+Single owner of every NLP model the backend loads (spaCy, DistilBERT, the
+MarianMT translator)
+
+- each model is registered once as a ModelSpec (loader, optional synthetic
+  warm-up request, optional release hook)
+- models still load lazily on first use; warm_up() loads and exercises all
+  enabled models in parallel at startup
+- per model: load time, warm-up time, resident memory and last use, reported
+  on /health
+- heavy models idle for longer than idle_timeout_seconds are unloaded by a
+  background reaper and reloaded transparently on next use
+
+Memory is the model's own estimate (e.g. tensor bytes) when the spec
+provides one, otherwise the process RSS growth measured around the load.
+RSS deltas are approximate when several models load at the same time.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+
+def process_rss_bytes() -> Optional[int]:
+    """Current resident set size of this process (None if unknown)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+def torch_module_bytes(module: Any) -> int:
+    """Bytes held by a torch module's parameters and buffers"""
+    tensors = list(module.parameters()) + list(module.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+@dataclass
+class ModelSpec:
+    """How to load, exercise and release one model"""
+    name: str
+    loader: Callable[[], Any]
+    warmup: Optional[Callable[[Any], Any]] = None
+    unloader: Optional[Callable[[Any], None]] = None
+    memory_estimator: Optional[Callable[[Any], int]] = None
+    enabled: Callable[[], bool] = lambda: True
+    heavy: bool = False
+
+
+class _ModelEntry:
+    """Runtime state of one registered model"""
+
+    def __init__(self, spec: ModelSpec):
+        self.spec = spec
+        self.model: Any = None
+        self.lock = threading.Lock()
+        self.status = "not_loaded"
+        self.error: Optional[str] = None
+        self.load_ms: Optional[float] = None
+        self.warmup_ms: Optional[float] = None
+        self.memory_bytes: Optional[int] = None
+        self.memory_source: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+        self.last_used: Optional[float] = None
+        self.loads = 0
+        self.unloads = 0
+
+
+class ModelRegistry:
+    """Loads, warms, accounts for and unloads the registered models"""
+
+    def __init__(self, idle_timeout_seconds: float = 0, clock: Callable[[], float] = time.monotonic):
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._reaper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def register(self, spec: ModelSpec):
+        """Add a model; re-registering a name replaces its spec and drops the old model"""
+        previous = self._entries.get(spec.name)
+        if previous is not None and previous.model is not None:
+            self.unload(spec.name)
+        self._entries[spec.name] = _ModelEntry(spec)
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def _entry(self, name: str) -> _ModelEntry:
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"Unknown model: {name}")
+        return entry
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def get(self, name: str) -> Any:
+        """The loaded model, loading it first if needed; marks it as used"""
+        entry = self._entry(name)
+        model = entry.model
+        if model is None:
+            model = self._load(entry)
+        entry.last_used = self._clock()
+        return model
+
+    def touch(self, name: str):
+        """Record a use of a model the caller already holds"""
+        entry = self._entries.get(name)
+        if entry is not None:
+            entry.last_used = self._clock()
+
+    def is_loaded(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return entry is not None and entry.model is not None
+
+    def _load(self, entry: _ModelEntry) -> Any:
+        with entry.lock:
+            if entry.model is not None:
+                return entry.model
+            spec = entry.spec
+            entry.status = "loading"
+            rss_before = process_rss_bytes()
+            started = time.perf_counter()
+            try:
+                model = spec.loader()
+            except Exception as e:
+                entry.status = "failed"
+                entry.error = str(e)
+                logger.warning(f"Failed to load model {spec.name}: {e}")
+                raise
+            entry.load_ms = round((time.perf_counter() - started) * 1000, 2)
+            entry.memory_bytes, entry.memory_source = self._measure(spec, model, rss_before)
+            entry.model = model
+            entry.status = "loaded"
+            entry.error = None
+            entry.loaded_at = entry.last_used = self._clock()
+            entry.loads += 1
+            logger.info(f"Loaded model {spec.name} in {entry.load_ms:.0f} ms")
+            return model
+
+    @staticmethod
+    def _measure(spec: ModelSpec, model: Any, rss_before: Optional[int]):
+        if spec.memory_estimator is not None:
+            try:
+                return int(spec.memory_estimator(model)), "estimate"
+            except Exception as e:
+                logger.debug(f"Memory estimate for {spec.name} failed: {e}")
+        rss_after = process_rss_bytes()
+        if rss_before is None or rss_after is None:
+            return None, None
+        return max(0, rss_after - rss_before), "rss_delta"
+
+    def warm_up(
+        self,
+        names: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, str]:
+        """
+        Load every enabled model (or just `names`) in parallel and run its
+        synthetic warm-up request. Returns name -> status; failures are
+        logged, never raised.
+        """
+        if names is None:
+            selected = [entry for entry in self._entries.values() if self._enabled(entry)]
+        else:
+            selected = [self._entry(name) for name in names]
+        if not selected:
+            return {}
+
+        pool = ThreadPoolExecutor(max_workers=len(selected), thread_name_prefix="model-warmup")
+        futures = {pool.submit(self._warm_one, entry): entry.spec.name for entry in selected}
+        done, _ = wait(futures, timeout=timeout)
+        pool.shutdown(wait=False)
+
+        results = {}
+        for future, name in futures.items():
+            results[name] = future.result() if future in done else "timeout"
+        return results
+
+    def _warm_one(self, entry: _ModelEntry) -> str:
+        try:
+            model = self.get(entry.spec.name)
+            if entry.spec.warmup is not None:
+                started = time.perf_counter()
+                entry.spec.warmup(model)
+                entry.warmup_ms = round((time.perf_counter() - started) * 1000, 2)
+        except Exception as e:
+            entry.error = str(e)
+            if entry.status == "loaded":
+                logger.warning(f"Warm-up request for model {entry.spec.name} failed: {e}")
+                return "warmup_failed"
+            return "failed"
+        return "ready"
+
+    @staticmethod
+    def _enabled(entry: _ModelEntry) -> bool:
+        try:
+            return bool(entry.spec.enabled())
+        except Exception:
+            return False
+
+    # -------------------------------------------------------------------------
+    # Unloading
+    # -------------------------------------------------------------------------
+
+    def unload(self, name: str) -> bool:
+        """Release a model; the next get() loads it again"""
+        entry = self._entry(name)
+        with entry.lock:
+            model = entry.model
+            if model is None:
+                return False
+            entry.model = None
+            entry.status = "unloaded"
+            entry.memory_bytes = None
+            entry.memory_source = None
+            entry.unloads += 1
+            if entry.spec.unloader is not None:
+                try:
+                    entry.spec.unloader(model)
+                except Exception as e:
+                    logger.warning(f"Release hook for model {name} failed: {e}")
+        del model
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        logger.info(f"Unloaded model {name}")
+        return True
+
+    def unload_idle(self, now: Optional[float] = None) -> List[str]:
+        """Unload heavy models unused for longer than idle_timeout_seconds"""
+        if self.idle_timeout_seconds <= 0:
+            return []
+        now = self._clock() if now is None else now
+        idle = [
+            name for name, entry in self._entries.items()
+            if entry.spec.heavy and entry.model is not None
+            and entry.last_used is not None
+            and now - entry.last_used > self.idle_timeout_seconds
+        ]
+        return [name for name in idle if self.unload(name)]
+
+    def start_idle_reaper(self, interval_seconds: float = 60):
+        """Check for idle heavy models every interval_seconds on a daemon thread"""
+        if self.idle_timeout_seconds <= 0 or self._reaper is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval_seconds):
+                try:
+                    self.unload_idle()
+                except Exception as e:
+                    logger.warning(f"Idle model check failed: {e}")
+
+        self._reaper = threading.Thread(target=run, name="model-idle-reaper", daemon=True)
+        self._reaper.start()
+
+    def stop_idle_reaper(self):
+        if self._reaper is not None:
+            self._stop.set()
+            self._reaper.join(timeout=1)
+            self._reaper = None
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        models = {}
+        for name, entry in self._entries.items():
+            models[name] = {
+                "status": entry.status,
+                "enabled": self._enabled(entry),
+                "heavy": entry.spec.heavy,
+                "load_ms": entry.load_ms,
+                "warmup_ms": entry.warmup_ms,
+                "memory_mb": round(entry.memory_bytes / _MB, 1) if entry.memory_bytes is not None else None,
+                "memory_source": entry.memory_source,
+                "idle_seconds": round(now - entry.last_used, 1)
+                if entry.model is not None and entry.last_used is not None else None,
+                "loads": entry.loads,
+                "unloads": entry.unloads,
+                "error": entry.error,
+            }
+        rss = process_rss_bytes()
+        return {
+            "process_rss_mb": round(rss / _MB, 1) if rss is not None else None,
+            "idle_timeout_seconds": self.idle_timeout_seconds,
+            "models": models,
+        }
+
+
+# Singleton registry; model modules register their specs on import
+_registry: Optional[ModelRegistry] = None
+
+
+def get_model_registry() -> ModelRegistry:
+    global _registry
+    if _registry is None:
+        from app.config import get_settings
+        _registry = ModelRegistry(idle_timeout_seconds=get_settings().MODEL_IDLE_UNLOAD_SECONDS)
+    return _registry
@@ -11,6 +11,7 @@ Following MODEL_USAGE_POLICY:
 
 import spacy
 from spacy.matcher import PhraseMatcher, Matcher
+from spacy.tokens import Doc
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 import re
 
+from .batching import MicroBatcher
+from .model_registry import ModelSpec, get_model_registry
+
 # spaCy availability flag - True since we're using Python 3.13 compatible version
 SPACY_AVAILABLE = True
 
@@ -27,6 +31,11 @@ SPACY_AVAILABLE = True
 _nlp = None
 _phrase_matcher = None
 _pattern_matcher = None
+_doc_batcher = None
+
+# Pipeline components none of the helpers below read (NER, noun chunks, POS
+# and the matchers only need tok2vec/tagger/parser/attribute_ruler/ner)
+UNUSED_PIPES = ("lemmatizer", "textcat", "senter")
 
 
 class EntityType(Enum):
@@ -90,23 +99,86 @@ class NLPResult:
         }
 
 
+def _load_nlp():
+    try:
+        nlp = spacy.load("en_core_web_sm")
+        logger.info(f"Loaded spaCy model: en_core_web_sm")
+        return nlp
+    except OSError:
+        raise RuntimeError(
+            "spaCy model not found. Run: python -m spacy download en_core_web_sm"
+        )
+
+
+def _warm_up_nlp(nlp):
+    """Build the matchers and run one synthetic parse"""
+    get_phrase_matcher()
+    get_pattern_matcher()
+    nlp("Warm-up request: the water supply in Ward 5 has been irregular since 12/05/2024.")
+
+
+def _release_nlp(nlp):
+    """Drop module references so the unloaded pipeline can be freed"""
+    global _nlp, _phrase_matcher, _pattern_matcher
+    _nlp = _phrase_matcher = _pattern_matcher = None
+
+
 def get_nlp():
-    """Lazy load spaCy model with error handling"""
+    """Lazy load spaCy model with error handling (owned by the model registry)"""
     global _nlp
     if not SPACY_AVAILABLE:
         raise RuntimeError("spaCy not available due to compatibility issues")
     
     if _nlp is None:
-        try:
-            _nlp = spacy.load("en_core_web_sm")
-            logger.info(f"Loaded spaCy model: en_core_web_sm")
-        except OSError:
-            raise RuntimeError(
-                "spaCy model not found. Run: python -m spacy download en_core_web_sm"
-            )
+        _nlp = get_model_registry().get("spacy")
+    else:
+        get_model_registry().touch("spacy")
     return _nlp
 
 
+def _disabled_pipes(nlp) -> List[str]:
+    """Unused pipes present in the loaded pipeline"""
+    return [name for name in UNUSED_PIPES if name in nlp.pipe_names]
+
+
+def parse_texts(texts: List[str], batch_size: int = 32) -> List[Doc]:
+    """
+    Parse many texts in one nlp.pipe call with unused pipes disabled.
+    The returned Docs can be passed to every helper via `doc=`.
+    """
+    nlp = get_nlp()
+    return list(nlp.pipe(texts, batch_size=batch_size, disable=_disabled_pipes(nlp)))
+
+
+def get_doc_batcher() -> MicroBatcher:
+    """Shared micro-batcher that funnels concurrent parses through nlp.pipe"""
+    global _doc_batcher
+    if _doc_batcher is None:
+        from app.config import get_settings
+        settings = get_settings()
+        _doc_batcher = MicroBatcher(
+            lambda texts: parse_texts(texts, batch_size=settings.SPACY_BATCH_MAX_SIZE),
+            max_batch_size=settings.SPACY_BATCH_MAX_SIZE,
+            max_wait_ms=settings.SPACY_BATCH_MAX_WAIT_MS,
+            name="spacy-batcher"
+        )
+    return _doc_batcher
+
+
+def parse_text(text: str, batched: bool = False) -> Doc:
+    """
+    Parse a single text once per request.
+
+    With batched=True the call joins the shared micro-batch, so concurrent
+    requests (running on executor threads) share one nlp.pipe pass.
+    Never use batched=True from the event loop thread.
+    """
+    if batched:
+        return get_doc_batcher().process(text)
+    nlp = get_nlp()
+    return nlp(text, disable=_disabled_pipes(nlp))
+
+
 def get_phrase_matcher() -> PhraseMatcher:
     """Initialize phrase matcher with civic-specific patterns"""
     global _phrase_matcher
@@ -195,9 +267,10 @@ INDIAN_CITIES = [
 ]
 
 
-def extract_entities(text: str) -> Dict[str, List[str]]:
+def extract_entities(text: str, doc: Optional[Doc] = None) -> Dict[str, List[str]]:
     """
     Extract named entities from text using spaCy + custom patterns.
+    Pass a Doc from parse_text() to reuse an existing parse.
     
     Returns dict with entity types as keys:
     - PERSON: Names
@@ -224,8 +297,8 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
             "EMAIL": []
         }
     
-    nlp = get_nlp()
-    doc = nlp(text)
+    if doc is None:
+        doc = parse_text(text)
     
     entities: Dict[str, List[str]] = {}
     
@@ -284,14 +357,13 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
     return entities
 
 
-def extract_entities_detailed(text: str) -> List[ExtractedEntity]:
+def extract_entities_detailed(text: str, doc: Optional[Doc] = None) -> List[ExtractedEntity]:
     """
     Extract entities with full metadata for audit trail.
     Returns list of ExtractedEntity objects with confidence scores.
     """
-    import time
-    nlp = get_nlp()
-    doc = nlp(text)
+    if doc is None:
+        doc = parse_text(text)
     
     entities: List[ExtractedEntity] = []
     
@@ -377,7 +449,7 @@ def extract_entities_detailed(text: str) -> List[ExtractedEntity]:
     return unique_entities
 
 
-def extract_key_phrases(text: str, top_n: int = 10) -> List[str]:
+def extract_key_phrases(text: str, top_n: int = 10, doc: Optional[Doc] = None) -> List[str]:
     """
     Extract key noun phrases from text.
     Enhanced with better filtering and ranking.
@@ -388,8 +460,8 @@ def extract_key_phrases(text: str, top_n: int = 10) -> List[str]:
         words = text.split()
         return [word for word in words if len(word) > 4][:top_n]
     
-    nlp = get_nlp()
-    doc = nlp(text)
+    if doc is None:
+        doc = parse_text(text)
     
     # Extract noun chunks with scoring
     phrases_with_scores = []
@@ -425,14 +497,15 @@ def extract_key_phrases(text: str, top_n: int = 10) -> List[str]:
     return unique_phrases
 
 
-def extract_matched_phrases(text: str) -> Dict[str, List[str]]:
+def extract_matched_phrases(text: str, doc: Optional[Doc] = None) -> Dict[str, List[str]]:
     """
     Extract civic-specific phrases using PhraseMatcher.
     Returns categorized matches.
     """
     nlp = get_nlp()
     matcher = get_phrase_matcher()
-    doc = nlp(text)
+    if doc is None:
+        doc = parse_text(text)
     
     matches = matcher(doc)
     
@@ -544,7 +617,7 @@ def analyze_urgency(text: str) -> Tuple[str, float]:
         return ("low", 0.7)
 
 
-def full_analysis(text: str) -> NLPResult:
+def full_analysis(text: str, doc: Optional[Doc] = None) -> NLPResult:
     """
     Perform complete NLP analysis on text.
     Returns comprehensive result with audit trail.
@@ -552,15 +625,16 @@ def full_analysis(text: str) -> NLPResult:
     import time
     start_time = time.time()
     
-    nlp = get_nlp()
-    doc = nlp(text)
+    # Parse once, share the Doc with every helper
+    if doc is None:
+        doc = parse_text(text)
     
     # Collect all analysis
-    entities = extract_entities_detailed(text)
-    key_phrases = extract_key_phrases(text, top_n=10)
+    entities = extract_entities_detailed(text, doc=doc)
+    key_phrases = extract_key_phrases(text, top_n=10, doc=doc)
     sentiment = analyze_sentiment_basic(text)
     urgency_level, urgency_conf = analyze_urgency(text)
-    matched_phrases = extract_matched_phrases(text)
+    matched_phrases = extract_matched_phrases(text, doc=doc)
     
     processing_time = (time.time() - start_time) * 1000
     
@@ -586,6 +660,14 @@ def full_analysis(text: str) -> NLPResult:
     )
 
 
+get_model_registry().register(ModelSpec(
+    name="spacy",
+    loader=_load_nlp,
+    warmup=_warm_up_nlp,
+    unloader=_release_nlp,
+))
+
+
 def preload_models():
     """Pre-load all models for faster first inference"""
     logger.info("Pre-loading spaCy models...")
@@ -6,7 +6,7 @@ from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
-def extract_entities(text: str) -> Dict[str, List[str]]:
+def extract_entities(text: str, doc=None) -> Dict[str, List[str]]:
     """Basic entity extraction fallback"""
     return {
         "PERSON": [],
@@ -19,7 +19,7 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
         "EMAIL": []
     }
 
-def extract_key_phrases(text: str, top_n: int = 10) -> List[str]:
+def extract_key_phrases(text: str, top_n: int = 10, doc=None) -> List[str]:
     """Basic key phrase extraction"""
     words = text.split()
     return [word.lower() for word in words if len(word) > 4][:top_n]
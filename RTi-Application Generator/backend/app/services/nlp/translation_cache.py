@@ -0,0 +1,186 @@
+"""
+Translation Cache
+Sentence -> translation cache used by the translator
+
+Two tiers:
+- in-process LRU keyed by (backend name, sentence)
+- optional SQLite table (WAL mode) so translations survive restarts and are
+  shared by every worker on the host; rows are keyed by backend name and the
+  SHA-256 of the sentence
+
+Entries are namespaced by backend name, so switching models never serves a
+translation produced by another model. Disk errors are logged and ignored:
+the cache is an optimisation, never a reason for a translation to fail.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_CHUNK = 500
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """LRU of translated sentences in front of an optional SQLite file"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 4096, busy_timeout_ms: int = 1000):
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._schema_ready = False
+        self._disk_failed = False
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    # -------------------------------------------------------------------------
+    # SQLite (opened lazily, one connection per thread)
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if not self.path or self._disk_failed:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self._schema_ready:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    "backend TEXT NOT NULL, source_hash TEXT NOT NULL, translation TEXT NOT NULL, "
+                    "PRIMARY KEY (backend, source_hash))"
+                )
+                self._schema_ready = True
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache at {self.path} unavailable, using memory only: {e}")
+            self._disk_failed = True
+            return None
+        self._local.conn = conn
+        return conn
+
+    def _disk_get(self, backend: str, texts: List[str]) -> Dict[str, str]:
+        conn = self._connect()
+        if conn is None or not texts:
+            return {}
+        by_hash = {_digest(text): text for text in texts}
+        hashes = list(by_hash)
+        found: Dict[str, str] = {}
+        try:
+            for start in range(0, len(hashes), _LOOKUP_CHUNK):
+                chunk = hashes[start:start + _LOOKUP_CHUNK]
+                rows = conn.execute(
+                    f"SELECT source_hash, translation FROM translations "
+                    f"WHERE backend = ? AND source_hash IN ({','.join('?' * len(chunk))})",
+                    (backend, *chunk)
+                ).fetchall()
+                for source_hash, translation in rows:
+                    found[by_hash[source_hash]] = translation
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache read failed: {e}")
+        return found
+
+    def _disk_put(self, backend: str, items: Dict[str, str]):
+        conn = self._connect()
+        if conn is None or not items:
+            return
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO translations (backend, source_hash, translation) VALUES (?, ?, ?)",
+                [(backend, _digest(text), translation) for text, translation in items.items()]
+            )
+            conn.execute("COMMIT")
+            self.writes += len(items)
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache write failed: {e}")
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def _remember(self, backend: str, items: Dict[str, str]):
+        with self._lock:
+            for text, translation in items.items():
+                key = (backend, text)
+                self._entries[key] = translation
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_many(self, backend: str, texts: Iterable[str]) -> Dict[str, str]:
+        """Translations for whichever of texts are cached"""
+        found: Dict[str, str] = {}
+        missing: List[str] = []
+        with self._lock:
+            for text in texts:
+                translation = self._entries.get((backend, text))
+                if translation is None:
+                    missing.append(text)
+                else:
+                    self._entries.move_to_end((backend, text))
+                    found[text] = translation
+        self.hits += len(found)
+
+        from_disk = self._disk_get(backend, missing)
+        if from_disk:
+            self._remember(backend, from_disk)
+            found.update(from_disk)
+            self.disk_hits += len(from_disk)
+        self.misses += len(missing) - len(from_disk)
+        return found
+
+    def put_many(self, backend: str, items: Dict[str, str]):
+        """Store new translations in memory and on disk"""
+        if not items:
+            return
+        self._remember(backend, items)
+        self._disk_put(backend, items)
+
+    def clear(self):
+        """Drop in-memory entries; the SQLite file is left untouched"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path or None,
+            "memory_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
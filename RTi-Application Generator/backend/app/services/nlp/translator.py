@@ -3,12 +3,25 @@ Translator Service
 Handles translation between supported languages using Hugging Face Transformers.
 Specifically designed for English <-> Hindi translation.
 
+Text is split into sentences and each distinct sentence is translated once:
+- a sentence -> translation cache (memory + SQLite, see translation_cache)
+  serves boilerplate that repeats across users' drafts
+- only uncached sentences reach the backend, in batches
+- backends are pluggable (TranslationBackend); tests install a deterministic
+  fake with set_translation_engine() instead of downloading MarianMT
+
 Note: Requires transformers package. Falls back to original text if unavailable.
 """
 
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from abc import ABC, abstractmethod
 from loguru import logger
-import functools
-import os
+import re
+import textwrap
+
+from app.config import get_settings
+from .translation_cache import TranslationCache
+from .model_registry import ModelSpec, get_model_registry, torch_module_bytes
 
 # Try to import transformers, but don't fail if it's not available
 try:
@@ -22,32 +35,276 @@ except ImportError:
 _translator_pipeline = None
 _model_name = "Helsinki-NLP/opus-mt-en-hi"
 
+def _load_translator():
+    logger.info(f"Loading translation model: {_model_name}")
+    # Use a local cache directory if possible to be nice to the filesystem
+    tokenizer = AutoTokenizer.from_pretrained(_model_name)
+    model = AutoModelForSeq2SeqLM.from_pretrained(_model_name)
+    translator_pipeline = pipeline("translation", model=model, tokenizer=tokenizer)  # type: ignore[call-overload]
+    logger.info("Translation model loaded successfully")
+    return translator_pipeline
+
+
+def _release_translator(translator_pipeline):
+    global _translator_pipeline
+    _translator_pipeline = None
+
+
+def _translator_enabled() -> bool:
+    return TRANSFORMERS_AVAILABLE and get_settings().FEATURE_HINDI_SUPPORT
+
+
 def get_translator():
     """
-    Get or load the translation pipeline.
-    Uses Singleton pattern to avoid reloading model.
-    Returns None if transformers not available.
+    Get or load the translation pipeline (owned by the model registry).
+    Returns None if transformers not available or the model fails to load.
     """
     global _translator_pipeline
-    
+
     if not TRANSFORMERS_AVAILABLE:
         return None
-    
+
     if _translator_pipeline is not None:
+        get_model_registry().touch("translator")
         return _translator_pipeline
-        
+
     try:
-        logger.info(f"Loading translation model: {_model_name}")
-        # Use a local cache directory if possible to be nice to the filesystem
-        tokenizer = AutoTokenizer.from_pretrained(_model_name)
-        model = AutoModelForSeq2SeqLM.from_pretrained(_model_name)
-        _translator_pipeline = pipeline("translation", model=model, tokenizer=tokenizer)  # type: ignore[call-overload]
-        logger.info("Translation model loaded successfully")
+        _translator_pipeline = get_model_registry().get("translator")
         return _translator_pipeline
     except Exception as e:
         logger.error(f"Failed to load translation model {_model_name}: {e}")
         return None
 
+
+get_model_registry().register(ModelSpec(
+    name="translator",
+    loader=_load_translator,
+    warmup=lambda translator_pipeline: translator_pipeline(["Please provide the information."]),
+    unloader=_release_translator,
+    memory_estimator=lambda translator_pipeline: torch_module_bytes(translator_pipeline.model),
+    enabled=_translator_enabled,
+    heavy=True,
+))
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class TranslationBackend(ABC):
+    """Translates a batch of sentences; `name` namespaces cached translations"""
+
+    name: str = "backend"
+
+    def is_available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def translate_batch(self, sentences: List[str]) -> List[Optional[str]]:
+        """One translation per sentence, in order (None = leave untranslated)"""
+
+
+class HuggingFaceTranslationBackend(TranslationBackend):
+    """MarianMT pipeline; the whole batch goes through one pipeline call"""
+
+    def __init__(self, model_name: str = _model_name):
+        self.name = model_name
+
+    def is_available(self) -> bool:
+        return TRANSFORMERS_AVAILABLE
+
+    def translate_batch(self, sentences: List[str]) -> List[Optional[str]]:
+        pipeline_instance = get_translator()
+        if not pipeline_instance:
+            raise RuntimeError(f"Translation model {self.name} is not loaded")
+        # Pipeline returns [{'translation_text': '...'}, ...] for a list input
+        results = pipeline_instance(sentences, batch_size=len(sentences))
+        return [
+            result.get("translation_text") if isinstance(result, dict) else None
+            for result in results
+        ]
+
+
+# =============================================================================
+# SEGMENTATION
+# =============================================================================
+
+# Line breaks, or whitespace after sentence-ending punctuation (incl. Devanagari danda)
+_SEPARATOR = re.compile(r'(\s*\n\s*|(?<=[.!?।])\s+)')
+
+# A period after these does not end a sentence
+_ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "shri", "smt", "no", "nos", "rs", "sr", "st", "vs",
+    "etc", "sec", "govt", "dept", "e.g", "i.e", "viz", "ref",
+}
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into [sentence, separator, sentence, ..., sentence].
+    "".join() of the result gives back the original text.
+    """
+    parts = _SEPARATOR.split(text)
+    merged = [parts[0]]
+    for separator, sentence in zip(parts[1::2], parts[2::2]):
+        previous = merged[-1].rstrip()
+        last_word = previous.rsplit(None, 1)[-1].rstrip(".").lower() if previous else ""
+        if "\n" not in separator and previous.endswith(".") and last_word in _ABBREVIATIONS:
+            merged[-1] += separator + sentence
+        else:
+            merged.extend([separator, sentence])
+    return merged
+
+
+def _needs_translation(text: str) -> bool:
+    # Very few alphabetic characters (numbers, separators): leave as is
+    return sum(c.isalpha() for c in text) >= 2
+
+
+# A sentence to translate: (leading whitespace, pieces, trailing whitespace)
+_Unit = Tuple[str, List[str], str]
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class TranslationEngine:
+    """
+    Sentence-level translation with a cache and batched backend calls.
+
+    Sentences longer than max_chars are wrapped into pieces (the model's
+    input limit), translated separately and joined with a space.
+    """
+
+    def __init__(
+        self,
+        backend: TranslationBackend,
+        cache: Optional[TranslationCache] = None,
+        batch_size: int = 16,
+        max_chars: int = 1000
+    ):
+        self.backend = backend
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
+        self.max_chars = max(1, max_chars)
+        self.batches = 0
+        self.sentences_translated = 0
+        self.failures = 0
+
+    def _plan(self, text: str) -> List[Union[str, _Unit]]:
+        """Literal strings kept as-is plus the units that need translating"""
+        plan: List[Union[str, _Unit]] = []
+        for index, part in enumerate(split_sentences(text)):
+            if index % 2 or not _needs_translation(part):
+                plan.append(part)
+                continue
+            core = part.strip()
+            lead = part[:len(part) - len(part.lstrip())]
+            trail = part[len(part.rstrip()):]
+            pieces = textwrap.wrap(core, width=self.max_chars, break_long_words=False) \
+                if len(core) > self.max_chars else [core]
+            plan.append((lead, pieces, trail))
+        return plan
+
+    def _translate_pieces(self, pieces: List[str]) -> Dict[str, str]:
+        """Cached translations plus batched backend calls for the rest"""
+        found = self.cache.get_many(self.backend.name, pieces) if self.cache is not None else {}
+        missing = [piece for piece in pieces if piece not in found]
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            try:
+                results = self.backend.translate_batch(batch)
+            except Exception as e:
+                logger.error(f"Translation error during processing: {e}")
+                self.failures += 1
+                continue
+            self.batches += 1
+            translated = {
+                source: result for source, result in zip(batch, results)
+                if result and result.strip()
+            }
+            self.sentences_translated += len(translated)
+            found.update(translated)
+            if self.cache is not None:
+                self.cache.put_many(self.backend.name, translated)
+        return found
+
+    def translate_many(self, texts: Sequence[str]) -> List[str]:
+        """
+        Translate several texts together: sentences shared between them are
+        translated once and all uncached sentences are batched.
+        Untranslatable parts come back unchanged.
+        """
+        if not self.backend.is_available():
+            return list(texts)
+
+        plans = [self._plan(text) if text and text.strip() else [text] for text in texts]
+        pieces = list(dict.fromkeys(
+            piece for plan in plans for item in plan if isinstance(item, tuple) for piece in item[1]
+        ))
+        if not pieces:
+            return list(texts)
+
+        translations = self._translate_pieces(pieces)
+
+        results = []
+        for plan in plans:
+            out = []
+            for item in plan:
+                if isinstance(item, tuple):
+                    lead, unit_pieces, trail = item
+                    out.append(lead + " ".join(translations.get(p, p) for p in unit_pieces) + trail)
+                else:
+                    out.append(item)
+            results.append("".join(out))
+        return results
+
+    def translate(self, text: str) -> str:
+        return self.translate_many([text])[0]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend.name,
+            "available": self.backend.is_available(),
+            "batch_size": self.batch_size,
+            "batches": self.batches,
+            "sentences_translated": self.sentences_translated,
+            "failures": self.failures,
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+
+# Singleton engine
+_engine: Optional[TranslationEngine] = None
+
+
+def get_translation_engine() -> TranslationEngine:
+    """Get the shared engine (MarianMT backend, cache from settings)"""
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        _engine = TranslationEngine(
+            backend=HuggingFaceTranslationBackend(),
+            cache=TranslationCache(
+                path=settings.TRANSLATION_CACHE_PATH or None,
+                max_entries=settings.TRANSLATION_CACHE_SIZE
+            ),
+            batch_size=settings.TRANSLATION_BATCH_SIZE,
+            max_chars=settings.TRANSLATION_MAX_CHARS
+        )
+    return _engine
+
+
+def set_translation_engine(engine: Optional[TranslationEngine]):
+    """Install a custom engine (e.g. a fake backend in tests); None restores the default"""
+    global _engine
+    if _engine is not None and _engine is not engine and _engine.cache is not None:
+        _engine.cache.close()
+    _engine = engine
+
+
 def translate_to_hindi(text: str) -> str:
     """
     Translate English text to Hindi.
@@ -55,39 +312,14 @@ def translate_to_hindi(text: str) -> str:
     """
     if not text or not text.strip():
         return text
-    
+
     # If text contains very few alphabetic characters, return as is (e.g. numbers, separators)
-    if sum(c.isalpha() for c in text) < 2:
+    if not _needs_translation(text):
         return text
 
-    pipeline_instance = get_translator()
-    if not pipeline_instance:
-        return text
-    
-    try:
-        # Handle long text by splitting if necessary, 
-        # but for now we rely on the pipeline's truncation or simple usage headers.
-        # Check text length - opus-mt usually handles ~512 tokens.
-        # If text is very long, we might just translate the first chunk or need a splitter.
-        # For typical description (5000 chars), we might need chunking.
-        
-        # Simple chunking by newlines or crude length
-        import textwrap
-        chunks = textwrap.wrap(text, width=1000, break_long_words=False, replace_whitespace=False)
-        
-        translated_chunks = []
-        for chunk in chunks:
-            # Pipeline is typically [ {'translation_text': '...'} ]
-            result = pipeline_instance(chunk)
-            if result and isinstance(result, list) and 'translation_text' in result[0]:
-                # Clean up the output slightly
-                trans = result[0]['translation_text']
-                translated_chunks.append(trans)
-            else:
-                translated_chunks.append(chunk) # Fallback for chunk
-        
-        return " ".join(translated_chunks)
-        
-    except Exception as e:
-        logger.error(f"Translation error during processing: {e}")
-        return text
+    return get_translation_engine().translate(text)
+
+
+def translate_many_to_hindi(texts: Sequence[str]) -> List[str]:
+    """Translate several texts in one batched pass (same fallbacks as translate_to_hindi)"""
+    return get_translation_engine().translate_many(texts)
@@ -0,0 +1,385 @@
+"""
+Rate Limiter
+Constant-time per-request rate limiting for RateLimitMiddleware
+
+Design:
+- Algorithms keep a fixed-size state per client instead of a timestamp list:
+  - "sliding_window": sliding-window counter (current + previous fixed window,
+    previous weighted by how much of it still overlaps the sliding window)
+  - "token_bucket": bucket of `limit` tokens refilled at limit/window per second
+- Storage backends apply an algorithm step atomically per key:
+  - InMemoryRateLimitStorage: dict split into shards, one lock per shard
+  - SQLiteRateLimitStorage: one WAL-mode file shared by all workers on a host;
+    its updates block, so the middleware runs them on the storage's own
+    single-thread executor instead of the event loop
+- Keys idle for two windows are evicted periodically (their state would
+  have fully decayed anyway)
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import asyncio
+import math
+import os
+import sqlite3
+import threading
+import time
+from loguru import logger
+
+
+# (s0, s1, s2) - meaning depends on the algorithm
+State = Tuple[float, float, float]
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one rate-limit check"""
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float    # seconds until the limit is fully available again
+    retry_after: float    # seconds until the next request would be allowed (0 if allowed)
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(1, math.ceil(self.retry_after))
+
+
+# =============================================================================
+# ALGORITHMS
+# =============================================================================
+
+class SlidingWindowCounter:
+    """
+    Sliding-window counter.
+    State: (window_start, current_count, previous_count)
+    """
+
+    name = "sliding_window"
+
+    def __init__(self, limit: int, window_seconds: float):
+        self.limit = max(1, limit)
+        self.window = float(window_seconds)
+
+    def apply(self, state: Optional[State], now: float) -> Tuple[State, RateLimitDecision]:
+        window_start = math.floor(now / self.window) * self.window
+        current, previous = 0.0, 0.0
+        if state is not None:
+            start, count, prev = state
+            if start == window_start:
+                current, previous = count, prev
+            elif start == window_start - self.window:
+                previous = count
+
+        elapsed = (now - window_start) / self.window
+        estimated = previous * (1 - elapsed) + current
+        reset_after = window_start + self.window - now
+
+        if estimated + 1 > self.limit:
+            return (window_start, current, previous), RateLimitDecision(
+                allowed=False,
+                limit=self.limit,
+                remaining=0,
+                reset_after=reset_after + (self.window if current else 0),
+                retry_after=self._retry_after(current, previous, window_start, now)
+            )
+
+        current += 1
+        return (window_start, current, previous), RateLimitDecision(
+            allowed=True,
+            limit=self.limit,
+            remaining=max(0, int(self.limit - estimated - 1)),
+            reset_after=reset_after,
+            retry_after=0.0
+        )
+
+    def _retry_after(self, current: float, previous: float, window_start: float, now: float) -> float:
+        """Time until the weighted estimate leaves room for one more request"""
+        if current + 1 <= self.limit and previous > 0:
+            # Previous window's weight decays during this window
+            fraction = 1 - (self.limit - 1 - current) / previous
+            return max(0.0, window_start + fraction * self.window - now)
+        # This window is full: it becomes the decaying previous window next
+        fraction = max(0.0, 1 - (self.limit - 1) / current) if current else 0.0
+        return window_start + (1 + fraction) * self.window - now
+
+
+class TokenBucket:
+    """
+    Token bucket holding `limit` tokens, refilled evenly over the window.
+    State: (tokens, last_refill, unused)
+    """
+
+    name = "token_bucket"
+
+    def __init__(self, limit: int, window_seconds: float):
+        self.limit = max(1, limit)
+        self.window = float(window_seconds)
+        self.rate = self.limit / self.window
+
+    def apply(self, state: Optional[State], now: float) -> Tuple[State, RateLimitDecision]:
+        if state is None:
+            tokens = float(self.limit)
+        else:
+            tokens = min(float(self.limit), state[0] + max(0.0, now - state[1]) * self.rate)
+
+        if tokens < 1:
+            return (tokens, now, 0.0), RateLimitDecision(
+                allowed=False,
+                limit=self.limit,
+                remaining=0,
+                reset_after=(self.limit - tokens) / self.rate,
+                retry_after=(1 - tokens) / self.rate
+            )
+
+        tokens -= 1
+        return (tokens, now, 0.0), RateLimitDecision(
+            allowed=True,
+            limit=self.limit,
+            remaining=int(tokens),
+            reset_after=(self.limit - tokens) / self.rate,
+            retry_after=0.0
+        )
+
+
+ALGORITHMS = {
+    SlidingWindowCounter.name: SlidingWindowCounter,
+    TokenBucket.name: TokenBucket,
+}
+
+Step = Callable[[Optional[State], float], Tuple[State, RateLimitDecision]]
+
+
+# =============================================================================
+# STORAGE
+# =============================================================================
+
+class RateLimitStorage(ABC):
+    """Per-key state store; update() must be atomic for a given key"""
+
+    # True when update() does I/O that may wait (locks held by other processes)
+    blocking = False
+
+    @abstractmethod
+    def update(self, key: str, step: Step, now: float) -> RateLimitDecision:
+        """Read the key's state, apply step, write the new state"""
+
+    @abstractmethod
+    def evict_idle(self, cutoff: float) -> int:
+        """Drop keys not updated since cutoff; returns the number removed"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def close(self):
+        pass
+
+
+class InMemoryRateLimitStorage(RateLimitStorage):
+    """Process-local storage sharded by key hash to reduce lock contention"""
+
+    def __init__(self, shards: int = 16):
+        self._shards: List[Tuple[threading.Lock, Dict[str, Tuple[State, float]]]] = [
+            (threading.Lock(), {}) for _ in range(max(1, shards))
+        ]
+
+    def _shard(self, key: str) -> Tuple[threading.Lock, Dict[str, Tuple[State, float]]]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def update(self, key: str, step: Step, now: float) -> RateLimitDecision:
+        lock, entries = self._shard(key)
+        with lock:
+            entry = entries.get(key)
+            state, decision = step(entry[0] if entry else None, now)
+            entries[key] = (state, now)
+        return decision
+
+    def evict_idle(self, cutoff: float) -> int:
+        removed = 0
+        for lock, entries in self._shards:
+            with lock:
+                idle = [key for key, (_, updated) in entries.items() if updated < cutoff]
+                for key in idle:
+                    del entries[key]
+                removed += len(idle)
+        return removed
+
+    def __len__(self) -> int:
+        return sum(len(entries) for _, entries in self._shards)
+
+
+class SQLiteRateLimitStorage(RateLimitStorage):
+    """
+    Storage in a local SQLite file so every worker process on the host
+    enforces the same limits. Each update is one short IMMEDIATE transaction.
+
+    An update can wait up to busy_timeout_ms for another worker's write lock,
+    so async callers go through executor, one thread with its own connection.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, busy_timeout_ms: int = 1000):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rate-limit-sqlite")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, s0 REAL, s1 REAL, s2 REAL, updated_at REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_rate_limits_updated ON rate_limits(updated_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def update(self, key: str, step: Step, now: float) -> RateLimitDecision:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT s0, s1, s2 FROM rate_limits WHERE key = ?", (key,)).fetchone()
+            state, decision = step(tuple(row) if row else None, now)
+            conn.execute(
+                "INSERT INTO rate_limits (key, s0, s1, s2, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET s0 = excluded.s0, s1 = excluded.s1, "
+                "s2 = excluded.s2, updated_at = excluded.updated_at",
+                (key, *state, now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return decision
+
+    def evict_idle(self, cutoff: float) -> int:
+        return self._connect().execute("DELETE FROM rate_limits WHERE updated_at < ?", (cutoff,)).rowcount
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM rate_limits").fetchone()[0]
+
+    def _close_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def close(self):
+        # The executor thread holds its own connection; close it there
+        try:
+            self.executor.submit(self._close_connection)
+        except RuntimeError:
+            pass  # already shut down
+        self.executor.shutdown(wait=True)
+        self._close_connection()
+
+
+# =============================================================================
+# LIMITER
+# =============================================================================
+
+class RateLimiter:
+    """
+    Applies an algorithm through a storage backend and evicts idle keys
+    at most once per evict_interval_seconds.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: float,
+        algorithm: str = "sliding_window",
+        storage: Optional[RateLimitStorage] = None,
+        evict_interval_seconds: float = 60.0
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+        self.algorithm = ALGORITHMS[algorithm](limit, window_seconds)
+        self.storage = storage if storage is not None else InMemoryRateLimitStorage()
+        self.idle_seconds = 2 * float(window_seconds)
+        self.evict_interval = evict_interval_seconds
+        self._next_eviction = 0.0
+        self._evict_lock = threading.Lock()
+        self.allowed = 0
+        self.rejected = 0
+        self.evicted = 0
+
+    @property
+    def limit(self) -> int:
+        return self.algorithm.limit
+
+    def hit(self, key: str, now: Optional[float] = None) -> RateLimitDecision:
+        """Record one request for key and decide whether it is allowed"""
+        now = time.time() if now is None else now
+        self._maybe_evict(now)
+
+        decision = self.storage.update(key, self.algorithm.apply, now)
+        if decision.allowed:
+            self.allowed += 1
+        else:
+            self.rejected += 1
+        return decision
+
+    async def hit_async(self, key: str, now: Optional[float] = None) -> RateLimitDecision:
+        """hit() for async callers; blocking storage runs on its own executor"""
+        if not self.storage.blocking:
+            return self.hit(key, now)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.storage.executor, self.hit, key, now)
+
+    def _maybe_evict(self, now: float):
+        if now < self._next_eviction or not self._evict_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_eviction = now + self.evict_interval
+            removed = self.storage.evict_idle(now - self.idle_seconds)
+            if removed:
+                self.evicted += removed
+                logger.debug(f"Rate limiter evicted {removed} idle clients")
+        except Exception as e:
+            logger.warning(f"Rate limiter eviction failed: {e}")
+        finally:
+            self._evict_lock.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "algorithm": self.algorithm.name,
+            "backend": type(self.storage).__name__,
+            "limit": self.limit,
+            "window_seconds": self.algorithm.window,
+            "tracked_clients": len(self.storage),
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "evicted": self.evicted,
+        }
+
+
+def build_rate_limiter(
+    limit: int,
+    window_seconds: float,
+    algorithm: str = "sliding_window",
+    backend: str = "memory",
+    sqlite_path: str = "rate_limits.db",
+    shards: int = 16,
+    evict_interval_seconds: float = 60.0
+) -> RateLimiter:
+    """Create a limiter with the named backend: 'memory' or 'sqlite'"""
+    if backend == "sqlite":
+        storage: RateLimitStorage = SQLiteRateLimitStorage(sqlite_path)
+    elif backend == "memory":
+        storage = InMemoryRateLimitStorage(shards=shards)
+    else:
+        raise ValueError(f"Unknown rate limit backend: {backend}")
+    return RateLimiter(limit, window_seconds, algorithm, storage, evict_interval_seconds)
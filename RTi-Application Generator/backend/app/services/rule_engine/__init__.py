@@ -11,8 +11,16 @@ Components:
 - intent_rules: Document type classification (RTI/Complaint/Appeal)
 - issue_rules: Issue-to-department mapping
 - legal_triggers: RTI Act sections and grievance markers
+- keyword_automaton: Shared single-pass keyword matcher used by all rules
 """
 
+from .keyword_automaton import (
+    KeywordAutomaton,
+    KeywordScan,
+    register_keywords,
+    scan_text,
+)
+
 from .intent_rules import (
     IntentType,
     DocumentSubType,
@@ -54,6 +62,12 @@ from .legal_triggers import (
 )
 
 __all__ = [
+    # Keyword automaton
+    "KeywordAutomaton",
+    "KeywordScan",
+    "register_keywords",
+    "scan_text",
+    
     # Intent rules
     "IntentType",
     "DocumentSubType",
@@ -100,9 +114,10 @@ def analyze_complete(text: str) -> dict:
     Returns:
         dict with intent, issue_mapping, and legal_analysis
     """
-    intent_result = classify_intent_detailed(text)
-    issue_result = map_issue_detailed(text)
-    legal_result = analyze_legal_context(text)
+    scan = scan_text(text)
+    intent_result = classify_intent_detailed(text, scan=scan)
+    issue_result = map_issue_detailed(text, scan=scan)
+    legal_result = analyze_legal_context(text, scan=scan)
     
     return {
         "intent": intent_result.to_dict(),
@@ -11,9 +11,10 @@ Following MODEL_USAGE_POLICY:
 from typing import Tuple, Optional, List, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
-import re
 import logging
 
+from .keyword_automaton import KeywordScan, register_keywords, scan_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -215,24 +216,35 @@ SUB_TYPE_INDICATORS = {
 }
 
 
-def _find_keyword_matches(text: str, keywords: Dict[str, float], category: str) -> List[IntentMatch]:
+# Compile every keyword table into the shared automaton
+for _keywords in (RTI_KEYWORDS, COMPLAINT_KEYWORDS, APPEAL_KEYWORDS,
+                  FOLLOW_UP_KEYWORDS, ESCALATION_KEYWORDS):
+    register_keywords(_keywords)
+for _indicators in SUB_TYPE_INDICATORS.values():
+    register_keywords(_indicators)
+
+
+def _find_keyword_matches(
+    text: str,
+    keywords: Dict[str, float],
+    category: str,
+    scan: Optional[KeywordScan] = None
+) -> List[IntentMatch]:
     """Find all keyword matches in text with positions"""
-    text_lower = text.lower()
+    if scan is None:
+        scan = scan_text(text)
     matches = []
     
     for keyword, weight in keywords.items():
         # Use word boundary matching for single words
-        if ' ' not in keyword:
-            pattern = rf'\b{re.escape(keyword)}\b'
-        else:
-            pattern = re.escape(keyword)
+        word_boundary = ' ' not in keyword
         
-        for match in re.finditer(pattern, text_lower):
+        for position in scan.match_positions(keyword, word_boundary=word_boundary):
             matches.append(IntentMatch(
                 keyword=keyword,
                 category=category,
                 weight=weight,
-                position=match.start()
+                position=position
             ))
     
     return matches
@@ -255,35 +267,40 @@ def _calculate_weighted_score(matches: List[IntentMatch]) -> float:
     return confidence
 
 
-def _determine_sub_type(text: str, intent: IntentType) -> DocumentSubType:
+def _determine_sub_type(
+    text: str,
+    intent: IntentType,
+    scan: Optional[KeywordScan] = None
+) -> DocumentSubType:
     """Determine document sub-type based on content"""
-    text_lower = text.lower()
+    if scan is None:
+        scan = scan_text(text)
     
     if intent == IntentType.RTI:
         for sub_type in [DocumentSubType.INSPECTION_REQUEST, 
                          DocumentSubType.RECORDS_REQUEST,
                          DocumentSubType.INFORMATION_REQUEST]:
             indicators = SUB_TYPE_INDICATORS.get(sub_type, [])
-            if any(ind in text_lower for ind in indicators):
+            if scan.contains_any(indicators):
                 return sub_type
         return DocumentSubType.INFORMATION_REQUEST
     
     elif intent == IntentType.COMPLAINT:
-        if any(ind in text_lower for ind in SUB_TYPE_INDICATORS[DocumentSubType.CORRUPTION_COMPLAINT]):
+        if scan.contains_any(SUB_TYPE_INDICATORS[DocumentSubType.CORRUPTION_COMPLAINT]):
             return DocumentSubType.CORRUPTION_COMPLAINT
-        elif any(ind in text_lower for ind in SUB_TYPE_INDICATORS[DocumentSubType.SERVICE_COMPLAINT]):
+        elif scan.contains_any(SUB_TYPE_INDICATORS[DocumentSubType.SERVICE_COMPLAINT]):
             return DocumentSubType.SERVICE_COMPLAINT
         return DocumentSubType.GRIEVANCE
     
     elif intent == IntentType.APPEAL:
-        if any(ind in text_lower for ind in SUB_TYPE_INDICATORS[DocumentSubType.SECOND_APPEAL]):
+        if scan.contains_any(SUB_TYPE_INDICATORS[DocumentSubType.SECOND_APPEAL]):
             return DocumentSubType.SECOND_APPEAL
         return DocumentSubType.FIRST_APPEAL
     
     return DocumentSubType.GENERAL
 
 
-def classify_intent(text: str) -> Tuple[str, float]:
+def classify_intent(text: str, scan: Optional[KeywordScan] = None) -> Tuple[str, float]:
     """
     Classify user intent based on weighted keyword matching.
     Returns (intent, confidence)
@@ -295,23 +312,27 @@ def classify_intent(text: str) -> Tuple[str, float]:
     1. Weighted keyword match = confidence based on weights
     2. No match = unknown (defer to NLP)
     """
-    result = classify_intent_detailed(text)
+    result = classify_intent_detailed(text, scan=scan)
     return (result.intent.value, result.confidence)
 
 
-def classify_intent_detailed(text: str) -> IntentResult:
+def classify_intent_detailed(text: str, scan: Optional[KeywordScan] = None) -> IntentResult:
     """
     Detailed intent classification with full audit trail.
     Returns IntentResult with all decision information.
+    
+    Pass a precomputed KeywordScan to share one text pass across rule modules.
     """
     decision_path = []
+    if scan is None:
+        scan = scan_text(text)
     
     # Find matches for each intent type
-    rti_matches = _find_keyword_matches(text, RTI_KEYWORDS, "rti")
-    complaint_matches = _find_keyword_matches(text, COMPLAINT_KEYWORDS, "complaint")
-    appeal_matches = _find_keyword_matches(text, APPEAL_KEYWORDS, "appeal")
-    follow_up_matches = _find_keyword_matches(text, FOLLOW_UP_KEYWORDS, "follow_up")
-    escalation_matches = _find_keyword_matches(text, ESCALATION_KEYWORDS, "escalation")
+    rti_matches = _find_keyword_matches(text, RTI_KEYWORDS, "rti", scan)
+    complaint_matches = _find_keyword_matches(text, COMPLAINT_KEYWORDS, "complaint", scan)
+    appeal_matches = _find_keyword_matches(text, APPEAL_KEYWORDS, "appeal", scan)
+    follow_up_matches = _find_keyword_matches(text, FOLLOW_UP_KEYWORDS, "follow_up", scan)
+    escalation_matches = _find_keyword_matches(text, ESCALATION_KEYWORDS, "escalation", scan)
     
     decision_path.append(f"Found {len(rti_matches)} RTI matches")
     decision_path.append(f"Found {len(complaint_matches)} complaint matches")
@@ -352,7 +373,7 @@ def classify_intent_detailed(text: str) -> IntentResult:
         decision_path.append("Score too low - marking as unknown")
     
     # Determine sub-type
-    sub_type = _determine_sub_type(text, best_intent)
+    sub_type = _determine_sub_type(text, best_intent, scan)
     decision_path.append(f"Sub-type determined: {sub_type.value}")
     
     # Should NLP be invoked?
@@ -375,13 +396,15 @@ def get_intent_suggestions(text: str, top_n: int = 3) -> List[Dict[str, Any]]:
     Get top intent suggestions with scores.
     Useful when confidence is low and user needs to choose.
     """
+    scan = scan_text(text)
+    
     # Find matches for each intent type
     scores = {
-        "rti": _calculate_weighted_score(_find_keyword_matches(text, RTI_KEYWORDS, "rti")),
-        "complaint": _calculate_weighted_score(_find_keyword_matches(text, COMPLAINT_KEYWORDS, "complaint")),
-        "appeal": _calculate_weighted_score(_find_keyword_matches(text, APPEAL_KEYWORDS, "appeal")),
-        "follow_up": _calculate_weighted_score(_find_keyword_matches(text, FOLLOW_UP_KEYWORDS, "follow_up")),
-        "escalation": _calculate_weighted_score(_find_keyword_matches(text, ESCALATION_KEYWORDS, "escalation")),
+        "rti": _calculate_weighted_score(_find_keyword_matches(text, RTI_KEYWORDS, "rti", scan)),
+        "complaint": _calculate_weighted_score(_find_keyword_matches(text, COMPLAINT_KEYWORDS, "complaint", scan)),
+        "appeal": _calculate_weighted_score(_find_keyword_matches(text, APPEAL_KEYWORDS, "appeal", scan)),
+        "follow_up": _calculate_weighted_score(_find_keyword_matches(text, FOLLOW_UP_KEYWORDS, "follow_up", scan)),
+        "escalation": _calculate_weighted_score(_find_keyword_matches(text, ESCALATION_KEYWORDS, "escalation", scan)),
     }
     
     # Sort by score
@@ -11,9 +11,10 @@ Following MODEL_USAGE_POLICY:
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
-import re
 import logging
 
+from .keyword_automaton import KeywordScan, register_keywords, scan_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -435,14 +436,19 @@ ISSUE_DEPARTMENT_MAP = {
 }
 
 
-def map_issue_to_department(text: str) -> Dict:
+# Compile department keywords into the shared automaton
+for _data in ISSUE_DEPARTMENT_MAP.values():
+    register_keywords(keyword for keyword, _ in _data["keywords"])
+
+
+def map_issue_to_department(text: str, scan: Optional[KeywordScan] = None) -> Dict:
     """
     Map user's issue description to relevant departments.
     Returns matched departments with confidence.
     
     This is the PRIMARY decision function for issue categorization.
     """
-    result = map_issue_detailed(text)
+    result = map_issue_detailed(text, scan=scan)
     
     return {
         "matches": [m.to_dict() for m in result[:3]],
@@ -451,12 +457,13 @@ def map_issue_to_department(text: str) -> Dict:
     }
 
 
-def map_issue_detailed(text: str) -> List[IssueMatch]:
+def map_issue_detailed(text: str, scan: Optional[KeywordScan] = None) -> List[IssueMatch]:
     """
     Detailed issue mapping with full audit trail.
     Returns list of IssueMatch objects sorted by confidence.
     """
-    text_lower = text.lower()
+    if scan is None:
+        scan = scan_text(text)
     matches = []
     
     for category, data in ISSUE_DEPARTMENT_MAP.items():
@@ -464,7 +471,7 @@ def map_issue_detailed(text: str) -> List[IssueMatch]:
         total_weight = 0.0
         
         for keyword, weight in data["keywords"]:
-            if keyword in text_lower:
+            if scan.contains(keyword):
                 keywords_found.append(keyword)
                 total_weight += weight
         
@@ -0,0 +1,248 @@
+"""
+Keyword Automaton - Shared multi-pattern matcher for the rule engine
+Single linear pass over the request text for every keyword table
+
+Following MODEL_USAGE_POLICY:
+- Purely deterministic string matching, no AI involved
+- Produces exactly the same matches as the per-keyword loops it replaces
+
+Every rule module registers its keyword tables at import time
+(RTI_KEYWORDS, COMPLAINT_KEYWORDS, ISSUE_DEPARTMENT_MAP, RTI_SECTION_TRIGGERS,
+GRIEVANCE_MARKERS, document-type indicators, ...). The patterns are compiled
+into one Aho-Corasick automaton, so a request is scanned once with scan_text()
+and the resulting KeywordScan is shared by intent_rules, issue_rules,
+legal_triggers and the inference orchestrator.
+"""
+
+from typing import Container, Dict, Iterable, List, Optional
+from dataclasses import dataclass, field
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _is_word_char(ch: str) -> bool:
+    """Mirror of the `re` module's \\w test for str patterns"""
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of lowercase keywords.
+
+    find_all() reports every (possibly overlapping) occurrence of every
+    keyword in a single left-to-right pass over the text.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.patterns: List[str] = []
+        self._pattern_ids: Dict[str, int] = {}
+        # State 0 is the root
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._build_failure_links()
+        self._lengths = [len(p) for p in self.patterns]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    @property
+    def keywords(self) -> Container[str]:
+        """Set-like view of the compiled keywords"""
+        return self._pattern_ids.keys()
+
+    def _add(self, pattern: str):
+        """Insert a pattern into the trie"""
+        if not pattern or pattern in self._pattern_ids:
+            return
+
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        self._pattern_ids[pattern] = pattern_id
+
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        """Breadth-first construction of failure links and merged outputs"""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # Every keyword ending at the fallback state also ends here
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Dict[str, List[int]]:
+        """
+        Scan text once and return {keyword: [start positions]}.
+        Positions are ascending and include overlapping occurrences.
+        Keywords that do not occur are omitted.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        lengths = self._lengths
+        positions: Dict[int, List[int]] = {}
+
+        state = 0
+        for end, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for pattern_id in output[state]:
+                    positions.setdefault(pattern_id, []).append(end - lengths[pattern_id] + 1)
+
+        return {self.patterns[pid]: starts for pid, starts in positions.items()}
+
+
+@dataclass
+class KeywordScan:
+    """
+    Result of one pass over a request's text.
+    Answers every keyword question the rule modules ask without rescanning.
+
+    Keywords the automaton was not compiled with fall back to a direct
+    search of text_lower, so lookups are always correct.
+    """
+    text_lower: str
+    hits: Dict[str, List[int]] = field(default_factory=dict)
+    known_keywords: Container[str] = field(default_factory=frozenset)
+
+    def positions(self, keyword: str) -> List[int]:
+        """All (overlapping) start positions of keyword"""
+        starts = self.hits.get(keyword)
+        if starts is not None:
+            return starts
+        if keyword in self.known_keywords or not keyword:
+            return []
+
+        starts = []
+        start = self.text_lower.find(keyword)
+        while start != -1:
+            starts.append(start)
+            start = self.text_lower.find(keyword, start + 1)
+        return starts
+
+    def contains(self, keyword: str) -> bool:
+        """Equivalent of `keyword in text_lower`"""
+        if keyword in self.hits:
+            return True
+        if keyword in self.known_keywords:
+            return False
+        return keyword in self.text_lower
+
+    def contains_any(self, keywords: Iterable[str]) -> bool:
+        """Equivalent of `any(kw in text_lower for kw in keywords)`"""
+        return any(self.contains(kw) for kw in keywords)
+
+    def count(self, keywords: Iterable[str]) -> int:
+        """Number of keywords from the list present in the text"""
+        return sum(1 for kw in keywords if self.contains(kw))
+
+    def present(self, keywords: Iterable[str]) -> List[str]:
+        """Keywords from the list present in the text, in list order"""
+        return [kw for kw in keywords if self.contains(kw)]
+
+    def match_positions(self, keyword: str, word_boundary: bool = False) -> List[int]:
+        """
+        Start positions re.finditer would report for the keyword.
+
+        Matches are non-overlapping, scanned left to right. With
+        word_boundary=True the keyword behaves like rf'\\b{re.escape(keyword)}\\b'.
+        """
+        starts = self.positions(keyword)
+        if not starts:
+            return []
+
+        text = self.text_lower
+        length = len(keyword)
+        first_is_word = _is_word_char(keyword[0])
+        last_is_word = _is_word_char(keyword[-1])
+
+        result = []
+        next_free = 0
+        for start in starts:
+            if start < next_free:
+                continue
+            end = start + length
+            if word_boundary:
+                before = start > 0 and _is_word_char(text[start - 1])
+                after = end < len(text) and _is_word_char(text[end])
+                if before == first_is_word or after == last_is_word:
+                    continue
+            result.append(start)
+            next_free = end
+        return result
+
+
+# ============================================================================
+# SHARED AUTOMATON
+# ============================================================================
+
+_registered_keywords: Dict[str, None] = {}
+_automaton: Optional[KeywordAutomaton] = None
+_automaton_lock = threading.Lock()
+
+
+def register_keywords(keywords: Iterable[str]):
+    """
+    Add keywords to the shared automaton.
+    Called by each rule module at import; the automaton is rebuilt lazily
+    on the next scan, so in practice it is compiled exactly once.
+    """
+    global _automaton
+    with _automaton_lock:
+        added = False
+        for keyword in keywords:
+            if keyword and keyword not in _registered_keywords:
+                _registered_keywords[keyword] = None
+                added = True
+        if added:
+            _automaton = None
+
+
+def get_automaton() -> KeywordAutomaton:
+    """Get the shared automaton, compiling it if keywords were registered"""
+    global _automaton
+    automaton = _automaton
+    if automaton is None:
+        with _automaton_lock:
+            if _automaton is None:
+                _automaton = KeywordAutomaton(_registered_keywords)
+                logger.info(f"Compiled keyword automaton with {len(_automaton)} patterns")
+            automaton = _automaton
+    return automaton
+
+
+def scan_text(text: str) -> KeywordScan:
+    """Scan text once for every registered keyword"""
+    text_lower = text.lower()
+    automaton = get_automaton()
+    return KeywordScan(
+        text_lower=text_lower,
+        hits=automaton.find_all(text_lower),
+        known_keywords=automaton.keywords
+    )
@@ -11,9 +11,10 @@ Following MODEL_USAGE_POLICY:
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
-import re
 import logging
 
+from .keyword_automaton import KeywordScan, register_keywords, scan_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -308,14 +309,30 @@ SERVICE_TIMELINES = {
 }
 
 
-def detect_legal_triggers(text: str) -> Dict:
+# Keywords that select the applicable response timeline
+TIMELINE_TRIGGERS = {
+    "life_liberty": ["life", "liberty", "emergency"],
+    "second_appeal": ["second appeal"],
+}
+
+
+# Compile trigger tables into the shared automaton
+for _triggers in RTI_SECTION_TRIGGERS.values():
+    register_keywords(_triggers)
+for _marker_data in GRIEVANCE_MARKERS.values():
+    register_keywords(_marker_data["triggers"])
+for _triggers in TIMELINE_TRIGGERS.values():
+    register_keywords(_triggers)
+
+
+def detect_legal_triggers(text: str, scan: Optional[KeywordScan] = None) -> Dict:
     """
     Detect legal triggers in user text.
     Returns relevant sections and markers.
     
     Simple interface for backward compatibility.
     """
-    result = analyze_legal_context(text)
+    result = analyze_legal_context(text, scan=scan)
     
     return {
         "rti_sections": [
@@ -337,12 +354,13 @@ def detect_legal_triggers(text: str) -> Dict:
     }
 
 
-def analyze_legal_context(text: str) -> LegalAnalysisResult:
+def analyze_legal_context(text: str, scan: Optional[KeywordScan] = None) -> LegalAnalysisResult:
     """
     Comprehensive legal analysis of text.
     Returns full LegalAnalysisResult with all details.
     """
-    text_lower = text.lower()
+    if scan is None:
+        scan = scan_text(text)
     
     # Find RTI sections
     rti_sections = []
@@ -350,7 +368,7 @@ def analyze_legal_context(text: str) -> LegalAnalysisResult:
     
     for section_id, triggers in RTI_SECTION_TRIGGERS.items():
         for trigger in triggers:
-            if trigger in text_lower:
+            if scan.contains(trigger):
                 section = RTI_SECTIONS.get(section_id)
                 if section and section not in rti_sections:
                     rti_sections.append(section)
@@ -362,7 +380,7 @@ def analyze_legal_context(text: str) -> LegalAnalysisResult:
     max_severity = SeverityLevel.LOW
     
     for marker_id, marker_data in GRIEVANCE_MARKERS.items():
-        triggers_found = [t for t in marker_data["triggers"] if t in text_lower]
+        triggers_found = scan.present(marker_data["triggers"])
         if triggers_found:
             severity = marker_data["severity"]
             grievance_markers.append(GrievanceMarker(
@@ -385,12 +403,13 @@ def analyze_legal_context(text: str) -> LegalAnalysisResult:
     
     # Determine applicable timeline
     timeline = None
-    if any("life" in t or "liberty" in t or "emergency" in t for t in text_lower.split()):
+    # Keywords contain no whitespace, so a token-level check equals a substring check
+    if scan.contains_any(TIMELINE_TRIGGERS["life_liberty"]):
         timeline = "48 hours (Section 7(1) proviso - life/liberty)"
     elif any(s.section == "Section 6" for s in rti_sections):
         timeline = "30 days (Section 7(1))"
     elif any(s.section == "Section 19" for s in rti_sections):
-        if "second appeal" in text_lower:
+        if scan.contains_any(TIMELINE_TRIGGERS["second_appeal"]):
             timeline = "90 days from First Appeal (Section 19(3))"
         else:
             timeline = "30 days from decision (Section 19(1))"
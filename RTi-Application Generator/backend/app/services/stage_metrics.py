@@ -0,0 +1,207 @@
+"""
+Stage Metrics
+Wall-time spans for the inference pipeline, aggregated into Prometheus histograms.
+
+Design:
+- StageTrace: per-call recorder; `with trace.span("intent_rules"):` adds the
+  elapsed time and a call count for that stage. Traces are plain local
+  objects, so concurrent inferences on executor threads never share one
+- every finished span is also observed into the process-wide MetricsRegistry
+  (when METRICS_ENABLED), which /metrics renders in the Prometheus text format
+- HTTP request durations from RequestLoggingMiddleware go into the same registry
+
+Histograms are fixed-bucket and lock-protected; an observation is a bisect
+and three additions, cheap next to any stage it measures.
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from bisect import bisect_left
+from contextlib import contextmanager
+import threading
+import time
+
+from app.config import get_settings
+
+
+# Seconds; stages range from tens of microseconds (confidence gate) to
+# hundreds of milliseconds (DistilBERT on CPU)
+STAGE_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram for one label set"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return result
+
+
+class HistogramFamily:
+    """A named histogram metric with one Histogram per label combination"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = Histogram(self.buckets)
+            series.observe(value)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Histogram]:
+        """Copies of every series, taken under the lock"""
+        with self._lock:
+            copies = {}
+            for labels, series in self._series.items():
+                copy = Histogram(self.buckets)
+                copy.counts = list(series.counts)
+                copy.sum = series.sum
+                copy.count = series.count
+                copies[labels] = copy
+            return copies
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self.snapshot().items()):
+            base = _format_labels(zip(self.label_names, labels))
+            for bound, count in series.cumulative():
+                le = _format_labels(list(zip(self.label_names, labels)) + [("le", bound)])
+                lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_sum{base} {series.sum!r}")
+            lines.append(f"{self.name}_count{base} {series.count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs) -> str:
+    pairs = list(pairs)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+class MetricsRegistry:
+    """Process-wide stage and request histograms"""
+
+    def __init__(self):
+        self.stage_duration = HistogramFamily(
+            "rti_inference_stage_duration_seconds",
+            "Wall time of one run_inference stage",
+            ("stage",), STAGE_BUCKETS,
+        )
+        self.inference_duration = HistogramFamily(
+            "rti_inference_duration_seconds",
+            "Wall time of a whole run_inference call",
+            (), STAGE_BUCKETS,
+        )
+        self.request_duration = HistogramFamily(
+            "rti_http_request_duration_seconds",
+            "HTTP request duration by route, method and status",
+            ("method", "path", "status"), REQUEST_BUCKETS,
+        )
+
+    def observe_stage(self, stage: str, seconds: float):
+        self.stage_duration.observe((stage,), seconds)
+
+    def observe_inference(self, seconds: float):
+        self.inference_duration.observe((), seconds)
+
+    def observe_request(self, method: str, path: str, status: int, seconds: float):
+        self.request_duration.observe((method, path, str(status)), seconds)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)"""
+        lines = []
+        for family in (self.stage_duration, self.inference_duration, self.request_duration):
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+# Singleton registry
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
+
+
+def set_metrics_registry(registry: Optional[MetricsRegistry]):
+    """Swap the process-wide registry (tests start from an empty one)"""
+    global _registry
+    _registry = registry
+
+
+class StageTrace:
+    """
+    Stage timings for one pipeline run.
+
+    A stage entered several times (e.g. once per batch item) accumulates its
+    time and call count.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        if registry is None and get_settings().METRICS_ENABLED:
+            registry = get_metrics_registry()
+        self._registry = registry
+        self._started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def record(self, stage: str, seconds: float):
+        entry = self.stages.get(stage)
+        if entry is None:
+            entry = self.stages[stage] = {"ms": 0.0, "calls": 0}
+        entry["ms"] += seconds * 1000
+        entry["calls"] += 1
+        if self._registry is not None:
+            self._registry.observe_stage(stage, seconds)
+
+    def finish(self) -> Dict[str, Dict[str, float]]:
+        """Close the trace: observe the total and return stage -> {ms, calls}"""
+        if self._registry is not None:
+            self._registry.observe_inference(time.perf_counter() - self._started)
+        return {
+            stage: {"ms": round(entry["ms"], 3), "calls": entry["calls"]}
+            for stage, entry in self.stages.items()
+        }
@@ -6,11 +6,18 @@ This module validates RTI requests BEFORE draft generation to:
 1. Prevent 70-80% of real RTI rejections
 2. Ensure legal compliance
 3. Check clarity and completeness
+
+Rules are a declarative table (RULES) built once at import: each rule names
+the request fields it reads, a predicate over them (regexes precompiled) and
+the issue it raises. Rules sharing the same input fields form a group, so
+revalidate() only re-runs groups whose fields changed and validate_many()
+evaluates each distinct group input once per batch.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 import re
 from loguru import logger
 
@@ -52,6 +59,16 @@ class ValidationResult:
     issues: List[ValidationIssue] = field(default_factory=list)
     score: int = 0  # Quality score 0-100
     scores_breakdown: Dict[str, int] = field(default_factory=dict)
+    # Inputs and per-group rule outcomes, used by RTIValidator.revalidate()
+    state: Optional["ValidationState"] = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class ValidationState:
+    """Snapshot of one validation run"""
+    values: Dict[str, str]
+    fired: Dict[Tuple[str, ...], Tuple[int, ...]]  # rule group inputs -> indices of rules that fired
+    rules_evaluated: int = 0
 
 
 # =============================================================================
@@ -59,11 +76,13 @@ class ValidationResult:
 # =============================================================================
 
 # Patterns that indicate vague/unclear requests
+# (pattern, suggestion, keywords - one must appear in the casefolded text for the pattern to match)
 VAGUE_PATTERNS = [
-    (r'^(all|any|every|some)\s+(information|details|records)', "Avoid using 'all' or 'any' - be specific"),
-    (r'etc\.?$|\.{3}$', "Don't end with 'etc.' - specify exactly what you need"),
-    (r'\ball\s+related\b', "Specify exactly what related items you need"),
-    (r'\bwhatever\b|\banything\b', "Replace with specific items"),
+    (r'^(all|any|every|some)\s+(information|details|records)', "Avoid using 'all' or 'any' - be specific",
+     ("information", "details", "records")),
+    (r'etc\.?$|\.{3}$', "Don't end with 'etc.' - specify exactly what you need", ("etc", "...")),
+    (r'\ball\s+related\b', "Specify exactly what related items you need", ("related",)),
+    (r'\bwhatever\b|\banything\b', "Replace with specific items", ("whatever", "anything")),
 ]
 
 # Time period patterns (valid)
@@ -89,21 +108,307 @@ QUESTION_INDICATORS = [
     r'(प्रदान करें|दें|भेजें|बताएं)',  # Hindi
 ]
 
-# Exemption keywords (Section 8 of RTI Act)
+# Exemption keywords (Section 8 of RTI Act) - same (pattern, warning, keywords) shape
 EXEMPTION_KEYWORDS = [
-    (r'\b(cabinet|PMO|prime\s*minister)\s*(papers?|notes?|discussions?)', "Cabinet papers may be exempt under Section 8(1)(i)"),
-    (r'\b(security|defence|intelligence|armed\s*forces)\b', "Security-related info may be exempt under Section 8(1)(a)"),
-    (r'\b(trade\s*secret|commercial\s*confidence|intellectual\s*property)\b', "Commercial confidential info may be exempt under Section 8(1)(d)"),
-    (r'\b(personal|private)\s+(information|details|records)\s+of\s+(third|other)', "Third party personal info may be exempt under Section 8(1)(j)"),
+    (r'\b(cabinet|PMO|prime\s*minister)\s*(papers?|notes?|discussions?)', "Cabinet papers may be exempt under Section 8(1)(i)",
+     ("cabinet", "pmo", "prime")),
+    (r'\b(security|defence|intelligence|armed\s*forces)\b', "Security-related info may be exempt under Section 8(1)(a)",
+     ("security", "defence", "intelligence", "armed")),
+    (r'\b(trade\s*secret|commercial\s*confidence|intellectual\s*property)\b', "Commercial confidential info may be exempt under Section 8(1)(d)",
+     ("trade", "commercial", "intellectual")),
+    (r'\b(personal|private)\s+(information|details|records)\s+of\s+(third|other)', "Third party personal info may be exempt under Section 8(1)(j)",
+     ("personal", "private")),
 ]
 
 
+# =============================================================================
+# RULE TABLE
+# =============================================================================
+
+# Request fields the rules read (all normalized to str, "" when missing)
+FIELDS = (
+    "information_sought",
+    "time_period",
+    "department",
+    "record_type",
+    "applicant_name",
+    "applicant_address",
+    "applicant_state",
+)
+
+# Order in which categories appear in scores_breakdown
+CATEGORY_ORDER = (
+    ValidationCategory.COMPLETENESS,
+    ValidationCategory.CLARITY,
+    ValidationCategory.LEGAL,
+    ValidationCategory.AUTHORITY,
+    ValidationCategory.FORMAT,
+)
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    """
+    One check. predicate receives the values of `inputs` (in order) and
+    returns True when the issue applies; each hit subtracts `penalty` from
+    the rule's category score.
+    
+    keywords is an optional prefilter: the predicate can only be True if one
+    of these lower-case literals occurs in the casefolded first input, so the
+    regex is skipped for most texts.
+    """
+    code: str
+    category: ValidationCategory
+    severity: ValidationSeverity
+    inputs: Tuple[str, ...]
+    predicate: Callable[..., bool]
+    penalty: int
+    message: str
+    message_hi: str
+    field: Optional[str] = None
+    suggestion: Optional[str] = None
+    suggestion_hi: Optional[str] = None
+    keywords: Tuple[str, ...] = ()
+    
+    def issue(self) -> ValidationIssue:
+        return ValidationIssue(
+            code=self.code,
+            message=self.message,
+            message_hi=self.message_hi,
+            severity=self.severity,
+            category=self.category,
+            field=self.field,
+            suggestion=self.suggestion,
+            suggestion_hi=self.suggestion_hi
+        )
+
+
+def _any_pattern(patterns: Iterable[str], flags: int = 0) -> "re.Pattern[str]":
+    """One alternation equivalent to any(re.search(p) for p in patterns)"""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+_TIME_PERIOD_RE = _any_pattern(TIME_PERIOD_PATTERNS, re.IGNORECASE)
+_QUESTION_RE = _any_pattern(QUESTION_INDICATORS)
+_VAGUE_DEPARTMENT_RE = _any_pattern([r'^other$', r'^general$', r'^government$', r'^sarkari$'], re.IGNORECASE)
+
+_INFO = ("information_sought",)
+
+
+def _build_rules() -> List[ValidationRule]:
+    """The rule table, in the order issues are reported"""
+    rules = [
+        # === COMPLETENESS ===
+        ValidationRule(
+            code="MISSING_INFO_SOUGHT",
+            category=ValidationCategory.COMPLETENESS,
+            severity=ValidationSeverity.ERROR,
+            inputs=_INFO,
+            predicate=lambda info: len(info.strip()) < 10,
+            penalty=40,
+            message="Information sought is required and must be at least 10 characters",
+            message_hi="मांगी गई जानकारी आवश्यक है और कम से कम 10 अक्षर होने चाहिए",
+            field="information_sought"
+        ),
+        ValidationRule(
+            code="MISSING_TIME_PERIOD",
+            category=ValidationCategory.COMPLETENESS,
+            severity=ValidationSeverity.ERROR,
+            inputs=("time_period",),
+            predicate=lambda period: len(period.strip()) < 4,
+            penalty=30,
+            message="Time period is required. RTI without time period is often rejected.",
+            message_hi="समय अवधि आवश्यक है। बिना समय अवधि के RTI अक्सर अस्वीकार हो जाती है।",
+            field="time_period"
+        ),
+        ValidationRule(
+            code="MISSING_DEPARTMENT",
+            category=ValidationCategory.COMPLETENESS,
+            severity=ValidationSeverity.ERROR,
+            inputs=("department",),
+            predicate=lambda department: len(department.strip()) < 2,
+            penalty=20,
+            message="Department/Public Authority must be specified",
+            message_hi="विभाग/लोक प्राधिकरण निर्दिष्ट होना चाहिए",
+            field="department"
+        ),
+        ValidationRule(
+            code="MISSING_APPLICANT_NAME",
+            category=ValidationCategory.COMPLETENESS,
+            severity=ValidationSeverity.ERROR,
+            inputs=("applicant_name",),
+            predicate=lambda name: not name,
+            penalty=10,
+            message="Applicant name is required",
+            message_hi="आवेदक का नाम आवश्यक है",
+            field="applicant_name"
+        ),
+        ValidationRule(
+            code="MISSING_APPLICANT_ADDRESS",
+            category=ValidationCategory.COMPLETENESS,
+            severity=ValidationSeverity.WARNING,
+            inputs=("applicant_address",),
+            predicate=lambda address: not address,
+            penalty=5,
+            message="Applicant address is required for receiving the response",
+            message_hi="उत्तर प्राप्त करने के लिए आवेदक का पता आवश्यक है",
+            field="applicant_address"
+        ),
+    ]
+    
+    # === CLARITY ===
+    for pattern, suggestion, keywords in VAGUE_PATTERNS:
+        regex = re.compile(pattern, re.IGNORECASE)
+        rules.append(ValidationRule(
+            code="VAGUE_REQUEST",
+            category=ValidationCategory.CLARITY,
+            severity=ValidationSeverity.WARNING,
+            inputs=_INFO,
+            predicate=lambda info, regex=regex: bool(info) and regex.search(info) is not None,
+            penalty=15,
+            message=f"Request may be too vague: {suggestion}",
+            message_hi="अनुरोध बहुत अस्पष्ट हो सकता है",
+            field="information_sought",
+            suggestion=suggestion,
+            keywords=keywords
+        ))
+    
+    rules += [
+        ValidationRule(
+            code="UNSTRUCTURED_REQUEST",
+            category=ValidationCategory.CLARITY,
+            severity=ValidationSeverity.INFO,
+            inputs=_INFO,
+            # Numbered/structured questions are good practice
+            predicate=lambda info: len(info) > 100 and _QUESTION_RE.search(info) is None,
+            penalty=10,
+            message="Consider numbering your questions for clarity",
+            message_hi="स्पष्टता के लिए अपने प्रश्नों को क्रमांकित करने पर विचार करें",
+            field="information_sought",
+            suggestion="Use numbered points like:\n1. First question\n2. Second question"
+        ),
+        # Length: too short = unclear, too long = may be rejected
+        ValidationRule(
+            code="REQUEST_TOO_SHORT",
+            category=ValidationCategory.CLARITY,
+            severity=ValidationSeverity.WARNING,
+            inputs=_INFO,
+            predicate=lambda info: 0 < len(info) < 50,
+            penalty=20,
+            message="Request seems too brief. Be more specific about what information you need.",
+            message_hi="अनुरोध बहुत संक्षिप्त लगता है। अधिक विस्तृत जानकारी दें।",
+            field="information_sought"
+        ),
+        ValidationRule(
+            code="REQUEST_TOO_LONG",
+            category=ValidationCategory.CLARITY,
+            severity=ValidationSeverity.INFO,
+            inputs=_INFO,
+            predicate=lambda info: len(info) > 1500,
+            penalty=5,
+            message="Request is quite long. Consider breaking into multiple focused RTIs.",
+            message_hi="अनुरोध काफी लंबा है। कई केंद्रित RTI में विभाजित करने पर विचार करें।",
+            field="information_sought"
+        ),
+        
+        # === LEGAL ===
+        ValidationRule(
+            code="INVALID_TIME_PERIOD",
+            category=ValidationCategory.LEGAL,
+            severity=ValidationSeverity.WARNING,
+            inputs=("time_period",),
+            predicate=lambda period: bool(period) and _TIME_PERIOD_RE.search(period) is None,
+            penalty=15,
+            message="Time period format unclear. Use formats like '2023-2024' or 'Last 2 years'",
+            message_hi="समय अवधि प्रारूप अस्पष्ट है। '2023-2024' या 'पिछले 2 वर्ष' जैसे प्रारूप का उपयोग करें",
+            field="time_period"
+        ),
+    ]
+    
+    # Potentially exempt information (Section 8)
+    for pattern, warning, keywords in EXEMPTION_KEYWORDS:
+        regex = re.compile(pattern, re.IGNORECASE)
+        rules.append(ValidationRule(
+            code="POTENTIAL_EXEMPTION",
+            category=ValidationCategory.LEGAL,
+            severity=ValidationSeverity.WARNING,
+            inputs=_INFO,
+            predicate=lambda info, regex=regex: bool(info) and regex.search(info) is not None,
+            penalty=10,
+            message=warning,
+            message_hi="यह जानकारी RTI अधिनियम की धारा 8 के तहत छूट प्राप्त हो सकती है",
+            field="information_sought",
+            suggestion="This information may be exempt. Consider rephrasing or be prepared for potential denial.",
+            keywords=keywords
+        ))
+    
+    rules += [
+        # === AUTHORITY ===
+        ValidationRule(
+            code="VAGUE_DEPARTMENT",
+            category=ValidationCategory.AUTHORITY,
+            severity=ValidationSeverity.WARNING,
+            inputs=("department",),
+            predicate=lambda department: bool(department) and _VAGUE_DEPARTMENT_RE.search(department) is not None,
+            penalty=30,
+            message="Department is too vague. Specify the exact department to avoid transfer delays.",
+            message_hi="विभाग बहुत अस्पष्ट है। स्थानांतरण में देरी से बचने के लिए सटीक विभाग निर्दिष्ट करें।",
+            field="department"
+        ),
+        
+        # === FORMAT ===
+        ValidationRule(
+            code="MISSING_RECORD_TYPE",
+            category=ValidationCategory.FORMAT,
+            severity=ValidationSeverity.INFO,
+            inputs=("record_type",),
+            predicate=lambda record_type: not record_type,
+            penalty=20,
+            message="Specifying record type (documents, data, inspection) helps get precise response",
+            message_hi="अभिलेख का प्रकार निर्दिष्ट करने से सटीक प्रतिक्रिया प्राप्त करने में मदद मिलती है",
+            field="record_type"
+        ),
+    ]
+    return rules
+
+
+RULES: List[ValidationRule] = _build_rules()
+
+
+def _group_rules(rules: List[ValidationRule]) -> Dict[Tuple[str, ...], Tuple[int, ...]]:
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for index, rule in enumerate(rules):
+        groups.setdefault(rule.inputs, []).append(index)
+    return {inputs: tuple(indices) for inputs, indices in groups.items()}
+
+
+# Rule groups keyed by the fields they read
+RULE_GROUPS: Dict[Tuple[str, ...], Tuple[int, ...]] = _group_rules(RULES)
+
+
+# Edit checks: legal elements that must survive user edits of an RTI draft
+RTI_DOCUMENT_TYPES = ("information_request", "records_request", "inspection_request")
+
+CRITICAL_EDIT_PATTERNS = [
+    (re.compile(r'RTI\s*(Act|अधिनियम)', re.IGNORECASE), "RTI Act reference should not be removed"),
+    (re.compile(r'(Section|धारा)\s*6', re.IGNORECASE), "Section 6 reference is important"),
+    (re.compile(r'(Public\s*Information\s*Officer|लोक\s*सूचना\s*अधिकारी|PIO)', re.IGNORECASE), "PIO addressee should be retained"),
+    (re.compile(r'(citizen|नागरिक)', re.IGNORECASE), "Citizenship declaration is legally required"),
+]
+
+
+@lru_cache(maxsize=256)
+def _critical_elements(text: str) -> Tuple[bool, ...]:
+    """Which critical patterns a draft contains; the original draft is the same on every keystroke"""
+    return tuple(pattern.search(text) is not None for pattern, _ in CRITICAL_EDIT_PATTERNS)
+
+
 class RTIValidator:
     """
     Validates RTI requests for legal compliance, clarity, and completeness.
     """
     
-    def __init__(self):
+    def __init__(self, rules: Optional[List[ValidationRule]] = None):
         self.weights = {
             ValidationCategory.LEGAL: 30,
             ValidationCategory.CLARITY: 25,
@@ -111,217 +416,63 @@ class RTIValidator:
             ValidationCategory.AUTHORITY: 15,
             ValidationCategory.FORMAT: 5,
         }
+        self.rules = RULES if rules is None else rules
+        self.groups = RULE_GROUPS if rules is None else _group_rules(self.rules)
     
-    def validate(
+    @staticmethod
+    def _normalize(values: Dict[str, Any]) -> Dict[str, str]:
+        return {name: values.get(name) or "" for name in FIELDS}
+    
+    def _evaluate_group(self, inputs: Tuple[str, ...], values: Dict[str, str]) -> Tuple[int, ...]:
+        args = [values[name] for name in inputs]
+        folded: Optional[str] = None
+        hits = []
+        for i in self.groups[inputs]:
+            rule = self.rules[i]
+            if rule.keywords:
+                if folded is None:
+                    folded = args[0].casefold()
+                if not any(keyword in folded for keyword in rule.keywords):
+                    continue
+            if rule.predicate(*args):
+                hits.append(i)
+        return tuple(hits)
+    
+    def _run(
         self,
-        information_sought: str,
-        time_period: str,
-        department: str,
-        record_type: str,
-        applicant_name: str = "",
-        applicant_address: str = "",
-        applicant_state: str = "",
-        **kwargs
+        values: Dict[str, str],
+        previous: Optional[ValidationState] = None,
+        memo: Optional[Dict[tuple, Tuple[int, ...]]] = None
     ) -> ValidationResult:
-        """
-        Validate an RTI request.
-        
-        Returns ValidationResult with issues and quality score.
-        """
-        issues: List[ValidationIssue] = []
-        scores: Dict[str, int] = {}
-        
-        # === COMPLETENESS CHECKS ===
-        completeness_score = 100
-        
-        # Required field: Information sought
-        if not information_sought or len(information_sought.strip()) < 10:
-            issues.append(ValidationIssue(
-                code="MISSING_INFO_SOUGHT",
-                message="Information sought is required and must be at least 10 characters",
-                message_hi="मांगी गई जानकारी आवश्यक है और कम से कम 10 अक्षर होने चाहिए",
-                severity=ValidationSeverity.ERROR,
-                category=ValidationCategory.COMPLETENESS,
-                field="information_sought"
-            ))
-            completeness_score -= 40
-        
-        # Required field: Time period
-        if not time_period or len(time_period.strip()) < 4:
-            issues.append(ValidationIssue(
-                code="MISSING_TIME_PERIOD",
-                message="Time period is required. RTI without time period is often rejected.",
-                message_hi="समय अवधि आवश्यक है। बिना समय अवधि के RTI अक्सर अस्वीकार हो जाती है।",
-                severity=ValidationSeverity.ERROR,
-                category=ValidationCategory.COMPLETENESS,
-                field="time_period"
-            ))
-            completeness_score -= 30
+        """Evaluate rule groups (all, or only those whose inputs changed) and score"""
+        fired: Dict[Tuple[str, ...], Tuple[int, ...]] = {}
+        evaluated = 0
+        for inputs, indices in self.groups.items():
+            if previous is not None and all(values[name] == previous.values[name] for name in inputs):
+                fired[inputs] = previous.fired[inputs]
+                continue
+            if memo is not None:
+                key = (inputs, *(values[name] for name in inputs))
+                hits = memo.get(key)
+                if hits is None:
+                    hits = memo[key] = self._evaluate_group(inputs, values)
+                    evaluated += len(indices)
+                fired[inputs] = hits
+                continue
+            fired[inputs] = self._evaluate_group(inputs, values)
+            evaluated += len(indices)
         
-        # Required field: Department
-        if not department or len(department.strip()) < 2:
-            issues.append(ValidationIssue(
-                code="MISSING_DEPARTMENT",
-                message="Department/Public Authority must be specified",
-                message_hi="विभाग/लोक प्राधिकरण निर्दिष्ट होना चाहिए",
-                severity=ValidationSeverity.ERROR,
-                category=ValidationCategory.COMPLETENESS,
-                field="department"
-            ))
-            completeness_score -= 20
-        
-        # Required field: Applicant details
-        if not applicant_name:
-            issues.append(ValidationIssue(
-                code="MISSING_APPLICANT_NAME",
-                message="Applicant name is required",
-                message_hi="आवेदक का नाम आवश्यक है",
-                severity=ValidationSeverity.ERROR,
-                category=ValidationCategory.COMPLETENESS,
-                field="applicant_name"
-            ))
-            completeness_score -= 10
-        
-        if not applicant_address:
-            issues.append(ValidationIssue(
-                code="MISSING_APPLICANT_ADDRESS",
-                message="Applicant address is required for receiving the response",
-                message_hi="उत्तर प्राप्त करने के लिए आवेदक का पता आवश्यक है",
-                severity=ValidationSeverity.WARNING,
-                category=ValidationCategory.COMPLETENESS,
-                field="applicant_address"
-            ))
-            completeness_score -= 5
-        
-        scores[ValidationCategory.COMPLETENESS.value] = max(0, completeness_score)
-        
-        # === CLARITY CHECKS ===
-        clarity_score = 100
-        
-        if information_sought:
-            # Check for vague language
-            for pattern, suggestion in VAGUE_PATTERNS:
-                if re.search(pattern, information_sought, re.IGNORECASE):
-                    issues.append(ValidationIssue(
-                        code="VAGUE_REQUEST",
-                        message=f"Request may be too vague: {suggestion}",
-                        message_hi="अनुरोध बहुत अस्पष्ट हो सकता है",
-                        severity=ValidationSeverity.WARNING,
-                        category=ValidationCategory.CLARITY,
-                        field="information_sought",
-                        suggestion=suggestion
-                    ))
-                    clarity_score -= 15
-            
-            # Check for numbered/structured questions (good practice)
-            has_structure = any(re.search(p, information_sought) for p in QUESTION_INDICATORS)
-            if not has_structure and len(information_sought) > 100:
-                issues.append(ValidationIssue(
-                    code="UNSTRUCTURED_REQUEST",
-                    message="Consider numbering your questions for clarity",
-                    message_hi="स्पष्टता के लिए अपने प्रश्नों को क्रमांकित करने पर विचार करें",
-                    severity=ValidationSeverity.INFO,
-                    category=ValidationCategory.CLARITY,
-                    field="information_sought",
-                    suggestion="Use numbered points like:\n1. First question\n2. Second question"
-                ))
-                clarity_score -= 10
-            
-            # Check length (too short = unclear, too long = may be rejected)
-            if len(information_sought) < 50:
-                issues.append(ValidationIssue(
-                    code="REQUEST_TOO_SHORT",
-                    message="Request seems too brief. Be more specific about what information you need.",
-                    message_hi="अनुरोध बहुत संक्षिप्त लगता है। अधिक विस्तृत जानकारी दें।",
-                    severity=ValidationSeverity.WARNING,
-                    category=ValidationCategory.CLARITY,
-                    field="information_sought"
-                ))
-                clarity_score -= 20
-            elif len(information_sought) > 1500:
-                issues.append(ValidationIssue(
-                    code="REQUEST_TOO_LONG",
-                    message="Request is quite long. Consider breaking into multiple focused RTIs.",
-                    message_hi="अनुरोध काफी लंबा है। कई केंद्रित RTI में विभाजित करने पर विचार करें।",
-                    severity=ValidationSeverity.INFO,
-                    category=ValidationCategory.CLARITY,
-                    field="information_sought"
-                ))
-                clarity_score -= 5
-        
-        scores[ValidationCategory.CLARITY.value] = max(0, clarity_score)
-        
-        # === LEGAL CHECKS ===
-        legal_score = 100
-        
-        if time_period:
-            # Validate time period format
-            has_valid_time = any(re.search(p, time_period, re.IGNORECASE) for p in TIME_PERIOD_PATTERNS)
-            if not has_valid_time:
-                issues.append(ValidationIssue(
-                    code="INVALID_TIME_PERIOD",
-                    message="Time period format unclear. Use formats like '2023-2024' or 'Last 2 years'",
-                    message_hi="समय अवधि प्रारूप अस्पष्ट है। '2023-2024' या 'पिछले 2 वर्ष' जैसे प्रारूप का उपयोग करें",
-                    severity=ValidationSeverity.WARNING,
-                    category=ValidationCategory.LEGAL,
-                    field="time_period"
-                ))
-                legal_score -= 15
-        
-        if information_sought:
-            # Check for potentially exempt information
-            for pattern, warning in EXEMPTION_KEYWORDS:
-                if re.search(pattern, information_sought, re.IGNORECASE):
-                    issues.append(ValidationIssue(
-                        code="POTENTIAL_EXEMPTION",
-                        message=warning,
-                        message_hi="यह जानकारी RTI अधिनियम की धारा 8 के तहत छूट प्राप्त हो सकती है",
-                        severity=ValidationSeverity.WARNING,
-                        category=ValidationCategory.LEGAL,
-                        field="information_sought",
-                        suggestion="This information may be exempt. Consider rephrasing or be prepared for potential denial."
-                    ))
-                    legal_score -= 10
-        
-        scores[ValidationCategory.LEGAL.value] = max(0, legal_score)
-        
-        # === AUTHORITY CHECKS ===
-        authority_score = 100
-        
-        if department:
-            # Check if department is specific enough
-            vague_dept_patterns = [r'^other$', r'^general$', r'^government$', r'^sarkari$']
-            if any(re.search(p, department, re.IGNORECASE) for p in vague_dept_patterns):
-                issues.append(ValidationIssue(
-                    code="VAGUE_DEPARTMENT",
-                    message="Department is too vague. Specify the exact department to avoid transfer delays.",
-                    message_hi="विभाग बहुत अस्पष्ट है। स्थानांतरण में देरी से बचने के लिए सटीक विभाग निर्दिष्ट करें।",
-                    severity=ValidationSeverity.WARNING,
-                    category=ValidationCategory.AUTHORITY,
-                    field="department"
-                ))
-                authority_score -= 30
-        
-        scores[ValidationCategory.AUTHORITY.value] = max(0, authority_score)
-        
-        # === FORMAT CHECKS ===
-        format_score = 100
-        
-        if record_type:
-            # Having record type specified is good
-            pass
-        else:
-            issues.append(ValidationIssue(
-                code="MISSING_RECORD_TYPE",
-                message="Specifying record type (documents, data, inspection) helps get precise response",
-                message_hi="अभिलेख का प्रकार निर्दिष्ट करने से सटीक प्रतिक्रिया प्राप्त करने में मदद मिलती है",
-                severity=ValidationSeverity.INFO,
-                category=ValidationCategory.FORMAT,
-                field="record_type"
-            ))
-            format_score -= 20
+        state = ValidationState(values=values, fired=fired, rules_evaluated=evaluated)
+        return self._build_result(state)
+    
+    def _build_result(self, state: ValidationState) -> ValidationResult:
+        fired = sorted(i for hits in state.fired.values() for i in hits)
+        issues = [self.rules[i].issue() for i in fired]
         
-        scores[ValidationCategory.FORMAT.value] = max(0, format_score)
+        penalties = {category: 0 for category in CATEGORY_ORDER}
+        for i in fired:
+            penalties[self.rules[i].category] += self.rules[i].penalty
+        scores = {category.value: max(0, 100 - penalties[category]) for category in CATEGORY_ORDER}
         
         # === CALCULATE OVERALL SCORE ===
         total_weight = sum(self.weights.values())
@@ -332,16 +483,65 @@ class RTIValidator:
         
         # Determine if valid
         has_errors = any(i.severity == ValidationSeverity.ERROR for i in issues)
-        has_warnings = any(i.severity == ValidationSeverity.WARNING for i in issues)
         
         return ValidationResult(
             is_valid=not has_errors,
             can_generate=not has_errors,  # Can generate if no blocking errors
             issues=issues,
             score=int(weighted_score),
-            scores_breakdown=scores
+            scores_breakdown=scores,
+            state=state
         )
     
+    def validate(
+        self,
+        information_sought: str,
+        time_period: str,
+        department: str,
+        record_type: str,
+        applicant_name: str = "",
+        applicant_address: str = "",
+        applicant_state: str = "",
+        **kwargs
+    ) -> ValidationResult:
+        """
+        Validate an RTI request.
+        
+        Returns ValidationResult with issues and quality score.
+        """
+        return self._run(self._normalize({
+            "information_sought": information_sought,
+            "time_period": time_period,
+            "department": department,
+            "record_type": record_type,
+            "applicant_name": applicant_name,
+            "applicant_address": applicant_address,
+            "applicant_state": applicant_state,
+        }))
+    
+    def revalidate(self, previous: ValidationResult, **changes) -> ValidationResult:
+        """
+        Re-validate after some fields changed (e.g. on every keystroke).
+        Only rules reading a changed field are re-run; the rest reuse the
+        outcome stored in previous.state.
+        """
+        if previous.state is None:
+            raise ValueError("previous result has no validation state")
+        unknown = set(changes) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown validation fields: {', '.join(sorted(unknown))}")
+        values = dict(previous.state.values)
+        values.update({name: value or "" for name, value in changes.items()})
+        return self._run(values, previous=previous.state)
+    
+    def validate_many(self, requests: Iterable[Dict[str, Any]]) -> List[ValidationResult]:
+        """
+        Validate a batch of requests (dicts with validate()'s field names).
+        Rule groups are evaluated once per distinct input across the batch.
+        """
+        memo: Dict[tuple, Tuple[int, ...]] = {}
+        return [self._run(self._normalize(request), memo=memo) for request in requests]
+    
     def validate_edit(
         self,
         original_text: str,
@@ -356,16 +556,11 @@ class RTIValidator:
         issues: List[ValidationIssue] = []
         
         # Critical patterns that shouldn't be removed
-        if document_type in ["information_request", "records_request", "inspection_request"]:
-            critical_patterns = [
-                (r'RTI\s*(Act|अधिनियम)', "RTI Act reference should not be removed"),
-                (r'(Section|धारा)\s*6', "Section 6 reference is important"),
-                (r'(Public\s*Information\s*Officer|लोक\s*सूचना\s*अधिकारी|PIO)', "PIO addressee should be retained"),
-                (r'(citizen|नागरिक)', "Citizenship declaration is legally required"),
-            ]
-            
-            for pattern, warning in critical_patterns:
-                if re.search(pattern, original_text, re.IGNORECASE) and not re.search(pattern, edited_text, re.IGNORECASE):
+        if document_type in RTI_DOCUMENT_TYPES:
+            before = _critical_elements(original_text)
+            after = _critical_elements(edited_text)
+            for (_, warning), had, has in zip(CRITICAL_EDIT_PATTERNS, before, after):
+                if had and not has:
                     issues.append(ValidationIssue(
                         code="CRITICAL_REMOVED",
                         message=warning,
@@ -9,7 +9,7 @@ Supports:
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from enum import Enum
 
 
@@ -245,6 +245,8 @@ HINDI_ISSUE_KEYWORDS = {
 
 # Devanagari Unicode range
 DEVANAGARI_PATTERN = re.compile(r'[\u0900-\u097F]')
+# Runs of Devanagari: one match per word instead of per character
+DEVANAGARI_RUN_PATTERN = re.compile(r'[\u0900-\u097F]+')
 
 # Common Hinglish words (not English, but romanized Hindi)
 HINGLISH_MARKERS = {
@@ -265,45 +267,46 @@ HINGLISH_MARKERS = {
     "kripya", "dhanyawad", "seva", "madad", "sahayata",
 }
 
+_is_marker = HINGLISH_MARKERS.__contains__
+
+
+def _devanagari_count(text: str) -> int:
+    """Devanagari characters in text; ASCII text is answered without a regex"""
+    if text.isascii():
+        return 0
+    return sum(map(len, DEVANAGARI_RUN_PATTERN.findall(text)))
+
 
 def detect_language(text: str) -> Tuple[DetectedLanguage, float]:
     """
     Detect whether text is English, Hindi, or Hinglish.
     
+    Each signal is a single C-level scan: the Devanagari count is skipped
+    for ASCII text, and the text is only split into words for the Hinglish
+    marker count when the script ratio has not already decided.
+    
     Returns:
         Tuple of (detected_language, confidence)
     """
-    if not text or not text.strip():
-        return DetectedLanguage.UNKNOWN, 0.0
-    
-    text_lower = text.lower()
-    words = text_lower.split()
-    total_words = len(words)
-    
-    if total_words == 0:
+    if not text or text.isspace():
         return DetectedLanguage.UNKNOWN, 0.0
     
-    # Check for Devanagari script
-    devanagari_chars = len(DEVANAGARI_PATTERN.findall(text))
-    total_chars = len(text.replace(" ", ""))
-    
-    if total_chars == 0:
-        return DetectedLanguage.UNKNOWN, 0.0
-    
-    devanagari_ratio = devanagari_chars / total_chars
+    # Non-space characters (tabs and newlines count)
+    total_chars = len(text) - text.count(" ")
+    devanagari_ratio = _devanagari_count(text) / total_chars
     
     # Pure Hindi (Devanagari script)
     if devanagari_ratio > 0.5:
         return DetectedLanguage.HINDI, min(0.95, 0.5 + devanagari_ratio * 0.5)
     
-    # Check for Hinglish markers
-    hinglish_word_count = sum(1 for word in words if word in HINGLISH_MARKERS)
-    hinglish_ratio = hinglish_word_count / total_words
-    
     # Mixed script (some Devanagari + Roman)
-    if devanagari_ratio > 0.1 and devanagari_ratio <= 0.5:
+    if devanagari_ratio > 0.1:
         return DetectedLanguage.HINGLISH, 0.7 + devanagari_ratio
     
+    # Check for Hinglish markers
+    words = text.lower().split()
+    hinglish_ratio = sum(map(_is_marker, words)) / len(words)
+    
     # Romanized Hindi (Hinglish)
     if hinglish_ratio > 0.2:
         return DetectedLanguage.HINGLISH, min(0.9, 0.5 + hinglish_ratio)
@@ -312,52 +315,94 @@ def detect_language(text: str) -> Tuple[DetectedLanguage, float]:
     return DetectedLanguage.ENGLISH, 0.8
 
 
+def detect_languages(texts: Iterable[str]) -> List[Tuple[DetectedLanguage, float]]:
+    """detect_language for many texts; repeated texts are scanned once"""
+    seen: Dict[str, Tuple[DetectedLanguage, float]] = {}
+    results = []
+    for text in texts:
+        result = seen.get(text)
+        if result is None:
+            result = seen[text] = detect_language(text)
+        results.append(result)
+    return results
+
+
+# Common Hindi to English translations for document generation.
+# Order matters where phrases overlap: earlier entries win.
+HINDI_TO_ENGLISH_KEYWORDS = {
+    # RTI related
+    "सूचना का अधिकार": "right to information",
+    "सूचना": "information",
+    "जानकारी": "information details",
+    "दस्तावेज": "documents",
+    "प्रति": "copy",
+    "नकल": "copy",
+    
+    # Complaint related
+    "शिकायत": "complaint",
+    "समस्या": "problem issue",
+    "परेशानी": "problem harassment",
+    "कार्रवाई": "action",
+    "भ्रष्टाचार": "corruption",
+    "रिश्वत": "bribe corruption",
+    "लापरवाही": "negligence",
+    
+    # Departments
+    "बिजली": "electricity power",
+    "पानी": "water supply",
+    "सड़क": "road",
+    "स्कूल": "school education",
+    "अस्पताल": "hospital health",
+    "पुलिस": "police",
+    "राशन": "ration pds",
+    
+    # Common terms
+    "कृपया": "please kindly",
+    "धन्यवाद": "thank you",
+    "महोदय": "sir madam respected",
+}
+
+# Replacements are applied in table order (str.replace runs in C and beats a
+# regex sub with a callback on Devanagari text). Phrases overlap - e.g.
+# "पुलिस" ends with the "स" that starts "सूचना" - so a single leftmost-match
+# pass would not give the same output. The precompiled alternation is only
+# used to rule out text containing none of the phrases in one scan.
+_TRANSLITERATIONS = [
+    (hindi, f" {english} ") for hindi, english in HINDI_TO_ENGLISH_KEYWORDS.items()
+]
+_TRANSLITERATION_PATTERN = re.compile(
+    "|".join(map(re.escape, HINDI_TO_ENGLISH_KEYWORDS))
+)
+
+
 def transliterate_to_english_keywords(text: str) -> str:
     """
     Convert Hindi text to searchable English keywords.
     This helps the rule engine match Hindi input to English patterns.
     """
-    # Common Hindi to English translations for document generation
-    translations = {
-        # RTI related
-        "सूचना का अधिकार": "right to information",
-        "सूचना": "information",
-        "जानकारी": "information details",
-        "दस्तावेज": "documents",
-        "प्रति": "copy",
-        "नकल": "copy",
-        
-        # Complaint related
-        "शिकायत": "complaint",
-        "समस्या": "problem issue",
-        "परेशानी": "problem harassment",
-        "कार्रवाई": "action",
-        "भ्रष्टाचार": "corruption",
-        "रिश्वत": "bribe corruption",
-        "लापरवाही": "negligence",
-        
-        # Departments
-        "बिजली": "electricity power",
-        "पानी": "water supply",
-        "सड़क": "road",
-        "स्कूल": "school education",
-        "अस्पताल": "hospital health",
-        "पुलिस": "police",
-        "राशन": "ration pds",
-        
-        # Common terms
-        "कृपया": "please kindly",
-        "धन्यवाद": "thank you",
-        "महोदय": "sir madam respected",
-    }
+    # Every phrase is Devanagari: ASCII text, or text matching none, is unchanged
+    if text.isascii() or _TRANSLITERATION_PATTERN.search(text) is None:
+        return text
     
     result = text
-    for hindi, english in translations.items():
-        result = result.replace(hindi, f" {english} ")
-    
+    for hindi, english in _TRANSLITERATIONS:
+        if hindi in result:
+            result = result.replace(hindi, english)
     return result
 
 
+def transliterate_many(texts: Iterable[str]) -> List[str]:
+    """transliterate_to_english_keywords for many texts; repeated texts are converted once"""
+    seen: Dict[str, str] = {}
+    results = []
+    for text in texts:
+        result = seen.get(text)
+        if result is None:
+            result = seen[text] = transliterate_to_english_keywords(text)
+        results.append(result)
+    return results
+
+
 def get_hindi_keywords_for_intent(intent: str) -> Dict[str, float]:
     """Get Hindi keywords for a specific intent type."""
     if intent == "rti":
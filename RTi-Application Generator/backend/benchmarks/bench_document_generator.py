@@ -0,0 +1,98 @@
+"""
+Document Generator Benchmark
+Per-format render latency (p50/p99) for PDF, DOCX and XLSX
+
+Three modes per format:
+- cold: a fresh DocumentGenerator per call, so styles, fonts and the DOCX
+  template are rebuilt every time (what every download used to pay)
+- warm: shared generator, output cache bypassed - templates reused, content rendered
+- cached: shared generator, same draft downloaded again - served by content hash
+
+Usage (from backend/):
+    python benchmarks/bench_document_generator.py [--iterations 50] [--paragraphs 12]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from loguru import logger
+
+from app.services.document_generator import DocumentGenerator
+
+FORMATS = ("pdf", "docx", "xlsx")
+
+
+def make_draft(paragraphs):
+    body = "\n\n".join(
+        f"{i}. Please provide certified copies of all records, file notings and "
+        f"correspondence related to road repair works & drainage in Ward {i} "
+        f"for the period 2022-2024, including sanctioned amounts <if any>."
+        for i in range(1, paragraphs + 1)
+    )
+    return (
+        "To,\nThe Public Information Officer\nMunicipal Corporation, Jaipur\n\n"
+        "Subject: Application under Section 6(1) of the RTI Act, 2005\n\n"
+        f"Sir/Madam,\n\n{body}\n\nYours faithfully,\nRahul Sharma"
+    )
+
+
+def render_args(fmt, draft):
+    return dict(
+        format=fmt,
+        draft_text=draft,
+        document_type="information_request",
+        applicant_name="Rahul Sharma",
+        applicant_details={"name": "Rahul Sharma", "address": "123, Gandhi Nagar", "state": "Rajasthan"},
+        authority_details={"department": "Municipal Corporation", "address": "Jaipur"},
+        metadata={"generated_at": "2024-01-01T10:00:00", "document_type": "information_request"},
+    )
+
+
+def time_calls(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    p99 = samples[max(0, int(len(samples) * 0.99) - 1)]
+    return statistics.median(samples), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--paragraphs", type=int, default=12)
+    args = parser.parse_args()
+
+    logger.remove()  # generator logs every render
+    draft = make_draft(args.paragraphs)
+    generator = DocumentGenerator()
+
+    print(f"draft: {len(draft)} chars, {args.iterations} iterations")
+    print(f"{'format':<6} {'mode':<7} {'p50 ms':>9} {'p99 ms':>9}")
+    for fmt in FORMATS:
+        kwargs = render_args(fmt, draft)
+        generator.render(**kwargs)  # prime the output cache
+
+        modes = {
+            "cold": lambda: DocumentGenerator().render(use_cache=False, **kwargs),
+            "warm": lambda: generator.render(use_cache=False, **kwargs),
+            "cached": lambda: generator.render(**kwargs),
+        }
+        for mode, fn in modes.items():
+            p50, p99 = percentiles(time_calls(fn, args.iterations))
+            print(f"{fmt:<6} {mode:<7} {p50:9.3f} {p99:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Hindi Support Benchmark
+Language detection and keyword transliteration over 10k mixed-script inputs
+
+For English, Hinglish, Hindi and mixed texts:
+- legacy: per-character Devanagari findall, full split and marker scan on
+  every text; one str.replace (and f-string) per phrase for transliteration
+- current: detect_language / transliterate_to_english_keywords
+- batch: detect_languages / transliterate_many over the whole corpus
+
+Both paths must produce identical results; the script aborts otherwise.
+
+Usage (from backend/):
+    python benchmarks/bench_hindi_support.py [--inputs 10000] [--seed 11]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.utils.hindi_support import (
+    DetectedLanguage,
+    HINDI_TO_ENGLISH_KEYWORDS,
+    HINGLISH_MARKERS,
+    detect_language,
+    detect_languages,
+    transliterate_many,
+    transliterate_to_english_keywords,
+)
+
+ENGLISH = [
+    "The road near my house has been broken for three months",
+    "I request certified copies of the tender documents for ward 12",
+    "Street lights are not working and the area is unsafe at night",
+]
+HINGLISH = [
+    "mera bijli ka bill bahut zyada aaya hai kya karna chahiye",
+    "paani nahi aa raha hai kripya madad karo",
+    "sadak mein gaddha hai aur koi sunwai nahi",
+]
+HINDI = [
+    "मेरे घर के पास सड़क पर गड्ढा है कृपया कार्रवाई करें",
+    "सूचना का अधिकार के तहत राशन वितरण की जानकारी और दस्तावेज की प्रति दें",
+    "पुलिस थाने में शिकायत दर्ज नहीं की गई",
+]
+MIXED = [
+    "Please fix the बिजली problem in our colony",
+    "Water supply की समस्या since last week",
+    "RTI application for स्कूल fees details",
+]
+
+
+def legacy_detect(text):
+    """The previous detect_language, kept here as the baseline"""
+    if not text or not text.strip():
+        return DetectedLanguage.UNKNOWN, 0.0
+    text_lower = text.lower()
+    words = text_lower.split()
+    total_words = len(words)
+    if total_words == 0:
+        return DetectedLanguage.UNKNOWN, 0.0
+    devanagari_chars = len(re.findall(r'[\u0900-\u097F]', text))
+    total_chars = len(text.replace(" ", ""))
+    if total_chars == 0:
+        return DetectedLanguage.UNKNOWN, 0.0
+    devanagari_ratio = devanagari_chars / total_chars
+    if devanagari_ratio > 0.5:
+        return DetectedLanguage.HINDI, min(0.95, 0.5 + devanagari_ratio * 0.5)
+    hinglish_word_count = sum(1 for word in words if word in HINGLISH_MARKERS)
+    hinglish_ratio = hinglish_word_count / total_words
+    if devanagari_ratio > 0.1 and devanagari_ratio <= 0.5:
+        return DetectedLanguage.HINGLISH, 0.7 + devanagari_ratio
+    if hinglish_ratio > 0.2:
+        return DetectedLanguage.HINGLISH, min(0.9, 0.5 + hinglish_ratio)
+    return DetectedLanguage.ENGLISH, 0.8
+
+
+def legacy_transliterate(text):
+    """The previous transliterate_to_english_keywords loop"""
+    result = text
+    for hindi, english in HINDI_TO_ENGLISH_KEYWORDS.items():
+        result = result.replace(hindi, f" {english} ")
+    return result
+
+
+def make_corpus(size, seed):
+    rng = random.Random(seed)
+    pools = [ENGLISH, HINGLISH, HINDI, MIXED]
+    corpus = []
+    for n in range(size):
+        pool = rng.choice(pools)
+        sentences = rng.sample(pool, rng.randint(1, len(pool)))
+        corpus.append(f"{' '.join(sentences)} {n}")
+    return corpus
+
+
+def rate(count, seconds):
+    return f"{count / seconds:10.0f}/s"
+
+
+def timed(label, fn, corpus):
+    start = time.perf_counter()
+    results = fn(corpus)
+    print(f"{label:<24} {rate(len(corpus), time.perf_counter() - start)}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--inputs", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.inputs, args.seed)
+
+    legacy = timed("detect (legacy)", lambda texts: [legacy_detect(t) for t in texts], corpus)
+    current = timed("detect", lambda texts: [detect_language(t) for t in texts], corpus)
+    batch = timed("detect_languages", detect_languages, corpus)
+    assert legacy == current == batch, "detection results differ"
+
+    legacy = timed("transliterate (legacy)", lambda texts: [legacy_transliterate(t) for t in texts], corpus)
+    current = timed("transliterate", lambda texts: [transliterate_to_english_keywords(t) for t in texts], corpus)
+    batch = timed("transliterate_many", transliterate_many, corpus)
+    assert legacy == current == batch, "transliteration results differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""
+Inference Pipeline Benchmark
+Per-stage latency budget and in-process load test for infer -> draft -> download
+
+Stages (timed directly, one call per round over a fixed set of inputs):
+- rule_engine: keyword scan, intent, legal triggers, department mapping
+- spacy: parse, entities, key phrases, sentiment
+- confidence_gate: should_use_nlp + gate_result
+- semantic: DistilBERT template similarities (only runs on low confidence)
+- run_inference: the whole orchestrator end to end, including the spaCy
+  micro-batch wait (SPACY_BATCH_MAX_WAIT_MS) a lone request pays
+- draft_assembly: DraftAssembler.assemble_draft
+- render_pdf / render_docx: DocumentGenerator.render, output cache bypassed
+
+Load: concurrent users each running /api/infer -> /api/draft ->
+/api/download against the ASGI app in-process (no server, no sockets),
+reporting per-endpoint p50/p95/p99 and scenario throughput.
+
+Models are stubbed so everything runs offline: spaCy is a blank English
+pipeline with a rule-based tagger and entity ruler, DistilBERT is a
+hash-seeded encoder. Stage numbers measure our code around the models,
+not model inference itself.
+
+--update-baseline stores stage medians in benchmarks/baselines/pipeline.json;
+--check exits with status 1 when a stage median exceeds its baseline by more
+than --tolerance (plus a small absolute slack for microsecond stages).
+Baselines are machine-specific - regenerate them on the machine that checks.
+
+Usage (from backend/):
+    python benchmarks/bench_pipeline.py [--rounds 200] [--users 16] [--scenarios 200]
+                                        [--skip-load] [--check | --update-baseline]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")  # before the app reads settings
+
+import httpx
+import numpy as np
+import spacy
+from spacy.language import Language
+from loguru import logger
+
+from app.config import get_settings
+from app.services.document_generator import get_document_generator
+from app.services.draft_assembler import get_draft_assembler
+from app.services.inference_orchestrator import DocumentType, run_inference
+from app.services.nlp import distilbert_semantic, spacy_engine
+from app.services.nlp.confidence_gate import gate_result, should_use_nlp
+from app.services.nlp.model_registry import ModelSpec, get_model_registry
+from app.services.rule_engine.intent_rules import classify_intent
+from app.services.rule_engine.issue_rules import map_issue_to_department
+from app.services.rule_engine.keyword_automaton import scan_text
+from app.services.rule_engine.legal_triggers import detect_legal_triggers
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "pipeline.json")
+ABSOLUTE_SLACK_MS = 0.05
+
+TEXTS = [
+    "I want to know how much money was spent on road repair in Ward 12 of Jaipur "
+    "Municipal Corporation during 2022-2024 under the RTI Act",
+    "The water supply in our colony has been irregular for three months and the "
+    "Jal Board has not responded to my complaint dated 12/05/2024",
+    "Please provide certified copies of the tender documents and file notings for "
+    "the new school building in Patna",
+    "Street lights near the bus stand are not working and the area is unsafe at night, "
+    "nobody from the electricity department has come",
+    "My pension has not been credited since January and the district office keeps "
+    "asking me to come back next week",
+    "I need details of ration cards issued in my village and the stock received by the fair price shop",
+]
+
+SEMANTIC_TEMPLATES = [
+    "I want to request information about government records",
+    "Please provide copies of documents under RTI Act",
+    "I want to file a complaint about poor service",
+    "I am facing problems with government department",
+]
+
+APPLICANT = {
+    "name": "Rahul Sharma",
+    "address": "123, Gandhi Nagar, Near Bus Stand, Jaipur",
+    "state": "Rajasthan",
+}
+
+
+# =============================================================================
+# OFFLINE MODEL STUBS
+# =============================================================================
+
+@Language.component("bench_stub_parser")
+def _stub_parser(doc):
+    """Tags content words as nouns so noun_chunks works without a trained parser"""
+    for token in doc:
+        noun = token.is_alpha and not token.is_stop
+        token.pos_ = "NOUN" if noun else "X"
+        token.dep_ = "dobj" if noun else "dep"
+        token.head = token
+    return doc
+
+
+def _load_stub_nlp():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("bench_stub_parser")
+    nlp.add_pipe("entity_ruler").add_patterns([
+        {"label": "ORG", "pattern": "Jaipur Municipal Corporation"},
+        {"label": "ORG", "pattern": "Jal Board"},
+        {"label": "GPE", "pattern": "Jaipur"},
+        {"label": "GPE", "pattern": "Patna"},
+        {"label": "DATE", "pattern": "three months"},
+    ])
+    return nlp
+
+
+def _stub_encoder(text):
+    seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).standard_normal(64).astype(np.float32)
+
+
+def install_stub_models():
+    spacy_engine._nlp = None
+    get_model_registry().register(ModelSpec(name="spacy", loader=_load_stub_nlp))
+    distilbert_semantic.set_encoder(_stub_encoder)
+
+
+# =============================================================================
+# STAGES
+# =============================================================================
+
+def stage_rule_engine(text):
+    scan = scan_text(text)
+    classify_intent(text, scan=scan)
+    detect_legal_triggers(text, scan=scan)
+    map_issue_to_department(text, scan=scan)
+
+
+def stage_spacy(text):
+    doc = spacy_engine.parse_text(text)
+    spacy_engine.extract_entities(text, doc=doc)
+    spacy_engine.extract_key_phrases(text, doc=doc)
+    spacy_engine.analyze_sentiment_basic(text)
+
+
+def stage_confidence_gate(text):
+    should_use_nlp(0.55)
+    gate_result(value="rti", confidence=0.55, alternatives=[], context=text[:100])
+
+
+def stage_semantic(text):
+    for template in SEMANTIC_TEMPLATES:
+        distilbert_semantic.compute_similarity(text, template)
+
+
+def stage_draft_assembly(text):
+    return get_draft_assembler().assemble_draft(
+        document_type=DocumentType.INFORMATION_REQUEST,
+        applicant_name=APPLICANT["name"],
+        applicant_address=APPLICANT["address"],
+        applicant_state=APPLICANT["state"],
+        issue_description=text,
+    )
+
+
+def _render_stage(fmt):
+    """Renders a pre-assembled draft per input, so only rendering is timed"""
+    drafts = {text: stage_draft_assembly(text)["draft_text"] for text in TEXTS}
+
+    def render(text):
+        get_document_generator().render(
+            format=fmt,
+            draft_text=drafts[text],
+            document_type="information_request",
+            applicant_name=APPLICANT["name"],
+            applicant_details=APPLICANT,
+            use_cache=False,
+        )
+    return render
+
+
+STAGES = {
+    "rule_engine": stage_rule_engine,
+    "spacy": stage_spacy,
+    "confidence_gate": stage_confidence_gate,
+    "semantic": stage_semantic,
+    "run_inference": run_inference,
+    "draft_assembly": stage_draft_assembly,
+}
+
+
+def measure(fn, rounds, warmup=5):
+    """pytest-benchmark style stats in milliseconds over `rounds` calls"""
+    for i in range(warmup):
+        fn(TEXTS[i % len(TEXTS)])
+    samples = []
+    for i in range(rounds):
+        text = TEXTS[i % len(TEXTS)]
+        start = time.perf_counter()
+        fn(text)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    mean = statistics.fmean(samples)
+    return {
+        "min_ms": round(samples[0], 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(mean, 4),
+        "p95_ms": round(percentile(samples, 95), 4),
+        "stddev_ms": round(statistics.pstdev(samples), 4),
+        "ops": round(1000 / mean, 1) if mean else 0.0,
+    }
+
+
+def percentile(sorted_samples, pct):
+    return sorted_samples[max(0, int(len(sorted_samples) * pct / 100) - 1)]
+
+
+def run_stages(rounds):
+    print(f"stages: {rounds} rounds each, milliseconds")
+    print(f"{'stage':<16} {'min':>9} {'median':>9} {'mean':>9} {'p95':>9} {'stddev':>9} {'ops/s':>10}")
+    stages = dict(STAGES, render_pdf=_render_stage("pdf"), render_docx=_render_stage("docx"))
+    results = {}
+    for name, fn in stages.items():
+        stats = results[name] = measure(fn, rounds)
+        print(
+            f"{name:<16} {stats['min_ms']:9.3f} {stats['median_ms']:9.3f} {stats['mean_ms']:9.3f} "
+            f"{stats['p95_ms']:9.3f} {stats['stddev_ms']:9.3f} {stats['ops']:10.1f}"
+        )
+    return results
+
+
+# =============================================================================
+# LOAD
+# =============================================================================
+
+async def _scenario(client, text, latencies, errors):
+    """One user: infer, draft from the inferred type, download the PDF"""
+    async def call(endpoint, payload):
+        start = time.perf_counter()
+        response = await client.post(f"/api/{endpoint}", json=payload)
+        latencies[endpoint].append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            errors[endpoint][response.status_code] = errors[endpoint].get(response.status_code, 0) + 1
+            return None
+        return response
+
+    inferred = await call("infer", {"text": text, "language": "english"})
+    if inferred is None:
+        return
+    document_type = inferred.json()["document_type"]
+    if document_type not in {t.value for t in DocumentType}:
+        document_type = DocumentType.INFORMATION_REQUEST.value
+
+    draft = await call("draft", {
+        "document_type": document_type,
+        "applicant": APPLICANT,
+        "issue": {"description": text},
+        "language": "english",
+        "enable_llm_enhancement": False,
+    })
+    if draft is None:
+        return
+
+    await call("download", {
+        "draft_text": draft.json()["draft_text"],
+        "document_type": document_type,
+        "format": "pdf",
+        "applicant": APPLICANT,
+    })
+
+
+async def run_load(users, scenarios):
+    from app.main import app
+
+    latencies = {"infer": [], "draft": [], "download": []}
+    errors = {endpoint: {} for endpoint in latencies}
+    semaphore = asyncio.Semaphore(users)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def user(i):
+            async with semaphore:
+                await _scenario(client, f"{TEXTS[i % len(TEXTS)]} (request {i})", latencies, errors)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user(i) for i in range(scenarios)))
+        elapsed = time.perf_counter() - start
+
+    print(f"\nload: {scenarios} scenarios, {users} concurrent users, {elapsed:.2f} s "
+          f"({scenarios / elapsed:.1f} scenarios/s)")
+    print(f"{'endpoint':<10} {'calls':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  errors")
+    for endpoint, samples in latencies.items():
+        samples.sort()
+        if not samples:
+            print(f"{endpoint:<10} {0:>6}")
+            continue
+        print(
+            f"{endpoint:<10} {len(samples):>6} {statistics.median(samples):9.2f} "
+            f"{percentile(samples, 95):9.2f} {percentile(samples, 99):9.2f}  {errors[endpoint] or '-'}"
+        )
+    return sum(sum(codes.values()) for codes in errors.values())
+
+
+# =============================================================================
+# BASELINE
+# =============================================================================
+
+def find_regressions(results, baseline, tolerance):
+    """Stages whose median exceeds baseline * (1 + tolerance) + slack"""
+    regressions = []
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        budget = reference["median_ms"] * (1 + tolerance) + ABSOLUTE_SLACK_MS
+        if stats["median_ms"] > budget:
+            regressions.append((name, stats["median_ms"], budget))
+    return regressions
+
+
+def write_baseline(path, results, rounds):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "rounds": rounds,
+            "stages": {name: {"median_ms": stats["median_ms"]} for name, stats in results.items()},
+        }, f, indent=2)
+        f.write("\n")
+    print(f"\nbaseline written to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--users", type=int, default=16)
+    parser.add_argument("--scenarios", type=int, default=200)
+    parser.add_argument("--skip-load", action="store_true")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative slowdown (0.5 = +50%%)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="exit 1 if a stage regressed past the baseline")
+    mode.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    logger.remove()  # every stage logs
+    logging.disable(logging.WARNING)
+    get_settings.cache_clear()
+    install_stub_models()
+
+    results = run_stages(args.rounds)
+
+    failed = False
+    if not args.skip_load:
+        failed = asyncio.run(run_load(args.users, args.scenarios)) > 0
+
+    if args.update_baseline:
+        write_baseline(args.baseline, results, args.rounds)
+    elif args.check:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["stages"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for name, median, budget in regressions:
+            print(f"REGRESSION {name}: median {median:.3f} ms > budget {budget:.3f} ms")
+        if not regressions:
+            print(f"\nall stages within {args.tolerance:.0%} of {args.baseline}")
+        failed = failed or bool(regressions)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Rule Engine Benchmark
+Per-request latency of the shared keyword automaton vs. per-keyword rescans
+
+Runs intent rules, legal triggers, issue mapping and document type detection
+on the same texts twice:
+- automaton: one scan_text() pass shared by all four modules (current path)
+- legacy: every keyword lookup rescans the lowercased text with `in` /
+  re.finditer, exactly like the loops the automaton replaced
+
+Both paths must produce identical results; the script aborts otherwise.
+
+Usage (from backend/):
+    python benchmarks/bench_rule_engine.py [--iterations 500]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.rule_engine.intent_rules import classify_intent_detailed
+from app.services.rule_engine.issue_rules import map_issue_detailed
+from app.services.rule_engine.legal_triggers import analyze_legal_context
+from app.services.rule_engine.keyword_automaton import scan_text
+from app.services.inference_orchestrator import _determine_document_type, IntentType
+
+
+class LegacyKeywordScan:
+    """KeywordScan look-alike that rescans the text for every lookup"""
+
+    def __init__(self, text: str):
+        self.text_lower = text.lower()
+
+    def contains(self, keyword):
+        return keyword in self.text_lower
+
+    def contains_any(self, keywords):
+        return any(kw in self.text_lower for kw in keywords)
+
+    def count(self, keywords):
+        return sum(1 for kw in keywords if kw in self.text_lower)
+
+    def present(self, keywords):
+        return [kw for kw in keywords if kw in self.text_lower]
+
+    def match_positions(self, keyword, word_boundary=False):
+        if word_boundary:
+            pattern = rf"\b{re.escape(keyword)}\b"
+        else:
+            pattern = re.escape(keyword)
+        return [m.start() for m in re.finditer(pattern, self.text_lower)]
+
+
+SAMPLE_TEXTS = [
+    "I request information under Section 6 of the Right to Information Act, 2005. "
+    "Please provide certified copies of all documents related to road construction "
+    "project in Delhi during 2023-2024. I am willing to pay the requisite fee.",
+
+    "I want to file a grievance regarding the poor condition of roads in my area. "
+    "There are multiple potholes and the street lights are not working. Despite several "
+    "complaints to the municipal corporation, no action has been taken.",
+
+    "I am filing a first appeal under Section 19 of RTI Act 2005. My original RTI "
+    "application number was RTI/2024/0001234, submitted 45 days ago. The PIO has not "
+    "responded within the stipulated time of 30 days.",
+
+    "URGENT: There has been a complete power failure in our area for the past 3 days. "
+    "The transformer exploded and there is a risk of fire. Lives are at risk. This is an "
+    "emergency situation requiring immediate action from the electricity board.",
+
+    "Officials in the Land Registry Office are demanding bribes of Rs. 50,000 to process "
+    "my property registration. This is corruption and I request immediate investigation.",
+]
+
+
+def run_rules(text, scan):
+    """Run the four keyword-driven rule stages with the given scan"""
+    intent = classify_intent_detailed(text, scan=scan)
+    issues = map_issue_detailed(text, scan=scan)
+    legal = analyze_legal_context(text, scan=scan)
+    try:
+        doc_intent = IntentType(intent.intent.value)
+    except ValueError:
+        doc_intent = IntentType.UNKNOWN
+    document_type = _determine_document_type(text, doc_intent, scan)
+    return (
+        intent.to_dict(),
+        [m.to_dict() for m in issues],
+        legal.to_dict(),
+        (document_type[0].value, document_type[1]),
+    )
+
+
+def time_path(texts, make_scan, iterations):
+    """Return per-request latencies in microseconds"""
+    samples = []
+    for _ in range(iterations):
+        for text in texts:
+            start = time.perf_counter()
+            run_rules(text, make_scan(text))
+            samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def summarize(name, samples):
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{name:<10} mean={statistics.fmean(samples):8.1f}us  p50={p50:8.1f}us  p99={p99:8.1f}us")
+    return p50
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--repeat-text", type=int, default=1,
+                        help="Concatenate each sample N times to simulate longer inputs")
+    args = parser.parse_args()
+
+    texts = [" ".join([t] * args.repeat_text) for t in SAMPLE_TEXTS]
+
+    for text in texts:
+        if run_rules(text, scan_text(text)) != run_rules(text, LegacyKeywordScan(text)):
+            raise SystemExit("Automaton and legacy results differ - aborting")
+
+    print(f"{len(texts)} texts, avg {statistics.fmean(len(t) for t in texts):.0f} chars, "
+          f"{args.iterations} iterations")
+    legacy = summarize("legacy", time_path(texts, LegacyKeywordScan, args.iterations))
+    automaton = summarize("automaton", time_path(texts, scan_text, args.iterations))
+    print(f"speedup (p50): {legacy / automaton:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Semantic Ranking Benchmark
+Top-k ranking over a large candidate set: per-candidate cosine loop vs.
+cached pre-normalized matrix + argpartition
+
+Uses a deterministic fake encoder (hash-seeded vectors), so no model is
+downloaded; only the ranking arithmetic and cache lookups are measured.
+- loop: the original path - fetch each embedding, cosine in Python, full sort
+- matrix: rank_by_similarity() - one matrix-vector product, argpartition top-k
+  (the candidate matrix is built once and reused across queries)
+
+Both paths must return the same top-k; the script aborts otherwise.
+
+Usage (from backend/):
+    python benchmarks/bench_semantic_ranking.py [--candidates 10000] [--queries 50]
+"""
+
+import argparse
+import hashlib
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.nlp import distilbert_semantic
+from app.services.nlp.distilbert_semantic import get_embedding, rank_by_similarity
+
+
+def make_fake_encoder(dim):
+    def encode(text):
+        seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return encode
+
+
+def legacy_rank(query, candidates, top_k):
+    """The loop rank_by_similarity used before vectorization"""
+    query_emb, _ = get_embedding(query)
+    results = []
+    for candidate in candidates:
+        cand_emb, _ = get_embedding(candidate)
+        dot_product = np.dot(query_emb, cand_emb)
+        norm1 = np.linalg.norm(query_emb)
+        norm2 = np.linalg.norm(cand_emb)
+        if norm1 == 0 or norm2 == 0:
+            score = 0.0
+        else:
+            score = float(dot_product / (norm1 * norm2))
+            score = max(0.0, min(1.0, score))
+        results.append((candidate, score))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:top_k]
+
+
+def time_queries(rank, queries, candidates, top_k):
+    """Return per-query latencies in milliseconds"""
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        rank(query, candidates, top_k)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(name, samples):
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[max(0, int(len(samples) * 0.99) - 1)]
+    print(f"{name:<8} mean={statistics.fmean(samples):9.3f}ms  p50={p50:9.3f}ms  p99={p99:9.3f}ms")
+    return p50
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    distilbert_semantic.set_encoder(make_fake_encoder(args.dim))
+    # Large enough that both paths read every embedding from memory
+    distilbert_semantic.configure_embedding_cache(max_size=args.candidates + args.queries + 1)
+
+    candidates = [f"public authority candidate {i}" for i in range(args.candidates)]
+    queries = [f"citizen query {i}" for i in range(args.queries)]
+
+    build_start = time.perf_counter()
+    rank_by_similarity(queries[0], candidates, top_k=args.top_k)
+    print(f"{args.candidates} candidates x {args.dim} dims, {args.queries} queries, top_k={args.top_k}")
+    print(f"first call (encode + build matrix): {(time.perf_counter() - build_start) * 1000:.1f}ms")
+
+    for query in queries[:5]:
+        fast = [c for c, _ in rank_by_similarity(query, candidates, top_k=args.top_k)]
+        slow = [c for c, _ in legacy_rank(query, candidates, args.top_k)]
+        if fast != slow:
+            raise SystemExit("Vectorized and loop rankings differ - aborting")
+
+    loop = summarize("loop", time_queries(legacy_rank, queries, candidates, args.top_k))
+    matrix = summarize("matrix", time_queries(
+        lambda q, c, k: rank_by_similarity(q, c, top_k=k), queries, candidates, args.top_k))
+    print(f"speedup (p50): {loop / matrix:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
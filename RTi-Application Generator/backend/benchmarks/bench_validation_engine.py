@@ -0,0 +1,107 @@
+"""
+Validation Engine Benchmark
+RTIValidator throughput over a synthetic corpus of RTI requests
+
+Modes:
+- validate: one full validate() call per request
+- validate_many: the whole corpus in one call (rule groups memoized across requests)
+- revalidate: keystroke simulation - information_sought grows one word at a
+  time and only rules reading that field are re-run
+- edit: validate_edit with a fixed original draft and a changing edit
+
+Usage (from backend/):
+    python benchmarks/bench_validation_engine.py [--requests 2000] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.validation_engine import RTIValidator
+
+INFO_PARTS = [
+    "1. Provide certified copies of the sanction orders for road repair in Ward {n}.",
+    "2. How much amount was spent on drainage works during the period?",
+    "Please furnish details of all related contracts etc.",
+    "all information regarding the tender process",
+    "Copies of cabinet notes about the project.",
+    "details of personal information of third parties involved",
+    "whatever records exist about the hospital expansion",
+    "a) list of contractors b) amounts paid to each contractor",
+    "मांगी गई जानकारी प्रदान करें",
+    "the status of my pension application submitted last year " * 3,
+]
+TIME_PERIODS = ["2022-2024", "last 2 years", "FY 2023", "March 2024", "recently", "", "पिछले 3 वर्ष", "01/04/2023"]
+DEPARTMENTS = ["Municipal Corporation", "Public Works Department", "other", "government", "", "Health Department"]
+RECORD_TYPES = ["documents", "data", "inspection", ""]
+
+
+def make_corpus(size, seed=7):
+    rng = random.Random(seed)
+    corpus = []
+    for n in range(size):
+        info = " ".join(rng.sample(INFO_PARTS, rng.randint(0, 4))).format(n=n)
+        corpus.append(dict(
+            information_sought=info * rng.choice([1, 1, 1, 8]),
+            time_period=rng.choice(TIME_PERIODS),
+            department=rng.choice(DEPARTMENTS),
+            record_type=rng.choice(RECORD_TYPES),
+            applicant_name=rng.choice(["Ravi Kumar", ""]),
+            applicant_address=rng.choice(["12 MG Road, Jaipur", ""]),
+            applicant_state="Rajasthan",
+        ))
+    return corpus
+
+
+def rate(count, seconds):
+    return f"{count / seconds:10.0f}/s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    validator = RTIValidator()
+    corpus = make_corpus(args.requests, args.seed)
+
+    start = time.perf_counter()
+    singles = [validator.validate(**request) for request in corpus]
+    print(f"validate       {rate(len(corpus), time.perf_counter() - start)}")
+
+    start = time.perf_counter()
+    bulk = validator.validate_many(corpus)
+    print(f"validate_many  {rate(len(corpus), time.perf_counter() - start)}")
+    assert [r.issues for r in bulk] == [r.issues for r in singles]
+
+    words = " ".join(INFO_PARTS[:4]).format(n=1).split()
+    base = dict(corpus[0])
+    for mode in ("full", "incremental"):
+        start = time.perf_counter()
+        result = validator.validate(**base)
+        for i in range(1, len(words) + 1):
+            text = " ".join(words[:i])
+            if mode == "full":
+                result = validator.validate(**{**base, "information_sought": text})
+            else:
+                result = validator.revalidate(result, information_sought=text)
+        label = "keystrokes" if mode == "full" else "revalidate"
+        print(f"{label:<14} {rate(len(words), time.perf_counter() - start)}  ({mode})")
+
+    original = (
+        "To,\nThe Public Information Officer\n\nSubject: Application under Section 6 of the RTI Act, 2005\n\n"
+        "I am a citizen of India. " + " ".join(words)
+    )
+    start = time.perf_counter()
+    for i in range(len(original)):
+        validator.validate_edit(original, original[:i], "information_request")
+    print(f"validate_edit  {rate(len(original), time.perf_counter() - start)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Unit tests for the authority resolution index and the batch endpoint
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.authority import MAX_BATCH_SIZE
+from app.services.authority_resolver import (
+    AuthorityIndex,
+    AuthorityLevel,
+    DEPARTMENT_AUTHORITIES,
+    STATE_INFO,
+    _format_address,
+    get_all_states,
+    get_authority_index,
+    resolve_authorities,
+    resolve_authority,
+)
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+class TestAuthorityIndex:
+    """Tests for the precomputed index"""
+
+    def test_covers_every_combination(self):
+        """Known categories and states plus the unknown (None) entries"""
+        index = AuthorityIndex()
+        assert len(index) == (len(DEPARTMENT_AUTHORITIES) + 1) * (len(STATE_INFO) + 1) * 2 * 2
+
+    def test_lookup_normalizes_unknowns(self):
+        index = get_authority_index()
+        plan = index.lookup("spaceport", "atlantis", AuthorityLevel.LOCAL, True)
+        assert plan.requires_state_selection
+        assert plan.department == DEPARTMENT_AUTHORITIES["general"]["pio"].department
+        # Unknown categories still get the collector fallback, unlike "general"
+        assert len(plan.matches) == len(index.lookup("general", "atlantis", AuthorityLevel.LOCAL, True).matches) + 1
+
+    def test_entries_are_shared(self):
+        """States only differ in the state hint, so plans are reused"""
+        index = get_authority_index()
+        assert index.lookup("water", "bihar", AuthorityLevel.LOCAL, False) is \
+            index.lookup("water", "kerala", AuthorityLevel.LOCAL, False)
+
+
+class TestResolveAuthority:
+    """Tests for resolution through the index"""
+
+    def test_rti_goes_to_pio(self):
+        result = resolve_authority("Electricity ", "Rajasthan", "jaipur", is_rti=True)
+        assert result.primary.authority.name == "Public Information Officer"
+        assert result.primary.authority.address_template == "Rajasthan State Electricity Board, Jaipur"
+        assert result.category == "electricity"
+        assert not result.requires_state_selection
+
+    def test_complaint_routing_levels(self):
+        """New complaints go local, escalations (from entity hints) go to district"""
+        new = resolve_authority("roads", "Bihar", "patna", "boring road", is_rti=False)
+        escalated = resolve_authority(
+            "roads", "Bihar", "patna", is_rti=False, extracted_entities={"dates": ["3 months"]}
+        )
+        assert new.primary.authority.designation == "Junior Engineer (Roads)"
+        assert new.primary.authority.address_template == "PWD Sub-Division, Boring Road, Patna"
+        assert escalated.primary.authority.designation == "Executive Engineer (Roads)"
+
+    def test_results_do_not_share_records(self):
+        """Each call gets its own Authority objects"""
+        first = resolve_authority("water", "Goa", "north goa")
+        second = resolve_authority("water", "Goa", "north goa")
+        assert first.primary.authority is not second.primary.authority
+        first.suggestions.append("edited")
+        assert "edited" not in second.suggestions
+
+    def test_addresses_are_memoized(self):
+        _format_address.cache_clear()
+        for _ in range(3):
+            resolve_authority("health", "Kerala", "kochi")
+        info = _format_address.cache_info()
+        assert info.hits >= 2 * info.misses
+
+    def test_batch_matches_single(self):
+        requests = [
+            dict(category="police", state="Delhi", district="south delhi", is_rti=False),
+            dict(category="pension", state="Atlantis"),
+            dict(category="ration", state="uttar-pradesh", area="sector 5", is_rti=False),
+        ]
+        batch = resolve_authorities(requests)
+        assert [repr(r) for r in batch] == [repr(resolve_authority(**r)) for r in requests]
+
+    def test_states_list(self):
+        states = get_all_states()
+        assert len(states) == len(STATE_INFO)
+        assert {"name": "Tamil Nadu", "code": "TN"} in states
+
+
+class TestBatchEndpoint:
+    """Tests for POST /api/authority/resolve/batch"""
+
+    def test_results_in_request_order(self, client):
+        response = client.post("/api/authority/resolve/batch", json={"requests": [
+            {"issue_category": "water", "state": "Goa", "is_rti": True},
+            {"issue_category": "police", "state": "Delhi", "district": "south delhi", "is_rti": False},
+        ]})
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["category"] for r in results] == ["water", "police"]
+        assert results[1]["primary"]["authority"]["address"] == "Police Station, [Area/Locality], South Delhi"
+
+    def test_same_response_as_single_endpoint(self, client):
+        item = {"issue_category": "education", "state": "Kerala", "district": "kochi", "is_rti": False}
+        single = client.post("/api/authority", json=item).json()
+        batch = client.post("/api/authority/resolve/batch", json={"requests": [item]}).json()["results"][0]
+        single.pop("timestamp")
+        batch.pop("timestamp")
+        assert batch == single
+
+    def test_invalid_category_names_its_index(self, client):
+        response = client.post("/api/authority/resolve/batch", json={"requests": [
+            {"issue_category": "water", "state": "Goa"},
+            {"issue_category": "spaceport", "state": "Goa"},
+        ]})
+        assert response.status_code == 400
+        assert "requests[1]" in response.json()["detail"]
+
+    def test_batch_size_limit(self, client):
+        item = {"issue_category": "water", "state": "Goa"}
+        response = client.post("/api/authority/resolve/batch", json={"requests": [item] * (MAX_BATCH_SIZE + 1)})
+        assert response.status_code == 422
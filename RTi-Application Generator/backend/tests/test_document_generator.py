@@ -0,0 +1,299 @@
+"""
+Unit tests for the document generator
+Tests the warm template layer, output cache and /download cache headers
+"""
+
+import io
+import time
+import zipfile
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from docx import Document
+
+from app.services import document_generator
+from app.services.document_generator import DocumentCache, DocumentGenerator
+
+DRAFT = (
+    "To,\nThe Public Information Officer\nMunicipal Corporation\n\n"
+    "Subject: Application under Section 6(1) of the RTI Act, 2005\n\n"
+    "Please provide copies of road repair records & <estimates> for Ward 12 "
+    "for the period 2022-2024.\n\nYours faithfully,\nRahul Sharma"
+)
+
+
+def _render(generator, fmt="pdf", draft=DRAFT, **kwargs):
+    return generator.render(
+        format=fmt,
+        draft_text=draft,
+        document_type="information_request",
+        applicant_name="Rahul Sharma",
+        metadata={"document_type": "information_request"},
+        **kwargs
+    )
+
+
+class FrozenClock:
+    """Stands in for generation_time(); advanced by the tests"""
+
+    def __init__(self):
+        self.now = datetime(2024, 5, 1, 10, 15)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FrozenClock()
+    monkeypatch.setattr(document_generator, "generation_time", clock)
+    return clock
+
+
+@pytest.fixture
+def generator(clock):
+    return DocumentGenerator()
+
+
+class TestRendering:
+    """Documents render in every format"""
+
+    @pytest.mark.parametrize("fmt,magic", [("pdf", b"%PDF"), ("docx", b"PK"), ("xlsx", b"PK")])
+    def test_render_produces_valid_container(self, generator, fmt, magic):
+        """Each format starts with its file signature"""
+        document = _render(generator, fmt)
+        assert document.content.startswith(magic)
+        assert document.filename.endswith(f".{fmt}")
+        assert document.cache_hit is False
+
+    def test_generate_keeps_tuple_interface(self, generator):
+        """generate() still returns (buffer, filename, content_type)"""
+        buffer, filename, content_type = generator.generate(
+            "docx", DRAFT, "grievance", "Rahul Sharma"
+        )
+        assert buffer.read(2) == b"PK"
+        assert filename.startswith("grievance_Rahul_Sharma_")
+        assert content_type.endswith("wordprocessingml.document")
+
+    def test_docx_template_sets_default_font(self, generator):
+        """Renders from the pre-styled template keep Times New Roman"""
+        from io import BytesIO
+        from docx import Document
+
+        doc = Document(BytesIO(_render(generator, "docx").content))
+        assert doc.styles["Normal"].font.name == "Times New Roman"
+
+    def test_unsupported_format(self, generator):
+        """Unknown formats raise ValueError"""
+        with pytest.raises(ValueError):
+            _render(generator, "odt")
+
+
+class TestOutputCache:
+    """Rendered bytes are reused for unchanged drafts"""
+
+    def test_unchanged_draft_is_cache_hit(self, generator):
+        """Second render returns identical bytes without rendering"""
+        first = _render(generator)
+        second = _render(generator)
+
+        assert second.cache_hit is True
+        assert second.content == first.content
+        assert generator.cache_stats()["hits"] == 1
+
+    def test_changed_draft_is_cache_miss(self, generator):
+        """Any change to the draft text renders again"""
+        _render(generator)
+        assert _render(generator, draft=DRAFT + " ").cache_hit is False
+
+    def test_formats_are_cached_separately(self, generator):
+        """The same draft in another format is a different entry"""
+        _render(generator, "pdf")
+        assert _render(generator, "docx").cache_hit is False
+
+    def test_xlsx_key_includes_applicant_details(self):
+        """Details only rendered in XLSX only affect XLSX keys"""
+        key = DocumentGenerator.content_key
+        assert key("pdf", DRAFT, "rti", "A", {"phone": "1"}) == key("pdf", DRAFT, "rti", "B", {"phone": "2"})
+        assert key("xlsx", DRAFT, "rti", "A", {"phone": "1"}) != key("xlsx", DRAFT, "rti", "A", {"phone": "2"})
+
+    def test_next_minute_renders_a_fresh_timestamp(self, generator, clock):
+        """Cached output never carries a stale "Generated on" time"""
+        first = _render(generator, "docx")
+        clock.now += timedelta(minutes=1)
+        second = _render(generator, "docx")
+
+        assert second.cache_hit is False
+        footer = Document(io.BytesIO(second.content)).paragraphs[-1].text
+        assert footer == "Generated on: 2024-05-01T10:16"
+        assert _render(generator, "docx").cache_hit is True
+
+    def test_xlsx_key_includes_generation_time(self, generator, clock):
+        """The tracking sheet's date/time cells are part of its key too"""
+        _render(generator, "xlsx")
+        clock.now += timedelta(minutes=1)
+        assert _render(generator, "xlsx").cache_hit is False
+
+    def test_use_cache_false_bypasses_cache(self, generator):
+        """use_cache=False always renders"""
+        _render(generator)
+        assert _render(generator, use_cache=False).cache_hit is False
+
+
+class TestSpooling:
+    """Large documents spill to a temp file and stream in chunks"""
+
+    def test_small_threshold_spools_to_disk(self, generator):
+        """Output above the threshold rolls over and is not cached"""
+        document = _render(generator, "pdf", spool_threshold=256)
+
+        assert document.spooled_to_disk
+        assert document.content.startswith(b"%PDF")
+        assert generator.cache_stats()["entries"] == 0
+
+    def test_in_memory_below_threshold(self, generator):
+        """Small output stays in memory and is cached"""
+        document = _render(generator, "pdf", spool_threshold=10 * 1024 * 1024)
+        assert not document.spooled_to_disk
+        assert generator.cache_stats()["entries"] == 1
+
+    def test_iter_chunks_streams_everything_then_closes(self, generator):
+        """Chunks reassemble to the full document and the file is closed"""
+        document = _render(generator, "docx", spool_threshold=1024)
+        expected = document.content
+
+        chunks = list(document.iter_chunks(chunk_size=1000))
+        assert all(len(c) <= 1000 for c in chunks)
+        assert b"".join(chunks) == expected
+        assert len(expected) == document.size
+        assert document.file.closed
+
+    def test_bundle_contains_each_document(self, generator):
+        """bundle() packs documents into a ZIP and closes them"""
+        documents = [_render(generator, fmt, use_cache=False) for fmt in ("pdf", "docx", "xlsx")]
+        expected = {d.filename: d.content for d in documents}
+
+        bundle = generator.bundle(documents, "bundle.zip", spool_threshold=1024)
+        with zipfile.ZipFile(io.BytesIO(bundle.content)) as archive:
+            assert {name: archive.read(name) for name in archive.namelist()} == expected
+        assert all(d.file.closed for d in documents)
+
+
+class TestDocumentCache:
+    """Tests for the cache bounds"""
+
+    def test_ttl_expiry(self):
+        """Expired entries are misses"""
+        cache = DocumentCache(ttl_seconds=0.01)
+        cache.put("k", b"data")
+        time.sleep(0.02)
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_byte_budget_evicts_oldest(self):
+        """Total size stays within max_bytes"""
+        cache = DocumentCache(max_entries=10, max_bytes=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.get("a")
+        cache.put("c", b"12345")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"12345"
+        assert cache.stats()["bytes"] == 10
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversized_documents_not_cached(self):
+        """A single document larger than the budget is skipped"""
+        cache = DocumentCache(max_bytes=4)
+        cache.put("k", b"12345")
+        assert cache.get("k") is None
+
+
+class TestDownloadEndpoint:
+    """Cache status is reported by /download"""
+
+    def test_repeat_download_is_served_from_cache(self, clock):
+        """Second identical download carries X-Document-Cache: HIT"""
+        from app.main import app
+
+        payload = {
+            "draft_text": DRAFT + " Unique draft for the endpoint cache test.",
+            "document_type": "information_request",
+            "format": "pdf",
+            "applicant": {"name": "Rahul Sharma", "address": "123, Gandhi Nagar, Jaipur", "state": "Rajasthan"},
+        }
+        with TestClient(app) as client:
+            first = client.post("/api/download", json=payload)
+            second = client.post("/api/download", json=payload)
+
+        assert first.status_code == 200
+        assert first.headers["X-Document-Cache"] == "MISS"
+        assert second.headers["X-Document-Cache"] == "HIT"
+        assert second.content == first.content
+        assert first.headers["Content-Length"] == str(len(first.content))
+
+    def test_bundle_endpoint_returns_zip_of_all_formats(self):
+        """/download/bundle streams one ZIP with PDF, DOCX and XLSX"""
+        from app.main import app
+        from app.services.executor import get_executor
+
+        payload = {
+            "draft_text": DRAFT + " Bundle endpoint test.",
+            "document_type": "grievance",
+            "applicant": {"name": "Rahul Sharma", "address": "123, Gandhi Nagar, Jaipur", "state": "Rajasthan"},
+        }
+        with TestClient(app) as client:
+            response = client.post("/api/download/bundle", json=payload)
+            completed = get_executor("documents").stats()["completed"]
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        assert response.headers["X-Bundle-Formats"] == "pdf,docx,xlsx"
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            extensions = sorted(name.rsplit(".", 1)[1] for name in archive.namelist())
+        assert extensions == ["docx", "pdf", "xlsx"]
+        assert completed >= 4  # three renders + the ZIP, all off the event loop
+
+    def test_bundle_closes_documents_when_executor_is_saturated(self, monkeypatch):
+        """Rendered documents are released when the ZIP step is rejected"""
+        from app.api import download
+        from app.main import app
+        from app.services.executor import ExecutorSaturatedError
+
+        rendered = []
+        submit = download.run_in_executor
+
+        async def saturated_bundle(func, *args, **kwargs):
+            if getattr(func, "__name__", "") == "bundle":
+                rendered.extend(args[0])
+                raise ExecutorSaturatedError("documents", 1)
+            return await submit(func, *args, **kwargs)
+
+        monkeypatch.setattr(download, "run_in_executor", saturated_bundle)
+        payload = {
+            "draft_text": DRAFT + " Saturated bundle test.",
+            "document_type": "grievance",
+            "applicant": {"name": "Rahul Sharma", "address": "123, Gandhi Nagar, Jaipur", "state": "Rajasthan"},
+        }
+        with TestClient(app) as client:
+            response = client.post("/api/download/bundle", json=payload)
+
+        assert response.status_code == 429
+        assert len(rendered) == 3
+        assert all(document.file.closed for document in rendered)
+
+    def test_bundle_rejects_unknown_format(self):
+        """Invalid formats are a 400"""
+        from app.main import app
+
+        payload = {
+            "draft_text": DRAFT,
+            "document_type": "grievance",
+            "formats": ["pdf", "odt"],
+            "applicant": {"name": "Rahul Sharma", "address": "123, Gandhi Nagar, Jaipur", "state": "Rajasthan"},
+        }
+        with TestClient(app) as client:
+            assert client.post("/api/download/bundle", json=payload).status_code == 400
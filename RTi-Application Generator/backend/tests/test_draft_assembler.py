@@ -0,0 +1,118 @@
+"""
+Unit tests for DraftAssembler's compiled templates and hot reload
+"""
+
+import os
+import shutil
+
+import pytest
+
+from app.services.draft_assembler import TEMPLATE_DIR, CompiledTemplate, DraftAssembler
+from app.services.inference_orchestrator import DocumentType
+
+
+REQUEST = dict(
+    applicant_name="Ravi Kumar",
+    applicant_address="12 MG Road, Jaipur",
+    applicant_state="Rajasthan",
+    issue_description="Street lights in Ward 5 have not worked for months.",
+)
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    """Writable copy of the bundled templates"""
+    target = tmp_path / "templates"
+    shutil.copytree(TEMPLATE_DIR, target)
+    return target
+
+
+class TestCompiledTemplate:
+    """Tests for segment compilation and rendering"""
+
+    def test_splits_literals_and_slots(self):
+        """Literals surround every slot, including adjacent ones"""
+        compiled = CompiledTemplate.compile("To {NAME},\n{A}{B} end")
+        assert compiled.slots == ["NAME", "A", "B"]
+        assert compiled.literals == ["To ", ",\n", "", " end"]
+
+    def test_missing_values_left_for_user(self):
+        """Slots without a value render as their placeholder"""
+        compiled = CompiledTemplate.compile("Dear {NAME}, re {SUBJECT}")
+        assert compiled.render({"NAME": "Ravi"}) == "Dear Ravi, re {SUBJECT}"
+
+    def test_empty_slot_can_drop_its_line_break(self):
+        """An empty contact slot does not leave a blank line"""
+        compiled = CompiledTemplate.compile("{NAME}\n{CONTACT}\nDate")
+        values = {"NAME": "Ravi", "CONTACT": ""}
+        assert compiled.render(values, drop_line_if_empty=("CONTACT",)) == "Ravi\nDate"
+        assert compiled.render(values) == "Ravi\n\nDate"
+
+    def test_values_are_not_rescanned(self):
+        """User text that looks like a placeholder is inserted verbatim"""
+        compiled = CompiledTemplate.compile("{DESC} on {DATE}")
+        assert compiled.render({"DESC": "see {DATE}", "DATE": "1 May"}) == "see {DATE} on 1 May"
+
+
+class TestAssembleDraft:
+    """Tests for assemble_draft on compiled templates"""
+
+    @pytest.mark.parametrize("document_type", list(DocumentType))
+    @pytest.mark.parametrize("language", ["english", "hindi"])
+    def test_every_template_fills(self, document_type, language):
+        """No known placeholder is left unfilled in any template"""
+        assembler = DraftAssembler(auto_reload=False)
+        draft = assembler.assemble_draft(document_type, language=language, **REQUEST)
+
+        assert "Ravi Kumar" in draft["draft_text"]
+        assert "{APPLICANT_NAME}" not in draft["draft_text"]
+        assert "{APPLICANT_CONTACT}" not in draft["draft_text"]
+        assert draft["placeholders_filled"]["APPLICANT_NAME"] == "Ravi Kumar"
+
+    def test_contact_line_removed_when_empty(self, template_dir):
+        """Drafts without phone/email have no empty contact line"""
+        (template_dir / "rti" / "information_request.txt").write_text(
+            "{APPLICANT_NAME}\n{APPLICANT_CONTACT}\n{APPLICANT_ADDRESS}", encoding="utf-8"
+        )
+        assembler = DraftAssembler(template_dir=template_dir, auto_reload=False)
+
+        bare = assembler.assemble_draft(DocumentType.INFORMATION_REQUEST, **REQUEST)
+        with_phone = assembler.assemble_draft(DocumentType.INFORMATION_REQUEST, applicant_phone="999", **REQUEST)
+
+        assert bare["draft_text"] == "Ravi Kumar\n12 MG Road, Jaipur, Rajasthan"
+        assert with_phone["draft_text"] == "Ravi Kumar\nPhone: 999\n12 MG Road, Jaipur, Rajasthan"
+
+
+class TestHotReload:
+    """Tests for mtime-based template reload"""
+
+    def _rewrite(self, path, text):
+        path.write_text(text, encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    def test_changed_template_is_recompiled(self, template_dir):
+        """Editing a template file takes effect without a restart"""
+        assembler = DraftAssembler(template_dir=template_dir, reload_check_seconds=0)
+        path = template_dir / "complaint" / "grievance.txt"
+        self._rewrite(path, "Grievance from {APPLICANT_NAME}")
+
+        draft = assembler.assemble_draft(DocumentType.GRIEVANCE, **REQUEST)
+        assert draft["draft_text"] == "Grievance from Ravi Kumar"
+        assert assembler.get_template_preview(DocumentType.GRIEVANCE) == "Grievance from {APPLICANT_NAME}"
+
+    def test_reload_disabled(self, template_dir):
+        """With auto_reload off the loaded version keeps being served"""
+        assembler = DraftAssembler(template_dir=template_dir, auto_reload=False)
+        original = assembler.get_template_preview(DocumentType.GRIEVANCE)
+        self._rewrite(template_dir / "complaint" / "grievance.txt", "changed")
+
+        assert assembler.get_template_preview(DocumentType.GRIEVANCE) == original
+
+    def test_deleted_template_keeps_last_version(self, template_dir):
+        """A template removed from disk is not dropped mid-flight"""
+        assembler = DraftAssembler(template_dir=template_dir, reload_check_seconds=0)
+        original = assembler.get_template_preview(DocumentType.ESCALATION)
+        (template_dir / "complaint" / "escalation.txt").unlink()
+
+        assert assembler.get_template_preview(DocumentType.ESCALATION) == original
@@ -0,0 +1,168 @@
+"""
+Unit tests for the embedding cache and memory-mapped store
+Uses a deterministic stub encoder so no model download is needed
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from app.services.nlp import distilbert_semantic
+from app.services.nlp.embedding_store import DiskEmbeddingStore, EmbeddingCache, EmbeddingLRU
+
+
+class StubEncoder:
+    """Hash-seeded random vectors; counts how often it is called"""
+
+    def __init__(self, dim: int = 8):
+        self.dim = dim
+        self.calls = 0
+
+    def __call__(self, text: str) -> np.ndarray:
+        self.calls += 1
+        seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+
+
+@pytest.fixture
+def stub_encoder():
+    encoder = StubEncoder()
+    distilbert_semantic.set_encoder(encoder)
+    distilbert_semantic.configure_embedding_cache(max_size=4)
+    yield encoder
+    distilbert_semantic.set_encoder(None)
+    distilbert_semantic._embedding_cache = None
+
+
+class TestEmbeddingLRU:
+    """Tests for the in-process LRU"""
+
+    def test_evicts_least_recently_used(self):
+        """Touching an entry protects it from eviction"""
+        lru = EmbeddingLRU(max_size=2)
+        lru.put("a", np.zeros(2))
+        lru.put("b", np.zeros(2))
+        lru.get("a")
+        lru.put("c", np.zeros(2))
+
+        assert "a" in lru and "c" in lru
+        assert "b" not in lru
+        assert lru.evictions == 1
+
+    def test_counts_hits_and_misses(self):
+        """Counters and hit rate are reported in stats"""
+        lru = EmbeddingLRU(max_size=2)
+        lru.put("a", np.zeros(2))
+        lru.get("a")
+        lru.get("missing")
+
+        stats = lru.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+class TestGetEmbedding:
+    """Tests for get_embedding with a stub encoder"""
+
+    def test_second_lookup_is_cache_hit(self, stub_encoder):
+        """Encoder runs once per distinct text"""
+        first, hit1 = distilbert_semantic.get_embedding("water supply complaint")
+        second, hit2 = distilbert_semantic.get_embedding("water supply complaint")
+
+        assert (hit1, hit2) == (False, True)
+        assert np.array_equal(first, second)
+        assert stub_encoder.calls == 1
+
+    def test_stats_surface_lru_counters(self, stub_encoder):
+        """get_cache_stats reports hits, misses and evictions"""
+        for text in ["a", "b", "c", "d", "e", "a"]:
+            distilbert_semantic.get_embedding(text)
+
+        stats = distilbert_semantic.get_cache_stats()
+        assert stats["cache_size"] == 4
+        assert stats["max_size"] == 4
+        assert stats["misses"] == 6
+        assert stats["evictions"] == 2
+        assert stats["disk"] is None
+        assert stats["model_loaded"] is False
+
+    def test_use_cache_false_bypasses_cache(self, stub_encoder):
+        """use_cache=False always encodes"""
+        distilbert_semantic.get_embedding("road", use_cache=False)
+        distilbert_semantic.get_embedding("road", use_cache=False)
+        assert stub_encoder.calls == 2
+
+    def test_similarity_uses_stub(self, stub_encoder):
+        """Identical texts are maximally similar"""
+        assert distilbert_semantic.compute_similarity("pothole", "pothole") == pytest.approx(1.0)
+
+
+class TestDiskEmbeddingStore:
+    """Tests for the memory-mapped store"""
+
+    def test_embeddings_survive_restart(self, tmp_path, stub_encoder):
+        """A fresh cache on the same directory serves embeddings without encoding"""
+        distilbert_semantic.configure_embedding_cache(max_size=4, store_path=str(tmp_path))
+        original, _ = distilbert_semantic.get_embedding("bribe demand by official")
+        assert distilbert_semantic.persist_embeddings() == 1
+
+        # Simulate a restart: empty LRU, same directory
+        distilbert_semantic.configure_embedding_cache(max_size=4, store_path=str(tmp_path))
+        restored, hit = distilbert_semantic.get_embedding("bribe demand by official")
+
+        assert hit is True
+        assert stub_encoder.calls == 1
+        assert np.array_equal(original, restored)
+        assert distilbert_semantic.get_cache_stats()["disk"]["entries"] == 1
+
+    def test_rows_are_memory_mapped_read_only(self, tmp_path):
+        """Stored rows come back as read-only memmap views"""
+        store = DiskEmbeddingStore(str(tmp_path))
+        store.add("k", np.arange(4, dtype=np.float32))
+        store.flush()
+
+        row = DiskEmbeddingStore(str(tmp_path), read_only=True).get("k")
+        assert isinstance(row.base, np.memmap) or isinstance(row, np.memmap)
+        assert not row.flags.writeable
+        assert row.tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    def test_reader_sees_other_writers(self, tmp_path):
+        """A worker picks up rows flushed by another worker"""
+        reader = DiskEmbeddingStore(str(tmp_path), read_only=True)
+        writer_a = DiskEmbeddingStore(str(tmp_path))
+        writer_b = DiskEmbeddingStore(str(tmp_path))
+
+        writer_a.add("a", np.ones(3))
+        writer_a.flush()
+        writer_b.add("b", np.full(3, 2.0))
+        writer_b.flush()
+
+        assert reader.get("a").tolist() == [1.0, 1.0, 1.0]
+        assert reader.get("b").tolist() == [2.0, 2.0, 2.0]
+        assert len(DiskEmbeddingStore(str(tmp_path))) == 2
+
+    def test_read_only_store_never_writes(self, tmp_path):
+        """Read-only caches keep new embeddings in memory only"""
+        cache = EmbeddingCache(max_size=4, store=DiskEmbeddingStore(str(tmp_path), read_only=True))
+        cache.put("k", np.ones(3, dtype=np.float32))
+
+        assert cache.flush() == 0
+        assert not (tmp_path / "index.json").exists()
+
+    def test_flush_every_writes_automatically(self, tmp_path):
+        """Pending rows are flushed once the threshold is reached"""
+        cache = EmbeddingCache(max_size=8, store=DiskEmbeddingStore(str(tmp_path)), flush_every=2)
+        cache.put("a", np.ones(3, dtype=np.float32))
+        assert cache.store.pending_count == 1
+        cache.put("b", np.ones(3, dtype=np.float32))
+        assert cache.store.pending_count == 0
+        assert len(DiskEmbeddingStore(str(tmp_path), read_only=True)) == 2
+
+    def test_dimension_mismatch_rejected(self, tmp_path):
+        """All rows in a store share one dimension"""
+        store = DiskEmbeddingStore(str(tmp_path))
+        store.add("a", np.ones(3))
+        with pytest.raises(ValueError):
+            store.add("b", np.ones(4))
@@ -0,0 +1,96 @@
+"""
+Unit tests for the bounded executor layer
+Tests backpressure, metrics and pool kinds without loading any model
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.executor import BoundedExecutor, ExecutorSaturatedError
+
+
+def _square(x):
+    """Module-level so the process pool can pickle it"""
+    return x * x
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+class TestBoundedExecutor:
+    """Tests for BoundedExecutor"""
+
+    async def test_runs_off_event_loop(self):
+        """Work executes on a worker thread, not the loop thread"""
+        executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+        loop_thread = threading.get_ident()
+        try:
+            worker_thread = await executor.run(threading.get_ident)
+            assert worker_thread != loop_thread
+        finally:
+            executor.shutdown()
+
+    async def test_rejects_when_saturated(self):
+        """Tasks beyond max_workers + max_queue raise immediately"""
+        executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+        gate = threading.Event()
+        try:
+            running = [asyncio.ensure_future(executor.run(gate.wait, 5)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(ExecutorSaturatedError):
+                await executor.run(_square, 2)
+
+            gate.set()
+            await asyncio.gather(*running)
+            assert executor.stats()["rejected"] == 1
+            assert executor.stats()["in_flight"] == 0
+            # Capacity is released again
+            assert await executor.run(_square, 3) == 9
+        finally:
+            gate.set()
+            executor.shutdown()
+
+    async def test_metrics_split_queue_wait_and_compute(self):
+        """Queued task reports queue wait, running task reports compute time"""
+        executor = BoundedExecutor("test", max_workers=1, max_queue=4)
+        try:
+            await asyncio.gather(
+                executor.run(time.sleep, 0.05),
+                executor.run(time.sleep, 0.05),
+            )
+            stats = executor.stats()
+            assert stats["completed"] == 2
+            assert stats["compute_ms"]["max"] >= 45
+            assert stats["queue_wait_ms"]["max"] >= 40
+        finally:
+            executor.shutdown()
+
+    async def test_failures_are_counted_and_raised(self):
+        """Exceptions propagate to the caller"""
+        executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+        try:
+            with pytest.raises(ValueError):
+                await executor.run(_fail)
+            stats = executor.stats()
+            assert stats["failed"] == 1
+            assert stats["in_flight"] == 0
+        finally:
+            executor.shutdown()
+
+    async def test_process_pool(self):
+        """Process pool kind runs picklable functions"""
+        executor = BoundedExecutor("test", kind="process", max_workers=1, max_queue=0)
+        try:
+            assert await executor.run(_square, 7) == 49
+        finally:
+            executor.shutdown()
+
+    def test_unknown_kind_rejected(self):
+        """Only thread and process pools are supported"""
+        with pytest.raises(ValueError):
+            BoundedExecutor("test", kind="gpu")
@@ -0,0 +1,116 @@
+"""
+Unit tests for Hindi language detection and keyword transliteration
+Outputs are checked against the previous implementations, kept below as references
+"""
+
+import random
+import re
+
+import pytest
+
+from app.utils.hindi_support import (
+    DetectedLanguage,
+    HINDI_TO_ENGLISH_KEYWORDS,
+    HINGLISH_MARKERS,
+    detect_language,
+    detect_languages,
+    transliterate_many,
+    transliterate_to_english_keywords,
+)
+
+
+def reference_detect_language(text):
+    """detect_language before the single-scan rewrite"""
+    if not text or not text.strip():
+        return DetectedLanguage.UNKNOWN, 0.0
+    words = text.lower().split()
+    total_words = len(words)
+    if total_words == 0:
+        return DetectedLanguage.UNKNOWN, 0.0
+    devanagari_chars = len(re.findall(r'[\u0900-\u097F]', text))
+    total_chars = len(text.replace(" ", ""))
+    if total_chars == 0:
+        return DetectedLanguage.UNKNOWN, 0.0
+    devanagari_ratio = devanagari_chars / total_chars
+    if devanagari_ratio > 0.5:
+        return DetectedLanguage.HINDI, min(0.95, 0.5 + devanagari_ratio * 0.5)
+    hinglish_ratio = sum(1 for word in words if word in HINGLISH_MARKERS) / total_words
+    if devanagari_ratio > 0.1 and devanagari_ratio <= 0.5:
+        return DetectedLanguage.HINGLISH, 0.7 + devanagari_ratio
+    if hinglish_ratio > 0.2:
+        return DetectedLanguage.HINGLISH, min(0.9, 0.5 + hinglish_ratio)
+    return DetectedLanguage.ENGLISH, 0.8
+
+
+def reference_transliterate(text):
+    """transliterate_to_english_keywords before the rewrite: one replace per phrase"""
+    result = text
+    for hindi, english in HINDI_TO_ENGLISH_KEYWORDS.items():
+        result = result.replace(hindi, f" {english} ")
+    return result
+
+
+FRAGMENTS = [
+    "the road near my house is broken", "please fix it", "Water supply", "bill 2024",
+    "kya", "hai", "nahi", "mera", "bijli", "paani", "kripya", "madad", "Hai?", "KYA",
+    "सूचना का अधिकार", "सूचना", "जानकारी", "प्रति", "पुलिस", "बिजली", "समस्या", "कृपया",
+    "मेरे", "घर", "के", "पास", "गड्ढा", "है", "।", "१२", "café", "naïve", "\t", "\n", "  ",
+]
+
+
+def mixed_corpus(size=2000, seed=3):
+    rng = random.Random(seed)
+    corpus = ["", " ", "\n\t", "।", "पुलिसूचना", "सड़कपुलिस", "सूचना का अधिकार सूचना"]
+    for _ in range(size):
+        parts = rng.choices(FRAGMENTS, k=rng.randint(1, 12))
+        corpus.append(rng.choice([" ", "", "  "]).join(parts))
+    return corpus
+
+
+class TestDetectLanguage:
+    """Tests for language detection"""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("The road near my house is broken", DetectedLanguage.ENGLISH),
+        ("mera bijli ka bill kya hai", DetectedLanguage.HINGLISH),
+        ("मेरे घर के पास गड्ढा है", DetectedLanguage.HINDI),
+        ("Please fix the सड़क", DetectedLanguage.HINGLISH),
+        ("   ", DetectedLanguage.UNKNOWN),
+    ])
+    def test_examples(self, text, expected):
+        assert detect_language(text)[0] == expected
+
+    def test_matches_reference_on_mixed_corpus(self):
+        """Language and confidence are identical to the previous implementation"""
+        for text in mixed_corpus():
+            assert detect_language(text) == reference_detect_language(text), repr(text)
+
+    def test_batch_matches_single(self):
+        """detect_languages keeps order and handles duplicates"""
+        corpus = mixed_corpus(300) * 2
+        assert detect_languages(corpus) == [detect_language(text) for text in corpus]
+
+
+class TestTransliteration:
+    """Tests for Hindi phrase -> English keyword conversion"""
+
+    def test_multi_word_phrase_wins_over_its_prefix(self):
+        result = transliterate_to_english_keywords("सूचना का अधिकार के तहत सूचना")
+        assert result == " right to information  के तहत  information "
+
+    def test_overlapping_phrases_follow_table_order(self):
+        """"पुलिस" ends with the "स" that starts "सूचना"; the earlier entry wins"""
+        assert transliterate_to_english_keywords("पुलिसूचना") == reference_transliterate("पुलिसूचना")
+        assert "information" in transliterate_to_english_keywords("पुलिसूचना")
+
+    def test_text_without_phrases_is_returned_as_is(self):
+        text = "road is broken near the school"
+        assert transliterate_to_english_keywords(text) is text
+
+    def test_matches_reference_on_mixed_corpus(self):
+        for text in mixed_corpus():
+            assert transliterate_to_english_keywords(text) == reference_transliterate(text), repr(text)
+
+    def test_batch_matches_single(self):
+        corpus = mixed_corpus(300) * 2
+        assert transliterate_many(corpus) == [reference_transliterate(text) for text in corpus]
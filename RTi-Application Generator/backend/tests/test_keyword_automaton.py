@@ -0,0 +1,110 @@
+"""
+Unit tests for the shared keyword automaton
+Checks the single-pass matcher against the regex/substring loops it replaced
+"""
+
+import pytest
+import re
+
+from app.services.rule_engine.keyword_automaton import KeywordAutomaton, KeywordScan, scan_text
+from app.services.rule_engine.intent_rules import RTI_KEYWORDS, classify_intent_detailed
+from app.services.rule_engine.issue_rules import map_issue_detailed
+from app.services.rule_engine.legal_triggers import analyze_legal_context
+
+
+def _finditer_positions(text_lower, keyword, word_boundary):
+    """Reference implementation: the original per-keyword regex"""
+    pattern = rf"\b{re.escape(keyword)}\b" if word_boundary else re.escape(keyword)
+    return [m.start() for m in re.finditer(pattern, text_lower)]
+
+
+class TestKeywordAutomaton:
+    """Tests for the Aho-Corasick automaton itself"""
+
+    def test_finds_overlapping_and_nested_keywords(self):
+        """Every occurrence is reported, including nested keywords"""
+        automaton = KeywordAutomaton(["rti", "rti act", "act", "he", "she", "hers"])
+        hits = automaton.find_all("ushers under the rti act")
+
+        assert hits["she"] == [1]
+        assert hits["he"] == [2, 14]
+        assert hits["hers"] == [2]
+        assert hits["rti"] == [17]
+        assert hits["rti act"] == [17]
+        assert hits["act"] == [21]
+
+    def test_missing_keywords_are_omitted(self):
+        """Keywords not present in the text are not in the result"""
+        automaton = KeywordAutomaton(["water", "road"])
+        assert automaton.find_all("no water today") == {"water": [3]}
+
+    def test_duplicate_and_empty_patterns_ignored(self):
+        """Duplicates and empty strings do not create extra patterns"""
+        automaton = KeywordAutomaton(["pio", "pio", ""])
+        assert len(automaton) == 1
+
+    def test_self_overlapping_keyword(self):
+        """Overlapping occurrences of the same keyword are all found"""
+        automaton = KeywordAutomaton(["aa"])
+        assert automaton.find_all("aaaa") == {"aa": [0, 1, 2]}
+
+
+class TestKeywordScan:
+    """Tests for KeywordScan lookups against the original semantics"""
+
+    @pytest.mark.parametrize("text", [
+        "RTI rtis xrti rti-act rti_act (rti)",
+        "Follow-up on my follow-up request, follow-upped",
+        "the pio and the PIO's office; pioneer",
+        "aaaa",
+    ])
+    def test_match_positions_equal_finditer(self, text):
+        """match_positions mirrors re.finditer with and without \\b"""
+        keywords = ["rti", "follow-up", "pio", "aa", "rti act"]
+        automaton = KeywordAutomaton(keywords)
+        scan = KeywordScan(text.lower(), automaton.find_all(text.lower()))
+
+        for keyword in keywords:
+            for word_boundary in (True, False):
+                assert scan.match_positions(keyword, word_boundary) == \
+                    _finditer_positions(text.lower(), keyword, word_boundary)
+
+    def test_contains_equals_substring(self, sample_complaint_text):
+        """contains/present/count match plain substring tests"""
+        scan = scan_text(sample_complaint_text)
+        text_lower = sample_complaint_text.lower()
+
+        for keyword in RTI_KEYWORDS:
+            assert scan.contains(keyword) == (keyword in text_lower)
+        keywords = ["grievance", "potholes", "not working", "missing phrase"]
+        assert scan.present(keywords) == [kw for kw in keywords if kw in text_lower]
+        assert scan.count(keywords) == 3
+        assert scan.contains_any(["missing phrase", "grievance"])
+
+
+class TestSharedScan:
+    """Rule modules give the same results with a shared scan"""
+
+    def test_rule_modules_accept_shared_scan(self, sample_rti_text, sample_complaint_text,
+                                             sample_appeal_text, sample_urgent_complaint):
+        """Passing one scan to each module equals letting each scan on its own"""
+        for text in (sample_rti_text, sample_complaint_text,
+                     sample_appeal_text, sample_urgent_complaint):
+            scan = scan_text(text)
+
+            assert classify_intent_detailed(text, scan=scan).to_dict() == \
+                classify_intent_detailed(text).to_dict()
+            assert [m.to_dict() for m in map_issue_detailed(text, scan=scan)] == \
+                [m.to_dict() for m in map_issue_detailed(text)]
+            assert analyze_legal_context(text, scan=scan).to_dict() == \
+                analyze_legal_context(text).to_dict()
+
+    def test_intent_classification_unchanged(self, sample_rti_text, sample_complaint_text):
+        """Known fixtures keep their classification"""
+        assert classify_intent_detailed(sample_rti_text).intent.value == "rti"
+        assert classify_intent_detailed(sample_complaint_text).intent.value == "complaint"
+
+    def test_life_liberty_timeline(self):
+        """Timeline detection still works on substrings inside tokens"""
+        result = analyze_legal_context("My father's life is at risk, please respond")
+        assert result.timeline_applicable.startswith("48 hours")
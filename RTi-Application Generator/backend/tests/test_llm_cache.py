@@ -0,0 +1,227 @@
+"""
+Unit tests for the LLM response cache, single-flight coalescing and audit log
+Uses a local fake OpenAI client - no network or API key needed
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.llm.openai_service import LLMMode, OpenAIService
+from app.services.llm.response_cache import LLMResponseCache, SingleFlight, make_cache_key
+
+
+class FakeCompletions:
+    """Mimics client.chat.completions; counts calls and can block or fail"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def create(self, model, messages, max_tokens, temperature):
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("API unavailable")
+        text = messages[-1]["content"].split("TEXT:\n", 1)[-1]
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=f"Polished: {text}"))],
+            usage=SimpleNamespace(total_tokens=42),
+        )
+
+
+class FakeClient:
+    """Stand-in for openai.OpenAI exposing chat.completions.create"""
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=FakeCompletions(**kwargs))
+
+    @property
+    def calls(self) -> int:
+        return self.chat.completions.calls
+
+
+class TestLLMResponseCache:
+    """Tests for the TTL/LRU cache"""
+
+    def test_evicts_least_recently_used(self):
+        """Touching an entry protects it from eviction"""
+        cache = LLMResponseCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_expire(self):
+        """Expired entries are dropped on lookup"""
+        cache = LLMResponseCache(ttl_seconds=0)
+        cache.put("a", 1)
+        time.sleep(0.001)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_key_covers_mode_and_message(self):
+        """Different tone/mode never share a key"""
+        base = make_cache_key("gpt", "polish", "Tone: formal\n\nTEXT:\nx")
+        assert base == make_cache_key("gpt", "polish", "Tone: formal\n\nTEXT:\nx")
+        assert base != make_cache_key("gpt", "clarify", "Tone: formal\n\nTEXT:\nx")
+        assert base != make_cache_key("gpt", "polish", "Tone: urgent\n\nTEXT:\nx")
+
+
+class TestSingleFlight:
+    """Tests for request coalescing"""
+
+    async def test_concurrent_callers_share_one_call(self):
+        """Only the first caller runs the factory"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(*(flight.run("k", factory) for _ in range(5)))
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["done"] * 5
+        assert sum(shared for _, shared in results) == 4
+        assert flight.in_flight == 0
+
+    async def test_exception_propagates_to_followers(self):
+        """Followers see the leader's exception"""
+        flight = SingleFlight()
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.run("k", factory) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+    async def test_leader_cancellation_does_not_reach_followers(self):
+        """A disconnecting first caller leaves the shared call running for the rest"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.run("k", factory))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.run("k", factory)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+        assert leader.cancelled()
+        assert results == [("done", True)] * 2
+        assert calls == 1
+        assert flight.in_flight == 0
+
+    async def test_call_is_cancelled_when_every_caller_leaves(self):
+        """Nobody left waiting: the call stops and the next caller starts afresh"""
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fast():
+            return "fresh"
+
+        caller = asyncio.ensure_future(flight.run("k", slow))
+        await started.wait()
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        assert flight.in_flight == 0
+        assert await flight.run("k", fast) == ("fresh", False)
+
+
+class TestOpenAIServiceCaching:
+    """Tests for enhance_text with the fake client"""
+
+    async def test_repeat_request_served_from_cache(self):
+        """Second identical request costs no API call or tokens"""
+        client = FakeClient()
+        service = OpenAIService(client=client)
+
+        first = await service.enhance_text("road is broken", LLMMode.POLISH)
+        second = await service.enhance_text("road is broken", LLMMode.POLISH)
+
+        assert client.calls == 1
+        assert second.enhanced_text == first.enhanced_text
+        assert (first.cached, second.cached) == (False, True)
+        assert (first.tokens_used, second.tokens_used) == (42, 0)
+
+    async def test_tone_is_part_of_the_key(self):
+        """Same text with a different tone is a separate call"""
+        client = FakeClient()
+        service = OpenAIService(client=client)
+
+        await service.enhance_text("road is broken", LLMMode.TONE_ADJUST, {"tone": "formal"})
+        await service.enhance_text("road is broken", LLMMode.TONE_ADJUST, {"tone": "urgent"})
+        assert client.calls == 2
+
+    async def test_concurrent_identical_requests_coalesce(self):
+        """Duplicates arriving while the call is in flight share it"""
+        client = FakeClient(delay=0.05)
+        service = OpenAIService(client=client)
+
+        results = await asyncio.gather(
+            *(service.enhance_text("water supply issue", LLMMode.POLISH) for _ in range(4))
+        )
+
+        assert client.calls == 1
+        assert len({r.enhanced_text for r in results}) == 1
+        assert sum(r.cached for r in results) == 3
+        assert service.get_cache_stats()["coalesced"] == 3
+
+    async def test_fallback_is_not_cached(self):
+        """Failed calls are retried rather than cached"""
+        client = FakeClient(fail=True)
+        service = OpenAIService(client=client)
+
+        first = await service.enhance_text("pension delay", LLMMode.POLISH)
+        second = await service.enhance_text("pension delay", LLMMode.POLISH)
+
+        assert first.fallback_used and second.fallback_used
+        assert client.calls == 2
+        assert service.get_cache_stats()["entries"] == 0
+
+    async def test_audit_log_is_bounded(self):
+        """Audit log keeps only the most recent entries"""
+        client = FakeClient()
+        service = OpenAIService(client=client)
+        service._audit_log = type(service._audit_log)(maxlen=3)
+
+        for i in range(5):
+            await service.enhance_text(f"text {i}", LLMMode.POLISH)
+        await service.enhance_text("text 4", LLMMode.POLISH)
+
+        log = service.get_audit_log()
+        assert len(log) == 3
+        assert [entry["source"] for entry in log] == ["llm", "llm", "cache"]
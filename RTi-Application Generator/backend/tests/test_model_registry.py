@@ -0,0 +1,262 @@
+"""
+Unit tests for the NLP model registry
+Stub loaders stand in for spaCy/DistilBERT/MarianMT - nothing is downloaded
+"""
+
+import importlib.util
+import os
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.nlp.model_registry import ModelRegistry, ModelSpec
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubModel:
+    """Records warm-up calls and releases"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.warmed = 0
+        self.released = False
+
+
+def stub_spec(name: str, delay: float = 0.0, heavy: bool = False, fail: bool = False, **kwargs) -> ModelSpec:
+    def load():
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} weights missing")
+        return StubModel(name)
+
+    def warm(model):
+        model.warmed += 1
+
+    def release(model):
+        model.released = True
+
+    return ModelSpec(name=name, loader=load, warmup=warm, unloader=release, heavy=heavy, **kwargs)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock):
+    return ModelRegistry(idle_timeout_seconds=60, clock=clock)
+
+
+class TestLoading:
+    """Tests for lazy loading and accounting"""
+
+    def test_loads_once_and_records_stats(self, registry):
+        """First get loads; later gets reuse the same object"""
+        registry.register(stub_spec("spacy", memory_estimator=lambda m: 5 * 1024 * 1024))
+
+        first = registry.get("spacy")
+        assert registry.get("spacy") is first
+
+        stats = registry.stats()["models"]["spacy"]
+        assert stats["status"] == "loaded"
+        assert stats["loads"] == 1
+        assert stats["load_ms"] is not None
+        assert (stats["memory_mb"], stats["memory_source"]) == (5.0, "estimate")
+
+    def test_concurrent_first_use_loads_once(self, registry):
+        """Threads racing on a cold model share one load"""
+        calls = []
+        registry.register(ModelSpec(name="slow", loader=lambda: calls.append(1) or time.sleep(0.05) or object()))
+
+        threads = [threading.Thread(target=registry.get, args=("slow",)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+
+    def test_failed_load_is_reported_and_retried(self, registry):
+        """A failure surfaces to the caller and on /health, and the next get tries again"""
+        attempts = []
+
+        def flaky_load():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("weights missing")
+            return StubModel("translator")
+
+        registry.register(ModelSpec(name="translator", loader=flaky_load))
+
+        with pytest.raises(RuntimeError):
+            registry.get("translator")
+        stats = registry.stats()["models"]["translator"]
+        assert stats["status"] == "failed"
+        assert "weights missing" in stats["error"]
+
+        assert registry.get("translator").name == "translator"
+        assert registry.stats()["models"]["translator"]["error"] is None
+
+    def test_unknown_model(self, registry):
+        with pytest.raises(KeyError):
+            registry.get("gpt")
+
+
+class TestWarmUp:
+    """Tests for parallel startup warm-up"""
+
+    def test_models_warm_in_parallel(self, registry):
+        """Three 0.2 s loads finish in well under 0.6 s"""
+        for name in ("spacy", "distilbert", "translator"):
+            registry.register(stub_spec(name, delay=0.2))
+
+        started = time.perf_counter()
+        results = registry.warm_up()
+        elapsed = time.perf_counter() - started
+
+        assert results == {"spacy": "ready", "distilbert": "ready", "translator": "ready"}
+        assert elapsed < 0.5
+        assert all(registry.get(name).warmed == 1 for name in results)
+        assert registry.stats()["models"]["spacy"]["warmup_ms"] is not None
+
+    def test_disabled_models_are_skipped(self, registry):
+        """Models whose feature flag is off are not loaded at startup"""
+        registry.register(stub_spec("spacy"))
+        registry.register(stub_spec("distilbert", enabled=lambda: False))
+
+        assert registry.warm_up() == {"spacy": "ready"}
+        assert not registry.is_loaded("distilbert")
+
+    def test_failures_do_not_raise(self, registry):
+        """One broken model does not stop the others"""
+        registry.register(stub_spec("spacy"))
+        registry.register(stub_spec("distilbert", fail=True))
+
+        assert registry.warm_up() == {"spacy": "ready", "distilbert": "failed"}
+
+    def test_timeout(self, registry):
+        """Models still loading when the timeout passes are reported"""
+        registry.register(stub_spec("translator", delay=0.3))
+        assert registry.warm_up(timeout=0.05) == {"translator": "timeout"}
+
+
+class TestIdleUnload:
+    """Tests for releasing idle heavy models"""
+
+    def test_idle_heavy_model_is_unloaded_and_reloaded(self, registry, clock):
+        """Only heavy models past the timeout are released; next use reloads"""
+        registry.register(stub_spec("spacy"))
+        registry.register(stub_spec("distilbert", heavy=True))
+        spacy_model = registry.get("spacy")
+        bert = registry.get("distilbert")
+
+        clock.now += 61
+        assert registry.unload_idle() == ["distilbert"]
+        assert bert.released
+        assert registry.is_loaded("spacy") and not spacy_model.released
+
+        reloaded = registry.get("distilbert")
+        assert reloaded is not bert
+        stats = registry.stats()["models"]["distilbert"]
+        assert (stats["loads"], stats["unloads"]) == (2, 1)
+
+    def test_recent_use_keeps_model(self, registry, clock):
+        """touch() resets the idle timer"""
+        registry.register(stub_spec("translator", heavy=True))
+        registry.get("translator")
+
+        clock.now += 50
+        registry.touch("translator")
+        clock.now += 50
+        assert registry.unload_idle() == []
+
+    def test_zero_timeout_disables_unloading(self, clock):
+        registry = ModelRegistry(idle_timeout_seconds=0, clock=clock)
+        registry.register(stub_spec("translator", heavy=True))
+        registry.get("translator")
+
+        clock.now += 10_000
+        assert registry.unload_idle() == []
+
+    def test_reaper_thread(self):
+        """Background reaper unloads without any caller involvement"""
+        registry = ModelRegistry(idle_timeout_seconds=0.01)
+        registry.register(stub_spec("distilbert", heavy=True))
+        registry.get("distilbert")
+
+        registry.start_idle_reaper(interval_seconds=0.01)
+        try:
+            deadline = time.monotonic() + 2
+            while registry.is_loaded("distilbert") and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            registry.stop_idle_reaper()
+        assert not registry.is_loaded("distilbert")
+
+
+def load_model_manager_module():
+    """ml/model_manager.py lives outside the backend package"""
+    path = os.path.join(os.path.dirname(__file__), "..", "..", "ml", "model_manager.py")
+    spec = importlib.util.spec_from_file_location("ml_model_manager", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestModelManagerStatus:
+    """ModelManager reports what the registry holds, not its own bookkeeping"""
+
+    def test_status_follows_idle_unload(self, registry, clock, monkeypatch):
+        model_manager = load_model_manager_module()
+        monkeypatch.setattr(model_manager, "_import_model_registry", lambda: registry)
+        registry.register(stub_spec("spacy"))
+        registry.register(stub_spec("distilbert", heavy=True))
+        manager = model_manager.ModelManager()
+        distilbert = model_manager.ModelType.DISTILBERT
+
+        assert not manager.is_model_ready(distilbert)
+        registry.get("distilbert")
+        assert manager.is_model_ready(distilbert)
+        assert manager.health_check()["models"]["distilbert"]["status"] == "loaded"
+
+        clock.now += 61
+        assert registry.unload_idle() == ["distilbert"]
+        assert not manager.is_model_ready(distilbert)
+        assert manager.get_model_status(distilbert)["status"] == "not_loaded"
+        assert manager.health_check()["models"]["distilbert"]["status"] == "not_loaded"
+        assert manager.is_model_ready(model_manager.ModelType.RULE_ENGINE)
+
+    def test_failed_load_degrades_health(self, registry, monkeypatch):
+        model_manager = load_model_manager_module()
+        monkeypatch.setattr(model_manager, "_import_model_registry", lambda: registry)
+        registry.register(stub_spec("spacy", fail=True))
+        with pytest.raises(RuntimeError):
+            registry.get("spacy")
+
+        health = model_manager.ModelManager().health_check()
+        assert health["status"] == "degraded"
+        assert health["models"]["spacy"]["error"] == "spacy weights missing"
+
+
+class TestHealthEndpoint:
+    """Tests for model stats on /health"""
+
+    def test_health_lists_registered_models(self):
+        response = TestClient(app).get("/health")
+        assert response.status_code == 200
+        models = response.json()["models"]
+        assert {"spacy", "distilbert", "translator"} <= set(models["models"])
+        assert "process_rss_mb" in models
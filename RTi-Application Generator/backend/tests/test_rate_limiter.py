@@ -0,0 +1,208 @@
+"""
+Unit tests for the rate limiter and RateLimitMiddleware
+Algorithms are driven with explicit timestamps; no sleeping
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware import RateLimitMiddleware
+from app.services.rate_limiter import (
+    InMemoryRateLimitStorage,
+    RateLimiter,
+    SlidingWindowCounter,
+    SQLiteRateLimitStorage,
+    TokenBucket,
+    build_rate_limiter,
+)
+
+
+class TestSlidingWindowCounter:
+    """Tests for the sliding-window counter"""
+
+    def test_allows_up_to_limit_then_rejects(self):
+        """Exactly `limit` requests fit in one window"""
+        limiter = RateLimiter(3, 60, "sliding_window")
+        decisions = [limiter.hit("client", now=120.0 + i) for i in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+        assert decisions[3].retry_after > 0
+
+    def test_previous_window_decays(self):
+        """Half-way through the next window half the previous count still applies"""
+        algorithm = SlidingWindowCounter(10, 60)
+        state = (0.0, 10.0, 0.0)
+
+        _, decision = algorithm.apply(state, now=90.0)
+        assert decision.allowed
+        assert decision.remaining == 4
+
+    def test_old_state_is_forgotten(self):
+        """State older than two windows no longer counts"""
+        _, decision = SlidingWindowCounter(2, 60).apply((0.0, 2.0, 2.0), now=300.0)
+        assert decision.allowed
+        assert decision.remaining == 1
+
+    def test_retry_after_is_accurate(self):
+        """A rejected client is allowed again once retry_after has passed"""
+        limiter = RateLimiter(5, 10, "sliding_window")
+        for _ in range(5):
+            limiter.hit("c", now=3.0)
+        rejected = limiter.hit("c", now=4.0)
+        assert not rejected.allowed
+
+        assert not limiter.hit("c", now=4.0 + rejected.retry_after - 0.01).allowed
+        assert limiter.hit("c", now=4.0 + rejected.retry_after + 0.01).allowed
+
+
+class TestTokenBucket:
+    """Tests for the token bucket"""
+
+    def test_burst_then_refill(self):
+        """A full bucket allows a burst, then refills at limit/window"""
+        limiter = RateLimiter(2, 10, "token_bucket")
+        assert limiter.hit("c", now=0.0).allowed
+        assert limiter.hit("c", now=0.0).allowed
+
+        rejected = limiter.hit("c", now=0.0)
+        assert not rejected.allowed
+        assert rejected.retry_after == pytest.approx(5.0)
+        assert limiter.hit("c", now=5.0).allowed
+
+    def test_bucket_never_exceeds_capacity(self):
+        """Long idle periods do not bank extra tokens"""
+        _, decision = TokenBucket(3, 60).apply((3.0, 0.0, 0.0), now=10_000.0)
+        assert decision.remaining == 2
+
+
+class TestStorage:
+    """Tests for the storage backends"""
+
+    def test_clients_are_independent(self):
+        """Limits apply per key"""
+        limiter = RateLimiter(1, 60)
+        assert limiter.hit("a", now=1.0).allowed
+        assert limiter.hit("b", now=1.0).allowed
+        assert not limiter.hit("a", now=2.0).allowed
+
+    def test_idle_keys_are_evicted(self):
+        """Keys idle for two windows are dropped on the next eviction pass"""
+        storage = InMemoryRateLimitStorage(shards=4)
+        limiter = RateLimiter(5, 10, storage=storage, evict_interval_seconds=5)
+        for i in range(20):
+            limiter.hit(f"client-{i}", now=1.0)
+        assert len(storage) == 20
+
+        limiter.hit("active", now=30.0)
+        assert len(storage) == 1
+        assert limiter.stats()["evicted"] == 20
+
+    def test_sqlite_shares_limits_between_instances(self, tmp_path):
+        """Two limiters on one SQLite file (two workers) share one budget"""
+        path = str(tmp_path / "limits.db")
+        worker_a = build_rate_limiter(3, 60, backend="sqlite", sqlite_path=path)
+        worker_b = build_rate_limiter(3, 60, backend="sqlite", sqlite_path=path)
+        try:
+            results = [worker.hit("client", now=10.0).allowed
+                       for worker in (worker_a, worker_b, worker_a, worker_b)]
+            assert results == [True, True, True, False]
+            assert len(worker_b.storage) == 1
+        finally:
+            worker_a.storage.close()
+            worker_b.storage.close()
+
+    def test_sqlite_eviction(self, tmp_path):
+        """Idle rows are deleted from the SQLite table"""
+        storage = SQLiteRateLimitStorage(str(tmp_path / "limits.db"))
+        try:
+            limiter = RateLimiter(5, 10, "token_bucket", storage=storage)
+            limiter.hit("old", now=1.0)
+            limiter.hit("new", now=100.0)
+            assert len(storage) == 1
+        finally:
+            storage.close()
+
+    def test_sqlite_hit_async_runs_off_the_event_loop(self, tmp_path):
+        """Async callers never run the blocking SQLite transaction on the loop thread"""
+        storage = SQLiteRateLimitStorage(str(tmp_path / "limits.db"))
+        threads = []
+        update = storage.update
+
+        def recording_update(key, step, now):
+            threads.append(threading.current_thread())
+            return update(key, step, now)
+
+        storage.update = recording_update
+        try:
+            limiter = RateLimiter(1, 60, storage=storage)
+            first = asyncio.run(limiter.hit_async("client", now=10.0))
+            second = asyncio.run(limiter.hit_async("client", now=10.0))
+            assert (first.allowed, second.allowed) == (True, False)
+            assert threading.main_thread() not in threads
+        finally:
+            storage.close()
+
+    def test_memory_hit_async_stays_inline(self):
+        """In-memory updates never wait, so they skip the thread hop"""
+        limiter = RateLimiter(1, 60)
+        assert limiter.storage.blocking is False
+        assert asyncio.run(limiter.hit_async("client", now=1.0)).allowed
+
+    def test_unknown_algorithm_and_backend_rejected(self):
+        """Configuration typos fail fast"""
+        with pytest.raises(ValueError):
+            RateLimiter(1, 1, "leaky")
+        with pytest.raises(ValueError):
+            build_rate_limiter(1, 1, backend="redis")
+
+
+class TestRateLimitMiddleware:
+    """End-to-end through a minimal app"""
+
+    def _client(self, **kwargs):
+        app = FastAPI()
+
+        @app.get("/ping")
+        def ping():
+            return {"ok": True}
+
+        @app.get("/health")
+        def health():
+            return {"status": "healthy"}
+
+        app.add_middleware(RateLimitMiddleware, **kwargs)
+        return TestClient(app)
+
+    def test_returns_429_with_headers(self):
+        """Over-limit requests get 429, Retry-After and rate limit headers"""
+        client = self._client(requests_per_window=2, window_seconds=60)
+
+        first = client.get("/ping")
+        assert first.status_code == 200
+        assert first.headers["X-RateLimit-Limit"] == "2"
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        assert client.get("/ping").status_code == 200
+
+        limited = client.get("/ping")
+        assert limited.status_code == 429
+        assert limited.json()["error"] == "rate_limit_exceeded"
+        assert int(limited.headers["Retry-After"]) >= 1
+
+    def test_sqlite_backend(self, tmp_path):
+        """The SQLite backend limits through the middleware too"""
+        client = self._client(
+            requests_per_window=1, window_seconds=60,
+            backend="sqlite", sqlite_path=str(tmp_path / "limits.db")
+        )
+        assert client.get("/ping").status_code == 200
+        assert client.get("/ping").status_code == 429
+
+    def test_health_is_not_limited(self):
+        """Health checks bypass the limiter"""
+        client = self._client(requests_per_window=1, window_seconds=60, algorithm="token_bucket")
+        assert all(client.get("/health").status_code == 200 for _ in range(5))
@@ -0,0 +1,128 @@
+"""
+Unit tests for vectorized semantic ranking
+Compares the matrix/argpartition path with the per-candidate cosine loop,
+using a deterministic stub encoder
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from app.services.nlp import distilbert_semantic
+from app.services.nlp.distilbert_semantic import (
+    batch_compute_similarities,
+    get_candidate_matrix,
+    rank_by_similarity,
+    rank_by_similarity_detailed,
+)
+
+
+def _stub_encoder(text: str) -> np.ndarray:
+    """Hash-seeded vectors; texts starting with 'zero' embed to the zero vector"""
+    if text.startswith("zero"):
+        return np.zeros(16, dtype=np.float32)
+    seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).standard_normal(16).astype(np.float32)
+
+
+def _reference_scores(query, candidates):
+    """The original loop: cosine per candidate, 0 for zero vectors"""
+    q = _stub_encoder(query)
+    scores = []
+    for candidate in candidates:
+        c = _stub_encoder(candidate)
+        n1, n2 = np.linalg.norm(q), np.linalg.norm(c)
+        scores.append(0.0 if n1 == 0 or n2 == 0 else float(np.dot(q, c) / (n1 * n2)))
+    return scores
+
+
+@pytest.fixture(autouse=True)
+def stub_encoder():
+    distilbert_semantic.set_encoder(_stub_encoder)
+    distilbert_semantic.configure_embedding_cache(max_size=1000)
+    yield
+    distilbert_semantic.set_encoder(None)
+    distilbert_semantic._embedding_cache = None
+
+
+CANDIDATES = [f"candidate authority {i}" for i in range(200)] + ["zero vector"]
+
+
+class TestVectorizedRanking:
+    """rank_by_similarity and friends match the original loop"""
+
+    def test_rank_matches_reference_order(self):
+        """Top-k equals a stable descending sort of clamped reference scores"""
+        reference = [(c, max(0.0, min(1.0, s)))
+                     for c, s in zip(CANDIDATES, _reference_scores("water board", CANDIDATES))]
+        reference.sort(key=lambda x: x[1], reverse=True)
+
+        for top_k in (None, 0, 1, 5, 50, len(CANDIDATES) + 10):
+            ranked = rank_by_similarity("water board", CANDIDATES, top_k=top_k)
+            expected = reference[:top_k] if top_k else reference
+            assert [c for c, _ in ranked] == [c for c, _ in expected]
+            assert [s for _, s in ranked] == pytest.approx([s for _, s in expected], abs=1e-5)
+
+    def test_ties_keep_input_order(self):
+        """Duplicate candidates tie and stay in input order around the cut-off"""
+        candidates = ["dup", "other", "dup", "dup"]
+        ranked = rank_by_similarity("dup", candidates, top_k=2)
+        assert ranked == [("dup", pytest.approx(1.0)), ("dup", pytest.approx(1.0))]
+
+    def test_batch_scores_are_raw_cosine(self):
+        """batch_compute_similarities keeps input order and sign"""
+        scores = batch_compute_similarities("road repair", CANDIDATES, batch_size=7)
+        assert scores == pytest.approx(_reference_scores("road repair", CANDIDATES), abs=1e-5)
+        assert min(scores) < 0
+
+    def test_detailed_ranking_uses_labels(self):
+        """Labels, ranks and audit trail are populated"""
+        labels = [f"label-{i}" for i in range(len(CANDIDATES))]
+        result = rank_by_similarity_detailed("electricity", CANDIDATES, candidate_labels=labels, top_k=3)
+        expected = rank_by_similarity("electricity", CANDIDATES, top_k=3)
+
+        assert [m.candidate for m in result.top_matches] == \
+            [labels[CANDIDATES.index(c)] for c, _ in expected]
+        assert [m.rank for m in result.top_matches] == [1, 2, 3]
+        assert result.audit_trail[1]["total_candidates"] == len(CANDIDATES)
+        assert result.audit_trail[2]["top_score"] == pytest.approx(expected[0][1], abs=1e-6)
+
+    def test_empty_candidates(self):
+        """No candidates gives no results"""
+        assert rank_by_similarity("query", []) == []
+        assert batch_compute_similarities("query", []) == []
+        assert rank_by_similarity_detailed("query", []).top_matches == []
+
+
+class TestCandidateMatrixCache:
+    """Matrices are cached per candidate-set fingerprint"""
+
+    def test_matrix_reused_for_same_candidates(self):
+        """Second lookup is a matrix cache hit returning the same array"""
+        first, _, cached1 = get_candidate_matrix(CANDIDATES)
+        second, _, cached2 = get_candidate_matrix(list(CANDIDATES))
+
+        assert (cached1, cached2) == (False, True)
+        assert first is second
+        assert not first.flags.writeable
+
+    def test_fingerprint_is_order_sensitive(self):
+        """A reordered candidate list gets its own matrix"""
+        get_candidate_matrix(["a", "b"])
+        _, _, cached = get_candidate_matrix(["b", "a"])
+        assert cached is False
+
+    def test_rows_are_normalized(self):
+        """Non-zero rows have unit norm, zero rows stay zero"""
+        matrix, _, _ = get_candidate_matrix(CANDIDATES)
+        norms = np.linalg.norm(matrix, axis=1)
+        assert norms[:-1] == pytest.approx(np.ones(len(CANDIDATES) - 1), abs=1e-5)
+        assert norms[-1] == 0
+
+    def test_set_encoder_invalidates_matrices(self):
+        """Swapping the encoder drops cached matrices"""
+        get_candidate_matrix(CANDIDATES)
+        distilbert_semantic.set_encoder(_stub_encoder)
+        _, _, cached = get_candidate_matrix(CANDIDATES)
+        assert cached is False
@@ -0,0 +1,116 @@
+"""
+Unit tests for spaCy Doc reuse and micro-batching
+Uses a blank English pipeline with an entity ruler - no model download needed
+"""
+
+import threading
+
+import pytest
+import spacy
+
+from app.services.nlp import spacy_engine
+from app.services.nlp.batching import MicroBatcher
+
+
+@pytest.fixture
+def blank_nlp(monkeypatch):
+    """Blank pipeline standing in for en_core_web_sm"""
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "ORG", "pattern": "Jal Board"},
+        {"label": "GPE", "pattern": "Jaipur"},
+    ])
+    monkeypatch.setattr(spacy_engine, "_nlp", nlp)
+    return nlp
+
+
+class TestMicroBatcher:
+    """Tests for the generic micro-batcher"""
+
+    def test_concurrent_items_share_batches(self):
+        """Items submitted together are processed in fewer batches"""
+        batch_sizes = []
+
+        def process(items):
+            batch_sizes.append(len(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(process, max_batch_size=16, max_wait_ms=50)
+        results = {}
+
+        def worker(value):
+            results[value] = batcher.process(value, timeout=5)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.close()
+
+        assert results == {i: i * 2 for i in range(8)}
+        assert sum(batch_sizes) == 8
+        assert len(batch_sizes) < 8
+        assert batcher.stats()["items"] == 8
+
+    def test_batch_size_cap(self):
+        """No batch exceeds max_batch_size"""
+        batch_sizes = []
+
+        def process(items):
+            batch_sizes.append(len(items))
+            return items
+
+        batcher = MicroBatcher(process, max_batch_size=3, max_wait_ms=20)
+        futures = [batcher.submit(i) for i in range(10)]
+        assert [f.result(timeout=5) for f in futures] == list(range(10))
+        batcher.close()
+
+        assert max(batch_sizes) <= 3
+
+    def test_errors_reach_every_caller(self):
+        """A failing batch fails all of its futures"""
+        def process(items):
+            raise ValueError("bad batch")
+
+        batcher = MicroBatcher(process, max_wait_ms=1)
+        with pytest.raises(ValueError):
+            batcher.process("x", timeout=5)
+        batcher.close()
+
+
+class TestDocReuse:
+    """Tests for sharing one parsed Doc across helpers"""
+
+    def test_parse_texts_uses_single_pipe(self, blank_nlp):
+        """parse_texts returns one Doc per text in order"""
+        docs = spacy_engine.parse_texts(["Jal Board in Jaipur", "no entities here"])
+        assert [d.text for d in docs] == ["Jal Board in Jaipur", "no entities here"]
+        assert [e.text for e in docs[0].ents] == ["Jal Board", "Jaipur"]
+
+    def test_helpers_reuse_given_doc(self, blank_nlp, monkeypatch):
+        """With doc= supplied, helpers never parse again"""
+        doc = spacy_engine.parse_text("Complaint to Jal Board, Jaipur. Ref No. WB/123/2024")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("text was parsed twice")
+
+        monkeypatch.setattr(spacy_engine, "parse_text", fail)
+        entities = spacy_engine.extract_entities(doc.text, doc=doc)
+
+        assert entities["ORG"] == ["Jal Board"]
+        assert "Jaipur" in entities["GPE"]
+        assert "WB/123/2024" in entities["REFERENCE"]
+
+    def test_batched_parse_matches_direct_parse(self, blank_nlp, monkeypatch):
+        """Parsing through the micro-batcher gives the same Doc content"""
+        batcher = MicroBatcher(spacy_engine.parse_texts, max_wait_ms=1)
+        monkeypatch.setattr(spacy_engine, "_doc_batcher", batcher)
+
+        text = "Water from Jal Board is dirty in Jaipur"
+        batched = spacy_engine.parse_text(text, batched=True)
+        direct = spacy_engine.parse_text(text)
+        batcher.close()
+
+        assert [(e.text, e.label_) for e in batched.ents] == [(e.text, e.label_) for e in direct.ents]
@@ -0,0 +1,135 @@
+"""
+Unit tests for stage timing spans and the /metrics endpoint
+spaCy is a blank pipeline and DistilBERT a hash-seeded stub - nothing is downloaded
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+import spacy
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import inference_orchestrator
+from app.services.inference_orchestrator import run_inference
+from app.services.nlp import distilbert_semantic
+from app.services.stage_metrics import (
+    Histogram,
+    MetricsRegistry,
+    StageTrace,
+    set_metrics_registry,
+)
+
+RTI_TEXT = "Under the RTI Act I request information on road repair expenditure in Ward 12"
+VAGUE_TEXT = "Something happened near my house last week and I am not sure what to do"
+
+
+def _stub_encoder(text: str) -> np.ndarray:
+    seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).standard_normal(16).astype(np.float32)
+
+
+@pytest.fixture
+def registry():
+    """Fresh process-wide registry for each test"""
+    registry = MetricsRegistry()
+    set_metrics_registry(registry)
+    yield registry
+    set_metrics_registry(None)
+
+
+@pytest.fixture
+def stub_models(monkeypatch):
+    """Blank spaCy (no parser, so no key phrases) and a stub encoder"""
+    nlp = spacy.blank("en")
+    monkeypatch.setattr(inference_orchestrator, "parse_text", lambda text, batched=False: nlp(text))
+    monkeypatch.setattr(inference_orchestrator, "extract_key_phrases", lambda text, doc=None: [])
+    distilbert_semantic.set_encoder(_stub_encoder)
+    yield
+    distilbert_semantic.set_encoder(None)
+
+
+class TestStageTrace:
+    """Tests for the span API"""
+
+    def test_spans_accumulate_time_and_calls(self, registry):
+        trace = StageTrace(registry)
+        for _ in range(3):
+            with trace.span("confidence_gate"):
+                pass
+        trace.record("intent_rules", 0.002)
+
+        timings = trace.finish()
+        assert timings["confidence_gate"]["calls"] == 3
+        assert timings["intent_rules"] == {"ms": 2.0, "calls": 1}
+
+        stages = registry.stage_duration.snapshot()
+        assert stages[("confidence_gate",)].count == 3
+        assert registry.inference_duration.snapshot()[()].count == 1
+
+    def test_span_records_on_error(self, registry):
+        trace = StageTrace(registry)
+        with pytest.raises(ValueError):
+            with trace.span("distilbert_fallback"):
+                raise ValueError("model missing")
+        assert trace.stages["distilbert_fallback"]["calls"] == 1
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram((0.001, 0.01))
+        for value in (0.0005, 0.001, 0.005, 3.0):
+            histogram.observe(value)
+        # Upper bounds are inclusive, as in Prometheus
+        assert histogram.cumulative() == [("0.001", 2), ("0.01", 3), ("+Inf", 4)]
+
+
+class TestRunInference:
+    """Tests for the instrumented pipeline"""
+
+    def test_rule_path_stages(self, registry, stub_models):
+        timings = run_inference(RTI_TEXT).stage_timings
+        assert {"keyword_scan", "intent_rules", "legal_triggers", "issue_mapping",
+                "spacy_parse", "entity_extraction", "confidence_gate", "document_type"} <= set(timings)
+        assert "distilbert_fallback" not in timings
+        # Boost check before DistilBERT and the final gate
+        assert timings["confidence_gate"]["calls"] == 2
+
+    def test_low_confidence_records_fallback(self, registry, stub_models):
+        result = run_inference(VAGUE_TEXT)
+        assert "distilbert_fallback" in result.stage_timings
+        assert ("distilbert_fallback",) in registry.stage_duration.snapshot()
+
+    def test_decision_path_unchanged(self, registry, stub_models):
+        """Timings live beside the audit trail, not in it"""
+        result = run_inference(RTI_TEXT)
+        assert not any("ms" in step for step in result.decision_path)
+
+
+class TestEndpoints:
+    """Tests for include_timings and /metrics"""
+
+    def test_timings_are_opt_in(self, registry, stub_models):
+        client = TestClient(app)
+        plain = client.post("/api/infer", json={"text": RTI_TEXT}).json()
+        timed = client.post("/api/infer", json={"text": RTI_TEXT, "include_timings": True}).json()
+
+        assert plain["stage_timings"] is None
+        assert timed["stage_timings"]["intent_rules"]["calls"] == 1
+
+    def test_metrics_exposition(self, registry, stub_models):
+        client = TestClient(app)
+        client.post("/api/infer", json={"text": RTI_TEXT})
+        client.get("/no-such-path")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+        body = response.text
+        assert "# TYPE rti_inference_stage_duration_seconds histogram" in body
+        assert 'rti_inference_stage_duration_seconds_count{stage="intent_rules"} 1' in body
+        assert 'rti_inference_stage_duration_seconds_bucket{stage="intent_rules",le="+Inf"} 1' in body
+        assert 'rti_http_request_duration_seconds_count{method="POST",path="/api/infer",status="200"} 1' in body
+        assert 'path="unmatched",status="404"' in body
+        # Scrapes themselves are not recorded
+        assert 'path="/metrics"' not in body
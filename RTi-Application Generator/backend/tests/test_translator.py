@@ -0,0 +1,162 @@
+"""
+Unit tests for sentence-level translation, the translation cache and batching
+Uses a deterministic fake backend so the MarianMT model is never downloaded
+"""
+
+from typing import List, Optional
+
+import pytest
+
+from app.services.nlp import translator
+from app.services.nlp.translation_cache import TranslationCache
+from app.services.nlp.translator import TranslationBackend, TranslationEngine, split_sentences
+
+
+class FakeTranslator(TranslationBackend):
+    """Upper-cases and tags each sentence; records every batch it receives"""
+
+    name = "fake"
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches: List[List[str]] = []
+
+    def translate_batch(self, sentences: List[str]) -> List[Optional[str]]:
+        self.batches.append(list(sentences))
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return [f"<{s.upper()}>" for s in sentences]
+
+    @property
+    def sentences_seen(self) -> List[str]:
+        return [s for batch in self.batches for s in batch]
+
+
+@pytest.fixture
+def backend():
+    return FakeTranslator()
+
+
+@pytest.fixture
+def engine(backend):
+    return TranslationEngine(backend, TranslationCache(), batch_size=4)
+
+
+class TestSplitSentences:
+    """Tests for segmentation"""
+
+    def test_round_trips_original_text(self):
+        """Joining the parts gives back the input exactly"""
+        text = "First line.  Second one!\n\n  Third? Fourth"
+        parts = split_sentences(text)
+        assert "".join(parts) == text
+        assert parts[::2] == ["First line.", "Second one!", "Third?", "Fourth"]
+
+    def test_abbreviations_do_not_split(self):
+        """Periods after common abbreviations stay inside the sentence"""
+        parts = split_sentences("Pay Rs. 10 to Dr. Rao. Then wait.")
+        assert parts[::2] == ["Pay Rs. 10 to Dr. Rao.", "Then wait."]
+
+    def test_hindi_danda_ends_sentence(self):
+        """Devanagari full stop is a sentence boundary"""
+        assert split_sentences("पहला वाक्य। दूसरा")[::2] == ["पहला वाक्य।", "दूसरा"]
+
+
+class TestTranslationEngine:
+    """Tests for caching and batching with the fake backend"""
+
+    def test_translates_sentence_by_sentence(self, engine):
+        """Layout (line breaks, spacing) is preserved around translations"""
+        result = engine.translate("Road is broken.\nPlease fix it.")
+        assert result == "<ROAD IS BROKEN.>\n<PLEASE FIX IT.>"
+
+    def test_repeated_sentences_translated_once(self, engine, backend):
+        """Boilerplate shared across texts and calls hits the cache"""
+        boilerplate = "I request the following information under the RTI Act."
+        engine.translate_many([f"{boilerplate} Ward 5 roads.", f"{boilerplate} Ward 9 drains."])
+        engine.translate(f"{boilerplate} Ward 5 roads.")
+
+        assert backend.sentences_seen.count(boilerplate) == 1
+        assert len(backend.sentences_seen) == 3
+        assert engine.cache.stats()["hits"] == 2
+
+    def test_uncached_sentences_are_batched(self, engine, backend):
+        """Ten distinct sentences go out in batches of batch_size"""
+        engine.translate(" ".join(f"Sentence number {i}." for i in range(10)))
+        assert [len(batch) for batch in backend.batches] == [4, 4, 2]
+
+    def test_non_text_parts_pass_through(self, engine, backend):
+        """Numbers and separators are never sent to the backend"""
+        assert engine.translate("12/05/2024\n---\nHello there") == "12/05/2024\n---\n<HELLO THERE>"
+        assert backend.sentences_seen == ["Hello there"]
+
+    def test_long_sentences_are_wrapped(self, backend):
+        """Sentences above max_chars are split into model-sized pieces"""
+        engine = TranslationEngine(backend, max_chars=20)
+        engine.translate("one two three four five six seven eight")
+        assert all(len(s) <= 20 for s in backend.sentences_seen)
+        assert len(backend.sentences_seen) > 1
+
+    def test_backend_failure_returns_original_and_is_not_cached(self):
+        """A failed batch leaves text untranslated and is retried next time"""
+        failing = FakeTranslator(fail=True)
+        engine = TranslationEngine(failing, TranslationCache())
+
+        assert engine.translate("Water supply is irregular.") == "Water supply is irregular."
+        engine.translate("Water supply is irregular.")
+        assert len(failing.batches) == 2
+        assert engine.stats()["failures"] == 2
+
+
+class TestTranslationCache:
+    """Tests for the SQLite-backed cache"""
+
+    def test_translations_survive_restart(self, tmp_path, backend):
+        """A new engine on the same file serves sentences without the backend"""
+        path = str(tmp_path / "translations.db")
+        TranslationEngine(backend, TranslationCache(path)).translate("Streetlights are off.")
+
+        fresh_backend = FakeTranslator()
+        cache = TranslationCache(path)
+        result = TranslationEngine(fresh_backend, cache).translate("Streetlights are off.")
+
+        assert result == "<STREETLIGHTS ARE OFF.>"
+        assert fresh_backend.batches == []
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_entries_are_namespaced_by_backend(self, tmp_path):
+        """A different model never reuses another model's output"""
+        cache = TranslationCache(str(tmp_path / "translations.db"))
+        cache.put_many("model-a", {"hello": "A"})
+        assert cache.get_many("model-b", ["hello"]) == {}
+        assert cache.get_many("model-a", ["hello"]) == {"hello": "A"}
+
+    def test_memory_only_without_path(self, tmp_path, monkeypatch):
+        """No path means nothing is written to disk"""
+        monkeypatch.chdir(tmp_path)
+        cache = TranslationCache(max_entries=1)
+        cache.put_many("fake", {"a": "1", "b": "2"})
+        assert len(cache) == 1
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestModuleApi:
+    """Tests for translate_to_hindi with an installed engine"""
+
+    def test_translate_to_hindi_uses_installed_engine(self, engine):
+        """set_translation_engine swaps the backend used by the module API"""
+        translator.set_translation_engine(engine)
+        try:
+            assert translator.translate_to_hindi("Fix the road.") == "<FIX THE ROAD.>"
+            assert translator.translate_many_to_hindi(["Fix the road.", "42"]) == ["<FIX THE ROAD.>", "42"]
+        finally:
+            translator.set_translation_engine(None)
+
+    def test_unavailable_backend_returns_text(self):
+        """Without a usable model text comes back unchanged"""
+        class Unavailable(FakeTranslator):
+            def is_available(self):
+                return False
+
+        engine = TranslationEngine(Unavailable())
+        assert engine.translate_many(["Fix the road.", ""]) == ["Fix the road.", ""]
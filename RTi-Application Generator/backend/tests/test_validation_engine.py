@@ -0,0 +1,187 @@
+"""
+Unit tests for the RTIValidator rule table, incremental re-validation and bulk API
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.validation_engine import RULES, RTIValidator, ValidationSeverity
+
+
+GOOD_REQUEST = dict(
+    information_sought=(
+        "1. Provide certified copies of the sanction orders for road repair in Ward 12.\n"
+        "2. How much was spent on the work?"
+    ),
+    time_period="2022-2024",
+    department="Public Works Department",
+    record_type="documents",
+    applicant_name="Ravi Kumar",
+    applicant_address="12 MG Road, Jaipur",
+    applicant_state="Rajasthan",
+)
+
+
+@pytest.fixture
+def validator():
+    return RTIValidator()
+
+
+def codes(result):
+    return [issue.code for issue in result.issues]
+
+
+class TestRuleTable:
+    """Tests for the declarative rules"""
+
+    def test_complete_request_scores_full_marks(self, validator):
+        """A specific, complete request raises no issues"""
+        result = validator.validate(**GOOD_REQUEST)
+        assert result.issues == []
+        assert result.score == 100
+        assert result.is_valid and result.can_generate
+
+    def test_empty_request_reports_completeness_errors_in_order(self, validator):
+        """Missing fields are errors, reported completeness-first"""
+        result = validator.validate(information_sought="", time_period="", department="", record_type="")
+
+        assert codes(result) == [
+            "MISSING_INFO_SOUGHT", "MISSING_TIME_PERIOD", "MISSING_DEPARTMENT",
+            "MISSING_APPLICANT_NAME", "MISSING_APPLICANT_ADDRESS", "MISSING_RECORD_TYPE",
+        ]
+        assert result.scores_breakdown == {
+            "completeness": 0, "clarity": 100, "legal": 100, "authority": 100, "format": 80,
+        }
+        assert not result.is_valid
+
+    def test_each_vague_pattern_penalized_separately(self, validator):
+        """Two vague phrasings are two issues with their own suggestions"""
+        result = validator.validate(**{**GOOD_REQUEST, "information_sought": "all information about whatever, etc."})
+        vague = [i for i in result.issues if i.code == "VAGUE_REQUEST"]
+
+        assert len(vague) == 3
+        assert len({i.suggestion for i in vague}) == 3
+        assert result.scores_breakdown["clarity"] == 100 - 3 * 15 - 20
+
+    def test_keyword_prefilter_is_case_insensitive(self, validator):
+        """Prefilters never hide a match the regex would find"""
+        result = validator.validate(**{
+            **GOOD_REQUEST,
+            "information_sought": GOOD_REQUEST["information_sought"] + " Include the Cabinet NOTES and PMO papers.",
+        })
+        assert codes(result) == ["POTENTIAL_EXEMPTION"]
+
+    def test_vague_department(self, validator):
+        """Generic department names are flagged"""
+        result = validator.validate(**{**GOOD_REQUEST, "department": "Government"})
+        assert codes(result) == ["VAGUE_DEPARTMENT"]
+        assert result.scores_breakdown["authority"] == 70
+
+    def test_every_rule_reads_known_fields(self):
+        """Rule inputs are request fields, so groups can be diffed"""
+        for rule in RULES:
+            assert rule.inputs
+            assert set(rule.inputs) <= set(GOOD_REQUEST)
+
+
+class TestIncrementalValidation:
+    """Tests for revalidate()"""
+
+    def test_only_rules_reading_changed_fields_rerun(self, validator):
+        """Editing time_period does not re-run information_sought rules"""
+        first = validator.validate(**GOOD_REQUEST)
+        second = validator.revalidate(first, time_period="sometime")
+
+        time_rules = sum(1 for rule in RULES if "time_period" in rule.inputs)
+        assert second.state.rules_evaluated == time_rules
+        assert codes(second) == ["INVALID_TIME_PERIOD"]
+
+    def test_unchanged_values_rerun_nothing(self, validator):
+        """Re-sending an identical value evaluates no rules"""
+        first = validator.validate(**GOOD_REQUEST)
+        assert validator.revalidate(first, department=GOOD_REQUEST["department"]).state.rules_evaluated == 0
+
+    def test_matches_full_validation(self, validator):
+        """Keystroke-by-keystroke revalidate equals validating from scratch"""
+        text = GOOD_REQUEST["information_sought"] + " all related files etc."
+        result = validator.validate(**{**GOOD_REQUEST, "information_sought": ""})
+        for end in range(0, len(text), 7):
+            result = validator.revalidate(result, information_sought=text[:end])
+            full = validator.validate(**{**GOOD_REQUEST, "information_sought": text[:end]})
+            assert (result.issues, result.score, result.scores_breakdown) == \
+                (full.issues, full.score, full.scores_breakdown)
+
+    def test_unknown_field_rejected(self, validator):
+        """Only rule input fields can be changed"""
+        first = validator.validate(**GOOD_REQUEST)
+        with pytest.raises(ValueError):
+            validator.revalidate(first, subject="x")
+
+
+class TestValidateMany:
+    """Tests for the bulk API"""
+
+    def test_same_results_as_single_calls(self, validator):
+        """Bulk results equal one validate() per request"""
+        requests = [
+            GOOD_REQUEST,
+            {**GOOD_REQUEST, "department": "other"},
+            {"information_sought": "anything", "time_period": None},
+            GOOD_REQUEST,
+        ]
+        bulk = validator.validate_many(requests)
+        singles = [validator.validate(**{"time_period": "", "department": "", "record_type": "", **r}) for r in requests]
+
+        assert [(r.issues, r.score) for r in bulk] == [(r.issues, r.score) for r in singles]
+
+    def test_repeated_inputs_evaluated_once(self, validator):
+        """Identical requests reuse every group's outcome"""
+        bulk = validator.validate_many([GOOD_REQUEST] * 5)
+        assert bulk[0].state.rules_evaluated == len(RULES)
+        assert all(r.state.rules_evaluated == 0 for r in bulk[1:])
+
+
+class TestValidateEdit:
+    """Tests for validate_edit"""
+
+    ORIGINAL = (
+        "To,\nThe Public Information Officer\n\nSubject: Application under Section 6 of the RTI Act\n\n"
+        "I am a citizen of India."
+    )
+
+    def test_removed_legal_elements_warned(self, validator):
+        """Dropping RTI Act/Section 6/citizenship is a warning"""
+        is_safe, issues = validator.validate_edit(self.ORIGINAL, "To,\nThe PIO\nI need copies.", "information_request")
+
+        assert is_safe
+        assert [i.code for i in issues] == ["CRITICAL_REMOVED"] * 3 + ["STRUCTURE_BROKEN"]
+        assert all(i.severity == ValidationSeverity.WARNING for i in issues)
+
+    def test_non_rti_documents_only_check_structure(self, validator):
+        """Complaints skip the RTI-specific checks"""
+        _, issues = validator.validate_edit(self.ORIGINAL, "Short complaint", "grievance")
+        assert [i.code for i in issues] == ["STRUCTURE_BROKEN"]
+
+
+class TestBatchEndpoint:
+    """Tests for POST /api/validate/rti/batch"""
+
+    def test_results_in_request_order(self):
+        """Each result uses its own request's language"""
+        client = TestClient(app)
+        response = client.post("/api/validate/rti/batch", json={"requests": [
+            GOOD_REQUEST,
+            {"information_sought": "all information etc.", "language": "hindi"},
+        ]})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results[0]["grade"] == "A" and results[0]["issues"] == []
+        assert results[1]["issues"][0]["code"] == "MISSING_TIME_PERIOD"
+        assert results[1]["issues"][0]["message"].startswith("समय अवधि आवश्यक है")
+
+    def test_empty_batch_rejected(self):
+        """At least one request is required"""
+        client = TestClient(app)
+        assert client.post("/api/validate/rti/batch", json={"requests": []}).status_code == 422
@@ -19,7 +19,7 @@ import sys
 import logging
 from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 
@@ -62,6 +62,16 @@ def _import_distilbert():
             raise ImportError("Could not import distilbert_semantic. Ensure backend/app is in PYTHONPATH")
 
 
+def _import_model_registry():
+    """
+    Lazy import for the backend's model registry. Both NLP modules are
+    imported first so their models are registered, and the registry is taken
+    from them so it is the instance they load through.
+    """
+    _import_distilbert()
+    return _import_spacy_engine().get_model_registry()
+
+
 def _import_intent_rules():
     """Lazy import for intent_rules module"""
     try:
@@ -116,6 +126,21 @@ class ModelStatus(Enum):
     ERROR = "error"
 
 
+# Model registry status -> ModelStatus ("unloaded" = released by the idle reaper)
+_REGISTRY_STATUS = {
+    "not_loaded": ModelStatus.NOT_LOADED,
+    "loading": ModelStatus.LOADING,
+    "loaded": ModelStatus.LOADED,
+    "unloaded": ModelStatus.NOT_LOADED,
+    "failed": ModelStatus.ERROR,
+}
+
+_MODEL_VERSIONS = {
+    ModelType.SPACY: "en_core_web_sm",
+    ModelType.DISTILBERT: "distilbert-base-uncased",
+}
+
+
 @dataclass
 class ModelInfo:
     """Information about a loaded model"""
@@ -164,6 +189,10 @@ class ModelManager:
     """
     Centralized model management for the application.
     
+    Load state, timings and memory of spaCy and DistilBERT come from the
+    backend's model registry, which owns the models (and may unload idle
+    ones); nothing is cached here.
+    
     Responsibilities:
     1. Lazy loading of models
     2. Model health monitoring
@@ -173,27 +202,45 @@ class ModelManager:
     """
     
     def __init__(self):
-        self._models: Dict[ModelType, ModelInfo] = {}
         self._initialized = False
         self._audit_log: List[Dict] = []
         self._max_audit_entries = 1000
-        
-        # Initialize model info
-        for model_type in [ModelType.SPACY, ModelType.DISTILBERT]:
-            self._models[model_type] = ModelInfo(
-                name=model_type.value,
-                type=model_type,
-                status=ModelStatus.NOT_LOADED,
-                version="unknown"
+    
+    def _model_info(self, model_type: ModelType) -> ModelInfo:
+        """Current info for a model, read from the model registry"""
+        if model_type == ModelType.RULE_ENGINE:
+            # Rule engine is always "loaded" (it's just Python code)
+            return ModelInfo(
+                name="rule_engine",
+                type=ModelType.RULE_ENGINE,
+                status=ModelStatus.LOADED,
+                version="1.0.0"
             )
         
-        # Rule engine is always "loaded" (it's just Python code)
-        self._models[ModelType.RULE_ENGINE] = ModelInfo(
-            name="rule_engine",
-            type=ModelType.RULE_ENGINE,
-            status=ModelStatus.LOADED,
-            version="1.0.0"
+        info = ModelInfo(
+            name=model_type.value,
+            type=model_type,
+            status=ModelStatus.NOT_LOADED,
+            version=_MODEL_VERSIONS[model_type]
         )
+        try:
+            stats = _import_model_registry().stats()["models"].get(model_type.value)
+        except Exception as e:
+            info.status = ModelStatus.ERROR
+            info.error_message = str(e)
+            return info
+        if stats is None:
+            return info
+        
+        info.status = _REGISTRY_STATUS.get(stats["status"], ModelStatus.NOT_LOADED)
+        info.memory_mb = stats["memory_mb"] or 0.0
+        info.load_time_ms = stats["load_ms"] or 0.0
+        if stats["idle_seconds"] is not None:
+            last_used = datetime.utcnow() - timedelta(seconds=stats["idle_seconds"])
+            info.last_used = last_used.isoformat()
+        if info.status == ModelStatus.ERROR:
+            info.error_message = stats["error"]
+        return info
     
     def initialize(self, preload_models: bool = False) -> Dict[str, Any]:
         """
@@ -225,86 +272,53 @@ class ModelManager:
         return result
     
     def load_spacy(self) -> Dict[str, Any]:
-        """Load spaCy model"""
-        import time
-        start_time = time.time()
-        
-        model_info = self._models[ModelType.SPACY]
-        model_info.status = ModelStatus.LOADING
-        
+        """Load spaCy model (through the model registry)"""
         try:
             spacy_engine = _import_spacy_engine()
+            spacy_engine.get_nlp()
             
-            # Load the model
-            nlp = spacy_engine.get_nlp()
-            
-            # Update model info
-            model_info.status = ModelStatus.LOADED
-            model_info.version = "en_core_web_sm"
-            model_info.load_time_ms = (time.time() - start_time) * 1000
-            model_info.last_used = datetime.utcnow().isoformat()
-            
-            # Estimate memory (rough)
-            model_info.memory_mb = 50.0  # en_core_web_sm is ~50MB
-            
+            model_info = self._model_info(ModelType.SPACY)
             logger.info(f"spaCy loaded in {model_info.load_time_ms:.2f}ms")
             
             return {"status": "loaded", "load_time_ms": model_info.load_time_ms}
             
         except Exception as e:
-            model_info.status = ModelStatus.ERROR
-            model_info.error_message = str(e)
             logger.error(f"Failed to load spaCy: {e}")
             return {"status": "error", "error": str(e)}
     
     def load_distilbert(self) -> Dict[str, Any]:
-        """Load DistilBERT model"""
-        import time
-        start_time = time.time()
-        
-        model_info = self._models[ModelType.DISTILBERT]
-        model_info.status = ModelStatus.LOADING
-        
+        """Load DistilBERT model (through the model registry)"""
         try:
             distilbert = _import_distilbert()
-            
-            # Load the model
             distilbert.preload_model()
             
-            # Update model info
-            model_info.status = ModelStatus.LOADED
-            model_info.version = "distilbert-base-uncased"
-            model_info.load_time_ms = (time.time() - start_time) * 1000
-            model_info.last_used = datetime.utcnow().isoformat()
-            
-            # Estimate memory
-            model_info.memory_mb = 250.0  # DistilBERT is ~250MB
-            
+            model_info = self._model_info(ModelType.DISTILBERT)
             logger.info(f"DistilBERT loaded in {model_info.load_time_ms:.2f}ms")
             
             return {"status": "loaded", "load_time_ms": model_info.load_time_ms}
             
         except Exception as e:
-            model_info.status = ModelStatus.ERROR
-            model_info.error_message = str(e)
             logger.error(f"Failed to load DistilBERT: {e}")
             return {"status": "error", "error": str(e)}
     
     def get_model_status(self, model_type: Optional[ModelType] = None) -> Dict[str, Any]:
         """Get status of one or all models"""
         if model_type:
-            info = self._models.get(model_type)
-            return info.to_dict() if info else {"error": "Model not found"}
+            return self._model_info(model_type).to_dict()
         
         return {
-            model_type.value: info.to_dict()
-            for model_type, info in self._models.items()
+            model_type.value: self._model_info(model_type).to_dict()
+            for model_type in ModelType
         }
     
     def is_model_ready(self, model_type: ModelType) -> bool:
         """Check if a model is ready for inference"""
-        info = self._models.get(model_type)
-        return info is not None and info.status == ModelStatus.LOADED
+        if model_type == ModelType.RULE_ENGINE:
+            return True
+        try:
+            return _import_model_registry().is_loaded(model_type.value)
+        except Exception:
+            return False
     
     def classify_intent(self, text: str) -> InferenceResult:
         """
@@ -616,7 +630,8 @@ class ModelManager:
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        for model_type, info in self._models.items():
+        for model_type in ModelType:
+            info = self._model_info(model_type)
             model_health = {
                 "status": info.status.value,
                 "version": info.version
@@ -2,11 +2,13 @@
 API endpoints for Smart Resume & Job Fit Analyzer.
 All endpoints follow the system design document.
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
+from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from datetime import datetime, timedelta
 import uuid
 import os
+import json
 from typing import Optional
 
 from .schemas import (
@@ -20,8 +22,11 @@ from .schemas import (
     EvaluationResult,
     ExportResponse,
     SessionData,
+    ParseCacheStats,
 )
 from services.session_manager import session_manager
+from services.parse_cache import parse_cache
+from services.batch_screening import BatchTooLargeError, expand_uploads, screen_resumes
 
 router = APIRouter(tags=["analysis"])
 
@@ -59,32 +64,43 @@ async def upload_resume(file: UploadFile = File(...)):
             detail="Invalid file type. Only PDF and DOCX files are accepted."
         )
     
-    # Save uploaded file
     session_id = generate_session_id()
-    file_path = os.path.join(UPLOAD_DIR, f"{session_id}.{file_ext}")
-    
     try:
         contents = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(contents)
-        logger.info(f"Saved file to: {file_path}")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to read file: {str(e)}")
     
-    # Parse the resume
-    try:
-        from parsers import parse_resume
-        parsed_resume = parse_resume(file_path, file_ext)
-        logger.info(f"Parsed resume - Skills count: {len(parsed_resume.skills)}")
-        logger.info(f"Raw text length: {len(parsed_resume.raw_text)}")
-    except Exception as e:
-        # Cleanup on failure
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        logger.error(f"Parse error: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Failed to parse resume: {str(e)}")
+    # Identical uploads are parsed once; a hit never touches the upload directory
+    cache_key = parse_cache.make_key(contents, file_ext)
+    parsed_resume = parse_cache.get(cache_key)
+    if parsed_resume is not None:
+        logger.info(f"Parse cache hit: {cache_key}")
+    else:
+        # Save uploaded file
+        file_path = os.path.join(UPLOAD_DIR, f"{session_id}.{file_ext}")
+        try:
+            with open(file_path, "wb") as f:
+                f.write(contents)
+            logger.info(f"Saved file to: {file_path}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+        
+        # Parse the resume
+        try:
+            from parsers import parse_resume
+            parsed_resume = parse_resume(file_path, file_ext)
+            logger.info(f"Parsed resume - Skills count: {len(parsed_resume.skills)}")
+            logger.info(f"Raw text length: {len(parsed_resume.raw_text)}")
+        except Exception as e:
+            # Cleanup on failure
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            logger.error(f"Parse error: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            raise HTTPException(status_code=500, detail=f"Failed to parse resume: {str(e)}")
+        
+        parse_cache.put(cache_key, parsed_resume)
     
     # Store session data
     now = datetime.now()
@@ -96,9 +112,6 @@ async def upload_resume(file: UploadFile = File(...)):
     )
     session_manager.save_session(session)
     
-    # Cleanup old sessions in background
-    session_manager.cleanup_old_sessions()
-    
     return ResumeUploadResponse(
         session_id=session_id,
         filename=file.filename,
@@ -188,6 +201,47 @@ async def evaluate_resume(request: EvaluationRequest):
     )
 
 
+@router.post("/evaluate/batch")
+async def evaluate_batch(
+    job_description: str = Form(..., min_length=50),
+    files: list[UploadFile] = File(...),
+    workers: Optional[int] = Form(None, ge=1, le=32),
+):
+    """
+    Screen a batch of resumes against one job description.
+    
+    - Accepts PDF/DOCX files and ZIP archives of them
+    - Parses the JD once and the resumes in the shared process pool
+      (BATCH_EVAL_WORKERS); the workers field can only lower how many of
+      its workers this batch uses
+    - Streams NDJSON: a line per resume as it finishes, with its rank so far,
+      then a summary line with the final ranking
+    """
+    uploads = [(file.filename or "", await file.read()) for file in files]
+    try:
+        # Decompression is blocking CPU and memory work
+        resumes, skipped = await run_in_threadpool(expand_uploads, uploads)
+    except BatchTooLargeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if not resumes:
+        raise HTTPException(status_code=400, detail="No PDF or DOCX resumes found in the upload")
+    
+    try:
+        from parsers import parse_job_description
+        parsed_jd = parse_job_description(job_description)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to parse job description: {str(e)}")
+    
+    async def ndjson_lines():
+        for entry in skipped:
+            yield json.dumps({"type": "error", "index": None, **entry}) + "\n"
+        async for record in screen_resumes(resumes, parsed_jd, workers):
+            yield json.dumps(record, default=str) + "\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/results/{session_id}", response_model=EvaluationResponse)
 async def get_results(session_id: str):
     """
@@ -251,6 +305,14 @@ async def export_results(session_id: str, format: str = "pdf"):
         }
 
 
+@router.get("/cache/stats", response_model=ParseCacheStats)
+async def get_parse_cache_stats():
+    """
+    Hit-rate counters and sizes of the resume parse cache.
+    """
+    return ParseCacheStats(**parse_cache.stats())
+
+
 @router.get("/session/{session_id}")
 async def get_session(session_id: str):
     """
@@ -245,6 +245,20 @@ class SessionData(BaseModel):
     updated_at: datetime
 
 
+class ParseCacheStats(BaseModel):
+    """Counters for the content-addressed resume parse cache."""
+    hits: int
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    lookups: int
+    hit_rate: float
+    stores: int
+    evictions: int
+    memory_entries: int
+    disk_entries: int
+
+
 # ============================================================================
 # Export Schemas
 # ============================================================================
@@ -0,0 +1,110 @@
+"""
+PDF Parsing Benchmark
+Multi-page resumes through parse_pdf: separate text and word passes vs. one pass per page, plus the page cap
+
+Documents come from tests/pdf_generator.py (_create_multi_page_resume, dense
+experience history with a sidebar column on every page):
+- legacy: the previous parse_pdf, page.extract_text() and page.extract_words()
+  per page, every page's layout kept until the PDF is closed
+- single-pass: iter_pdf_pages with no page cap, one word extraction per page
+  and each page released once parsed
+- capped: an oversized upload (--oversized pages) at the PDF_MAX_PAGES default
+
+Text and blocks must be identical between legacy and single-pass; the
+script aborts otherwise. Peak memory is measured with tracemalloc on the
+oversized document.
+
+Usage (from backend/):
+    python benchmarks/bench_pdf_parsing.py [--pages 2 5 10] [--oversized 30] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pdfplumber
+
+from parsers.pdf_parser import _group_words_into_lines, max_pdf_pages, parse_pdf
+from tests.pdf_generator import _create_multi_page_resume
+
+
+def legacy_parse_pdf(file_path):
+    """The previous two-pass parser, kept here as the baseline"""
+    text_blocks = []
+    raw_text_parts = []
+    with pdfplumber.open(file_path) as pdf:
+        for page_num, page in enumerate(pdf.pages, start=1):
+            raw_text_parts.append(page.extract_text() or "")
+            lines = _group_words_into_lines(page.extract_words())
+            for line_num, line_data in enumerate(lines, start=1):
+                text_blocks.append({
+                    "text": line_data["text"],
+                    "page": page_num,
+                    "line": line_num,
+                    "top": line_data["top"],
+                    "left": line_data.get("left", 0),
+                    "font_size": line_data.get("font_size"),
+                    "is_bold": line_data.get("is_bold", False),
+                })
+    return "\n".join(raw_text_parts), text_blocks
+
+
+def single_pass(file_path):
+    return parse_pdf(file_path, max_pages=0)
+
+
+def timed(parse, path, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse(path)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_memory(parse, path):
+    tracemalloc.start()
+    parse(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 5, 10])
+    parser.add_argument("--oversized", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        print(f"{'pages':>6} {'legacy':>10} {'single-pass':>12} {'speedup':>8}")
+        for pages in args.pages:
+            path = os.path.join(output_dir, f"resume_{pages}.pdf")
+            _create_multi_page_resume(path, pages)
+
+            legacy_time, legacy = timed(legacy_parse_pdf, path, args.repeat)
+            single_time, single = timed(single_pass, path, args.repeat)
+            assert legacy == single, f"parse results differ on {pages} pages"
+            print(f"{pages:>6} {legacy_time * 1000:8.0f} ms {single_time * 1000:9.0f} ms {legacy_time / single_time:7.2f}x")
+
+        path = os.path.join(output_dir, "oversized.pdf")
+        _create_multi_page_resume(path, args.oversized)
+        cap = max_pdf_pages()
+        print(f"\n{args.oversized}-page upload (PDF_MAX_PAGES={cap}):")
+        for label, parse in [
+            ("legacy", legacy_parse_pdf),
+            ("single-pass", single_pass),
+            ("capped", parse_pdf),
+        ]:
+            elapsed, (_, blocks) = timed(parse, path, 1)
+            print(f"{label:<12} {elapsed * 1000:8.0f} ms {peak_memory(parse, path):8.1f} MB peak {len(blocks):6d} blocks")
+
+
+if __name__ == "__main__":
+    main()
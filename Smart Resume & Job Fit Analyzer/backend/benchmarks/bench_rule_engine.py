@@ -0,0 +1,127 @@
+"""
+Rule Engine Benchmark
+Bulk screening: 1 JD x N resumes through RuleEngine.evaluate, JD re-derived per resume vs. one JDContext
+
+Resumes are tests/data_generator.py resumes (all domains and layouts, seeded;
+needs faker) run through section detection once up front, so only evaluate()
+is timed:
+- legacy: what evaluate() did before JDContext, per resume: JD skills
+  re-normalized, domain re-detected from the lowercased raw text, experience
+  signal patterns looked up through re.search per experience entry
+- context: jd_context() built once for the JD and passed to every evaluate()
+
+Results must be identical for every resume; the script aborts otherwise.
+
+Usage (from backend/):
+    python benchmarks/bench_rule_engine.py [--resumes 1000] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import faker
+
+from api.schemas import ParsedResume
+from parsers import detect_sections, parse_job_description
+from rules.engine import RuleEngine
+from tests.data_generator import LAYOUTS, generate_resume_data
+
+JD_TEXT = """
+Senior Software Engineer
+
+Requirements:
+- 5+ years of experience with Python, SQL, Docker and Kubernetes
+- Experience with React, TypeScript and AWS
+- Bachelor's degree in Computer Science
+
+Nice to have:
+- Terraform, Kafka, GraphQL, Machine Learning
+"""
+
+
+class LegacyRuleEngine(RuleEngine):
+    """The previous per-call JD handling, kept here as the baseline"""
+
+    def jd_context(self, job_description):
+        # No memoization: everything is re-derived from the JD on every call
+        self._contexts.clear()
+        return super().jd_context(job_description)
+
+    def _calculate_experience_score(self, resume):
+        if not resume.experience:
+            return 50.0
+        score = 50.0
+        signals = self.config.get("experience_signals", {})
+        for exp in resume.experience:
+            text = exp.description.lower() + " ".join(exp.responsibilities).lower()
+            for name, points in (("leadership", 10), ("scale", 10), ("technical_depth", 8)):
+                if name in signals:
+                    for pattern in signals[name]["patterns"]:
+                        if re.search(pattern, text, re.IGNORECASE):
+                            score += points * signals[name]["weight"]
+                            break
+        return min(100.0, score)
+
+
+def make_resumes(count, seed):
+    random.seed(seed)
+    faker.Faker.seed(seed)
+    resumes = []
+    for _ in range(count):
+        raw_text = generate_resume_data(layout=random.choice(LAYOUTS))["raw_text"]
+        blocks = [
+            {"text": line.strip(), "line": i, "top": i * 20, "left": 0}
+            for i, line in enumerate(raw_text.split("\n")) if line.strip()
+        ]
+        sections = detect_sections(raw_text, blocks)
+        resumes.append(ParsedResume(
+            raw_text=raw_text,
+            education=sections.get("education", []),
+            experience=sections.get("experience", []),
+            projects=sections.get("projects", []),
+            skills=sections.get("skills", []),
+            contact_info=sections.get("contact_info", {}),
+        ))
+    return resumes
+
+
+def timed(label, evaluate_all):
+    start = time.perf_counter()
+    results = evaluate_all()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<8} {elapsed:8.3f} s {elapsed / len(results) * 1000:8.3f} ms/resume")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    resumes = make_resumes(args.resumes, args.seed)
+    jd = parse_job_description(JD_TEXT)
+    print(f"1 JD ({len(jd.required_skills)} required, {len(jd.optional_skills)} optional skills) x {len(resumes)} resumes")
+
+    legacy_engine = LegacyRuleEngine()
+    engine = RuleEngine()
+
+    legacy = timed("legacy", lambda: [legacy_engine.evaluate(resume, jd) for resume in resumes])
+
+    def with_context():
+        context = engine.jd_context(jd)
+        return [engine.evaluate(resume, jd, context) for resume in resumes]
+
+    memoized = timed("context", with_context)
+
+    assert legacy == memoized, "evaluation results differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Section Detection Benchmark
+Stress test of _find_section_boundaries: per-pattern header regexes vs. the precompiled alternation
+
+Documents are built from tests/data_generator.py resumes (all domains and
+layouts, seeded; needs faker), --pages resumes per document to mimic long
+multi-page CVs, one block per non-empty line as the DOCX parser emits them:
+- legacy: the previous header scan, one f-string pattern built and searched
+  per (block x section x pattern)
+- compiled: length/first-character prefilter, one alternation with a named
+  group per section, per-section patterns only for header blocks
+
+Boundaries must be identical on every document and on the regression PDFs
+(tests/pdf_generator.py); the script aborts otherwise.
+
+Usage (from backend/):
+    python benchmarks/bench_section_detection.py [--resumes 300] [--pages 3] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import faker
+
+from parsers import section_detector
+from parsers.pdf_parser import parse_pdf
+from parsers.section_detector import SECTION_PATTERNS, _find_section_boundaries
+from tests.data_generator import LAYOUTS, generate_resume_data
+from tests.pdf_generator import generate_test_pdfs
+
+
+def legacy_find_section_starts(text_blocks):
+    """The previous header scan, kept here as the baseline"""
+    section_starts = []
+    for idx, block in enumerate(text_blocks):
+        text = block["text"].lower().strip()
+        for section_type, patterns in SECTION_PATTERNS.items():
+            for pattern in patterns:
+                combined_pattern = (
+                    f"(?:^|\\n)\\s*"
+                    f"(?:[-–—*=_<>►▶→•\\[\\(#]+\\s*)?"
+                    f"(?:\\d+[\\.)\\-]?|[IVX]+\\.)?\\s*"
+                    f"{pattern}"
+                    f"(?:\\s*[:\\-–—._\\]\\)*=_<>►▶→•#]*)?\\s*"
+                    f"(?:$|\\n|[|,])"
+                )
+                if re.search(combined_pattern, text, re.IGNORECASE):
+                    if len(text) < 80:
+                        left_pos = block.get("left", 0)
+                        section_starts.append((idx, section_type, left_pos))
+                        break
+    return section_starts
+
+
+def make_documents(count, pages, seed):
+    random.seed(seed)
+    faker.Faker.seed(seed)
+    documents = []
+    for _ in range(count):
+        lines = []
+        for _ in range(pages):
+            lines.extend(generate_resume_data(layout=random.choice(LAYOUTS))["raw_text"].split("\n"))
+        documents.append([
+            {"text": line.strip(), "line": i, "top": i * 20, "left": 0}
+            for i, line in enumerate(lines) if line.strip()
+        ])
+    return documents
+
+
+def golden_documents():
+    with tempfile.TemporaryDirectory() as output_dir:
+        generate_test_pdfs(output_dir)
+        return [parse_pdf(os.path.join(output_dir, f"{name}.pdf"))[1] for name in ("standard", "two_column", "messy")]
+
+
+def run(find_starts, documents):
+    compiled = section_detector._find_section_starts
+    section_detector._find_section_starts = find_starts
+    try:
+        return [_find_section_boundaries(blocks) for blocks in documents]
+    finally:
+        section_detector._find_section_starts = compiled
+
+
+def timed(label, find_starts, documents):
+    start = time.perf_counter()
+    results = run(find_starts, documents)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {elapsed:8.3f} s {len(documents) / elapsed:10.0f} resumes/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=300)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    documents = make_documents(args.resumes, args.pages, args.seed)
+    blocks = sum(map(len, documents))
+    print(f"{len(documents)} documents x {args.pages} resumes, {blocks // len(documents)} blocks avg")
+
+    golden = golden_documents()
+    assert run(legacy_find_section_starts, golden) == run(section_detector._find_section_starts, golden), \
+        "golden boundaries differ"
+
+    legacy = timed("legacy", legacy_find_section_starts, documents)
+    compiled = timed("compiled", section_detector._find_section_starts, documents)
+
+    assert legacy == compiled, "section boundaries differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Skill Extraction Benchmark
+Extracting catalog skills from synthetic resumes: one regex run per entry vs. the single-scan matcher
+
+Resumes come from tests/data_generator.py (all domains and layouts, seeded;
+needs faker). Each text goes through:
+- per-entry: the previous scan, one re.search per catalog entry over the
+  lowercased text
+- matcher: SkillMatcher.find, one finder scan plus a lookahead chain at each
+  candidate position
+
+Both must report the same first match for every entry; the script aborts otherwise.
+
+Usage (from backend/):
+    python benchmarks/bench_skill_extraction.py [--resumes 500] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import faker
+
+from taxonomy.skill_matcher import get_skill_matcher
+from tests.data_generator import LAYOUTS, generate_resume_data
+
+
+def per_entry_find(matcher, text):
+    """The previous extraction loop, run over the shared catalog"""
+    text_lower = text.lower()
+    found = []
+    for pattern in matcher.patterns:
+        match = re.search("|".join(pattern.alternatives), text_lower)
+        if match:
+            found.append((pattern.name, match.group(), match.start(), match.end()))
+    return found
+
+
+def matcher_find(matcher, text):
+    return [(m.name, m.text, m.start, m.end) for m in matcher.find(text)]
+
+
+def timed(label, fn, texts):
+    start = time.perf_counter()
+    results = [fn(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:8.3f} s {elapsed / len(texts) * 1000:8.3f} ms/resume")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    faker.Faker.seed(args.seed)
+    texts = [
+        generate_resume_data(layout=random.choice(LAYOUTS))["raw_text"]
+        for _ in range(args.resumes)
+    ]
+
+    start = time.perf_counter()
+    matcher = get_skill_matcher()
+    compile_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(texts)} resumes, {sum(map(len, texts)) // len(texts)} chars avg, "
+          f"{len(matcher.patterns)} catalog entries, compiled in {compile_ms:.1f} ms")
+
+    per_entry = timed("per-entry", lambda text: per_entry_find(matcher, text), texts)
+    single = timed("matcher", lambda text: matcher_find(matcher, text), texts)
+
+    assert per_entry == single, "extraction results differ"
+
+
+if __name__ == "__main__":
+    main()
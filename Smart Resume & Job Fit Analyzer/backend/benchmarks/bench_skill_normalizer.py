@@ -0,0 +1,132 @@
+"""
+Skill Normalizer Benchmark
+Normalizing 50k skill mentions: per-call list rebuilds vs. indexed lookups
+
+Mentions are canonical names, aliases, typos (dropped/swapped letters),
+random casing/padding and unknown words, drawn with repetition like the
+skill lists of a batch of resumes:
+- legacy: the previous normalize (canonical scan, lowercase list and alias
+  key list rebuilt, two extractOne passes on every call)
+- normalize (cold): precomputed lookups, memo cleared first
+- normalize (warm): same mentions again, served by the memo
+- normalize_batch: one cdist over the unique unresolved mentions
+
+All paths must produce identical results; the script aborts otherwise.
+
+Usage (from backend/):
+    python benchmarks/bench_skill_normalizer.py [--mentions 50000] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from rapidfuzz import fuzz, process
+
+from taxonomy.normalizer import SkillNormalizer
+
+UNKNOWN = ["teamwork", "synergy", "blockchain", "xyzabc", "leadership skills", "ms office suite", "cobol"]
+
+
+def legacy_normalize(normalizer, skill):
+    """The previous SkillNormalizer.normalize, kept here as the baseline"""
+    skill_lower = skill.lower().strip()
+    if skill_lower in normalizer.alias_map:
+        return (normalizer.alias_map[skill_lower], "high", 100.0)
+    for canonical in normalizer.canonical_skills:
+        if canonical.lower() == skill_lower:
+            return (canonical, "high", 100.0)
+    result = None
+    if normalizer.canonical_skills:
+        result = process.extractOne(skill_lower, [c.lower() for c in normalizer.canonical_skills], scorer=fuzz.ratio)
+        if result and result[1] >= normalizer.thresholds["high_confidence"]:
+            return (normalizer.canonical_skills[result[2]], "high", result[1])
+    if normalizer.alias_map:
+        alias_result = process.extractOne(skill_lower, list(normalizer.alias_map.keys()), scorer=fuzz.ratio)
+        if alias_result:
+            alias_match, alias_score, _ = alias_result
+            canonical_score = result[1] if result else 0
+            if alias_score > canonical_score and alias_score >= normalizer.thresholds["medium_confidence"]:
+                return (normalizer.alias_map[alias_match], normalizer._score_to_confidence(alias_score), alias_score)
+    if result:
+        confidence = normalizer._score_to_confidence(result[1])
+        if confidence != "no_match":
+            return (normalizer.canonical_skills[result[2]], confidence, result[1])
+    return (skill, "no_match", 0.0)
+
+
+def typo(rng, word):
+    if len(word) < 4:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    if rng.random() < 0.5:
+        return word[:i] + word[i + 1:]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def make_mentions(normalizer, size, seed):
+    rng = random.Random(seed)
+    canonical = normalizer.canonical_skills
+    aliases = list(normalizer.alias_map)
+    mentions = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < 0.4:
+            mention = rng.choice(canonical)
+        elif roll < 0.6:
+            mention = rng.choice(aliases)
+        elif roll < 0.9:
+            mention = typo(rng, rng.choice(canonical + aliases))
+        else:
+            mention = rng.choice(UNKNOWN) + rng.choice(["", "", rng.choice(string.ascii_lowercase)])
+        case = rng.random()
+        if case < 0.2:
+            mention = mention.upper()
+        elif case < 0.4:
+            mention = mention.lower()
+        if rng.random() < 0.1:
+            mention = f" {mention} "
+        mentions.append(mention)
+    return mentions
+
+
+def timed(label, fn, mentions):
+    start = time.perf_counter()
+    results = fn(mentions)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} {elapsed:8.3f} s {len(mentions) / elapsed:12.0f}/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mentions", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    normalizer = SkillNormalizer()
+    mentions = make_mentions(normalizer, args.mentions, args.seed)
+    unique = len({m.lower().strip() for m in mentions})
+    print(f"{len(mentions)} mentions, {unique} unique, "
+          f"{len(normalizer.canonical_skills)} canonical skills, {len(normalizer.alias_map)} aliases")
+
+    legacy = timed("legacy", lambda ms: [legacy_normalize(normalizer, m) for m in ms], mentions)
+
+    normalizer._cache.clear()
+    cold = timed("normalize (cold)", lambda ms: [normalizer.normalize(m) for m in ms], mentions)
+    warm = timed("normalize (warm)", lambda ms: [normalizer.normalize(m) for m in ms], mentions)
+
+    normalizer._cache.clear()
+    batch = timed("normalize_batch", normalizer.normalize_batch, mentions)
+    batch = [(r["canonical"], r["confidence"], r["score"]) for r in batch]
+
+    assert legacy == cold == warm == batch, "normalization results differ"
+
+
+if __name__ == "__main__":
+    main()
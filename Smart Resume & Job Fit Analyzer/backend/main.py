@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 import spacy
 
 from api.routes import router as api_router
+from services.batch_screening import get_executor, shutdown_executor
 
 # Global spaCy model instance
 nlp = None
@@ -19,8 +20,11 @@ async def lifespan(app: FastAPI):
     global nlp
     # Load spaCy model on startup
     nlp = spacy.load("en_core_web_sm")
+    # Start the batch screening pool before serving requests
+    get_executor()
     yield
     # Cleanup on shutdown
+    shutdown_executor()
     nlp = None
 
 
@@ -6,6 +6,8 @@ import re
 
 from typing import Optional
 
+from taxonomy.skill_matcher import get_skill_matcher
+
 
 def parse_job_description(jd_text: str) -> "ParsedJobDescription":
     """
@@ -183,142 +185,8 @@ def _extract_skills_and_requirements(text: str, priority: "SkillPriority") -> tu
 
 
 def _extract_skills_from_text(text: str) -> list[str]:
-    """Extract skill names from text using pattern matching."""
-    skills = []
-    
-    # Technology patterns
-    tech_patterns = [
-        # Programming Languages
-        (r"\bpython\b", "Python"),
-        (r"\bjavascript\b|\bjs\b", "JavaScript"),
-        (r"\btypescript\b|\bts\b", "TypeScript"),
-        (r"\bjava\b", "Java"),
-        (r"\bc\+\+\b|cpp\b", "C++"),
-        (r"\bc#\b|csharp\b", "C#"),
-        (r"\b(?<!en)go\b|\bgolang\b", "Go"),
-        (r"\brust\b", "Rust"),
-        (r"\bruby\b", "Ruby"),
-        (r"\bphp\b", "PHP"),
-        (r"\bswift\b", "Swift"),
-        (r"\bkotlin\b", "Kotlin"),
-        (r"\bscala\b", "Scala"),
-        (r"\br\b(?=\s|,|\.)", "R"),
-        (r"\bsql\b", "SQL"),
-        (r"\bhtml\b", "HTML"),
-        (r"\bcss\b", "CSS"),
-        (r"\bshell\b|\bbash\b", "Bash"),
-        
-        # Frameworks
-        (r"\breact\b|\breactjs\b", "React"),
-        (r"\bangular\b", "Angular"),
-        (r"\bvue\b|\bvuejs\b", "Vue.js"),
-        (r"\bnode\b|\bnodejs\b", "Node.js"),
-        (r"\bexpress\b", "Express.js"),
-        (r"\bdjango\b", "Django"),
-        (r"\bflask\b", "Flask"),
-        (r"\bfastapi\b", "FastAPI"),
-        (r"\bspring\b", "Spring Boot"),
-        (r"\bnext\.?js\b", "Next.js"),
-        (r"\btailwind\b", "Tailwind CSS"),
-        (r"\bbootstrap\b", "Bootstrap"),
-        
-        # ML/AI
-        (r"\btensorflow\b", "TensorFlow"),
-        (r"\bpytorch\b", "PyTorch"),
-        (r"\bscikit-?learn\b", "Scikit-learn"),
-        (r"\bpandas\b", "Pandas"),
-        (r"\bnumpy\b", "NumPy"),
-        (r"\bopencv\b", "OpenCV"),
-        
-        # Databases
-        (r"\bpostgres(?:ql)?\b", "PostgreSQL"),
-        (r"\bmysql\b", "MySQL"),
-        (r"\bmongodb\b", "MongoDB"),
-        (r"\bredis\b", "Redis"),
-        (r"\belasticsearch\b", "Elasticsearch"),
-        (r"\bdynamodb\b", "DynamoDB"),
-        
-        # Cloud & DevOps
-        (r"\baws\b", "AWS"),
-        (r"\bgcp\b|google cloud\b", "Google Cloud"),
-        (r"\bazure\b", "Azure"),
-        (r"\bdocker\b", "Docker"),
-        (r"\bkubernetes\b|\bk8s\b", "Kubernetes"),
-        (r"\bgit\b", "Git"),
-        (r"\bjenkins\b", "Jenkins"),
-        (r"\bterraform\b", "Terraform"),
-        (r"\bansible\b", "Ansible"),
-        (r"\blinux\b", "Linux"),
-        (r"\bjira\b", "Jira"),
-        
-        # Soft Skills & Business
-        (r"\bcommunication\b", "Communication"),
-        (r"\bleadership\b", "Leadership"),
-        (r"\bteamwork\b", "Teamwork"),
-        (r"\bproblem[- ]?solving\b", "Problem Solving"),
-        (r"\bagile\b", "Agile"),
-        (r"\bscrum\b", "Scrum"),
-        (r"\bproject[- ]?management\b", "Project Management"),
-        (r"\btime[- ]?management\b", "Time Management"),
-        (r"\bcustomer[- ]?service\b", "Customer Service"),
-        (r"\bpresentation\b", "Presentation"),
-        (r"\banalysis\b|\banalytical\b", "Analytical Skills"),
-        (r"\bmarketing\b", "Marketing"),
-        (r"\bsales\b", "Sales"),
-        (r"\bexcel\b", "Excel"),
-        (r"\bpower\s?bi\b", "Power BI"),
-        (r"\btableau\b", "Tableau"),
-        
-        # Finance & Accounting
-        (r"\bgaap\b", "GAAP"),
-        (r"\bifrs\b", "IFRS"),
-        (r"\bsox\b", "SOX"),
-        (r"\bcpa\b", "CPA"),
-        (r"\bcfa\b", "CFA"),
-        (r"\btax\b|\btaxation\b", "Taxation"),
-        (r"\baudit\b|\bauditing\b", "Auditing"),
-        (r"\baccounting\b", "Accounting"),
-        (r"\bfinancial\s+analysis\b", "Financial Analysis"),
-        (r"\bfinancial\s+modeling\b", "Financial Modeling"),
-        (r"\bbudgeting\b", "Budgeting"),
-        (r"\bforecasting\b", "Forecasting"),
-        (r"\bvariance\s+analysis\b", "Variance Analysis"),
-        (r"\bpayroll\b", "Payroll"),
-        
-        # Healthcare
-        (r"\bhcfa\b", "HCFA"),
-        (r"\bhipaa\b", "HIPAA"),
-        (r"\bemr\b|\behr\b", "EMR/EHR"),
-        (r"\bepic\b", "Epic"),
-        (r"\bcerner\b", "Cerner"),
-        (r"\bmeditech\b", "Meditech"),
-        (r"\bpatient\s+care\b", "Patient Care"),
-        (r"\btriag(?:e|ing)\b", "Triage"),
-        (r"\bclinical\b", "Clinical Skills"),
-        (r"\bphlebotomy\b", "Phlebotomy"),
-        (r"\bbls\b", "BLS"),
-        (r"\bacls\b", "ACLS"),
-        (r"\bcnor\b", "CNOR"),
-        (r"\brn\b|\bregistered\s+nurse\b", "Registered Nurse"),
-        
-         # General Business
-        (r"\bstrategic\s+planning\b", "Strategic Planning"),
-        (r"\bnegotiation\b", "Negotiation"),
-        (r"\boperations\b", "Operations Management"),
-        (r"\bcompliance\b", "Compliance"),
-        (r"\brisk\s+management\b", "Risk Management"),
-        (r"\bdata\s+entry\b", "Data Entry"),
-    ]
-    
-    text_lower = text.lower()
-    seen = set()
-    
-    for pattern, skill_name in tech_patterns:
-        if re.search(pattern, text_lower) and skill_name not in seen:
-            skills.append(skill_name)
-            seen.add(skill_name)
-    
-    return skills
+    """Extract skill names from text using the shared skill pattern catalog."""
+    return get_skill_matcher().find_names(text)
 
 
 def _extract_experience_requirement(text: str) -> Optional[str]:
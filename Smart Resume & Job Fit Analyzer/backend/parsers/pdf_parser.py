@@ -2,16 +2,27 @@
 PDF parsing module using pdfplumber.
 Extracts text with layout awareness for section detection.
 """
+import os
+import logging
 import pdfplumber
-from typing import Tuple
+from pdfplumber.utils.text import WordExtractor
+from typing import Iterator, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-def parse_pdf(file_path: str) -> Tuple[str, list[dict]]:
+
+def max_pdf_pages() -> int:
+    """Most pages parsed per PDF, from PDF_MAX_PAGES (0 means no limit)."""
+    return int(os.getenv("PDF_MAX_PAGES", "20"))
+
+
+def parse_pdf(file_path: str, max_pages: Optional[int] = None) -> Tuple[str, list[dict]]:
     """
     Parse a PDF file and extract text with positioning.
     
     Args:
         file_path: Path to the PDF file
+        max_pages: Page cap, see iter_pdf_pages
     
     Returns:
         Tuple of (raw_text, text_blocks)
@@ -21,18 +32,47 @@ def parse_pdf(file_path: str) -> Tuple[str, list[dict]]:
     text_blocks = []
     raw_text_parts = []
     
+    for text, blocks in iter_pdf_pages(file_path, max_pages):
+        raw_text_parts.append(text)
+        text_blocks.extend(blocks)
+    
+    raw_text = "\n".join(raw_text_parts)
+    return raw_text, text_blocks
+
+
+def iter_pdf_pages(file_path: str, max_pages: Optional[int] = None) -> Iterator[Tuple[str, list[dict]]]:
+    """
+    Parse a PDF page by page.
+    
+    Each page is laid out once and its words extracted once; both the page
+    text and the line blocks come from that pass. A page's layout objects
+    are released before it is yielded, and pages past the cap are never
+    laid out.
+    
+    Args:
+        file_path: Path to the PDF file
+        max_pages: Stop after this many pages; defaults to PDF_MAX_PAGES,
+            0 parses every page
+    
+    Yields:
+        (page_text, text_blocks) for each page, blocks as in parse_pdf
+    """
+    if max_pages is None:
+        max_pages = max_pdf_pages()
+    
     with pdfplumber.open(file_path) as pdf:
         for page_num, page in enumerate(pdf.pages, start=1):
-            # Extract text with layout
-            text = page.extract_text() or ""
-            raw_text_parts.append(text)
+            if max_pages and page_num > max_pages:
+                logger.warning(f"Parsed only the first {max_pages} of {len(pdf.pages)} pages of {file_path}")
+                break
             
-            # Extract text with positioning for layout analysis
-            words = page.extract_words()
+            text, words = _extract_text_and_words(page)
+            page.close()
             
             # Group words into lines based on vertical position
             lines = _group_words_into_lines(words)
             
+            text_blocks = []
             for line_num, line_data in enumerate(lines, start=1):
                 text_blocks.append({
                     "text": line_data["text"],
@@ -43,9 +83,23 @@ def parse_pdf(file_path: str) -> Tuple[str, list[dict]]:
                     "font_size": line_data.get("font_size"),
                     "is_bold": line_data.get("is_bold", False),
                 })
-    
-    raw_text = "\n".join(raw_text_parts)
-    return raw_text, text_blocks
+            yield text, text_blocks
+
+
+def _extract_text_and_words(page) -> Tuple[str, list[dict]]:
+    """
+    Same results as page.extract_text() and page.extract_words(), from one
+    word extraction instead of one per call.
+    """
+    wordmap = WordExtractor().extract_wordmap(page.chars)
+    # The layout arguments page.extract_text() passes by default
+    textmap = wordmap.to_textmap(
+        presorted=True,
+        layout_bbox=page.bbox,
+        layout_width=page.width,
+        layout_height=page.height,
+    )
+    return textmap.as_string, [word for word, _ in wordmap.tuples]
 
 
 def _group_words_into_lines(words: list[dict], tolerance: float = 3.0) -> list[dict]:
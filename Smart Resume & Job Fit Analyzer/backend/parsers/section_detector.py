@@ -5,6 +5,8 @@ Identifies Education, Experience, Projects, and Skills sections.
 import re
 from typing import Any
 
+from taxonomy.skill_matcher import get_skill_matcher
+
 
 # Section header patterns
 SECTION_PATTERNS = {
@@ -64,6 +66,56 @@ SECTION_PATTERNS = {
     ],
 }
 
+# Relaxed header line shape, to handle:
+# 1. Numbering: "2. Experience" or "II. Experience"
+# 2. Decoration: "--- Experience ---" or "*** Work History ***"
+# 3. Colons: "Experience:"
+# 4. Unicode dashes (en-dash, em-dash)
+# 5. Square brackets, parentheses
+_HEADER_PREFIX = (
+    "(?:^|\\n)\\s*"
+    "(?:[-–—*=_<>►▶→•\\[\\(#]+\\s*)?"  # Include arrows, bullets, hash, and brackets
+    "(?:\\d+[\\.)\\-]?|[IVX]+\\.)?\\s*"
+)
+_HEADER_SUFFIX = (
+    "(?:\\s*[:\\-–—._\\]\\)*=_<>►▶→•#]*)?\\s*"
+    "(?:$|\\n|[|,])"
+)
+
+
+def _compile_header(body: str) -> re.Pattern:
+    return re.compile(f"{_HEADER_PREFIX}(?:{body}){_HEADER_SUFFIX}", re.IGNORECASE)
+
+
+def _header_first_letters(pattern: str) -> set[str]:
+    """Letters a header pattern can start with; a leading optional group adds its own."""
+    if pattern.startswith("("):
+        end = pattern.index(")?")
+        return _header_first_letters(pattern[1:end]) | _header_first_letters(pattern[end + 2:])
+    return {pattern[0]}
+
+
+# Every section's patterns in one alternation, one named group per section type
+_ANY_SECTION_HEADER = _compile_header("|".join(
+    f"(?P<{section_type}>{'|'.join(patterns)})"
+    for section_type, patterns in SECTION_PATTERNS.items()
+))
+_SECTION_HEADERS = {
+    section_type: _compile_header("|".join(patterns))
+    for section_type, patterns in SECTION_PATTERNS.items()
+}
+# ASCII characters a single-line header can start with: decoration, numbering
+# (digits, roman numerals) or the first letter of a pattern
+_HEADER_START_CHARS = frozenset(
+    "-*=_<>[(#0123456789ivx"
+    + "".join(
+        letter
+        for patterns in SECTION_PATTERNS.values()
+        for pattern in patterns
+        for letter in _header_first_letters(pattern)
+    )
+)
+
 
 def detect_sections(raw_text: str, text_blocks: list[dict]) -> dict[str, Any]:
     """
@@ -157,39 +209,7 @@ def _find_section_boundaries(text_blocks: list[dict]) -> dict[str, tuple[int, in
     else:
         is_two_column = False
     
-    section_starts = []
-    
-    for idx, block in enumerate(text_blocks):
-        text = block["text"].lower().strip()
-        
-        # Check if this line is a section header
-        for section_type, patterns in SECTION_PATTERNS.items():
-            for pattern in patterns:
-                # Relaxed pattern matching to handle:
-                # 1. Numbering: "2. Experience" or "II. Experience"
-                # 2. Decoration: "--- Experience ---" or "*** Work History ***"
-                # 3. Colons: "Experience:"
-                # 4. Unicode dashes (en-dash, em-dash)
-                # 5. Square brackets, parentheses
-                
-                # Check for start of line with optional decoration, numbering, and trailing decoration
-                combined_pattern = (
-                    f"(?:^|\\n)\\s*"
-                    f"(?:[-–—*=_<>►▶→•\\[\\(#]+\\s*)?"  # Include arrows, bullets, hash, and brackets
-                    f"(?:\\d+[\\.)\\-]?|[IVX]+\\.)?\\s*"
-                    f"{pattern}"
-                    f"(?:\\s*[:\\-–—._\\]\\)*=_<>►▶→•#]*)?\\s*"
-                    f"(?:$|\\n|[|,])"
-                )
-                
-                # If exact match or very close match
-                if re.search(combined_pattern, text, re.IGNORECASE):
-                    # Guard against false positives in long text blocks (headers should be short)
-                    if len(text) < 80:
-                        # Store block index, section type, and column position
-                        left_pos = block.get("left", 0)
-                        section_starts.append((idx, section_type, left_pos))
-                        break
+    section_starts = _find_section_starts(text_blocks)
     
     if not section_starts:
         return {}
@@ -242,6 +262,37 @@ def _find_section_boundaries(text_blocks: list[dict]) -> dict[str, tuple[int, in
     return boundaries
 
 
+def _find_section_starts(text_blocks: list[dict]) -> list[tuple[int, str, float]]:
+    """
+    Find header blocks as (block index, section type, left position).
+    A multi-line block can open more than one section.
+    """
+    section_starts = []
+    
+    for idx, block in enumerate(text_blocks):
+        text = block["text"].lower().strip()
+        
+        # Guard against false positives in long text blocks (headers should be short)
+        if not text or len(text) >= 80:
+            continue
+        # Cheap rejection of ordinary lines before any regex runs
+        first = text[0]
+        if "\n" not in text and first.isascii() and first not in _HEADER_START_CHARS:
+            continue
+        
+        header = _ANY_SECTION_HEADER.search(text)
+        if header is None:
+            continue
+        
+        # Store block index, section type, and column position
+        left_pos = block.get("left", 0)
+        for section_type, pattern in _SECTION_HEADERS.items():
+            if section_type == header.lastgroup or pattern.search(text):
+                section_starts.append((idx, section_type, left_pos))
+    
+    return section_starts
+
+
 def _extract_section_from_raw_text(raw_text: str, section_type: str) -> str:
     """
     Extract section content directly from raw text using regex.
@@ -511,237 +562,23 @@ def _parse_skills(text: str, blocks: list[dict]) -> list:
 
 
 def _extract_skills_from_text(text: str) -> list:
-    """Extract skills from any text using pattern matching."""
+    """Extract skills from any text using the shared skill pattern catalog."""
     from api.schemas import ExtractedSkill, SkillCategory, ConfidenceLevel
     
     skills = []
-    
-    # Common technology keywords - expanded list
-    tech_patterns = [
-        # Programming Languages
-        (r"\bpython\b", "Python", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bjavascript\b|\bjs\b", "JavaScript", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\btypescript\b|\bts\b", "TypeScript", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bjava\b", "Java", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bc\+\+\b|cpp\b", "C++", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bc#\b|csharp\b", "C#", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\b(?<!en)go\b|\bgolang\b", "Go", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\brust\b", "Rust", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bruby\b", "Ruby", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bphp\b", "PHP", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bswift\b", "Swift", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bkotlin\b", "Kotlin", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bscala\b", "Scala", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\br\b(?=\s|,|\.)", "R", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bmatlab\b", "MATLAB", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bsql\b", "SQL", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bhtml\b", "HTML", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bcss\b", "CSS", SkillCategory.PROGRAMMING_LANGUAGES),
-        (r"\bshell\b|\bbash\b", "Bash", SkillCategory.PROGRAMMING_LANGUAGES),
-        
-        # Frameworks - Web
-        (r"\breact\b|\breactjs\b|react\.js\b", "React", SkillCategory.FRAMEWORKS),
-        (r"\bangular\b", "Angular", SkillCategory.FRAMEWORKS),
-        (r"\bvue\b|\bvuejs\b|vue\.js\b", "Vue.js", SkillCategory.FRAMEWORKS),
-        (r"\bnode\b|\bnodejs\b|node\.js\b", "Node.js", SkillCategory.FRAMEWORKS),
-        (r"\bexpress\b|express\.js\b", "Express.js", SkillCategory.FRAMEWORKS),
-        (r"\bdjango\b", "Django", SkillCategory.FRAMEWORKS),
-        (r"\bflask\b", "Flask", SkillCategory.FRAMEWORKS),
-        (r"\bfastapi\b", "FastAPI", SkillCategory.FRAMEWORKS),
-        (r"\bspring\s?boot\b|\bspring\b", "Spring Boot", SkillCategory.FRAMEWORKS),
-        (r"\bnext\.?js\b", "Next.js", SkillCategory.FRAMEWORKS),
-        (r"\btailwind\b", "Tailwind CSS", SkillCategory.FRAMEWORKS),
-        (r"\bbootstrap\b", "Bootstrap", SkillCategory.FRAMEWORKS),
-        (r"\bjquery\b", "jQuery", SkillCategory.FRAMEWORKS),
-        (r"\brails\b|ruby on rails\b", "Ruby on Rails", SkillCategory.FRAMEWORKS),
-        (r"\blasp\.?net\b|\.net\b", ".NET", SkillCategory.FRAMEWORKS),
-        
-        # ML/AI Frameworks
-        (r"\btensorflow\b", "TensorFlow", SkillCategory.FRAMEWORKS),
-        (r"\bpytorch\b", "PyTorch", SkillCategory.FRAMEWORKS),
-        (r"\bkeras\b", "Keras", SkillCategory.FRAMEWORKS),
-        (r"\bscikit-?learn\b|sklearn\b", "Scikit-learn", SkillCategory.FRAMEWORKS),
-        (r"\bpandas\b", "Pandas", SkillCategory.FRAMEWORKS),
-        (r"\bnumpy\b", "NumPy", SkillCategory.FRAMEWORKS),
-        (r"\bopencv\b", "OpenCV", SkillCategory.FRAMEWORKS),
-        (r"\bhugging\s?face\b", "Hugging Face", SkillCategory.FRAMEWORKS),
-        
-        # Databases
-        (r"\bpostgres(?:ql)?\b", "PostgreSQL", SkillCategory.DATABASES),
-        (r"\bmysql\b", "MySQL", SkillCategory.DATABASES),
-        (r"\bmongodb\b|\bmongo\b", "MongoDB", SkillCategory.DATABASES),
-        (r"\bredis\b", "Redis", SkillCategory.DATABASES),
-        (r"\bsqlite\b", "SQLite", SkillCategory.DATABASES),
-        (r"\boracle\b", "Oracle", SkillCategory.DATABASES),
-        (r"\bsql server\b|mssql\b", "SQL Server", SkillCategory.DATABASES),
-        (r"\bdynamodb\b", "DynamoDB", SkillCategory.DATABASES),
-        (r"\bcassandra\b", "Cassandra", SkillCategory.DATABASES),
-        (r"\belasticsearch\b", "Elasticsearch", SkillCategory.DATABASES),
-        (r"\bfirebase\b", "Firebase", SkillCategory.DATABASES),
-        
-        # Cloud & DevOps
-        (r"\baws\b|amazon web services\b", "AWS", SkillCategory.CLOUD),
-        (r"\bgcp\b|google cloud\b", "Google Cloud", SkillCategory.CLOUD),
-        (r"\bazure\b|microsoft azure\b", "Azure", SkillCategory.CLOUD),
-        (r"\bdocker\b", "Docker", SkillCategory.TOOLS),
-        (r"\bkubernetes\b|\bk8s\b", "Kubernetes", SkillCategory.TOOLS),
-        (r"\bgit\b(?!hub)", "Git", SkillCategory.TOOLS),
-        (r"\bgithub\b", "GitHub", SkillCategory.TOOLS),
-        (r"\bgitlab\b", "GitLab", SkillCategory.TOOLS),
-        (r"\bjenkins\b", "Jenkins", SkillCategory.TOOLS),
-        (r"\bci/?cd\b", "CI/CD", SkillCategory.TOOLS),
-        (r"\bterraform\b", "Terraform", SkillCategory.TOOLS),
-        (r"\bansible\b", "Ansible", SkillCategory.TOOLS),
-        (r"\blinux\b", "Linux", SkillCategory.TOOLS),
-        (r"\bnginx\b", "Nginx", SkillCategory.TOOLS),
-        (r"\bapache\b", "Apache", SkillCategory.TOOLS),
-        (r"\bjira\b", "Jira", SkillCategory.TOOLS),
-        (r"\bconfluence\b", "Confluence", SkillCategory.TOOLS),
-        (r"\bfigma\b", "Figma", SkillCategory.TOOLS),
-        (r"\bpostman\b", "Postman", SkillCategory.TOOLS),
-        
-        # Soft Skills
-        (r"\bcommunication\b", "Communication", SkillCategory.SOFT_SKILLS),
-        (r"\bleadership\b", "Leadership", SkillCategory.SOFT_SKILLS),
-        (r"\bteamwork\b|team\s*work\b", "Teamwork", SkillCategory.SOFT_SKILLS),
-        (r"\bproblem[- ]?solving\b", "Problem Solving", SkillCategory.SOFT_SKILLS),
-        (r"\bagile\b", "Agile", SkillCategory.SOFT_SKILLS),
-        (r"\bscrum\b", "Scrum", SkillCategory.SOFT_SKILLS),
-        (r"\badaptability\b", "Adaptability", SkillCategory.SOFT_SKILLS),
-        (r"\bcollaboration\b", "Collaboration", SkillCategory.SOFT_SKILLS),
-        (r"\btime[- ]?management\b", "Time Management", SkillCategory.SOFT_SKILLS),
-        (r"\bcritical[- ]?thinking\b", "Critical Thinking", SkillCategory.SOFT_SKILLS),
-        (r"\bwork[- ]?ethic\b|strong work ethic\b", "Strong Work Ethic", SkillCategory.SOFT_SKILLS),
-        (r"\battention[- ]?to[- ]?detail\b", "Attention to Detail", SkillCategory.SOFT_SKILLS),
-        (r"\bproject[- ]?management\b", "Project Management", SkillCategory.SOFT_SKILLS),
-        (r"\bcustomer[- ]?service\b", "Customer Service", SkillCategory.SOFT_SKILLS),
-        (r"\borganization\b|organizational\b", "Organization", SkillCategory.SOFT_SKILLS),
-        (r"\bpresentation\b", "Presentation", SkillCategory.SOFT_SKILLS),
-        (r"\bmultitasking\b|multi-tasking\b", "Multitasking", SkillCategory.SOFT_SKILLS),
-        (r"\bhandling[- ]?pressure\b", "Handling Pressure", SkillCategory.SOFT_SKILLS),
-        (r"\binterpersonal\b", "Interpersonal Skills", SkillCategory.SOFT_SKILLS),
-        (r"\bconflict[- ]?resolution\b", "Conflict Resolution", SkillCategory.SOFT_SKILLS),
-        (r"\bnegotiation\b", "Negotiation", SkillCategory.SOFT_SKILLS),
-        (r"\bcoaching\b|mentoring\b", "Coaching/Mentoring", SkillCategory.SOFT_SKILLS),
-        
-        # Business Tools (common in administrative roles)
-        (r"\bmicrosoft\s*excel\b|\bexcel\b", "Microsoft Excel", SkillCategory.TOOLS),
-        (r"\bmicrosoft\s*word\b|\bword\b", "Microsoft Word", SkillCategory.TOOLS),
-        (r"\bmicrosoft\s*powerpoint\b|\bpowerpoint\b", "Microsoft PowerPoint", SkillCategory.TOOLS),
-        (r"\bmicrosoft\s*office\b|\bms\s*office\b", "Microsoft Office", SkillCategory.TOOLS),
-        (r"\boutlook\b", "Outlook", SkillCategory.TOOLS),
-        (r"\bsalesforce\b", "Salesforce", SkillCategory.TOOLS),
-        (r"\bsap\b", "SAP", SkillCategory.TOOLS),
-        (r"\btableau\b", "Tableau", SkillCategory.TOOLS),
-        (r"\bpower\s*bi\b", "Power BI", SkillCategory.TOOLS),
-        
-        # Other
-        (r"\brest\s*api\b|\brestful\b", "REST API", SkillCategory.OTHER),
-        (r"\bgraphql\b", "GraphQL", SkillCategory.OTHER),
-        (r"\bmicroservices\b", "Microservices", SkillCategory.OTHER),
-        (r"\bmachine\s*learning\b|\bml\b", "Machine Learning", SkillCategory.OTHER),
-        (r"\bdeep\s*learning\b|\bdl\b", "Deep Learning", SkillCategory.OTHER),
-        (r"\bdata\s*science\b", "Data Science", SkillCategory.OTHER),
-        (r"\bnlp\b|natural language processing\b", "NLP", SkillCategory.OTHER),
-        (r"\bcomputer vision\b", "Computer Vision", SkillCategory.OTHER),
+    for match in get_skill_matcher().find(text):
+        # Find the original text context
+        start = max(0, match.start - 50)
+        end = min(len(text), match.end + 50)
+        context = text[start:end]
         
-        # Full Stack & Development Roles
-        (r"\bfull\s*stack\b|fullstack\b", "Full Stack Development", SkillCategory.OTHER),
-        (r"\bfront\s*end\b|frontend\b", "Frontend Development", SkillCategory.OTHER),
-        (r"\bback\s*end\b|backend\b", "Backend Development", SkillCategory.OTHER),
-        (r"\bweb\s*development\b|web\s*dev\b", "Web Development", SkillCategory.OTHER),
-        (r"\bmobile\s*development\b|mobile\s*dev\b|app\s*development\b", "Mobile Development", SkillCategory.OTHER),
-        (r"\bsoftware\s*development\b|software\s*dev\b", "Software Development", SkillCategory.OTHER),
-        
-        # Data Structures & Algorithms  
-        (r"\bdsa\b|data\s*structures?\s*(and|&)?\s*algorithms?\b", "Data Structures & Algorithms", SkillCategory.OTHER),
-        (r"\balgorithms?\b", "Algorithms", SkillCategory.OTHER),
-        (r"\bdata\s*structures?\b", "Data Structures", SkillCategory.OTHER),
-        (r"\boops?\b|object\s*oriented\s*programming\b", "Object-Oriented Programming", SkillCategory.OTHER),
-        (r"\boop\s*concepts?\b", "OOP Concepts", SkillCategory.OTHER),
-        
-        # Design Skills
-        (r"\bgraphic\s*design(er|ing)?\b", "Graphic Design", SkillCategory.TOOLS),
-        (r"\bui\s*/?ux\b|ux\s*/?ui\b", "UI/UX Design", SkillCategory.TOOLS),
-        (r"\buser\s*experience\b", "User Experience", SkillCategory.TOOLS),
-        (r"\buser\s*interface\b", "User Interface", SkillCategory.TOOLS),
-        (r"\bvisual\s*design\b", "Visual Design", SkillCategory.TOOLS),
-        (r"\bweb\s*design\b", "Web Design", SkillCategory.TOOLS),
-        (r"\badobe\s*photoshop\b|photoshop\b", "Adobe Photoshop", SkillCategory.TOOLS),
-        (r"\badobe\s*illustrator\b|illustrator\b", "Adobe Illustrator", SkillCategory.TOOLS),
-        (r"\badobe\s*xd\b", "Adobe XD", SkillCategory.TOOLS),
-        (r"\bcanva\b", "Canva", SkillCategory.TOOLS),
-        (r"\bsketch\b", "Sketch", SkillCategory.TOOLS),
-        (r"\binvision\b", "InVision", SkillCategory.TOOLS),
-        
-        # IoT & Embedded Systems
-        (r"\biot\b|internet\s*of\s*things\b", "IoT", SkillCategory.OTHER),
-        (r"\bembedded\s*systems?\b", "Embedded Systems", SkillCategory.OTHER),
-        (r"\barduino\b", "Arduino", SkillCategory.TOOLS),
-        (r"\braspberry\s*pi\b", "Raspberry Pi", SkillCategory.TOOLS),
-        (r"\bmicrocontrollers?\b", "Microcontrollers", SkillCategory.OTHER),
-        (r"\bhardware\b", "Hardware", SkillCategory.OTHER),
-        (r"\bfirmware\b", "Firmware", SkillCategory.OTHER),
-        (r"\bpcb\s*design\b", "PCB Design", SkillCategory.TOOLS),
-        
-        # Social Media & Content
-        (r"\bsocial\s*media\b", "Social Media", SkillCategory.TOOLS),
-        (r"\bcontent\s*creation\b|content\s*creator\b", "Content Creation", SkillCategory.OTHER),
-        (r"\bvideo\s*editing\b", "Video Editing", SkillCategory.TOOLS),
-        (r"\bpremiere\s*pro\b", "Adobe Premiere Pro", SkillCategory.TOOLS),
-        (r"\bafter\s*effects\b", "Adobe After Effects", SkillCategory.TOOLS),
-        (r"\bfinal\s*cut\b", "Final Cut Pro", SkillCategory.TOOLS),
-        
-        # Certifications/Platforms (for detection purposes)
-        (r"\bcoursera\b", "Coursera", SkillCategory.OTHER),
-        (r"\budemy\b", "Udemy", SkillCategory.OTHER),
-        (r"\bedx\b", "edX", SkillCategory.OTHER),
-        (r"\bforage\b", "Forage", SkillCategory.OTHER),
-        (r"\blinkedin\s*learning\b", "LinkedIn Learning", SkillCategory.OTHER),
-        
-        # Healthcare & Medical
-        (r"\bpatient\s*care\b", "Patient Care", SkillCategory.HEALTHCARE),
-        (r"\bvital\s*signs\b", "Vital Signs", SkillCategory.HEALTHCARE),
-        (r"\bphlebotomy\b", "Phlebotomy", SkillCategory.HEALTHCARE),
-        (r"\bemr\b|electronic\s*medical\s*records?\b", "EMR", SkillCategory.TOOLS),
-        (r"\behr\b|electronic\s*health\s*records?\b", "EHR", SkillCategory.TOOLS),
-        (r"\bhipaa\b", "HIPAA", SkillCategory.HEALTHCARE),
-        (r"\bbls\b|basic\s*life\s*support\b", "BLS", SkillCategory.CERTIFICATIONS),
-        (r"\bacls\b|advanced\s*cardiac\s*life\s*support\b", "ACLS", SkillCategory.CERTIFICATIONS),
-        (r"\bcpr\b", "CPR", SkillCategory.CERTIFICATIONS),
-        (r"\btriage\b", "Triage", SkillCategory.HEALTHCARE),
-        (r"\bmedication\s*administration\b", "Medication Administration", SkillCategory.HEALTHCARE),
-        (r"\bclinical\s*documentation\b", "Clinical Documentation", SkillCategory.HEALTHCARE),
-        (r"\bmedical\s*billing\b", "Medical Billing", SkillCategory.HEALTHCARE),
-        (r"\bicd[- ]?10\b", "ICD-10", SkillCategory.HEALTHCARE),
-        (r"\bepic\b", "Epic", SkillCategory.TOOLS),
-        (r"\bcerner\b", "Cerner", SkillCategory.TOOLS),
-        (r"\bmeditech\b", "Meditech", SkillCategory.TOOLS),
-        (r"\bnursing\b", "Nursing", SkillCategory.HEALTHCARE),
-        (r"\banatomy\b", "Anatomy", SkillCategory.HEALTHCARE),
-        (r"\bphysiology\b", "Physiology", SkillCategory.HEALTHCARE),
-    ]
-    
-    text_lower = text.lower()
-    seen = set()
-    
-    for pattern, canonical, category in tech_patterns:
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            if canonical not in seen:
-                seen.add(canonical)
-                # Find the original text context
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
-                
-                skills.append(ExtractedSkill(
-                    name=match.group(),
-                    canonical_name=canonical,
-                    category=category,
-                    confidence=ConfidenceLevel.HIGH,
-                    source_text=context,
-                ))
+        skills.append(ExtractedSkill(
+            name=match.text,
+            canonical_name=match.name,
+            category=SkillCategory(match.category),
+            confidence=ConfidenceLevel.HIGH,
+            source_text=context,
+        ))
     
     return skills
 
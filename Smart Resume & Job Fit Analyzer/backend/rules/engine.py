@@ -5,8 +5,10 @@ Rules always override AI signals.
 """
 import os
 import re
+import threading
 import yaml
-from typing import Optional
+from collections import OrderedDict
+from typing import NamedTuple, Optional
 
 from api.schemas import (
     ParsedResume,
@@ -15,19 +17,74 @@ from api.schemas import (
     ScoreBreakdown,
     ImprovementSuggestion,
     SkillMatch,
+    ExperienceSignals,
+    ConfidenceLevel,
 )
-from .matchers import match_skills
+from .matchers import match_skills, normalize_jd_skills
+
+
+OWNERSHIP_VERBS = ["led", "managed", "architected", "designed", "created", "spearheaded", "built", "developed"]
+LEADERSHIP_VERBS = ["led", "mentored", "managed", "supervised", "directed"]
+STRONG_VERBS = {"led", "developed", "created", "managed", "designed", "implemented", "architected", "improved", "increased", "decreased", "saved", "launched", "engineered", "optimized", "spearheaded", "forecasted", "audited", "diagnosed", "treated", "administered"}
+
+# Finance roles: require currency symbols or specific metric keywords with numbers
+# e.g. "$50k", "15% margin", "budget of 50k"
+FINANCE_METRICS = [
+    r"[\$€£]\s*\d+",           # Currency + number
+    r"\d+\s*%",                # Percentage
+    r"\d+\s*(?:k|m|b)\+?",     # Short numbers (50k, 10m)
+    r"budget\s*(?:of)?\s*[\$€£]?\d+", # Budget + number
+    r"saved\s*[\$€£]?\d+",     # Saved + number
+    r"revenue",                # specific enough? maybe 
+    r"profit\s*margin" 
+]
+
+# Healthcare: "patient" is too generic if just "saw patients".
+# Look for "caseload", "acuity", "triage", "compliance" or numbers + patient
+HEALTH_CONTEXT = [
+    r"caseload",
+    r"acuity",
+    r"triage",
+    r"vital\s*signs",
+    r"compliance",
+    r"hipaa",
+    r"\d+\s*patients", # "20 patients"
+    r"administer(?:ed)?\s*med" # "administered medication" - clearer action
+]
+
+
+def _compile_all(patterns: list[str]) -> list[re.Pattern]:
+    """Compile case-insensitive patterns once instead of on every search."""
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+def _search_any(patterns: list[re.Pattern], text: str) -> bool:
+    return any(pattern.search(text) for pattern in patterns)
+
+
+_FINANCE_METRICS = _compile_all(FINANCE_METRICS)
+_HEALTH_CONTEXT = _compile_all(HEALTH_CONTEXT)
+_GENERAL_METRICS = re.compile(r'\d+%|\d+ (users|customers|requests|\$)|[\$€£]\d+')
+
+
+class JDContext(NamedTuple):
+    """Everything evaluate() derives from the JD alone, computed once per JD."""
+    required_canonical: list[str]
+    optional_canonical: list[str]
+    domain: str
+    is_tech_role: bool
 
 
 class RuleEngine:
     """Deterministic rule-based evaluation engine."""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, context_cache_size: int = 64):
         """
         Initialize the engine with scoring configuration.
         
         Args:
             config_path: Path to config.yaml, defaults to same directory
+            context_cache_size: Number of recent JDContexts kept for reuse
         """
         if config_path is None:
             config_path = os.path.join(os.path.dirname(__file__), "config.yaml")
@@ -38,16 +95,65 @@ class RuleEngine:
         self.penalties = self.config["scoring"]["penalties"]
         self.bounds = self.config["scoring"]["score_bounds"]
         self.enforcement = self.config["scoring"]["required_skill_enforcement"]
+        
+        # (points per match, compiled patterns) per experience signal, in config order
+        signals = self.config.get("experience_signals", {})
+        self._signal_patterns = [
+            (points * signals[name]["weight"], _compile_all(signals[name]["patterns"]))
+            for name, points in (("leadership", 10), ("scale", 10), ("technical_depth", 8))
+            if name in signals
+        ]
+        
+        self._context_cache_size = context_cache_size
+        self._contexts: OrderedDict[tuple, JDContext] = OrderedDict()
+        self._contexts_lock = threading.Lock()
     
     def _load_config(self, path: str) -> dict:
         """Load configuration from YAML."""
         with open(path, "r", encoding="utf-8") as f:
             return yaml.safe_load(f)
     
+    def jd_context(self, job_description: ParsedJobDescription) -> JDContext:
+        """
+        Precompute the JD-only parts of an evaluation.
+        
+        Contexts are memoized on the JD fields they are derived from, so
+        evaluating many resumes against one JD normalizes its skills and
+        detects its domain once.
+        """
+        key = (
+            job_description.title,
+            job_description.raw_text,
+            tuple(job_description.required_skills),
+            tuple(job_description.optional_skills),
+        )
+        with self._contexts_lock:
+            context = self._contexts.get(key)
+            if context is not None:
+                self._contexts.move_to_end(key)
+                return context
+        
+        domain = self._detect_domain(job_description)
+        raw_lower = job_description.raw_text.lower()
+        context = JDContext(
+            required_canonical=normalize_jd_skills(job_description.required_skills),
+            optional_canonical=normalize_jd_skills(job_description.optional_skills),
+            domain=domain,
+            is_tech_role=domain in ["software_engineering", "data_science"] or
+                         any(s in raw_lower for s in ["software", "developer", "engineer", "data", "full stack"]),
+        )
+        
+        with self._contexts_lock:
+            self._contexts[key] = context
+            while len(self._contexts) > self._context_cache_size:
+                self._contexts.popitem(last=False)
+        return context
+    
     def evaluate(
         self,
         resume: ParsedResume,
         job_description: ParsedJobDescription,
+        context: Optional[JDContext] = None,
     ) -> EvaluationResult:
         """
         Evaluate resume against job description.
@@ -55,10 +161,14 @@ class RuleEngine:
         Args:
             resume: Parsed resume data
             job_description: Parsed job description data
+            context: jd_context(job_description), when the caller already has it
         
         Returns:
             EvaluationResult with score, breakdown, and suggestions
         """
+        if context is None:
+            context = self.jd_context(job_description)
+        
         # Step 1: Match skills
         skill_results = match_skills(
             resume_skills=[s.dict() for s in resume.skills],
@@ -66,6 +176,8 @@ class RuleEngine:
             jd_optional_skills=job_description.optional_skills,
             full_match_threshold=self.thresholds["full_match"],
             partial_match_threshold=self.thresholds["partial_match"],
+            jd_required_canonical=context.required_canonical,
+            jd_optional_canonical=context.optional_canonical,
         )
         
         # Step 2: Calculate component scores
@@ -125,14 +237,9 @@ class RuleEngine:
         )
         
         # Step 8: Generate improvement suggestions
-        suggestions = self._generate_suggestions(skill_results, resume, job_description)
+        suggestions = self._generate_suggestions(skill_results, resume, context)
         
         # Step 9: Analyze experience signals
-        from api.schemas import ExperienceSignals, ConfidenceLevel
-        
-        ownership_verbs = ["led", "managed", "architected", "designed", "created", "spearheaded", "built", "developed"]
-        leadership_verbs = ["led", "mentored", "managed", "supervised", "directed"]
-        
         leadership_signals = []
         ownership_count = 0
         relevant_years = 0.0 # simplified placeholder
@@ -143,11 +250,11 @@ class RuleEngine:
             
             for exp in resume.experience:
                 text_lower = (exp.title + " " + exp.description + " " + " ".join(exp.responsibilities)).lower()
-                if any(v in text_lower for v in leadership_verbs):
+                if any(v in text_lower for v in LEADERSHIP_VERBS):
                     leadership_signals.append(f"Leadership detected in {exp.company}")
                 
                 # Check for ownership in title or action verbs
-                if any(v in text_lower for v in ownership_verbs):
+                if any(v in text_lower for v in OWNERSHIP_VERBS):
                     ownership_count += 1
         
         ownership_strength = "High" if ownership_count >= 2 else "Medium" if ownership_count > 0 else "Low"
@@ -223,32 +330,13 @@ class RuleEngine:
             return 50.0  # Neutral if no experience section
         
         score = 50.0  # Base score
-        signals = self.config.get("experience_signals", {})
         
-        # Analyze experience descriptions
+        # Analyze experience descriptions for leadership, scale and technical depth
         for exp in resume.experience:
             text = exp.description.lower() + " ".join(exp.responsibilities).lower()
-            
-            # Check for leadership signals
-            if "leadership" in signals:
-                for pattern in signals["leadership"]["patterns"]:
-                    if re.search(pattern, text, re.IGNORECASE):
-                        score += 10 * signals["leadership"]["weight"]
-                        break
-            
-            # Check for scale signals
-            if "scale" in signals:
-                for pattern in signals["scale"]["patterns"]:
-                    if re.search(pattern, text, re.IGNORECASE):
-                        score += 10 * signals["scale"]["weight"]
-                        break
-            
-            # Check for technical depth
-            if "technical_depth" in signals:
-                for pattern in signals["technical_depth"]["patterns"]:
-                    if re.search(pattern, text, re.IGNORECASE):
-                        score += 8 * signals["technical_depth"]["weight"]
-                        break
+            for points, patterns in self._signal_patterns:
+                if _search_any(patterns, text):
+                    score += points
         
         return min(100.0, score)
     
@@ -324,15 +412,15 @@ This score reflects:
         self,
         skill_results: dict,
         resume: ParsedResume,
-        job_description: ParsedJobDescription,
+        context: JDContext,
     ) -> list[ImprovementSuggestion]:
         """Generate actionable improvement suggestions."""
         suggestions = []
         max_suggestions = self.config.get("output", {}).get("max_suggestions", 5)
         
         
-        # Determine domain for specific checks
-        domain = self._detect_domain(job_description)
+        # Domain for specific checks
+        domain = context.domain
         
         # Priority 1: Formatting & Structure Gaps (Immediate fix)
         # Check contact info
@@ -343,10 +431,7 @@ This score reflects:
             contact_gaps.append("phone number")
         
         # Check for LinkedIn/GitHub for tech roles
-        is_tech_role = domain in ["software_engineering", "data_science"] or \
-                      any(s in job_description.raw_text.lower() for s in ["software", "developer", "engineer", "data", "full stack"])
-                      
-        if is_tech_role:
+        if context.is_tech_role:
             if not resume.contact_info.get("linkedin"):
                 contact_gaps.append("LinkedIn profile")
             if not resume.contact_info.get("github") and "github" not in str(resume.contact_info).lower():
@@ -380,19 +465,8 @@ This score reflects:
             # Domain-Specific Checks
             if domain == "finance":
                 # Stricter checks: require currency symbols or specific metric keywords with numbers
-                # e.g. "$50k", "15% margin", "budget of 50k"
-                finance_metrics = [
-                    r"[\$€£]\s*\d+",           # Currency + number
-                    r"\d+\s*%",                # Percentage
-                    r"\d+\s*(?:k|m|b)\+?",     # Short numbers (50k, 10m)
-                    r"budget\s*(?:of)?\s*[\$€£]?\d+", # Budget + number
-                    r"saved\s*[\$€£]?\d+",     # Saved + number
-                    r"revenue",                # specific enough? maybe 
-                    r"profit\s*margin" 
-                ]
-                
                 has_finance_metrics = any(
-                    any(re.search(pat, " ".join(exp.responsibilities), re.IGNORECASE) for pat in finance_metrics)
+                    _search_any(_FINANCE_METRICS, " ".join(exp.responsibilities))
                     for exp in resume.experience
                 )
                 
@@ -405,21 +479,8 @@ This score reflects:
             
             elif domain == "healthcare":
                 # Healthcare: Check for patient volume or specific clinical terms
-                # "patient" is too generic if just "saw patients". 
-                # Look for "caseload", "acuity", "triage", "compliance" or numbers + patient
-                health_context = [
-                    r"caseload",
-                    r"acuity",
-                    r"triage",
-                    r"vital\s*signs",
-                    r"compliance",
-                    r"hipaa",
-                    r"\d+\s*patients", # "20 patients"
-                    r"administer(?:ed)?\s*med" # "administered medication" - clearer action
-                ]
-                
                 has_health_context = any(
-                    any(re.search(pat, " ".join(exp.responsibilities), re.IGNORECASE) for pat in health_context)
+                    _search_any(_HEALTH_CONTEXT, " ".join(exp.responsibilities))
                     for exp in resume.experience
                 )
                 
@@ -431,7 +492,6 @@ This score reflects:
                     ))
 
             # General Weak Verbs Check
-            strong_verbs = {"led", "developed", "created", "managed", "designed", "implemented", "architected", "improved", "increased", "decreased", "saved", "launched", "engineered", "optimized", "spearheaded", "forecasted", "audited", "diagnosed", "treated", "administered"}
             weak_starts = 0
             total_bullets = 0
             
@@ -439,7 +499,7 @@ This score reflects:
                 for bullet in exp.responsibilities:
                     total_bullets += 1
                     first_word = bullet.strip().split()[0].lower() if bullet.strip() else ""
-                    if first_word not in strong_verbs and not first_word.endswith("ed"): # Simple heuristic
+                    if first_word not in STRONG_VERBS and not first_word.endswith("ed"): # Simple heuristic
                          weak_starts += 1
             
             if total_bullets > 0 and (weak_starts / total_bullets) > 0.5:
@@ -451,8 +511,7 @@ This score reflects:
 
             # General Metrics Check (skip if specific domain check failed already to avoid double dipping)
             has_metrics = any(
-                re.search(r'\d+%|\d+ (users|customers|requests|\$)|[\$€£]\d+', 
-                         " ".join(exp.responsibilities))
+                _GENERAL_METRICS.search(" ".join(exp.responsibilities))
                 for exp in resume.experience
             )
             if not has_metrics and domain != "finance": # Finance already checked specifically
@@ -12,6 +12,8 @@ def match_skills(
     jd_optional_skills: list[str],
     full_match_threshold: float = 90.0,
     partial_match_threshold: float = 70.0,
+    jd_required_canonical: Optional[list[str]] = None,
+    jd_optional_canonical: Optional[list[str]] = None,
 ) -> dict:
     """
     Match resume skills against job description requirements.
@@ -22,6 +24,9 @@ def match_skills(
         jd_optional_skills: List of optional skill names from JD
         full_match_threshold: Score threshold for full match
         partial_match_threshold: Score threshold for partial match
+        jd_required_canonical: Canonical names of jd_required_skills, when
+            already normalized (see normalize_jd_skills)
+        jd_optional_canonical: Canonical names of jd_optional_skills
     
     Returns:
         Dictionary with matched, partial, and missing skills with evidence
@@ -56,9 +61,13 @@ def match_skills(
         canonical, _, _ = normalizer.normalize(name)
         resume_skill_map[canonical.lower()] = skill
     
+    if jd_required_canonical is None:
+        jd_required_canonical = normalize_jd_skills(jd_required_skills)
+    if jd_optional_canonical is None:
+        jd_optional_canonical = normalize_jd_skills(jd_optional_skills)
+    
     # Match required skills
-    for jd_skill in jd_required_skills:
-        jd_canonical, _, _ = normalizer.normalize(jd_skill)
+    for jd_skill, jd_canonical in zip(jd_required_skills, jd_required_canonical):
         match_result = _find_skill_match(
             jd_canonical,
             resume_skill_map,
@@ -112,8 +121,7 @@ def match_skills(
             results["stats"]["missing_count"] += 1
     
     # Match optional skills
-    for jd_skill in jd_optional_skills:
-        jd_canonical, _, _ = normalizer.normalize(jd_skill)
+    for jd_skill, jd_canonical in zip(jd_optional_skills, jd_optional_canonical):
         match_result = _find_skill_match(
             jd_canonical,
             resume_skill_map,
@@ -169,6 +177,12 @@ def match_skills(
     return results
 
 
+def normalize_jd_skills(jd_skills: list[str]) -> list[str]:
+    """Canonical name of each JD skill, in order."""
+    normalizer = get_normalizer()
+    return [normalizer.normalize(skill)[0] for skill in jd_skills]
+
+
 def _find_skill_match(
     jd_canonical: str,
     resume_skill_map: dict,
@@ -0,0 +1,277 @@
+import os
+import io
+import asyncio
+import bisect
+import logging
+import tempfile
+import threading
+import zipfile
+import zlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Optional
+
+from api.schemas import ParsedJobDescription, ParsedResume
+from services.parse_cache import parse_cache
+
+logger = logging.getLogger(__name__)
+
+RESUME_TYPES = ("pdf", "docx")
+# Largest archive member read into memory (guards against ZIP bombs)
+MAX_MEMBER_BYTES = 10 * 1024 * 1024
+
+
+# Parser pool shared by every batch, created on first use or at startup
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 1
+_executor_lock = threading.Lock()
+
+
+def default_workers() -> int:
+    """Parser processes for the server, from BATCH_EVAL_WORKERS (defaults to the CPU count, at most 4)."""
+    return int(os.getenv("BATCH_EVAL_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+def get_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    The process pool shared by all batches, sized by BATCH_EVAL_WORKERS.
+    None when that is 1: resumes are then parsed on a thread.
+
+    Workers are started by forkserver (spawn where unavailable) rather than
+    forked from the server, which already runs threads that may hold locks.
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None and default_workers() > 1:
+            _executor_workers = default_workers()
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _executor = ProcessPoolExecutor(max_workers=_executor_workers, mp_context=context)
+            logger.info(f"Batch screening pool started with {_executor_workers} workers")
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the shared pool; the next batch starts a new one."""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _executor_workers = 1
+
+
+def max_batch_size() -> int:
+    """Most resumes accepted in one batch, from BATCH_EVAL_MAX_FILES."""
+    return int(os.getenv("BATCH_EVAL_MAX_FILES", "500"))
+
+
+def max_batch_bytes() -> int:
+    """Largest total size of the resumes in one batch, uncompressed, from BATCH_EVAL_MAX_BYTES."""
+    return int(os.getenv("BATCH_EVAL_MAX_BYTES", str(200 * 1024 * 1024)))
+
+
+class BatchTooLargeError(ValueError):
+    """A batch holds more resumes or more resume bytes than allowed."""
+
+
+def expand_uploads(
+    uploads: list[tuple[str, bytes]],
+    max_resumes: Optional[int] = None,
+    max_total_bytes: Optional[int] = None,
+) -> tuple[list[tuple[str, str, bytes]], list[dict]]:
+    """
+    Flatten uploaded files and ZIP archives into resumes.
+
+    Archive members are only decompressed while the batch stays within the
+    limits, using their declared sizes, so an archive of many small but
+    highly compressible members is rejected before it is inflated.
+
+    Args:
+        uploads: (filename, contents) pairs as received
+        max_resumes: Most resumes allowed (defaults to max_batch_size())
+        max_total_bytes: Most resume bytes allowed, uncompressed
+            (defaults to max_batch_bytes())
+
+    Returns:
+        Tuple of (resumes, skipped)
+        - resumes: (filename, file_ext, contents) for every PDF/DOCX, archive
+          members named "archive.zip/member.pdf"
+        - skipped: {"filename", "detail"} for everything else, including
+          archive members that cannot be decompressed
+
+    Raises:
+        BatchTooLargeError: If either limit is exceeded
+    """
+    if max_resumes is None:
+        max_resumes = max_batch_size()
+    if max_total_bytes is None:
+        max_total_bytes = max_batch_bytes()
+
+    resumes = []
+    skipped = []
+    total_bytes = 0
+
+    def reserve(size: int) -> None:
+        nonlocal total_bytes
+        if len(resumes) >= max_resumes:
+            raise BatchTooLargeError(f"Too many resumes (limit {max_resumes})")
+        total_bytes += size
+        if total_bytes > max_total_bytes:
+            raise BatchTooLargeError(f"Resumes exceed {max_total_bytes} bytes uncompressed")
+
+    for filename, contents in uploads:
+        file_ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
+        if file_ext in RESUME_TYPES:
+            reserve(len(contents))
+            resumes.append((filename, file_ext, contents))
+            continue
+        if file_ext != "zip":
+            skipped.append({"filename": filename, "detail": "Unsupported file type"})
+            continue
+
+        try:
+            archive = zipfile.ZipFile(io.BytesIO(contents))
+        except zipfile.BadZipFile:
+            skipped.append({"filename": filename, "detail": "Invalid ZIP archive"})
+            continue
+
+        with archive:
+            for member in archive.infolist():
+                name = f"{filename}/{member.filename}"
+                member_ext = member.filename.lower().rsplit(".", 1)[-1]
+                # Skip folders and macOS metadata ("__MACOSX/", "._resume.pdf")
+                if member.is_dir() or member.filename.startswith("__MACOSX/"):
+                    continue
+                if os.path.basename(member.filename).startswith("."):
+                    continue
+                if member_ext not in RESUME_TYPES:
+                    skipped.append({"filename": name, "detail": "Unsupported file type"})
+                elif member.file_size > MAX_MEMBER_BYTES:
+                    skipped.append({"filename": name, "detail": "File too large"})
+                else:
+                    # The declared size also caps how much read() inflates
+                    reserve(member.file_size)
+                    try:
+                        member_contents = archive.read(member)
+                    except (zipfile.BadZipFile, RuntimeError, NotImplementedError, zlib.error):
+                        # Corrupt, encrypted or unsupported compression
+                        total_bytes -= member.file_size
+                        skipped.append({"filename": name, "detail": "Unreadable archive member"})
+                        continue
+                    resumes.append((name, member_ext, member_contents))
+
+    return resumes, skipped
+
+
+def parse_resume_bytes(contents: bytes, file_ext: str) -> ParsedResume:
+    """
+    Parse an in-memory resume through a temporary file.
+    Runs inside pool workers, so it must stay importable at module level.
+    """
+    from parsers import parse_resume
+
+    fd, path = tempfile.mkstemp(suffix=f".{file_ext}")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(contents)
+        return parse_resume(path, file_ext)
+    finally:
+        os.remove(path)
+
+
+async def screen_resumes(
+    resumes: list[tuple[str, str, bytes]],
+    job_description: ParsedJobDescription,
+    workers: Optional[int] = None,
+) -> AsyncIterator[dict]:
+    """
+    Parse resumes in a process pool and evaluate each against one JD.
+
+    Yields a "result" record per resume in completion order, with its rank
+    among the resumes finished so far, an "error" record per resume that
+    failed, then a "summary" record with the final ranking (score, then
+    matched skills, then upload order).
+
+    Args:
+        resumes: (filename, file_ext, contents) from expand_uploads
+        job_description: JD parsed once for the whole batch
+        workers: Most of the shared pool's workers this batch may use at
+            once; it can lower BATCH_EVAL_WORKERS but never exceed it
+    """
+    from rules.engine import get_engine
+
+    engine = get_engine()
+    context = engine.jd_context(job_description)
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    server_workers = _executor_workers if executor is not None else 1
+    limit = max(1, min(workers or server_workers, server_workers))
+
+    # Bounds this batch's parses in the shared pool, taken only on a cache miss
+    parse_slots = asyncio.Semaphore(limit)
+
+    def lookup(contents: bytes, file_ext: str):
+        cache_key = parse_cache.make_key(contents, file_ext)
+        return cache_key, parse_cache.get(cache_key)
+
+    async def screen_one(contents: bytes, file_ext: str):
+        # Hashing, cache disk I/O and evaluation all stay off the event loop
+        cache_key, resume = await loop.run_in_executor(None, lookup, contents, file_ext)
+        if resume is None:
+            async with parse_slots:
+                resume = await loop.run_in_executor(executor, parse_resume_bytes, contents, file_ext)
+            await loop.run_in_executor(None, parse_cache.put, cache_key, resume)
+        return await loop.run_in_executor(None, engine.evaluate, resume, job_description, context)
+
+    ranked_keys = []
+    ranking = []
+    failed = 0
+
+    # Each resume is looked up, parsed on a miss and evaluated independently
+    tasks = {
+        asyncio.ensure_future(screen_one(contents, file_ext)): (index, filename)
+        for index, (filename, file_ext, contents) in enumerate(resumes)
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda task: tasks[task][0]):
+                index, filename = tasks[task]
+                try:
+                    result = task.result()
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Batch screening failed for {filename}: {str(e)}")
+                    yield {"type": "error", "index": index, "filename": filename, "detail": str(e)}
+                    continue
+
+                rank_key = (-result.job_fit_score, -result.matched_count, index)
+                position = bisect.bisect(ranked_keys, rank_key)
+                ranked_keys.insert(position, rank_key)
+                ranking.insert(position, {
+                    "index": index,
+                    "filename": filename,
+                    "job_fit_score": result.job_fit_score,
+                })
+                yield {
+                    "type": "result",
+                    "index": index,
+                    "filename": filename,
+                    "rank": position + 1,
+                    "job_fit_score": result.job_fit_score,
+                    "result": result.dict(),
+                }
+    finally:
+        # Client went away: drop this batch's parses that have not started
+        for task in pending:
+            task.cancel()
+
+    yield {
+        "type": "summary",
+        "total": len(resumes),
+        "evaluated": len(ranking),
+        "failed": failed,
+        "ranking": [dict(entry, rank=rank) for rank, entry in enumerate(ranking, start=1)],
+    }
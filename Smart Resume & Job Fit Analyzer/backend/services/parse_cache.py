@@ -0,0 +1,231 @@
+import os
+import hashlib
+import logging
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from typing import Optional
+from pathlib import Path
+
+from api.schemas import ParsedResume
+from parsers.pdf_parser import max_pdf_pages
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(os.path.dirname(os.path.dirname(__file__)))
+
+# Bump when parsing output changes in a way the fingerprint below cannot see
+PARSER_VERSION = "1"
+
+# Everything that shapes a ParsedResume: the parsers, the skill taxonomy and the schema
+PARSER_SOURCES = ("parsers/*.py", "taxonomy/*.py", "taxonomy/*.yaml", "api/schemas.py")
+
+
+def _parser_fingerprint() -> str:
+    """SHA-256 of PARSER_VERSION, the pdfplumber version and the parser sources."""
+    digest = hashlib.sha256(PARSER_VERSION.encode())
+    try:
+        digest.update(version("pdfplumber").encode())
+    except PackageNotFoundError:
+        pass
+    for pattern in PARSER_SOURCES:
+        for path in sorted(BACKEND_DIR.glob(pattern)):
+            digest.update(path.relative_to(BACKEND_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+PARSER_FINGERPRINT = _parser_fingerprint()
+
+
+class ParseCache:
+    """
+    Content-addressed cache of parsed resumes.
+
+    Keys are the SHA-256 of the parser fingerprint, the PDF page cap, the
+    file type and the uploaded bytes, so a retried upload or the same resume
+    scored against several JDs is parsed once, and a deploy that changes
+    parsing never serves resumes parsed by the previous code.
+    Entries live in a bounded in-memory LRU backed by one JSON file per key;
+    both tiers expire entries after ttl_hours and drop the oldest beyond
+    their size limits.
+    """
+
+    def __init__(
+        self,
+        storage_dir: str = "parse_cache",
+        ttl_hours: float = 24,
+        max_memory_entries: int = 256,
+        max_disk_entries: int = 2000,
+    ):
+        self.storage_dir = BACKEND_DIR / storage_dir
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+
+        self._lock = threading.Lock()
+        # key -> (stored_at, ParsedResume), least recently used first
+        self._memory: OrderedDict[str, tuple[float, ParsedResume]] = OrderedDict()
+        # key -> stored_at, oldest write first
+        self._disk: OrderedDict[str, float] = OrderedDict()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        entries = []
+        for file_path in self.storage_dir.glob("*.json"):
+            try:
+                entries.append((file_path.stat().st_mtime, file_path.stem))
+            except OSError:
+                continue
+        for mtime, key in sorted(entries):
+            self._disk[key] = mtime
+        logger.info(f"Parse cache initialized at: {self.storage_dir} ({len(self._disk)} entries)")
+
+    @staticmethod
+    def make_key(contents: bytes, file_ext: str) -> str:
+        """SHA-256 of the parser fingerprint, page cap, file type and contents."""
+        digest = hashlib.sha256(PARSER_FINGERPRINT.encode())
+        digest.update(f"\0{max_pdf_pages()}\0{file_ext.lower()}\0".encode())
+        digest.update(contents)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.storage_dir / f"{key}.json"
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return now - stored_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[ParsedResume]:
+        """Return a copy of the cached resume, or None on a miss."""
+        now = time.time()
+        stale = []
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._expired(entry[0], now):
+                stale = self._forget(key)
+                entry = None
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+            else:
+                stored_at = self._disk.get(key)
+                if stored_at is not None and self._expired(stored_at, now):
+                    stale = self._forget(key)
+                    stored_at = None
+                if stored_at is None:
+                    self._stats["misses"] += 1
+        self._unlink(stale)
+
+        # Cached models are never mutated, so copying can happen unlocked
+        if entry is not None:
+            return entry[1].copy(deep=True)
+        if stored_at is None:
+            return None
+
+        # Disk reads and parsing happen outside the lock
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                resume = ParsedResume.parse_raw(f.read())
+        except Exception as e:
+            logger.warning(f"Dropping unreadable parse cache entry {key}: {e}")
+            with self._lock:
+                stale = self._forget(key) if self._disk.get(key) == stored_at else []
+                self._stats["misses"] += 1
+            self._unlink(stale)
+            return None
+
+        with self._lock:
+            self._remember(key, stored_at, resume)
+            self._stats["disk_hits"] += 1
+        return resume.copy(deep=True)
+
+    def put(self, key: str, resume: ParsedResume) -> None:
+        """Cache a freshly parsed resume in memory and on disk."""
+        now = time.time()
+        resume = resume.copy(deep=True)
+        written = False
+        try:
+            # Unique temp file per writer, so concurrent puts of one key cannot collide
+            fd, tmp_path = tempfile.mkstemp(dir=self.storage_dir, prefix=f"{key}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(resume.json())
+                os.replace(tmp_path, self._path(key))
+                written = True
+            finally:
+                if not written and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except Exception as e:
+            logger.error(f"Failed to write parse cache entry {key}: {str(e)}")
+
+        stale = []
+        with self._lock:
+            self._remember(key, now, resume)
+            if written:
+                self._disk.pop(key, None)
+                self._disk[key] = now
+            self._stats["stores"] += 1
+
+            # Oldest writes are at the front: drop expired ones, then any over the limit
+            while self._disk:
+                oldest_key, stored_at = next(iter(self._disk.items()))
+                if not self._expired(stored_at, now) and len(self._disk) <= self.max_disk_entries:
+                    break
+                stale += self._forget(oldest_key)
+        self._unlink(stale)
+
+    def _remember(self, key: str, stored_at: float, resume: ParsedResume) -> None:
+        self._memory[key] = (stored_at, resume)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _forget(self, key: str) -> list[str]:
+        """Drop a key from both indexes (lock held); returns the keys whose files to delete."""
+        self._memory.pop(key, None)
+        if self._disk.pop(key, None) is not None:
+            self._stats["evictions"] += 1
+            return [key]
+        return []
+
+    def _unlink(self, keys: list[str]) -> None:
+        """Delete entry files, called without the lock."""
+        for key in keys:
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Error removing parse cache entry {key}: {e}")
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            stale = []
+            for key in list(self._disk):
+                stale += self._forget(key)
+            self._memory.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+        self._unlink(stale)
+
+    def stats(self) -> dict:
+        """Hit/miss counters, hit rate and current sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hits"] = stats["memory_hits"] + stats["disk_hits"]
+            stats["lookups"] = lookups
+            stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_entries"] = len(self._disk)
+            return stats
+
+# Global instance
+parse_cache = ParseCache(
+    ttl_hours=float(os.getenv("PARSE_CACHE_TTL_HOURS", "24")),
+    max_memory_entries=int(os.getenv("PARSE_CACHE_MAX_MEMORY_ENTRIES", "256")),
+    max_disk_entries=int(os.getenv("PARSE_CACHE_MAX_DISK_ENTRIES", "2000")),
+)
@@ -1,23 +1,56 @@
 import os
 import json
 import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 from pathlib import Path
 
+import orjson
+
 from api.schemas import SessionData
 
 logger = logging.getLogger(__name__)
 
+
+class _CleanupTimer:
+    """Daemon thread calling cleanup() every interval_seconds until stopped."""
+
+    def __init__(self, cleanup, interval_seconds: float):
+        self._cleanup = cleanup
+        self._interval = interval_seconds
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="session-cleanup", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self._cleanup()
+            except Exception as e:
+                logger.error(f"Session cleanup failed: {e}")
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
 class FileSessionManager:
     """
     Manages session persistence using file system storage.
     Replaces in-memory session storage to persist data across server restarts.
     """
     
-    def __init__(self, storage_dir: str = "sessions"):
+    def __init__(self, storage_dir: str = "sessions", ttl_hours: float = 24, cleanup_interval_seconds: float = 0):
         self.storage_dir = Path(os.path.dirname(os.path.dirname(__file__))) / storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_hours = ttl_hours
+        self._cleanup_timer = (
+            _CleanupTimer(self.cleanup_old_sessions, cleanup_interval_seconds)
+            if cleanup_interval_seconds > 0 else None
+        )
         logger.info(f"Session storage initialized at: {self.storage_dir}")
 
     def save_session(self, session: SessionData) -> None:
@@ -68,11 +101,11 @@ class FileSessionManager:
             logger.error(f"Failed to delete session {session_id}: {str(e)}")
             return False
 
-    def cleanup_old_sessions(self, max_age_hours: int = 24) -> int:
-        """Remove sessions older than max_age."""
+    def cleanup_old_sessions(self, max_age_hours: Optional[float] = None) -> int:
+        """Remove sessions older than max_age (defaults to ttl_hours)."""
         count = 0
         now = datetime.now()
-        cutoff = now - timedelta(hours=max_age_hours)
+        cutoff = now - timedelta(hours=max_age_hours if max_age_hours is not None else self.ttl_hours)
         
         try:
             for file_path in self.storage_dir.glob("*.json"):
@@ -91,5 +124,178 @@ class FileSessionManager:
             logger.info(f"Cleaned up {count} expired sessions")
         return count
 
+    def close(self) -> None:
+        """Stop the background cleanup."""
+        if self._cleanup_timer is not None:
+            self._cleanup_timer.stop()
+
+
+class SQLiteSessionManager:
+    """
+    Manages session persistence in a SQLite database (WAL mode).
+
+    Sessions are stored as compact orjson blobs with an indexed expires_at,
+    so expiry is one indexed DELETE run on a background timer instead of a
+    directory scan per upload. Recently used sessions are kept parsed in an
+    in-process LRU, validated against the row's updated_at so several
+    server processes can share one database.
+
+    Same interface as FileSessionManager. get_session returns a shallow
+    copy: callers replace fields (session.evaluation = ...) and save, they
+    must not mutate nested models of a loaded session in place.
+    """
+
+    def __init__(
+        self,
+        storage_dir: str = "sessions",
+        filename: str = "sessions.db",
+        ttl_hours: float = 24,
+        cache_size: int = 128,
+        cleanup_interval_seconds: float = 300,
+    ):
+        self.storage_dir = Path(os.path.dirname(os.path.dirname(__file__))) / storage_dir
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.storage_dir / filename
+        self.ttl_seconds = ttl_hours * 3600
+        self.cache_size = cache_size
+
+        self._lock = threading.Lock()
+        # session_id -> (updated_at, SessionData), least recently used first
+        self._cache: OrderedDict[str, tuple[float, SessionData]] = OrderedDict()
+
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, "
+            "data BLOB NOT NULL, "
+            "updated_at REAL NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)")
+
+        self._cleanup_timer = (
+            _CleanupTimer(self.cleanup_old_sessions, cleanup_interval_seconds)
+            if cleanup_interval_seconds > 0 else None
+        )
+        logger.info(f"Session storage initialized at: {self.db_path}")
+
+    def save_session(self, session: SessionData) -> None:
+        """Save session to the database."""
+        try:
+            # Update timestamp
+            updated_at = time.time()
+            session.updated_at = datetime.fromtimestamp(updated_at)
+            data = orjson.dumps(session.dict())
+
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sessions (session_id, data, updated_at, expires_at) VALUES (?, ?, ?, ?)",
+                    (session.session_id, data, updated_at, updated_at + self.ttl_seconds),
+                )
+                self._remember(session.session_id, updated_at, session.copy())
+
+            logger.debug(f"Saved session {session.session_id}")
+        except Exception as e:
+            logger.error(f"Failed to save session {session.session_id}: {str(e)}")
+            raise
+
+    def get_session(self, session_id: str) -> Optional[SessionData]:
+        """Load session from the LRU or the database."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data, updated_at FROM sessions WHERE session_id = ? AND expires_at >= ?",
+                    (session_id, time.time()),
+                ).fetchone()
+                if row is None:
+                    self._cache.pop(session_id, None)
+                    logger.warning(f"Session not found: {session_id}")
+                    return None
+
+                data, updated_at = row
+                cached = self._cache.get(session_id)
+                if cached is not None and cached[0] == updated_at:
+                    self._cache.move_to_end(session_id)
+                    return cached[1].copy()
+
+            # Parse outside the lock
+            session = SessionData.parse_obj(orjson.loads(data))
+            with self._lock:
+                self._remember(session_id, updated_at, session)
+            return session.copy()
+        except Exception as e:
+            logger.error(f"Failed to load session {session_id}: {str(e)}")
+            return None
+
+    def delete_session(self, session_id: str) -> bool:
+        """Delete session row."""
+        try:
+            with self._lock:
+                self._cache.pop(session_id, None)
+                cursor = self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Failed to delete session {session_id}: {str(e)}")
+            return False
+
+    def cleanup_old_sessions(self, max_age_hours: Optional[float] = None) -> int:
+        """
+        Remove expired sessions, or those not updated within max_age_hours.
+        Either way a single range delete on the expires_at index.
+        """
+        # expires_at = updated_at + ttl, so an age cutoff is an expires_at cutoff
+        cutoff = time.time()
+        if max_age_hours is not None:
+            cutoff += self.ttl_seconds - max_age_hours * 3600
+
+        try:
+            with self._lock:
+                cursor = self._conn.execute("DELETE FROM sessions WHERE expires_at < ?", (cutoff,))
+                count = cursor.rowcount
+        except Exception as e:
+            logger.error(f"Cleanup failed: {e}")
+            return 0
+
+        if count > 0:
+            logger.info(f"Cleaned up {count} expired sessions")
+        return count
+
+    def _remember(self, session_id: str, updated_at: float, session: SessionData) -> None:
+        self._cache[session_id] = (updated_at, session)
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def close(self) -> None:
+        """Stop the background cleanup and close the database."""
+        if self._cleanup_timer is not None:
+            self._cleanup_timer.stop()
+        with self._lock:
+            self._cache.clear()
+            self._conn.close()
+
+
+def create_session_manager():
+    """
+    Build the session backend selected by SESSION_BACKEND: "sqlite"
+    (default) or "file". Both expire sessions on a background timer every
+    SESSION_CLEANUP_INTERVAL_SECONDS.
+    """
+    backend = os.getenv("SESSION_BACKEND", "sqlite").lower()
+    ttl_hours = float(os.getenv("SESSION_TTL_HOURS", "24"))
+    cleanup_interval = float(os.getenv("SESSION_CLEANUP_INTERVAL_SECONDS", "300"))
+
+    if backend == "file":
+        return FileSessionManager(ttl_hours=ttl_hours, cleanup_interval_seconds=cleanup_interval)
+    if backend == "sqlite":
+        return SQLiteSessionManager(
+            ttl_hours=ttl_hours,
+            cache_size=int(os.getenv("SESSION_CACHE_SIZE", "128")),
+            cleanup_interval_seconds=cleanup_interval,
+        )
+    raise ValueError(f"Unknown SESSION_BACKEND: {backend}")
+
 # Global instance
-session_manager = FileSessionManager()
+session_manager = create_session_manager()
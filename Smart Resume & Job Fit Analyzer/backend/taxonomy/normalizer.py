@@ -1,22 +1,68 @@
 """
 Skill normalizer using rapidfuzz for fuzzy matching.
 Maps skill variations to canonical forms with confidence scoring.
+
+Lowercased canonical names and alias keys are built once at load time;
+normalized results are memoized per lowercased mention, and batches are
+scored with a single rapidfuzz cdist call.
 """
 import os
+import threading
+from collections import OrderedDict
 from typing import Optional, Tuple
+import numpy as np
 from rapidfuzz import fuzz, process
 import yaml
 
 
+class _LRUCache:
+    """Small thread-safe LRU mapping used to memoize normalization results."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+    
+    def __len__(self):
+        return len(self._data)
+
+
 class SkillNormalizer:
     """Normalizes skill mentions to canonical forms using fuzzy matching."""
     
-    def __init__(self, taxonomy_path: Optional[str] = None):
+    def __init__(self, taxonomy_path: Optional[str] = None, cache_size: int = 50000):
         """
         Initialize the normalizer with a skill taxonomy.
         
         Args:
             taxonomy_path: Path to skills.yaml, defaults to same directory
+            cache_size: Max memoized mentions (0 disables the memo)
         """
         if taxonomy_path is None:
             taxonomy_path = os.path.join(os.path.dirname(__file__), "skills.yaml")
@@ -30,6 +76,14 @@ class SkillNormalizer:
             "medium_confidence": 75,
             "low_confidence": 60,
         })
+        
+        # Lookup structures, built once instead of on every normalize call
+        self._canonical_lower = [c.lower() for c in self.canonical_skills]
+        self._canonical_by_lower = {}
+        for canonical, lower in zip(self.canonical_skills, self._canonical_lower):
+            self._canonical_by_lower.setdefault(lower, canonical)
+        self._alias_keys = list(self.alias_map.keys())
+        self._cache = _LRUCache(cache_size)
     
     def _load_taxonomy(self, path: str) -> dict:
         """Load taxonomy from YAML file."""
@@ -89,75 +143,74 @@ class SkillNormalizer:
         """
         skill_lower = skill.lower().strip()
         
-        # Check exact alias match first
-        if skill_lower in self.alias_map:
-            return (self.alias_map[skill_lower], "high", 100.0)
-        
-        # Check if it's already a canonical name (case-insensitive)
-        for canonical in self.canonical_skills:
-            if canonical.lower() == skill_lower:
-                return (canonical, "high", 100.0)
-        
-        # Fuzzy match against canonical skills
-        if self.canonical_skills:
-            result = process.extractOne(
-                skill_lower,
-                [c.lower() for c in self.canonical_skills],
-                scorer=fuzz.ratio
-            )
-            
-            if result:
-                match_text, score, idx = result
-                # If high score, return immediately
-                if score >= self.thresholds["high_confidence"]:
-                    canonical = self.canonical_skills[idx]
-                    return (canonical, "high", score)
-        
-        # Fuzzy match against ALIASES
-        # This handles cases like "Amazn Web Services" (typo) -> "amazon web services" (alias) -> "AWS" (canonical)
-        if self.alias_map:
-            alias_result = process.extractOne(
-                skill_lower,
-                list(self.alias_map.keys()),
-                scorer=fuzz.ratio
-            )
-            
-            if alias_result:
-                alias_match, alias_score, _ = alias_result
-                
-                # Check if this alias score is better than the canonical score
-                # or if we didn't have a canonical score
-                canonical_score = result[1] if result else 0
-                
-                if alias_score > canonical_score and alias_score >= self.thresholds["medium_confidence"]:
-                    start_canonical = self.alias_map[alias_match]
-                    return (start_canonical, self._score_to_confidence(alias_score), alias_score)
-
-        # Return best canonical match if it exists and wasn't returned above
-        if result:
-            match_text, score, idx = result
-            canonical = self.canonical_skills[idx]
-            confidence = self._score_to_confidence(score)
-            
-            if confidence != "no_match":
-                return (canonical, confidence, score)
+        result = self._cache.get(skill_lower)
+        if result is None:
+            result = self._exact_match(skill_lower)
+            if result is None:
+                canonical_best = alias_best = None
+                if self._canonical_lower:
+                    _, score, idx = process.extractOne(skill_lower, self._canonical_lower, scorer=fuzz.ratio)
+                    canonical_best = (idx, score)
+                if self._alias_keys:
+                    # Aliases below medium confidence are never used, so skip them early
+                    match = process.extractOne(
+                        skill_lower, self._alias_keys, scorer=fuzz.ratio,
+                        score_cutoff=self.thresholds["medium_confidence"]
+                    )
+                    if match is not None:
+                        alias_best = (match[2], match[1])
+                result = self._fuzzy_match(canonical_best, alias_best)
+            self._cache.put(skill_lower, result)
         
-        # No good match found
-        return (skill, "no_match", 0.0)
+        return self._with_original(skill, result)
     
     def normalize_batch(self, skills: list[str]) -> list[dict]:
         """
         Normalize a batch of skills.
         
+        Mentions that are not exact matches or already memoized are
+        deduplicated and scored together in one cdist call per choice list.
+        
         Args:
             skills: List of raw skill texts
         
         Returns:
             List of normalization results with original, canonical, and confidence
         """
+        keys = [skill.lower().strip() for skill in skills]
+        resolved = {}
+        pending = []
+        for key in dict.fromkeys(keys):
+            result = self._cache.get(key)
+            if result is None:
+                result = self._exact_match(key)
+            if result is None:
+                pending.append(key)
+            else:
+                resolved[key] = result
+        
+        if pending:
+            canonical_matrix = alias_matrix = None
+            if self._canonical_lower:
+                canonical_matrix = process.cdist(
+                    pending, self._canonical_lower, scorer=fuzz.ratio, dtype=np.float64, workers=-1
+                )
+            if self._alias_keys:
+                alias_matrix = process.cdist(
+                    pending, self._alias_keys, scorer=fuzz.ratio, dtype=np.float64, workers=-1
+                )
+            for row, key in enumerate(pending):
+                resolved[key] = self._fuzzy_match(
+                    self._best(canonical_matrix, row),
+                    self._best(alias_matrix, row),
+                )
+        
+        for key, result in resolved.items():
+            self._cache.put(key, result)
+        
         results = []
-        for skill in skills:
-            canonical, confidence, score = self.normalize(skill)
+        for skill, key in zip(skills, keys):
+            canonical, confidence, score = self._with_original(skill, resolved[key])
             results.append({
                 "original": skill,
                 "canonical": canonical,
@@ -166,6 +219,74 @@ class SkillNormalizer:
             })
         return results
     
+    def _exact_match(self, skill_lower: str) -> Optional[Tuple[Optional[str], str, float]]:
+        """Alias or case-insensitive canonical match, or None."""
+        # Check exact alias match first
+        if skill_lower in self.alias_map:
+            return (self.alias_map[skill_lower], "high", 100.0)
+        
+        # Check if it's already a canonical name (case-insensitive)
+        canonical = self._canonical_by_lower.get(skill_lower)
+        if canonical is not None:
+            return (canonical, "high", 100.0)
+        return None
+    
+    @staticmethod
+    def _best(matrix, row: int) -> Optional[Tuple[int, float]]:
+        """(index, score) of the best choice in a cdist row; first one on ties, like extractOne."""
+        if matrix is None:
+            return None
+        idx = int(np.argmax(matrix[row]))
+        return (idx, float(matrix[row, idx]))
+    
+    def _fuzzy_match(
+        self,
+        canonical_best: Optional[Tuple[int, float]],
+        alias_best: Optional[Tuple[int, float]]
+    ) -> Tuple[Optional[str], str, float]:
+        """
+        Decide from the best canonical and best alias (index, score) pairs.
+        A canonical name of None means no match (the caller keeps the original text).
+        """
+        # If high score, return immediately
+        if canonical_best and canonical_best[1] >= self.thresholds["high_confidence"]:
+            return (self.canonical_skills[canonical_best[0]], "high", canonical_best[1])
+        
+        # Fuzzy match against ALIASES
+        # This handles cases like "Amazn Web Services" (typo) -> "amazon web services" (alias) -> "AWS" (canonical)
+        if alias_best:
+            alias_idx, alias_score = alias_best
+            
+            # Check if this alias score is better than the canonical score
+            # or if we didn't have a canonical score
+            canonical_score = canonical_best[1] if canonical_best else 0
+            
+            if alias_score > canonical_score and alias_score >= self.thresholds["medium_confidence"]:
+                canonical = self.alias_map[self._alias_keys[alias_idx]]
+                return (canonical, self._score_to_confidence(alias_score), alias_score)
+        
+        # Return best canonical match if it exists and wasn't returned above
+        if canonical_best:
+            idx, score = canonical_best
+            confidence = self._score_to_confidence(score)
+            
+            if confidence != "no_match":
+                return (self.canonical_skills[idx], confidence, score)
+        
+        # No good match found
+        return (None, "no_match", 0.0)
+    
+    @staticmethod
+    def _with_original(skill: str, result: Tuple[Optional[str], str, float]) -> Tuple[str, str, float]:
+        canonical, confidence, score = result
+        if canonical is None:
+            return (skill, confidence, score)
+        return result
+    
+    def cache_info(self) -> dict:
+        """Memo hit/miss counters and current size."""
+        return {"hits": self._cache.hits, "misses": self._cache.misses, "size": len(self._cache)}
+    
     def _score_to_confidence(self, score: float) -> str:
         """Convert numeric score to confidence level."""
         if score >= self.thresholds["high_confidence"]:
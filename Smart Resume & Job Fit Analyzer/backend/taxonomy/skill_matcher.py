@@ -0,0 +1,196 @@
+"""
+Skill pattern matcher shared by the resume and JD parsers.
+
+The `patterns` catalog in skills.yaml is compiled once into:
+- a finder: one alternation of every pattern, with the leading word boundary
+  factored out so it is tested once per position, that locates the positions
+  where some skill can start
+- lookahead chains, one per first character: `(?=(?P<s0>...))?(?=(?P<s7>...))?`
+  matched at a candidate position to capture every entry that starts there
+
+Scanning the text once this way gives each entry exactly the first match a
+separate `re.search` would, overlapping ones included ("sql server" yields both
+SQL Server and SQL), without running every regex over the whole text.
+"""
+import os
+import re
+import threading
+from typing import NamedTuple, Optional
+import yaml
+
+
+class SkillPattern(NamedTuple):
+    """One catalog entry."""
+    name: str
+    category: str
+    alternatives: tuple[str, ...]
+
+
+class SkillMatch(NamedTuple):
+    """First match of a catalog entry, with offsets into the lowercased text."""
+    name: str
+    category: str
+    text: str
+    start: int
+    end: int
+
+
+def _first_char(alternative: str) -> Optional[str]:
+    """
+    Literal character every match of the alternative starts with, or None
+    if it cannot be read off the pattern (class, group, optional first char).
+    """
+    if alternative.startswith(r"\b"):
+        alternative = alternative[2:]
+    # Lookbehinds are zero-width, the match still starts at what follows
+    while alternative.startswith(("(?<!", "(?<=")):
+        depth = 0
+        for i, ch in enumerate(alternative):
+            if ch == "(" and alternative[i - 1:i] != "\\":
+                depth += 1
+            elif ch == ")" and alternative[i - 1:i] != "\\":
+                depth -= 1
+                if depth == 0:
+                    alternative = alternative[i + 1:]
+                    break
+        else:
+            return None
+
+    if alternative[:1] == "\\" and len(alternative) > 1 and not alternative[1].isalnum():
+        char, rest = alternative[1], alternative[2:]
+    elif alternative[:1] and alternative[0] not in "\\()[]{}.^$|?*+":
+        char, rest = alternative[0], alternative[1:]
+    else:
+        return None
+
+    if rest[:1] in ("?", "*", "{"):
+        return None
+    return char
+
+
+class SkillMatcher:
+    """Finds catalog skills in text with a single scan."""
+
+    def __init__(self, taxonomy_path: Optional[str] = None):
+        """
+        Load and compile the pattern catalog.
+
+        Args:
+            taxonomy_path: Path to skills.yaml, defaults to same directory
+        """
+        if taxonomy_path is None:
+            taxonomy_path = os.path.join(os.path.dirname(__file__), "skills.yaml")
+
+        with open(taxonomy_path, "r", encoding="utf-8") as f:
+            taxonomy = yaml.safe_load(f)
+
+        self.patterns = self._build_patterns(taxonomy.get("patterns", []))
+
+        word_start = []
+        anywhere = []
+        by_char: dict[str, set[int]] = {}
+        unindexed = set()
+        for index, pattern in enumerate(self.patterns):
+            for alternative in pattern.alternatives:
+                if alternative.startswith(r"\b"):
+                    word_start.append(alternative[2:])
+                else:
+                    anywhere.append(alternative)
+                char = _first_char(alternative)
+                if char is None:
+                    unindexed.add(index)
+                else:
+                    by_char.setdefault(char, set()).add(index)
+
+        finder = []
+        if word_start:
+            finder.append(r"\b(?:" + "|".join(word_start) + ")")
+        finder.extend(anywhere)
+        self._finder = re.compile("|".join(finder)) if finder else None
+
+        self._chains = {
+            char: self._compile_chain(indexes | unindexed)
+            for char, indexes in by_char.items()
+        }
+        self._fallback_chain = self._compile_chain(unindexed) if unindexed else None
+
+    @staticmethod
+    def _build_patterns(entries: list[dict]) -> list[SkillPattern]:
+        """Validate catalog entries and check that every regex compiles."""
+        patterns = []
+        seen = set()
+        for entry in entries:
+            name = entry["name"]
+            if name in seen:
+                raise ValueError(f"Duplicate skill pattern: {name}")
+            seen.add(name)
+
+            alternatives = tuple(entry["match"])
+            for alternative in alternatives:
+                re.compile(alternative)
+            patterns.append(SkillPattern(name, entry.get("category", "other"), alternatives))
+        return patterns
+
+    def _compile_chain(self, indexes: set[int]) -> re.Pattern:
+        return re.compile("".join(
+            f"(?=(?P<s{i}>{'|'.join(self.patterns[i].alternatives)}))?"
+            for i in sorted(indexes)
+        ))
+
+    def find(self, text: str) -> list[SkillMatch]:
+        """
+        Find every catalog skill mentioned in text.
+
+        Args:
+            text: Raw resume or JD text (matched lowercased)
+
+        Returns:
+            First match of each matching entry, in catalog order
+        """
+        text_lower = text.lower()
+        found: dict[int, SkillMatch] = {}
+        if self._finder is None:
+            return []
+
+        search = self._finder.search
+        pos = 0
+        while len(found) < len(self.patterns):
+            candidate = search(text_lower, pos)
+            if candidate is None:
+                break
+            start = candidate.start()
+            chain = self._chains.get(text_lower[start], self._fallback_chain)
+            if chain is not None:
+                groups = chain.match(text_lower, start)
+                for group, matched in groups.groupdict().items():
+                    if matched is None:
+                        continue
+                    index = int(group[1:])
+                    if index not in found:
+                        pattern = self.patterns[index]
+                        found[index] = SkillMatch(
+                            pattern.name, pattern.category, matched, start, groups.end(group)
+                        )
+            # Next position, not candidate.end(): other skills may start inside this match
+            pos = start + 1
+
+        return [found[index] for index in sorted(found)]
+
+    def find_names(self, text: str) -> list[str]:
+        """Names of the catalog skills mentioned in text, in catalog order."""
+        return [match.name for match in self.find(text)]
+
+
+# Singleton instance for convenience
+_matcher_instance = None
+_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Get the singleton matcher, compiling the catalog on first use."""
+    global _matcher_instance
+    if _matcher_instance is None:
+        with _matcher_lock:
+            if _matcher_instance is None:
+                _matcher_instance = SkillMatcher()
+    return _matcher_instance
@@ -118,3 +118,47 @@ def _create_messy_resume(path: str):
     c.drawString(50, height - 220, "linux, aws, python, kubernetes")
     
     c.save()
+
+def _create_multi_page_resume(path: str, pages: int = 5):
+    """Create a long multi-page resume: a dense experience history with a sidebar on each page."""
+    c = canvas.Canvas(path, pagesize=letter)
+    width, height = letter
+    skills = ["Python", "SQL", "Docker", "Kubernetes", "React", "AWS", "Terraform", "Kafka"]
+    
+    for page in range(pages):
+        y = height - 50
+        if page == 0:
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(50, y, "Jane Roe")
+            c.setFont("Helvetica", 10)
+            c.drawString(50, y - 15, "jane@example.com | (555) 987-6543")
+            y -= 50
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(50, y, "EXPERIENCE")
+            y -= 20
+        
+        # Sidebar column, far enough right to be split into its own block
+        c.setFont("Helvetica", 9)
+        for i, skill in enumerate(skills):
+            c.drawString(480, height - 120 - i * 14, f"{skill} ({(page + i) % 9 + 1} yrs)")
+        
+        job = 0
+        while y > 80:
+            company = f"Company {page * 10 + job} | Senior Engineer"
+            c.setFont("Helvetica-Bold", 10)
+            c.drawString(50, y, company)
+            c.setFont("Helvetica-Oblique", 10)
+            c.drawString(50, y - 12, f"Jan {2000 + job} - Dec {2001 + job}")
+            y -= 30
+            c.setFont("Helvetica", 10)
+            for bullet in range(5):
+                if y <= 80:
+                    break
+                c.drawString(60, y, f"• Built {skills[(job + bullet) % len(skills)]} services handling "
+                                    f"{(bullet + 1) * 1000} requests per second for team {job}")
+                y -= 15
+            job += 1
+            y -= 10
+        c.showPage()
+    
+    c.save()
@@ -0,0 +1,264 @@
+"""
+Tests for bulk resume screening against one job description.
+"""
+import asyncio
+import io
+import json
+import threading
+import zipfile
+import pytest
+from services import batch_screening
+from services.batch_screening import BatchTooLargeError, expand_uploads, screen_resumes
+from services.parse_cache import ParseCache
+from tests.pdf_generator import (
+    _create_messy_resume,
+    _create_standard_resume,
+    _create_two_column_resume,
+)
+
+JD_TEXT = """
+Software Engineer
+
+Requirements:
+- Python, SQL and Docker
+- Experience with React and AWS
+"""
+
+
+@pytest.fixture(scope="module")
+def resume_pdfs(tmp_path_factory):
+    """Bytes of the three regression PDFs."""
+    output_dir = tmp_path_factory.mktemp("batch")
+    pdfs = {}
+    for name, create in [
+        ("standard", _create_standard_resume),
+        ("two_column", _create_two_column_resume),
+        ("messy", _create_messy_resume),
+    ]:
+        path = output_dir / f"{name}.pdf"
+        create(str(path))
+        pdfs[name] = path.read_bytes()
+    return pdfs
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = ParseCache(storage_dir=str(tmp_path / "cache"))
+    monkeypatch.setattr(batch_screening, "parse_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def pool_size(monkeypatch):
+    """Set BATCH_EVAL_WORKERS for a fresh shared pool, stopped afterwards."""
+    def set_size(workers: int):
+        monkeypatch.setenv("BATCH_EVAL_WORKERS", str(workers))
+        batch_screening.shutdown_executor()
+    yield set_size
+    batch_screening.shutdown_executor()
+
+
+def _zip(members: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, contents in members.items():
+            archive.writestr(name, contents)
+    return buffer.getvalue()
+
+
+def _post_batch(client, files, workers=1):
+    response = client.post(
+        "/api/evaluate/batch",
+        data={"job_description": JD_TEXT, "workers": str(workers)},
+        files=[("files", file) for file in files],
+    )
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    return response, lines
+
+
+class TestExpandUploads:
+    """Test flattening of files and ZIP archives."""
+
+    def test_zip_members_and_skips(self):
+        archive = _zip({
+            "cvs/a.pdf": b"%PDF",
+            "cvs/b.DOCX": b"PK",
+            "notes.txt": b"hello",
+            "__MACOSX/cvs/._a.pdf": b"",
+        })
+
+        resumes, skipped = expand_uploads([
+            ("batch.zip", archive),
+            ("c.pdf", b"%PDF"),
+            ("d.png", b""),
+            ("broken.zip", b"not a zip"),
+        ])
+
+        assert [(name, ext) for name, ext, _ in resumes] == [
+            ("batch.zip/cvs/a.pdf", "pdf"),
+            ("batch.zip/cvs/b.DOCX", "docx"),
+            ("c.pdf", "pdf"),
+        ]
+        assert [entry["filename"] for entry in skipped] == ["batch.zip/notes.txt", "d.png", "broken.zip"]
+
+    def test_limits_stop_expansion(self, monkeypatch):
+        """Limits are checked against declared sizes before members are inflated."""
+        archive = _zip({f"{i}.pdf": b"\0" * 1024 * 1024 for i in range(5)})
+        inflated = []
+        read = zipfile.ZipFile.read
+        monkeypatch.setattr(zipfile.ZipFile, "read", lambda self, member: inflated.append(member) or read(self, member))
+
+        with pytest.raises(BatchTooLargeError, match="bytes"):
+            expand_uploads([("bomb.zip", archive)], max_resumes=100, max_total_bytes=3 * 1024 * 1024)
+        assert len(inflated) == 3
+
+        with pytest.raises(BatchTooLargeError, match="Too many"):
+            expand_uploads([("bomb.zip", archive)], max_resumes=2)
+
+
+class TestScreenResumes:
+    """Test the screening loop itself."""
+
+    def test_work_stays_off_the_event_loop(self, cache, resume_pdfs, pool_size, monkeypatch):
+        """Lookups, parses and evaluations run in executors; a miss parses without waiting for other lookups."""
+        from parsers import parse_job_description
+        from rules.engine import get_engine
+
+        pool_size(1)
+        engine = get_engine()
+        evaluate = engine.evaluate
+        evaluate_threads = []
+        monkeypatch.setattr(engine, "evaluate", lambda *args: evaluate_threads.append(threading.current_thread()) or evaluate(*args))
+
+        resumes = [(f"{name}.pdf", "pdf", contents) for name, contents in resume_pdfs.items()]
+        slow_key = cache.make_key(resumes[-1][2], "pdf")
+        parse_started = threading.Event()
+        parsed_during_lookup = []
+        get = cache.get
+        parse = batch_screening.parse_resume_bytes
+
+        def slow_get(key):
+            if key == slow_key:
+                parsed_during_lookup.append(parse_started.wait(timeout=5))
+            return get(key)
+
+        monkeypatch.setattr(cache, "get", slow_get)
+        monkeypatch.setattr(batch_screening, "parse_resume_bytes", lambda *args: parse_started.set() or parse(*args))
+
+        async def run():
+            records = [record async for record in screen_resumes(resumes, parse_job_description(JD_TEXT))]
+            return records, threading.current_thread()
+
+        records, loop_thread = asyncio.run(run())
+
+        assert records[-1]["evaluated"] == 3
+        assert len(evaluate_threads) == 3 and loop_thread not in evaluate_threads
+        assert parsed_during_lookup == [True]
+
+
+class TestBatchEndpoint:
+    """Test /evaluate/batch streaming."""
+
+    def test_streams_ranked_results(self, client, cache, resume_pdfs):
+        archive = _zip({"two_column.pdf": resume_pdfs["two_column"], "readme.txt": b"x"})
+        response, lines = _post_batch(client, [
+            ("standard.pdf", resume_pdfs["standard"], "application/pdf"),
+            ("more.zip", archive, "application/zip"),
+            ("messy.pdf", resume_pdfs["messy"], "application/pdf"),
+        ])
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        errors = [line for line in lines if line["type"] == "error"]
+        results = [line for line in lines if line["type"] == "result"]
+        summary = lines[-1]
+        assert [e["filename"] for e in errors] == ["more.zip/readme.txt"]
+        assert len(results) == 3
+        assert all(0 <= r["result"]["job_fit_score"] <= 100 for r in results)
+
+        assert summary["type"] == "summary"
+        assert (summary["total"], summary["evaluated"], summary["failed"]) == (3, 3, 0)
+        scores = [entry["job_fit_score"] for entry in summary["ranking"]]
+        assert scores == sorted(scores, reverse=True)
+        assert [entry["rank"] for entry in summary["ranking"]] == [1, 2, 3]
+        assert {entry["filename"] for entry in summary["ranking"]} == {
+            "standard.pdf", "more.zip/two_column.pdf", "messy.pdf"
+        }
+
+    def test_process_pool_matches_inline(self, client, cache, resume_pdfs, pool_size):
+        files = [(f"{name}.pdf", contents, "application/pdf") for name, contents in resume_pdfs.items()]
+
+        pool_size(1)
+        _, inline = _post_batch(client, files)
+        cache.clear()
+        pool_size(2)
+        _, pooled = _post_batch(client, files)
+
+        assert inline[-1]["ranking"] == pooled[-1]["ranking"]
+
+    def test_batches_share_one_pool(self, client, cache, resume_pdfs, pool_size):
+        """The pool is created once per server; the workers field cannot grow it."""
+        pool_size(2)
+        files = [("standard.pdf", resume_pdfs["standard"], "application/pdf")]
+
+        _post_batch(client, files, workers=8)
+        pool = batch_screening._executor
+        cache.clear()
+        _post_batch(client, files, workers=1)
+
+        assert pool is not None and batch_screening._executor is pool
+        assert batch_screening._executor_workers == 2
+
+    def test_single_worker_server_has_no_pool(self, client, cache, resume_pdfs, pool_size):
+        pool_size(1)
+        _, lines = _post_batch(client, [("standard.pdf", resume_pdfs["standard"], "application/pdf")], workers=8)
+
+        assert lines[-1]["evaluated"] == 1
+        assert batch_screening._executor is None
+
+    def test_repeat_batch_uses_parse_cache(self, client, cache, resume_pdfs):
+        files = [("standard.pdf", resume_pdfs["standard"], "application/pdf")]
+
+        _post_batch(client, files)
+        _post_batch(client, files)
+
+        assert cache.stats()["hits"] == 1
+
+    def test_corrupt_archive_member_is_skipped(self, client, cache, resume_pdfs):
+        """A member failing its CRC check does not lose the rest of the batch."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+            archive.writestr("bad.pdf", b"%PDF-1.4 corrupted in transit")
+            archive.writestr("standard.pdf", resume_pdfs["standard"])
+        contents = buffer.getvalue().replace(b"corrupted", b"CORRUPTED", 1)
+
+        response, lines = _post_batch(client, [("cvs.zip", contents, "application/zip")])
+
+        assert response.status_code == 200
+        errors = [line for line in lines if line["type"] == "error"]
+        assert [(e["filename"], e["detail"]) for e in errors] == [("cvs.zip/bad.pdf", "Unreadable archive member")]
+        assert [entry["filename"] for entry in lines[-1]["ranking"]] == ["cvs.zip/standard.pdf"]
+
+    def test_rejects_batch_without_resumes(self, client, cache):
+        response, _ = _post_batch(client, [("notes.txt", b"hello", "text/plain")])
+
+        assert response.status_code == 400
+
+    def test_rejects_oversized_batch(self, client, cache, monkeypatch):
+        monkeypatch.setenv("BATCH_EVAL_MAX_FILES", "1")
+        response, _ = _post_batch(client, [("a.pdf", b"%PDF", "application/pdf"), ("b.pdf", b"%PDF", "application/pdf")])
+
+        assert response.status_code == 400
+        assert "Too many resumes" in response.json()["detail"]
+
+    def test_unparseable_resume_is_reported(self, client, cache, resume_pdfs):
+        _, lines = _post_batch(client, [
+            ("broken.pdf", b"not a pdf", "application/pdf"),
+            ("standard.pdf", resume_pdfs["standard"], "application/pdf"),
+        ])
+
+        errors = [line for line in lines if line["type"] == "error"]
+        assert [e["filename"] for e in errors] == ["broken.pdf"]
+        assert lines[-1]["failed"] == 1
+        assert [entry["filename"] for entry in lines[-1]["ranking"]] == ["standard.pdf"]
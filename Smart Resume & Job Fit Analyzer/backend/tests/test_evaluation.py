@@ -198,3 +198,73 @@ class TestScoreCalculation:
         assert engine._bound_score(150.0) == 100
         assert engine._bound_score(-50.0) == 0
         assert engine._bound_score(75.5) == 76
+
+
+class TestJDContext:
+    """Test the per-JD context reused across resumes."""
+    
+    @pytest.fixture
+    def jd(self):
+        return ParsedJobDescription(
+            title="Financial Analyst",
+            raw_text="Financial Analyst with SQL and Python",
+            required_skills=["SQL", "Python"],
+            optional_skills=["Tableau"],
+        )
+    
+    @pytest.fixture
+    def resume(self):
+        return ParsedResume(
+            raw_text="Analyst",
+            experience=[
+                ExperienceEntry(
+                    company="Bank",
+                    title="Analyst",
+                    description="Managed reporting",
+                    source_text="Bank",
+                    responsibilities=["Designed dashboards for a team of 5", "Cut costs"],
+                )
+            ],
+            skills=[
+                ExtractedSkill(
+                    name="sql", canonical_name="SQL",
+                    category=SkillCategory.DATABASES,
+                    confidence=ConfidenceLevel.HIGH,
+                    source_text="sql"
+                ),
+            ],
+        )
+    
+    def test_context_is_memoized_per_jd(self, jd):
+        """An equal JD reuses the context; a different one gets its own."""
+        from rules.engine import RuleEngine
+        
+        engine = RuleEngine()
+        context = engine.jd_context(jd)
+        
+        assert engine.jd_context(jd.copy(deep=True)) is context
+        assert context.domain == "finance"
+        assert context.required_canonical == ["SQL", "Python"]
+        
+        other = jd.copy(update={"required_skills": ["Python"]})
+        assert engine.jd_context(other) is not context
+    
+    def test_context_cache_is_bounded(self, jd):
+        from rules.engine import RuleEngine
+        
+        engine = RuleEngine(context_cache_size=2)
+        first = engine.jd_context(jd)
+        for title in ("A", "B"):
+            engine.jd_context(jd.copy(update={"title": title}))
+        
+        assert engine.jd_context(jd) is not first
+    
+    def test_explicit_context_gives_same_result(self, jd, resume):
+        from rules.engine import RuleEngine
+        
+        engine = RuleEngine()
+        expected = engine.evaluate(resume, jd)
+        
+        assert engine.evaluate(resume, jd, engine.jd_context(jd)) == expected
+        assert expected.score_breakdown.experience_depth_score == pytest.approx(50 + 12 + 11 + 9.2)
+        assert "Domain Gap" in [s.category for s in expected.improvement_suggestions]
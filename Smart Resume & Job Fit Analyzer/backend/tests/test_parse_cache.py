@@ -0,0 +1,152 @@
+"""
+Tests for the content-addressed resume parse cache.
+"""
+import os
+import pytest
+from api import routes
+from api.schemas import ParsedResume
+from services import parse_cache as parse_cache_module
+from services.parse_cache import ParseCache
+from tests.pdf_generator import _create_standard_resume
+
+
+def _resume(text: str = "John Doe") -> ParsedResume:
+    return ParsedResume(raw_text=text)
+
+
+class TestParseCache:
+    """Test the memory and disk tiers."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ParseCache(storage_dir=str(tmp_path / "cache"))
+
+    def test_key_depends_on_contents_and_type(self):
+        """Same bytes with a different file type are different entries."""
+        key = ParseCache.make_key(b"%PDF-1.4", "pdf")
+
+        assert key == ParseCache.make_key(b"%PDF-1.4", "PDF")
+        assert key != ParseCache.make_key(b"%PDF-1.4", "docx")
+        assert key != ParseCache.make_key(b"%PDF-1.5", "pdf")
+
+    def test_miss_then_memory_hit(self, cache):
+        """A stored resume is served from memory, as an independent copy."""
+        key = ParseCache.make_key(b"resume", "pdf")
+        assert cache.get(key) is None
+
+        cache.put(key, _resume())
+        hit = cache.get(key)
+        hit.raw_text = "edited"
+
+        assert cache.get(key).raw_text == "John Doe"
+        stats = cache.stats()
+        assert (stats["memory_hits"], stats["misses"], stats["hit_rate"]) == (2, 1, 0.6667)
+
+    def test_disk_hit_after_restart(self, tmp_path):
+        """Entries survive a new cache instance on the same directory."""
+        key = ParseCache.make_key(b"resume", "pdf")
+        ParseCache(storage_dir=str(tmp_path)).put(key, _resume())
+
+        reloaded = ParseCache(storage_dir=str(tmp_path))
+
+        assert reloaded.get(key).raw_text == "John Doe"
+        assert reloaded.stats()["disk_hits"] == 1
+        # Promoted to memory
+        reloaded.get(key)
+        assert reloaded.stats()["memory_hits"] == 1
+
+    def test_disk_io_outside_lock(self, tmp_path, monkeypatch):
+        """Other lookups are not blocked while an entry is read from disk."""
+        key = ParseCache.make_key(b"resume", "pdf")
+        ParseCache(storage_dir=str(tmp_path)).put(key, _resume())
+        reloaded = ParseCache(storage_dir=str(tmp_path))
+
+        parse_raw = ParsedResume.parse_raw
+        def checked_parse_raw(data):
+            assert not reloaded._lock.locked()
+            return parse_raw(data)
+        monkeypatch.setattr(parse_cache_module.ParsedResume, "parse_raw", checked_parse_raw)
+
+        assert reloaded.get(key).raw_text == "John Doe"
+
+    def test_entries_expire(self, cache, monkeypatch):
+        """Entries older than the TTL are dropped from both tiers."""
+        key = ParseCache.make_key(b"resume", "pdf")
+        cache.put(key, _resume())
+
+        later = parse_cache_module.time.time() + cache.ttl_seconds + 1
+        monkeypatch.setattr(parse_cache_module.time, "time", lambda: later)
+
+        assert cache.get(key) is None
+        assert not os.path.exists(cache.storage_dir / f"{key}.json")
+        assert cache.stats()["disk_entries"] == 0
+
+    def test_size_limits(self, tmp_path):
+        """The oldest entries are evicted once a tier is full."""
+        cache = ParseCache(storage_dir=str(tmp_path), max_memory_entries=1, max_disk_entries=2)
+        keys = [ParseCache.make_key(str(i).encode(), "pdf") for i in range(3)]
+        for key in keys:
+            cache.put(key, _resume(key))
+
+        stats = cache.stats()
+        assert (stats["memory_entries"], stats["disk_entries"]) == (1, 2)
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]).raw_text == keys[1]
+
+
+class TestUploadUsesCache:
+    """Test the upload endpoint with a fresh cache and upload directory."""
+
+    @pytest.fixture
+    def upload_env(self, tmp_path, monkeypatch):
+        cache = ParseCache(storage_dir=str(tmp_path / "cache"))
+        upload_dir = tmp_path / "uploads"
+        upload_dir.mkdir()
+        monkeypatch.setattr(routes, "parse_cache", cache)
+        monkeypatch.setattr(routes, "UPLOAD_DIR", str(upload_dir))
+        monkeypatch.setattr(routes.session_manager, "save_session", lambda session: None)
+        return upload_dir
+
+    def test_repeat_upload_is_not_written_or_reparsed(self, client, upload_env, tmp_path):
+        pdf_path = tmp_path / "resume.pdf"
+        _create_standard_resume(str(pdf_path))
+        contents = pdf_path.read_bytes()
+
+        first = client.post("/api/upload-resume", files={"file": ("resume.pdf", contents, "application/pdf")})
+        second = client.post("/api/upload-resume", files={"file": ("retry.pdf", contents, "application/pdf")})
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["session_id"] != second.json()["session_id"]
+        assert first.json()["parsed_resume"] == second.json()["parsed_resume"]
+        assert len(os.listdir(upload_env)) == 1
+
+        stats = client.get("/api/cache/stats").json()
+        assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+
+class TestCacheKey:
+    """Test that parser changes invalidate cached entries."""
+
+    def test_key_depends_on_parser_version(self, monkeypatch):
+        key = ParseCache.make_key(b"resume", "pdf")
+
+        monkeypatch.setattr(parse_cache_module, "PARSER_FINGERPRINT", "next-release")
+        assert ParseCache.make_key(b"resume", "pdf") != key
+
+    def test_key_depends_on_page_cap(self, monkeypatch):
+        monkeypatch.setenv("PDF_MAX_PAGES", "20")
+        key = ParseCache.make_key(b"resume", "pdf")
+
+        monkeypatch.setenv("PDF_MAX_PAGES", "5")
+        assert ParseCache.make_key(b"resume", "pdf") != key
+
+    def test_fingerprint_covers_parser_sources(self, monkeypatch):
+        fingerprint = parse_cache_module._parser_fingerprint()
+        monkeypatch.setattr(parse_cache_module, "PARSER_VERSION", "999")
+
+        assert parse_cache_module._parser_fingerprint() != fingerprint
+        assert any(
+            parse_cache_module.BACKEND_DIR.glob(pattern)
+            for pattern in parse_cache_module.PARSER_SOURCES
+        )
@@ -5,11 +5,15 @@ import pytest
 from parsers.section_detector import (
     detect_sections,
     _extract_skills_from_text,
+    _find_section_boundaries,
+    _find_section_starts,
     _parse_education,
     _parse_experience,
 )
 from parsers.docx_parser import parse_docx, _extract_all_xml_text
 from parsers.jd_parser import parse_job_description
+from parsers.pdf_parser import parse_pdf, iter_pdf_pages, _group_words_into_lines
+from tests.pdf_generator import generate_test_pdfs, _create_multi_page_resume
 
 
 class TestSkillExtraction:
@@ -168,6 +172,46 @@ class TestPdfParser:
             assert "left" in blocks[0]
 
 
+class TestPdfPages:
+    """Test page-wise PDF parsing."""
+    
+    @pytest.fixture(scope="class")
+    def multi_page_pdf(self, tmp_path_factory):
+        path = tmp_path_factory.mktemp("pdf") / "long.pdf"
+        _create_multi_page_resume(str(path), pages=4)
+        return str(path)
+    
+    def test_matches_separate_text_and_word_passes(self, multi_page_pdf):
+        """One pass per page gives what extract_text() and extract_words() give."""
+        import pdfplumber
+        
+        with pdfplumber.open(multi_page_pdf) as pdf:
+            expected = [
+                (page.extract_text(), [line["text"] for line in _group_words_into_lines(page.extract_words())])
+                for page in pdf.pages
+            ]
+        
+        pages = [(text, [block["text"] for block in blocks]) for text, blocks in iter_pdf_pages(multi_page_pdf)]
+        assert pages == expected
+    
+    def test_parse_pdf_joins_pages(self, multi_page_pdf):
+        pages = list(iter_pdf_pages(multi_page_pdf))
+        raw_text, blocks = parse_pdf(multi_page_pdf)
+        
+        assert raw_text == "\n".join(text for text, _ in pages)
+        assert blocks == [block for _, page_blocks in pages for block in page_blocks]
+        assert [page_blocks[0]["page"] for _, page_blocks in pages] == [1, 2, 3, 4]
+    
+    def test_page_cap(self, multi_page_pdf, monkeypatch):
+        """Pages past the cap are not parsed; 0 lifts the cap."""
+        assert len(list(iter_pdf_pages(multi_page_pdf, max_pages=2))) == 2
+        assert len(list(iter_pdf_pages(multi_page_pdf, max_pages=0))) == 4
+        
+        monkeypatch.setenv("PDF_MAX_PAGES", "3")
+        _, blocks = parse_pdf(multi_page_pdf)
+        assert max(block["page"] for block in blocks) == 3
+
+
 class TestSectionDetection:
     """Test resume section detection."""
     
@@ -194,3 +238,52 @@ class TestSectionDetection:
         # Should find skills mentioned in the resume
         skill_names = [s.canonical_name for s in sections.get("skills", [])]
         assert len(skill_names) > 0
+
+
+class TestSectionHeaders:
+    """Test precompiled section header matching."""
+    
+    # Boundaries of the regression PDFs from the per-pattern matcher
+    GOLDEN_BOUNDARIES = {
+        "standard": {"skills": (3, 4), "experience": (5, 10), "education": (11, 12)},
+        "two_column": {"experience": (2, 4), "contact": (5, 8), "skills": (9, 13)},
+        "messy": {},
+    }
+    
+    def test_golden_boundaries(self, tmp_path):
+        """Section boundaries of the golden PDFs are unchanged."""
+        generate_test_pdfs(str(tmp_path))
+        for name, expected in self.GOLDEN_BOUNDARIES.items():
+            _, blocks = parse_pdf(str(tmp_path / f"{name}.pdf"))
+            assert _find_section_boundaries(blocks) == expected
+    
+    def test_decorated_headers(self):
+        """Numbering, decoration and trailing punctuation are accepted."""
+        lines = ["II. Experience", "— Skills —", "[Projects]", "2) Work History:", "*** EDUCATION ***"]
+        blocks = [{"text": line} for line in lines]
+        
+        starts = [section_type for _, section_type, _ in _find_section_starts(blocks)]
+        assert starts == ["experience", "skills", "projects", "experience", "education"]
+    
+    def test_block_can_open_several_sections(self):
+        """A block holding two header lines is reported for both sections."""
+        starts = _find_section_starts([{"text": "Skills\nEducation"}])
+        
+        assert [section_type for _, section_type, _ in starts] == ["education", "skills"]
+    
+    def test_rejects_content_lines(self):
+        """Ordinary and long lines are not headers."""
+        blocks = [
+            {"text": "Python, Java, SQL"},
+            {"text": "Led the education outreach program for 200 students"},
+            {"text": "Skills " + "x" * 80},
+            {"text": ""},
+        ]
+        
+        assert _find_section_starts(blocks) == []
+    
+    def test_header_on_later_line_of_block(self):
+        """Multi-line blocks are matched line by line."""
+        starts = _find_section_starts([{"text": "Jane Doe\nEXPERIENCE", "left": 12}])
+        
+        assert starts == [(0, "experience", 12)]
@@ -0,0 +1,143 @@
+"""
+Tests for the session storage backends.
+"""
+import threading
+import pytest
+from datetime import datetime
+from api.schemas import ParsedJobDescription, ParsedResume, SessionData
+from services import session_manager as session_manager_module
+from services.session_manager import (
+    FileSessionManager,
+    SQLiteSessionManager,
+    create_session_manager,
+)
+
+
+def _session(session_id: str = "abc", text: str = "John Doe") -> SessionData:
+    now = datetime.now()
+    return SessionData(
+        session_id=session_id,
+        resume=ParsedResume(raw_text=text),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def sqlite_manager(tmp_path):
+    manager = SQLiteSessionManager(storage_dir=str(tmp_path), cleanup_interval_seconds=0)
+    yield manager
+    manager.close()
+
+
+class TestSessionBackends:
+    """Behaviour shared by both backends."""
+
+    @pytest.fixture(params=["file", "sqlite"])
+    def manager(self, request, tmp_path):
+        if request.param == "file":
+            manager = FileSessionManager(storage_dir=str(tmp_path))
+        else:
+            manager = SQLiteSessionManager(storage_dir=str(tmp_path), cleanup_interval_seconds=0)
+        yield manager
+        manager.close()
+
+    def test_save_get_delete(self, manager):
+        session = _session()
+        manager.save_session(session)
+
+        loaded = manager.get_session("abc")
+        assert loaded == session
+        assert manager.get_session("missing") is None
+
+        assert manager.delete_session("abc") is True
+        assert manager.delete_session("abc") is False
+        assert manager.get_session("abc") is None
+
+
+class TestSQLiteSessionManager:
+    """Test the SQLite backend."""
+
+    def test_wal_mode_and_expiry_index(self, sqlite_manager):
+        conn = sqlite_manager._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN DELETE FROM sessions WHERE expires_at < ?", (0,)
+        ).fetchall()
+        assert "idx_sessions_expires_at" in str(plan)
+
+    def test_loaded_session_is_a_copy(self, sqlite_manager):
+        """Replacing fields on a loaded session does not touch the cached one."""
+        sqlite_manager.save_session(_session())
+
+        loaded = sqlite_manager.get_session("abc")
+        loaded.job_description = ParsedJobDescription(raw_text="Engineer")
+
+        assert sqlite_manager.get_session("abc").job_description is None
+
+    def test_cache_follows_other_writers(self, tmp_path):
+        """A process sharing the database never serves its stale cached copy."""
+        first = SQLiteSessionManager(storage_dir=str(tmp_path), cleanup_interval_seconds=0)
+        second = SQLiteSessionManager(storage_dir=str(tmp_path), cleanup_interval_seconds=0)
+        try:
+            first.save_session(_session(text="v1"))
+            assert second.get_session("abc").resume.raw_text == "v1"
+
+            first.save_session(_session(text="v2"))
+            assert second.get_session("abc").resume.raw_text == "v2"
+
+            first.delete_session("abc")
+            assert second.get_session("abc") is None
+        finally:
+            first.close()
+            second.close()
+
+    def test_sessions_expire(self, sqlite_manager, monkeypatch):
+        sqlite_manager.save_session(_session("old"))
+        later = session_manager_module.time.time() + sqlite_manager.ttl_seconds + 1
+        monkeypatch.setattr(session_manager_module.time, "time", lambda: later)
+        sqlite_manager.save_session(_session("new"))
+
+        assert sqlite_manager.get_session("old") is None
+        assert sqlite_manager.cleanup_old_sessions() == 1
+        assert sqlite_manager.get_session("new") is not None
+
+    def test_cleanup_by_max_age(self, sqlite_manager):
+        sqlite_manager.save_session(_session())
+
+        assert sqlite_manager.cleanup_old_sessions(max_age_hours=1) == 0
+        assert sqlite_manager.cleanup_old_sessions(max_age_hours=-1) == 1
+
+    def test_cleanup_runs_on_timer(self, tmp_path, monkeypatch):
+        swept = threading.Event()
+        monkeypatch.setattr(SQLiteSessionManager, "cleanup_old_sessions", lambda self: swept.set())
+
+        manager = SQLiteSessionManager(storage_dir=str(tmp_path), cleanup_interval_seconds=0.01)
+        try:
+            assert swept.wait(timeout=5)
+        finally:
+            manager.close()
+
+
+class TestCreateSessionManager:
+    """Test backend selection from the environment."""
+
+    @pytest.mark.parametrize("backend, expected", [
+        ("sqlite", SQLiteSessionManager),
+        ("file", FileSessionManager),
+    ])
+    def test_backend_from_env(self, monkeypatch, backend, expected):
+        monkeypatch.setenv("SESSION_BACKEND", backend)
+        monkeypatch.setenv("SESSION_CLEANUP_INTERVAL_SECONDS", "0")
+
+        manager = create_session_manager()
+        try:
+            assert isinstance(manager, expected)
+        finally:
+            manager.close()
+
+    def test_unknown_backend(self, monkeypatch):
+        monkeypatch.setenv("SESSION_BACKEND", "redis")
+
+        with pytest.raises(ValueError):
+            create_session_manager()
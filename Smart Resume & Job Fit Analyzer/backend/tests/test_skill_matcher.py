@@ -0,0 +1,126 @@
+"""
+Tests for the shared skill pattern catalog and matcher.
+"""
+import os
+import re
+import pytest
+from api.schemas import SkillCategory
+from parsers import parse_resume
+from parsers.jd_parser import _extract_skills_from_text as extract_jd_skills
+from parsers.section_detector import _extract_skills_from_text as extract_resume_skills
+from taxonomy.skill_matcher import SkillMatcher, get_skill_matcher
+from tests.pdf_generator import generate_test_pdfs
+
+# Skills found in the raw text of the regression PDFs before the two parsers
+# shared a catalog (each parser running its own regex list)
+GOLDEN_RESUME_SKILLS = {
+    "standard": ["Python", "JavaScript", "SQL", "React", "FastAPI", "Docker"],
+    "two_column": ["HTML", "CSS", "React", "Figma", "Adobe Photoshop"],
+    "messy": ["Python", "AWS", "Kubernetes", "Jenkins", "CI/CD", "Linux"],
+}
+
+GOLDEN_JDS = [
+    "Golden JD: Python, React, SQL required.",
+    "Looking for Python and SQL developer.",
+    """
+    Looking for a Software Engineer with Python, SQL, and Docker skills.
+    Experience with REST APIs and team management is a plus.
+    """,
+]
+
+EXTRA_TEXTS = [
+    "Registered Nurse (RN) with BLS, ACLS and EMR/EHR charting; triaging patients in the ER",
+    "Financial analyst: GAAP reporting, financial modeling in MS Excel, budgeting and forecasting",
+    "Go and golang services, Django, SQL Server and MySQL, data structures and algorithms, C++ / C#",
+]
+
+
+def _reference_find(matcher, text):
+    """One re.search per catalog entry, the way the parsers used to scan."""
+    text_lower = text.lower()
+    found = []
+    for pattern in matcher.patterns:
+        match = re.search("|".join(pattern.alternatives), text_lower)
+        if match:
+            found.append((pattern.name, match.group(), match.start(), match.end()))
+    return found
+
+
+@pytest.fixture(scope="module")
+def golden_texts(tmp_path_factory):
+    """Raw text of the regression PDFs plus the golden JDs."""
+    output_dir = tmp_path_factory.mktemp("resumes")
+    generate_test_pdfs(str(output_dir))
+    resumes = {
+        name: parse_resume(os.path.join(output_dir, f"{name}.pdf"), "pdf").raw_text
+        for name in GOLDEN_RESUME_SKILLS
+    }
+    return resumes, GOLDEN_JDS + EXTRA_TEXTS
+
+
+class TestSkillMatcher:
+    """Test the compiled single-scan matcher."""
+
+    @pytest.fixture
+    def matcher(self):
+        return get_skill_matcher()
+
+    def test_matches_reference(self, matcher, golden_texts):
+        """Single scan gives every entry the same first match as separate searches."""
+        resumes, others = golden_texts
+        for text in list(resumes.values()) + others:
+            found = [(m.name, m.text, m.start, m.end) for m in matcher.find(text)]
+            assert found == _reference_find(matcher, text)
+
+    def test_overlapping_skills(self, matcher):
+        """Skills starting at or inside another skill's match are still found."""
+        names = matcher.find_names("Administered SQL Server; studied data structures and algorithms")
+
+        assert {"SQL Server", "SQL", "Data Structures & Algorithms", "Data Structures", "Algorithms"} <= set(names)
+
+    def test_word_boundaries(self, matcher):
+        """Go is not found inside other words."""
+        assert "Go" not in matcher.find_names("django, mongo, ergonomics")
+        assert "Go" in matcher.find_names("Backend in Go")
+
+    def test_catalog_categories_are_valid(self, matcher):
+        """Every catalog category is a SkillCategory value."""
+        for pattern in matcher.patterns:
+            SkillCategory(pattern.category)
+
+    def test_duplicate_names_rejected(self, tmp_path):
+        """A catalog listing the same skill twice fails to load."""
+        path = tmp_path / "skills.yaml"
+        path.write_text(
+            "patterns:\n"
+            "  - {name: Python, category: programming_languages, match: ['\\bpython\\b']}\n"
+            "  - {name: Python, category: programming_languages, match: ['\\bpy\\b']}\n"
+        )
+
+        with pytest.raises(ValueError):
+            SkillMatcher(str(path))
+
+
+class TestParsersShareCatalog:
+    """Test that the resume and JD parsers extract from the same catalog."""
+
+    def test_golden_resume_skills_unchanged(self, golden_texts):
+        """Resume extraction on the golden PDFs matches the pre-catalog results."""
+        resumes, _ = golden_texts
+        for name, expected in GOLDEN_RESUME_SKILLS.items():
+            assert [s.canonical_name for s in extract_resume_skills(resumes[name])] == expected
+
+    def test_parsers_agree(self, golden_texts):
+        """Both parsers report the same skills, in the same order, for the same text."""
+        resumes, others = golden_texts
+        for text in list(resumes.values()) + others:
+            assert [s.canonical_name for s in extract_resume_skills(text)] == extract_jd_skills(text)
+
+    def test_resume_skill_context(self):
+        """Resume skills keep the matched text and surrounding context."""
+        text = "Built dashboards in Power BI and Tableau for the finance team"
+        skill = next(s for s in extract_resume_skills(text) if s.canonical_name == "Power BI")
+
+        assert skill.name == "power bi"
+        assert skill.category == SkillCategory.TOOLS
+        assert "dashboards in Power BI" in skill.source_text
@@ -65,3 +65,74 @@ class TestSkillNormalizer:
         
         assert category is not None
         assert category == "programming_languages"
+
+
+def _reference_normalize(normalizer, skill):
+    """normalize before the indexed rewrite: rebuilt lists and two extractOne passes"""
+    from rapidfuzz import fuzz, process
+    
+    skill_lower = skill.lower().strip()
+    if skill_lower in normalizer.alias_map:
+        return (normalizer.alias_map[skill_lower], "high", 100.0)
+    for canonical in normalizer.canonical_skills:
+        if canonical.lower() == skill_lower:
+            return (canonical, "high", 100.0)
+    result = process.extractOne(skill_lower, [c.lower() for c in normalizer.canonical_skills], scorer=fuzz.ratio)
+    if result[1] >= normalizer.thresholds["high_confidence"]:
+        return (normalizer.canonical_skills[result[2]], "high", result[1])
+    alias_match, alias_score, _ = process.extractOne(skill_lower, list(normalizer.alias_map.keys()), scorer=fuzz.ratio)
+    if alias_score > result[1] and alias_score >= normalizer.thresholds["medium_confidence"]:
+        return (normalizer.alias_map[alias_match], normalizer._score_to_confidence(alias_score), alias_score)
+    confidence = normalizer._score_to_confidence(result[1])
+    if confidence != "no_match":
+        return (normalizer.canonical_skills[result[2]], confidence, result[1])
+    return (skill, "no_match", 0.0)
+
+
+MENTIONS = [
+    "Python", " python ", "PYTHON", "js", "Amazn Web Services", "javascrpt", "reactjs",
+    "Kubernets", "node", "Postgres", "tensorflw", "xyzabc123unknown", "teamwork", "qqqq zzzz", "",
+    "C#", "c sharp", "go lang", "Vue", "next js", "machine lerning", "excel", "Tally",
+]
+
+
+class TestIndexedNormalizer:
+    """Precomputed lookups, memo and batched cdist give the same answers as before."""
+    
+    @pytest.fixture
+    def normalizer(self):
+        return SkillNormalizer()
+    
+    def test_matches_reference(self, normalizer):
+        """Single mentions, including typos and unknowns, match the previous implementation"""
+        for mention in MENTIONS:
+            assert normalizer.normalize(mention) == _reference_normalize(normalizer, mention), mention
+    
+    def test_batch_matches_single(self, normalizer):
+        """normalize_batch keeps order, repeats and original text for no_match"""
+        mentions = MENTIONS + [m.upper() for m in MENTIONS] + MENTIONS
+        batch = normalizer.normalize_batch(mentions)
+        
+        assert [r["original"] for r in batch] == mentions
+        assert [(r["canonical"], r["confidence"], r["score"]) for r in batch] == \
+            [_reference_normalize(normalizer, m) for m in mentions]
+    
+    def test_results_are_memoized(self, normalizer):
+        """Case and padding variants share one memo entry"""
+        normalizer.normalize("Kubernets")
+        normalizer.normalize(" KUBERNETS ")
+        info = normalizer.cache_info()
+        
+        assert info["size"] == 1
+        assert info["hits"] == 1
+    
+    def test_no_match_keeps_each_original(self, normalizer):
+        """A memoized no_match still returns the caller's own text"""
+        assert normalizer.normalize("Qqqq Zzzz") == ("Qqqq Zzzz", "no_match", 0.0)
+        assert normalizer.normalize("QQQQ ZZZZ") == ("QQQQ ZZZZ", "no_match", 0.0)
+    
+    def test_memo_can_be_disabled(self):
+        normalizer = SkillNormalizer(cache_size=0)
+        normalizer.normalize("Kubernets")
+        
+        assert normalizer.cache_info()["size"] == 0